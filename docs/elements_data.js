@@ -1,20274 +1,15 @@
 // Element data for interactive plotting
-// Auto-generated by generate_elements_data.py
-const ELEMENTS_DATA = {
-  "neon": {
-    "name": "Neon",
-    "symbol": "Ne",
-    "binding_energies": {
-      "1s": 870.2,
-      "2s": 48.5,
-      "2p1/2": 21.7,
-      "2p3/2": 21.6
-    },
-    "shell_data": [
-      {
-        "photon_energy": [
-          860.0,
-          865.0,
-          870.0,
-          875.0,
-          880.0,
-          885.0,
-          890.0,
-          895.0,
-          900.0,
-          905.0,
-          910.0,
-          915.0,
-          920.0,
-          925.0,
-          930.0,
-          935.0,
-          940.0,
-          945.0,
-          950.0,
-          955.0,
-          960.0,
-          965.0,
-          970.0,
-          975.0,
-          980.0,
-          985.0,
-          990.0,
-          995.0,
-          1000.0,
-          1005.0,
-          1010.0,
-          1015.0,
-          1020.0,
-          1025.0,
-          1030.0,
-          1035.0,
-          1040.0,
-          1041.0,
-          1045.0,
-          1050.0,
-          1055.0,
-          1060.0,
-          1065.0,
-          1070.0,
-          1075.0,
-          1080.0,
-          1085.0,
-          1090.0,
-          1095.0,
-          1100.0,
-          1105.0,
-          1110.0,
-          1115.0,
-          1120.0,
-          1125.0,
-          1130.0,
-          1135.0,
-          1140.0,
-          1145.0,
-          1150.0,
-          1155.0,
-          900.0,
-          950.0,
-          1000.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.3341,
-          0.3121,
-          0.3053,
-          0.3022,
-          0.3004,
-          0.299,
-          0.2976,
-          0.2961,
-          0.2945,
-          0.2926,
-          0.2904,
-          0.288,
-          0.2854,
-          0.2826,
-          0.2795,
-          0.2764,
-          0.2731,
-          0.2697,
-          0.2663,
-          0.2628,
-          0.2593,
-          0.2558,
-          0.2523,
-          0.2489,
-          0.2455,
-          0.2421,
-          0.2388,
-          0.2356,
-          0.2324,
-          0.2293,
-          0.2263,
-          0.2234,
-          0.2205,
-          0.2177,
-          0.215,
-          0.2124,
-          0.2098,
-          0.2093,
-          0.2073,
-          0.2048,
-          0.2024,
-          0.2001,
-          0.1978,
-          0.1956,
-          0.1934,
-          0.1912,
-          0.1891,
-          0.187,
-          0.185,
-          0.183,
-          0.181,
-          0.1791,
-          0.1772,
-          0.1753,
-          0.1735,
-          0.1716,
-          0.1698,
-          0.168,
-          0.1663,
-          0.1645,
-          0.1628,
-          0.2945,
-          0.2663,
-          0.2324,
-          0.2048,
-          0.183,
-          0.1645,
-          0.1482,
-          0.1338,
-          0.1328,
-          0.1211,
-          0.1101,
-          0.1004,
-          0.0918,
-          0.08612,
-          0.08415
-        ],
-        "cs1": [
-          0.3341,
-          0.3121,
-          0.3052,
-          0.3021,
-          0.3003,
-          0.2989,
-          0.2975,
-          0.296,
-          0.2943,
-          0.2924,
-          0.2903,
-          0.2879,
-          0.2852,
-          0.2824,
-          0.2794,
-          0.2763,
-          0.273,
-          0.2696,
-          0.2662,
-          0.2627,
-          0.2592,
-          0.2557,
-          0.2523,
-          0.2488,
-          0.2454,
-          0.2421,
-          0.2388,
-          0.2356,
-          0.2324,
-          0.2293,
-          0.2263,
-          0.2234,
-          0.2206,
-          0.2178,
-          0.2151,
-          0.2124,
-          0.2099,
-          0.2094,
-          0.2073,
-          0.2049,
-          0.2025,
-          0.2002,
-          0.1979,
-          0.1956,
-          0.1935,
-          0.1913,
-          0.1892,
-          0.1871,
-          0.1851,
-          0.1831,
-          0.1811,
-          0.1792,
-          0.1773,
-          0.1754,
-          0.1736,
-          0.1717,
-          0.1699,
-          0.1681,
-          0.1664,
-          0.1646,
-          0.1629,
-          0.2943,
-          0.2662,
-          0.2324,
-          0.2049,
-          0.1831,
-          0.1646,
-          0.1483,
-          0.1338,
-          0.1328,
-          0.1211,
-          0.11,
-          0.1003,
-          0.09173,
-          0.08605,
-          0.08408
-        ],
-        "cs2": [
-          0.3343,
-          0.3122,
-          0.3053,
-          0.3023,
-          0.3005,
-          0.299,
-          0.2977,
-          0.2962,
-          0.2945,
-          0.2926,
-          0.2904,
-          0.288,
-          0.2854,
-          0.2826,
-          0.2796,
-          0.2764,
-          0.2731,
-          0.2698,
-          0.2663,
-          0.2629,
-          0.2594,
-          0.2559,
-          0.2524,
-          0.249,
-          0.2456,
-          0.2422,
-          0.2389,
-          0.2357,
-          0.2326,
-          0.2295,
-          0.2265,
-          0.2236,
-          0.2207,
-          0.2179,
-          0.2152,
-          0.2126,
-          0.21,
-          0.2095,
-          0.2075,
-          0.205,
-          0.2026,
-          0.2003,
-          0.198,
-          0.1958,
-          0.1936,
-          0.1914,
-          0.1893,
-          0.1873,
-          0.1852,
-          0.1832,
-          0.1813,
-          0.1793,
-          0.1774,
-          0.1755,
-          0.1737,
-          0.1718,
-          0.17,
-          0.1682,
-          0.1665,
-          0.1647,
-          0.163,
-          0.2945,
-          0.2663,
-          0.2326,
-          0.205,
-          0.1832,
-          0.1647,
-          0.1484,
-          0.1339,
-          0.1329,
-          0.1212,
-          0.1101,
-          0.1004,
-          0.0918,
-          0.08611,
-          0.08414
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.3178,
-          0.426,
-          0.5006,
-          0.5502,
-          0.5814,
-          0.5988,
-          0.6058,
-          0.6046,
-          0.5974,
-          0.5859,
-          0.5713,
-          0.5549,
-          0.5374,
-          0.5194,
-          0.5012,
-          0.483,
-          0.4649,
-          0.4471,
-          0.439,
-          0.4296,
-          0.4124,
-          0.3957,
-          0.3795,
-          0.3751,
-          0.3639,
-          0.349,
-          0.3347,
-          0.3211,
-          0.3083,
-          0.2961,
-          0.2846,
-          0.2738,
-          0.2635,
-          0.2538,
-          0.2446,
-          0.2358,
-          0.2275,
-          0.2195,
-          0.2118,
-          0.2045,
-          0.1974,
-          0.1907,
-          0.1843,
-          0.1781,
-          0.1723,
-          0.1666,
-          0.1613,
-          0.1562,
-          0.1514,
-          0.1468,
-          0.1424,
-          0.1382,
-          0.1343,
-          0.1304,
-          0.1268,
-          0.1233,
-          0.1199,
-          0.1166,
-          0.1134,
-          0.1104,
-          0.1074,
-          0.1045,
-          0.09378,
-          0.0844,
-          0.07633,
-          0.06944,
-          0.06348,
-          0.05819,
-          0.05338,
-          0.04901,
-          0.04508,
-          0.04162,
-          0.03859,
-          0.03593,
-          0.03355,
-          0.03136,
-          0.0293,
-          0.02737,
-          0.02558,
-          0.02395,
-          0.02248,
-          0.02118,
-          0.02001,
-          0.01894,
-          0.01792,
-          0.01556,
-          0.01353,
-          0.01196,
-          0.01068,
-          0.009714,
-          0.009506,
-          0.008426,
-          0.007548,
-          0.006863,
-          0.006254,
-          0.006211,
-          0.005653,
-          0.005097,
-          0.004646,
-          0.004294,
-          0.004062,
-          0.003978
-        ],
-        "cs1": [
-          0.317,
-          0.4255,
-          0.5016,
-          0.5519,
-          0.5828,
-          0.5994,
-          0.6054,
-          0.6038,
-          0.5966,
-          0.5855,
-          0.5715,
-          0.5556,
-          0.5384,
-          0.5203,
-          0.5019,
-          0.4834,
-          0.4649,
-          0.4467,
-          0.4385,
-          0.429,
-          0.4117,
-          0.3951,
-          0.379,
-          0.3747,
-          0.3637,
-          0.349,
-          0.3349,
-          0.3215,
-          0.3088,
-          0.2967,
-          0.2852,
-          0.2742,
-          0.2638,
-          0.2539,
-          0.2445,
-          0.2356,
-          0.2271,
-          0.219,
-          0.2113,
-          0.204,
-          0.197,
-          0.1904,
-          0.1841,
-          0.178,
-          0.1723,
-          0.1668,
-          0.1615,
-          0.1565,
-          0.1517,
-          0.1471,
-          0.1427,
-          0.1384,
-          0.1344,
-          0.1305,
-          0.1267,
-          0.1231,
-          0.1197,
-          0.1163,
-          0.1131,
-          0.11,
-          0.107,
-          0.1042,
-          0.09364,
-          0.08452,
-          0.07657,
-          0.0696,
-          0.06346,
-          0.05804,
-          0.05324,
-          0.04897,
-          0.04518,
-          0.04179,
-          0.03874,
-          0.03599,
-          0.03351,
-          0.03125,
-          0.02919,
-          0.02731,
-          0.02559,
-          0.02402,
-          0.02258,
-          0.02125,
-          0.02002,
-          0.01888,
-          0.01783,
-          0.01552,
-          0.0136,
-          0.01199,
-          0.01062,
-          0.009656,
-          0.009459,
-          0.008462,
-          0.007603,
-          0.006858,
-          0.006204,
-          0.00616,
-          0.005633,
-          0.005131,
-          0.004689,
-          0.004299,
-          0.004038,
-          0.003948
-        ],
-        "cs2": [
-          0.3208,
-          0.4296,
-          0.5056,
-          0.5557,
-          0.5863,
-          0.6025,
-          0.6084,
-          0.6066,
-          0.5993,
-          0.588,
-          0.5738,
-          0.5577,
-          0.5404,
-          0.5222,
-          0.5036,
-          0.4849,
-          0.4664,
-          0.4481,
-          0.4398,
-          0.4303,
-          0.413,
-          0.3963,
-          0.3802,
-          0.3758,
-          0.3648,
-          0.35,
-          0.3359,
-          0.3225,
-          0.3097,
-          0.2975,
-          0.2859,
-          0.2749,
-          0.2644,
-          0.2545,
-          0.2451,
-          0.2361,
-          0.2276,
-          0.2195,
-          0.2118,
-          0.2045,
-          0.1975,
-          0.1909,
-          0.1845,
-          0.1785,
-          0.1727,
-          0.1672,
-          0.1619,
-          0.1569,
-          0.152,
-          0.1474,
-          0.143,
-          0.1387,
-          0.1347,
-          0.1308,
-          0.127,
-          0.1234,
-          0.1199,
-          0.1166,
-          0.1134,
-          0.1103,
-          0.1073,
-          0.1044,
-          0.09386,
-          0.08472,
-          0.07673,
-          0.06973,
-          0.06358,
-          0.05815,
-          0.05334,
-          0.04907,
-          0.04527,
-          0.04186,
-          0.0388,
-          0.03605,
-          0.03356,
-          0.0313,
-          0.02924,
-          0.02736,
-          0.02564,
-          0.02406,
-          0.02261,
-          0.02128,
-          0.02004,
-          0.01891,
-          0.01785,
-          0.01554,
-          0.01362,
-          0.012,
-          0.01064,
-          0.00967,
-          0.009474,
-          0.008476,
-          0.007613,
-          0.006865,
-          0.006212,
-          0.006168,
-          0.005641,
-          0.005139,
-          0.004695,
-          0.004302,
-          0.004042,
-          0.003952
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          20.0,
-          21.22,
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          276.1333333333333,
-          2.171333333333333,
-          2.7026666666666666,
-          2.848,
-          2.99,
-          3.051333333333333,
-          2.9929999999999994,
-          2.9763333333333333,
-          2.8686666666666665,
-          2.7119999999999997,
-          2.5406666666666666,
-          2.3626666666666667,
-          2.182,
-          2.0026666666666664,
-          1.8283333333333334,
-          1.6636666666666664,
-          1.5110000000000001,
-          1.3716666666666666,
-          1.2456666666666667,
-          1.1313333333333333,
-          1.028,
-          0.9346666666666665,
-          0.8503333333333334,
-          0.7746666666666666,
-          0.7066666666666667,
-          0.6463333333333333,
-          0.6206666666666667,
-          0.5926666666666667,
-          0.5446666666666666,
-          0.502,
-          0.46366666666666667,
-          0.45366666666666666,
-          0.42899999999999994,
-          0.3973333333333333,
-          0.3686666666666667,
-          0.34233333333333327,
-          0.31816666666666665,
-          0.29619999999999996,
-          0.2762,
-          0.258,
-          0.24143333333333333,
-          0.22636666666666666,
-          0.21263333333333334,
-          0.19999999999999998,
-          0.1883333333333333,
-          0.1775,
-          0.16736666666666666,
-          0.15789999999999998,
-          0.14903333333333332,
-          0.1407,
-          0.1329,
-          0.1256,
-          0.11883333333333332,
-          0.11256666666666666,
-          0.10676666666666665,
-          0.10136666666666666,
-          0.0964,
-          0.09173333333333333,
-          0.08743333333333332,
-          0.08336666666666666,
-          0.07953333333333333,
-          0.07586666666666667,
-          0.07243333333333332,
-          0.0691,
-          0.06596666666666666,
-          0.06296666666666667,
-          0.05246666666666667,
-          0.044333333333333336,
-          0.038066666666666665,
-          0.032806666666666665,
-          0.02824,
-          0.02441,
-          0.021366666666666666,
-          0.01893,
-          0.016813333333333333,
-          0.014866666666666667,
-          0.013126666666666665,
-          0.01168,
-          0.010523333333333332,
-          0.009553333333333334,
-          0.008656666666666667,
-          0.007789999999999999,
-          0.006996666666666667,
-          0.006326666666666666,
-          0.0057866666666666665,
-          0.005336666666666667,
-          0.004923333333333333,
-          0.004513333333333333,
-          0.0041066666666666665,
-          0.0037400000000000003,
-          0.0030876666666666665,
-          0.0025973333333333334,
-          0.002111,
-          0.001796,
-          0.0016003333333333332,
-          0.0015533333333333332,
-          0.0012873333333333333,
-          0.001107,
-          0.0009926666666666667,
-          0.0008489999999999999,
-          0.000838,
-          0.0007203333333333334,
-          0.0006519999999999999,
-          0.0005859999999999999,
-          0.0005006666666666666,
-          0.00045333333333333337,
-          0.00044166666666666665
-        ],
-        "cs1": [
-          276.23333333333335,
-          2.1696666666666666,
-          2.7046666666666668,
-          2.8529999999999998,
-          2.9953333333333334,
-          3.051,
-          2.9906666666666664,
-          2.974333333333333,
-          2.8699999999999997,
-          2.716333333333333,
-          2.5443333333333333,
-          2.3633333333333333,
-          2.1803333333333335,
-          2.0006666666666666,
-          1.8276666666666666,
-          1.6646666666666665,
-          1.513,
-          1.3736666666666668,
-          1.2463333333333333,
-          1.1306666666666665,
-          1.0266666666666666,
-          0.9329999999999999,
-          0.8493333333333333,
-          0.7743333333333333,
-          0.7073333333333333,
-          0.6473333333333333,
-          0.622,
-          0.5936666666666666,
-          0.5453333333333332,
-          0.5023333333333333,
-          0.46333333333333326,
-          0.45299999999999996,
-          0.428,
-          0.3963333333333333,
-          0.36766666666666664,
-          0.3416666666666666,
-          0.3178333333333333,
-          0.29623333333333335,
-          0.2765333333333333,
-          0.2585333333333333,
-          0.242,
-          0.22683333333333333,
-          0.21283333333333332,
-          0.19996666666666665,
-          0.18806666666666666,
-          0.17703333333333332,
-          0.1668333333333333,
-          0.15736666666666665,
-          0.14856666666666665,
-          0.1404,
-          0.13276666666666664,
-          0.12566666666666665,
-          0.11906666666666667,
-          0.11286666666666667,
-          0.10709999999999999,
-          0.10169999999999998,
-          0.09663333333333332,
-          0.09186666666666667,
-          0.08743333333333332,
-          0.08323333333333333,
-          0.0793,
-          0.07556666666666667,
-          0.0721,
-          0.0688,
-          0.0657,
-          0.06276666666666667,
-          0.05266666666666667,
-          0.04456666666666667,
-          0.038,
-          0.03263666666666666,
-          0.02822,
-          0.024556666666666664,
-          0.02149333333333333,
-          0.018903333333333334,
-          0.016696666666666665,
-          0.014806666666666666,
-          0.013183333333333333,
-          0.011783333333333333,
-          0.01057,
-          0.009503333333333332,
-          0.00857,
-          0.00775,
-          0.007026666666666667,
-          0.00639,
-          0.005823333333333333,
-          0.005316666666666666,
-          0.004866666666666667,
-          0.0044599999999999996,
-          0.0040999999999999995,
-          0.0037733333333333334,
-          0.003094,
-          0.002559333333333333,
-          0.002137,
-          0.0018006666666666666,
-          0.0015719999999999998,
-          0.001527,
-          0.0013043333333333331,
-          0.0011226666666666666,
-          0.0009713333333333333,
-          0.0008446666666666665,
-          0.0008363333333333332,
-          0.0007389999999999999,
-          0.00065,
-          0.0005733333333333332,
-          0.000508,
-          0.00046633333333333336,
-          0.000452
-        ],
-        "cs2": [
-          276.4,
-          2.1639999999999997,
-          2.702,
-          2.851,
-          2.9939999999999998,
-          3.05,
-          2.9906666666666664,
-          2.974333333333333,
-          2.8706666666666667,
-          2.716666666666667,
-          2.5443333333333333,
-          2.3633333333333333,
-          2.1803333333333335,
-          2.0006666666666666,
-          1.8283333333333334,
-          1.665,
-          1.5133333333333332,
-          1.3736666666666668,
-          1.2463333333333333,
-          1.1306666666666665,
-          1.0266666666666666,
-          0.9333333333333332,
-          0.8493333333333333,
-          0.7746666666666666,
-          0.7073333333333333,
-          0.6473333333333333,
-          0.622,
-          0.5936666666666666,
-          0.5453333333333332,
-          0.5023333333333333,
-          0.46333333333333326,
-          0.45299999999999996,
-          0.428,
-          0.3963333333333333,
-          0.36766666666666664,
-          0.3416666666666666,
-          0.31789999999999996,
-          0.29633333333333334,
-          0.27659999999999996,
-          0.2585666666666666,
-          0.24203333333333332,
-          0.22683333333333333,
-          0.21286666666666665,
-          0.19996666666666665,
-          0.18806666666666666,
-          0.17703333333333332,
-          0.1668333333333333,
-          0.15739999999999998,
-          0.14859999999999998,
-          0.14043333333333333,
-          0.13279999999999997,
-          0.1257333333333333,
-          0.1191,
-          0.1129,
-          0.10713333333333333,
-          0.10169999999999998,
-          0.09663333333333332,
-          0.09186666666666667,
-          0.08743333333333332,
-          0.08323333333333333,
-          0.0793,
-          0.0756,
-          0.0721,
-          0.06883333333333333,
-          0.06573333333333332,
-          0.0628,
-          0.05266666666666667,
-          0.04456666666666667,
-          0.038,
-          0.03263666666666666,
-          0.028226666666666667,
-          0.02456,
-          0.021486666666666668,
-          0.018896666666666666,
-          0.01669333333333333,
-          0.014806666666666666,
-          0.013186666666666666,
-          0.011783333333333333,
-          0.010563333333333334,
-          0.0095,
-          0.008566666666666667,
-          0.00775,
-          0.007026666666666667,
-          0.006386666666666666,
-          0.00582,
-          0.005313333333333333,
-          0.004863333333333333,
-          0.0044599999999999996,
-          0.0040999999999999995,
-          0.0037733333333333334,
-          0.0030919999999999997,
-          0.0025589999999999996,
-          0.002137,
-          0.0017993333333333333,
-          0.0015716666666666665,
-          0.0015266666666666666,
-          0.0013043333333333331,
-          0.0011216666666666666,
-          0.0009706666666666667,
-          0.0008446666666666665,
-          0.0008366666666666667,
-          0.0007389999999999999,
-          0.0006493333333333334,
-          0.0005729999999999999,
-          0.000508,
-          0.00046599999999999994,
-          0.0004516666666666667
-        ],
-        "beta0": [
-          0.8738,
-          -0.396,
-          0.1333,
-          0.3209,
-          0.5533,
-          0.7958,
-          0.9534,
-          0.9739,
-          1.064,
-          1.147,
-          1.21,
-          1.261,
-          1.302,
-          1.335,
-          1.363,
-          1.386,
-          1.405,
-          1.422,
-          1.436,
-          1.448,
-          1.458,
-          1.466,
-          1.473,
-          1.478,
-          1.481,
-          1.484,
-          1.486,
-          1.487,
-          1.489,
-          1.49,
-          1.491,
-          1.491,
-          1.491,
-          1.491,
-          1.49,
-          1.489,
-          1.487,
-          1.484,
-          1.481,
-          1.478,
-          1.474,
-          1.471,
-          1.467,
-          1.464,
-          1.461,
-          1.458,
-          1.454,
-          1.45,
-          1.446,
-          1.442,
-          1.437,
-          1.433,
-          1.427,
-          1.422,
-          1.417,
-          1.412,
-          1.407,
-          1.403,
-          1.398,
-          1.394,
-          1.389,
-          1.385,
-          1.381,
-          1.377,
-          1.372,
-          1.368,
-          1.348,
-          1.327,
-          1.309,
-          1.292,
-          1.275,
-          1.256,
-          1.237,
-          1.219,
-          1.203,
-          1.188,
-          1.171,
-          1.154,
-          1.138,
-          1.123,
-          1.109,
-          1.094,
-          1.08,
-          1.066,
-          1.053,
-          1.04,
-          1.027,
-          1.013,
-          0.9999,
-          0.9878,
-          0.9619,
-          0.9314,
-          0.9027,
-          0.8845,
-          0.8626,
-          0.8566,
-          0.8282,
-          0.8186,
-          0.8002,
-          0.7665,
-          0.7645,
-          0.753,
-          0.7516,
-          0.7249,
-          0.6957,
-          0.6958,
-          0.699
-        ],
-        "beta1": [
-          0.8738,
-          -0.3976,
-          0.1319,
-          0.3204,
-          0.5537,
-          0.796,
-          0.9534,
-          0.9738,
-          1.064,
-          1.147,
-          1.21,
-          1.261,
-          1.302,
-          1.335,
-          1.363,
-          1.386,
-          1.406,
-          1.422,
-          1.436,
-          1.448,
-          1.457,
-          1.466,
-          1.472,
-          1.478,
-          1.482,
-          1.485,
-          1.487,
-          1.488,
-          1.49,
-          1.491,
-          1.491,
-          1.491,
-          1.491,
-          1.49,
-          1.489,
-          1.488,
-          1.486,
-          1.484,
-          1.481,
-          1.478,
-          1.475,
-          1.472,
-          1.469,
-          1.465,
-          1.461,
-          1.457,
-          1.453,
-          1.449,
-          1.445,
-          1.441,
-          1.436,
-          1.432,
-          1.427,
-          1.422,
-          1.418,
-          1.413,
-          1.409,
-          1.404,
-          1.399,
-          1.394,
-          1.39,
-          1.385,
-          1.38,
-          1.375,
-          1.371,
-          1.366,
-          1.347,
-          1.328,
-          1.31,
-          1.291,
-          1.273,
-          1.255,
-          1.238,
-          1.221,
-          1.204,
-          1.187,
-          1.17,
-          1.154,
-          1.139,
-          1.124,
-          1.109,
-          1.094,
-          1.08,
-          1.066,
-          1.052,
-          1.039,
-          1.026,
-          1.014,
-          1.001,
-          0.9891,
-          0.9598,
-          0.9319,
-          0.9057,
-          0.8807,
-          0.861,
-          0.8569,
-          0.8349,
-          0.814,
-          0.7939,
-          0.7752,
-          0.774,
-          0.7577,
-          0.7407,
-          0.7241,
-          0.7089,
-          0.6981,
-          0.6942
-        ],
-        "beta2": [
-          0.8748,
-          -0.3902,
-          0.1372,
-          0.3246,
-          0.5566,
-          0.7974,
-          0.9538,
-          0.9742,
-          1.064,
-          1.146,
-          1.21,
-          1.26,
-          1.301,
-          1.334,
-          1.362,
-          1.385,
-          1.405,
-          1.421,
-          1.435,
-          1.447,
-          1.456,
-          1.465,
-          1.471,
-          1.477,
-          1.481,
-          1.484,
-          1.486,
-          1.487,
-          1.489,
-          1.49,
-          1.49,
-          1.49,
-          1.49,
-          1.489,
-          1.488,
-          1.487,
-          1.485,
-          1.483,
-          1.48,
-          1.478,
-          1.475,
-          1.471,
-          1.468,
-          1.464,
-          1.461,
-          1.457,
-          1.453,
-          1.449,
-          1.444,
-          1.44,
-          1.436,
-          1.431,
-          1.427,
-          1.422,
-          1.417,
-          1.413,
-          1.408,
-          1.403,
-          1.399,
-          1.394,
-          1.389,
-          1.385,
-          1.38,
-          1.375,
-          1.37,
-          1.366,
-          1.347,
-          1.328,
-          1.309,
-          1.291,
-          1.273,
-          1.255,
-          1.238,
-          1.22,
-          1.203,
-          1.187,
-          1.17,
-          1.154,
-          1.139,
-          1.123,
-          1.109,
-          1.094,
-          1.08,
-          1.066,
-          1.052,
-          1.039,
-          1.026,
-          1.014,
-          1.001,
-          0.9891,
-          0.9599,
-          0.9321,
-          0.9057,
-          0.8807,
-          0.8612,
-          0.8571,
-          0.8349,
-          0.8139,
-          0.7941,
-          0.7754,
-          0.7741,
-          0.7576,
-          0.7407,
-          0.7244,
-          0.7089,
-          0.6979,
-          0.694
-        ]
-      },
-      {
-        "photon_energy": [
-          20.0,
-          21.22,
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          552.2666666666667,
-          4.342666666666666,
-          5.405333333333333,
-          5.696,
-          5.98,
-          6.102666666666666,
-          5.985999999999999,
-          5.9526666666666666,
-          5.737333333333333,
-          5.4239999999999995,
-          5.081333333333333,
-          4.725333333333333,
-          4.364,
-          4.005333333333333,
-          3.6566666666666667,
-          3.327333333333333,
-          3.0220000000000002,
-          2.743333333333333,
-          2.4913333333333334,
-          2.2626666666666666,
-          2.056,
-          1.869333333333333,
-          1.7006666666666668,
-          1.5493333333333332,
-          1.4133333333333333,
-          1.2926666666666666,
-          1.2413333333333334,
-          1.1853333333333333,
-          1.0893333333333333,
-          1.004,
-          0.9273333333333333,
-          0.9073333333333333,
-          0.8579999999999999,
-          0.7946666666666666,
-          0.7373333333333334,
-          0.6846666666666665,
-          0.6363333333333333,
-          0.5923999999999999,
-          0.5524,
-          0.516,
-          0.48286666666666667,
-          0.4527333333333333,
-          0.4252666666666667,
-          0.39999999999999997,
-          0.3766666666666666,
-          0.355,
-          0.3347333333333333,
-          0.31579999999999997,
-          0.29806666666666665,
-          0.2814,
-          0.2658,
-          0.2512,
-          0.23766666666666664,
-          0.22513333333333332,
-          0.2135333333333333,
-          0.20273333333333332,
-          0.1928,
-          0.18346666666666667,
-          0.17486666666666664,
-          0.16673333333333332,
-          0.15906666666666666,
-          0.15173333333333333,
-          0.14486666666666664,
-          0.1382,
-          0.13193333333333332,
-          0.12593333333333334,
-          0.10493333333333334,
-          0.08866666666666667,
-          0.07613333333333333,
-          0.06561333333333333,
-          0.05648,
-          0.04882,
-          0.04273333333333333,
-          0.03786,
-          0.033626666666666666,
-          0.029733333333333334,
-          0.02625333333333333,
-          0.02336,
-          0.021046666666666665,
-          0.019106666666666668,
-          0.017313333333333333,
-          0.015579999999999998,
-          0.013993333333333333,
-          0.012653333333333332,
-          0.011573333333333333,
-          0.010673333333333333,
-          0.009846666666666667,
-          0.009026666666666665,
-          0.008213333333333333,
-          0.0074800000000000005,
-          0.006175333333333333,
-          0.005194666666666667,
-          0.004222,
-          0.003592,
-          0.0032006666666666663,
-          0.0031066666666666664,
-          0.0025746666666666665,
-          0.002214,
-          0.0019853333333333333,
-          0.0016979999999999999,
-          0.001676,
-          0.0014406666666666667,
-          0.0013039999999999998,
-          0.0011719999999999999,
-          0.0010013333333333332,
-          0.0009066666666666667,
-          0.0008833333333333333
-        ],
-        "cs1": [
-          552.4666666666667,
-          4.339333333333333,
-          5.4093333333333335,
-          5.7059999999999995,
-          5.990666666666667,
-          6.102,
-          5.981333333333333,
-          5.948666666666666,
-          5.739999999999999,
-          5.432666666666666,
-          5.088666666666667,
-          4.726666666666667,
-          4.360666666666667,
-          4.001333333333333,
-          3.655333333333333,
-          3.329333333333333,
-          3.026,
-          2.7473333333333336,
-          2.4926666666666666,
-          2.261333333333333,
-          2.0533333333333332,
-          1.8659999999999999,
-          1.6986666666666665,
-          1.5486666666666666,
-          1.4146666666666665,
-          1.2946666666666666,
-          1.244,
-          1.1873333333333331,
-          1.0906666666666665,
-          1.0046666666666666,
-          0.9266666666666665,
-          0.9059999999999999,
-          0.856,
-          0.7926666666666666,
-          0.7353333333333333,
-          0.6833333333333332,
-          0.6356666666666666,
-          0.5924666666666667,
-          0.5530666666666666,
-          0.5170666666666666,
-          0.484,
-          0.45366666666666666,
-          0.42566666666666664,
-          0.3999333333333333,
-          0.3761333333333333,
-          0.35406666666666664,
-          0.3336666666666666,
-          0.3147333333333333,
-          0.2971333333333333,
-          0.2808,
-          0.2655333333333333,
-          0.2513333333333333,
-          0.23813333333333334,
-          0.22573333333333334,
-          0.21419999999999997,
-          0.20339999999999997,
-          0.19326666666666664,
-          0.18373333333333333,
-          0.17486666666666664,
-          0.16646666666666665,
-          0.1586,
-          0.15113333333333334,
-          0.1442,
-          0.1376,
-          0.1314,
-          0.12553333333333333,
-          0.10533333333333333,
-          0.08913333333333334,
-          0.076,
-          0.06527333333333332,
-          0.05644,
-          0.04911333333333333,
-          0.04298666666666666,
-          0.03780666666666667,
-          0.03339333333333333,
-          0.029613333333333332,
-          0.026366666666666667,
-          0.023566666666666666,
-          0.02114,
-          0.019006666666666665,
-          0.01714,
-          0.0155,
-          0.014053333333333334,
-          0.01278,
-          0.011646666666666666,
-          0.010633333333333331,
-          0.009733333333333333,
-          0.008919999999999999,
-          0.008199999999999999,
-          0.007546666666666667,
-          0.006188,
-          0.005118666666666666,
-          0.004274,
-          0.003601333333333333,
-          0.0031439999999999997,
-          0.003054,
-          0.0026086666666666663,
-          0.002245333333333333,
-          0.0019426666666666665,
-          0.001689333333333333,
-          0.0016726666666666665,
-          0.0014779999999999997,
-          0.0013,
-          0.0011466666666666665,
-          0.001016,
-          0.0009326666666666667,
-          0.000904
-        ],
-        "cs2": [
-          552.8,
-          4.327999999999999,
-          5.404,
-          5.702,
-          5.9879999999999995,
-          6.1,
-          5.981333333333333,
-          5.948666666666666,
-          5.741333333333333,
-          5.433333333333334,
-          5.088666666666667,
-          4.726666666666667,
-          4.360666666666667,
-          4.001333333333333,
-          3.6566666666666667,
-          3.33,
-          3.0266666666666664,
-          2.7473333333333336,
-          2.4926666666666666,
-          2.261333333333333,
-          2.0533333333333332,
-          1.8666666666666665,
-          1.6986666666666665,
-          1.5493333333333332,
-          1.4146666666666665,
-          1.2946666666666666,
-          1.244,
-          1.1873333333333331,
-          1.0906666666666665,
-          1.0046666666666666,
-          0.9266666666666665,
-          0.9059999999999999,
-          0.856,
-          0.7926666666666666,
-          0.7353333333333333,
-          0.6833333333333332,
-          0.6357999999999999,
-          0.5926666666666667,
-          0.5531999999999999,
-          0.5171333333333332,
-          0.48406666666666665,
-          0.45366666666666666,
-          0.4257333333333333,
-          0.3999333333333333,
-          0.3761333333333333,
-          0.35406666666666664,
-          0.3336666666666666,
-          0.31479999999999997,
-          0.29719999999999996,
-          0.28086666666666665,
-          0.26559999999999995,
-          0.2514666666666666,
-          0.2382,
-          0.2258,
-          0.21426666666666666,
-          0.20339999999999997,
-          0.19326666666666664,
-          0.18373333333333333,
-          0.17486666666666664,
-          0.16646666666666665,
-          0.1586,
-          0.1512,
-          0.1442,
-          0.13766666666666666,
-          0.13146666666666665,
-          0.1256,
-          0.10533333333333333,
-          0.08913333333333334,
-          0.076,
-          0.06527333333333332,
-          0.056453333333333335,
-          0.04912,
-          0.042973333333333336,
-          0.03779333333333333,
-          0.03338666666666666,
-          0.029613333333333332,
-          0.026373333333333332,
-          0.023566666666666666,
-          0.02112666666666667,
-          0.019,
-          0.017133333333333334,
-          0.0155,
-          0.014053333333333334,
-          0.012773333333333333,
-          0.01164,
-          0.010626666666666666,
-          0.009726666666666666,
-          0.008919999999999999,
-          0.008199999999999999,
-          0.007546666666666667,
-          0.006183999999999999,
-          0.005117999999999999,
-          0.004274,
-          0.0035986666666666667,
-          0.003143333333333333,
-          0.0030533333333333332,
-          0.0026086666666666663,
-          0.0022433333333333333,
-          0.0019413333333333333,
-          0.001689333333333333,
-          0.0016733333333333333,
-          0.0014779999999999997,
-          0.0012986666666666667,
-          0.0011459999999999999,
-          0.001016,
-          0.0009319999999999999,
-          0.0009033333333333334
-        ],
-        "beta0": [
-          0.8738,
-          -0.396,
-          0.1333,
-          0.3209,
-          0.5533,
-          0.7958,
-          0.9534,
-          0.9739,
-          1.064,
-          1.147,
-          1.21,
-          1.261,
-          1.302,
-          1.335,
-          1.363,
-          1.386,
-          1.405,
-          1.422,
-          1.436,
-          1.448,
-          1.458,
-          1.466,
-          1.473,
-          1.478,
-          1.481,
-          1.484,
-          1.486,
-          1.487,
-          1.489,
-          1.49,
-          1.491,
-          1.491,
-          1.491,
-          1.491,
-          1.49,
-          1.489,
-          1.487,
-          1.484,
-          1.481,
-          1.478,
-          1.474,
-          1.471,
-          1.467,
-          1.464,
-          1.461,
-          1.458,
-          1.454,
-          1.45,
-          1.446,
-          1.442,
-          1.437,
-          1.433,
-          1.427,
-          1.422,
-          1.417,
-          1.412,
-          1.407,
-          1.403,
-          1.398,
-          1.394,
-          1.389,
-          1.385,
-          1.381,
-          1.377,
-          1.372,
-          1.368,
-          1.348,
-          1.327,
-          1.309,
-          1.292,
-          1.275,
-          1.256,
-          1.237,
-          1.219,
-          1.203,
-          1.188,
-          1.171,
-          1.154,
-          1.138,
-          1.123,
-          1.109,
-          1.094,
-          1.08,
-          1.066,
-          1.053,
-          1.04,
-          1.027,
-          1.013,
-          0.9999,
-          0.9878,
-          0.9619,
-          0.9314,
-          0.9027,
-          0.8845,
-          0.8626,
-          0.8566,
-          0.8282,
-          0.8186,
-          0.8002,
-          0.7665,
-          0.7645,
-          0.753,
-          0.7516,
-          0.7249,
-          0.6957,
-          0.6958,
-          0.699
-        ],
-        "beta1": [
-          0.8738,
-          -0.3976,
-          0.1319,
-          0.3204,
-          0.5537,
-          0.796,
-          0.9534,
-          0.9738,
-          1.064,
-          1.147,
-          1.21,
-          1.261,
-          1.302,
-          1.335,
-          1.363,
-          1.386,
-          1.406,
-          1.422,
-          1.436,
-          1.448,
-          1.457,
-          1.466,
-          1.472,
-          1.478,
-          1.482,
-          1.485,
-          1.487,
-          1.488,
-          1.49,
-          1.491,
-          1.491,
-          1.491,
-          1.491,
-          1.49,
-          1.489,
-          1.488,
-          1.486,
-          1.484,
-          1.481,
-          1.478,
-          1.475,
-          1.472,
-          1.469,
-          1.465,
-          1.461,
-          1.457,
-          1.453,
-          1.449,
-          1.445,
-          1.441,
-          1.436,
-          1.432,
-          1.427,
-          1.422,
-          1.418,
-          1.413,
-          1.409,
-          1.404,
-          1.399,
-          1.394,
-          1.39,
-          1.385,
-          1.38,
-          1.375,
-          1.371,
-          1.366,
-          1.347,
-          1.328,
-          1.31,
-          1.291,
-          1.273,
-          1.255,
-          1.238,
-          1.221,
-          1.204,
-          1.187,
-          1.17,
-          1.154,
-          1.139,
-          1.124,
-          1.109,
-          1.094,
-          1.08,
-          1.066,
-          1.052,
-          1.039,
-          1.026,
-          1.014,
-          1.001,
-          0.9891,
-          0.9598,
-          0.9319,
-          0.9057,
-          0.8807,
-          0.861,
-          0.8569,
-          0.8349,
-          0.814,
-          0.7939,
-          0.7752,
-          0.774,
-          0.7577,
-          0.7407,
-          0.7241,
-          0.7089,
-          0.6981,
-          0.6942
-        ],
-        "beta2": [
-          0.8748,
-          -0.3902,
-          0.1372,
-          0.3246,
-          0.5566,
-          0.7974,
-          0.9538,
-          0.9742,
-          1.064,
-          1.146,
-          1.21,
-          1.26,
-          1.301,
-          1.334,
-          1.362,
-          1.385,
-          1.405,
-          1.421,
-          1.435,
-          1.447,
-          1.456,
-          1.465,
-          1.471,
-          1.477,
-          1.481,
-          1.484,
-          1.486,
-          1.487,
-          1.489,
-          1.49,
-          1.49,
-          1.49,
-          1.49,
-          1.489,
-          1.488,
-          1.487,
-          1.485,
-          1.483,
-          1.48,
-          1.478,
-          1.475,
-          1.471,
-          1.468,
-          1.464,
-          1.461,
-          1.457,
-          1.453,
-          1.449,
-          1.444,
-          1.44,
-          1.436,
-          1.431,
-          1.427,
-          1.422,
-          1.417,
-          1.413,
-          1.408,
-          1.403,
-          1.399,
-          1.394,
-          1.389,
-          1.385,
-          1.38,
-          1.375,
-          1.37,
-          1.366,
-          1.347,
-          1.328,
-          1.309,
-          1.291,
-          1.273,
-          1.255,
-          1.238,
-          1.22,
-          1.203,
-          1.187,
-          1.17,
-          1.154,
-          1.139,
-          1.123,
-          1.109,
-          1.094,
-          1.08,
-          1.066,
-          1.052,
-          1.039,
-          1.026,
-          1.014,
-          1.001,
-          0.9891,
-          0.9599,
-          0.9321,
-          0.9057,
-          0.8807,
-          0.8612,
-          0.8571,
-          0.8349,
-          0.8139,
-          0.7941,
-          0.7754,
-          0.7741,
-          0.7576,
-          0.7407,
-          0.7244,
-          0.7089,
-          0.6979,
-          0.694
-        ]
-      }
-    ],
-    "auger_peaks": [
-      {
-        "peak_name": "Ne_KLL_1S0",
-        "kinetic_energy": 748.5,
-        "channel": "KLL",
-        "intensity_factor": 0.06157635467980295,
-        "origin": "1s",
-        "origin_binding_key": "1s"
-      },
-      {
-        "peak_name": "Ne_KLL_1P1",
-        "kinetic_energy": 771.0,
-        "channel": "KLL",
-        "intensity_factor": 0.16995073891625612,
-        "origin": "1s",
-        "origin_binding_key": "1s"
-      },
-      {
-        "peak_name": "Ne_KLL_3P02",
-        "kinetic_energy": 782.0,
-        "channel": "KLL",
-        "intensity_factor": 0.06773399014778325,
-        "origin": "1s",
-        "origin_binding_key": "1s"
-      },
-      {
-        "peak_name": "Ne_KLL_1S0",
-        "kinetic_energy": 800.0,
-        "channel": "KLL",
-        "intensity_factor": 0.09667487684729063,
-        "origin": "1s",
-        "origin_binding_key": "1s"
-      },
-      {
-        "peak_name": "Ne_KLL'_1D2",
-        "kinetic_energy": 803.6,
-        "channel": "KLL",
-        "intensity_factor": 0.604064039408867,
-        "origin": "1s",
-        "origin_binding_key": "1s"
-      }
-    ]
-  },
-  "argon": {
-    "name": "Argon",
-    "symbol": "Ar",
-    "binding_energies": {
-      "L1 2s": 326.3,
-      "L2 2p1/2": 250.6,
-      "L3 2p3/2": 248.4,
-      "M1 3s": 29.3,
-      "M2 3p1/2": 15.9,
-      "M3 3p3/2": 15.7
-    },
-    "shell_data": [
-      {
-        "photon_energy": [
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          405.0,
-          410.0,
-          415.0,
-          420.0,
-          425.0,
-          430.0,
-          435.0,
-          440.0,
-          445.0,
-          450.0,
-          455.0,
-          460.0,
-          465.0,
-          470.0,
-          475.0,
-          480.0,
-          485.0,
-          490.0,
-          495.0,
-          500.0,
-          505.0,
-          510.0,
-          515.0,
-          520.0,
-          525.0,
-          530.0,
-          535.0,
-          540.0,
-          545.0,
-          550.0,
-          555.0,
-          560.0,
-          565.0,
-          570.0,
-          575.0,
-          580.0,
-          585.0,
-          590.0,
-          595.0,
-          600.0,
-          605.0,
-          610.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.2871,
-          0.2957,
-          0.3011,
-          0.3043,
-          0.3057,
-          0.3054,
-          0.3037,
-          0.3008,
-          0.2971,
-          0.2926,
-          0.2878,
-          0.2827,
-          0.2775,
-          0.2724,
-          0.2674,
-          0.2626,
-          0.2581,
-          0.2537,
-          0.2495,
-          0.2455,
-          0.2418,
-          0.2381,
-          0.2347,
-          0.2313,
-          0.228,
-          0.2248,
-          0.2217,
-          0.2186,
-          0.2156,
-          0.2126,
-          0.2097,
-          0.2067,
-          0.2038,
-          0.2009,
-          0.1981,
-          0.1952,
-          0.1924,
-          0.1897,
-          0.1869,
-          0.1843,
-          0.1816,
-          0.179,
-          0.1765,
-          0.174,
-          0.1715,
-          0.1691,
-          0.1668,
-          0.1645,
-          0.1622,
-          0.16,
-          0.1579,
-          0.1558,
-          0.1537,
-          0.1517,
-          0.1497,
-          0.1477,
-          0.1458,
-          0.1439,
-          0.142,
-          0.1402,
-          0.1366,
-          0.1297,
-          0.1233,
-          0.1172,
-          0.1116,
-          0.1063,
-          0.1013,
-          0.09675,
-          0.09248,
-          0.08849,
-          0.07954,
-          0.07177,
-          0.06498,
-          0.05902,
-          0.05468,
-          0.05378,
-          0.04914,
-          0.04502,
-          0.04136,
-          0.03811,
-          0.03789,
-          0.03524,
-          0.03268,
-          0.03039,
-          0.02832,
-          0.02692,
-          0.02643
-        ],
-        "cs1": [
-          0.2866,
-          0.2952,
-          0.3005,
-          0.3037,
-          0.3051,
-          0.3049,
-          0.3032,
-          0.3004,
-          0.2967,
-          0.2924,
-          0.2876,
-          0.2826,
-          0.2776,
-          0.2726,
-          0.2676,
-          0.2629,
-          0.2584,
-          0.254,
-          0.2499,
-          0.2459,
-          0.2422,
-          0.2386,
-          0.2351,
-          0.2317,
-          0.2284,
-          0.2252,
-          0.2221,
-          0.219,
-          0.2159,
-          0.2129,
-          0.2099,
-          0.2069,
-          0.2039,
-          0.201,
-          0.1981,
-          0.1952,
-          0.1924,
-          0.1896,
-          0.1868,
-          0.1841,
-          0.1814,
-          0.1788,
-          0.1763,
-          0.1737,
-          0.1713,
-          0.1689,
-          0.1665,
-          0.1642,
-          0.1619,
-          0.1597,
-          0.1576,
-          0.1554,
-          0.1534,
-          0.1513,
-          0.1494,
-          0.1474,
-          0.1455,
-          0.1436,
-          0.1418,
-          0.1399,
-          0.1364,
-          0.1296,
-          0.1233,
-          0.1173,
-          0.1117,
-          0.1064,
-          0.1015,
-          0.09691,
-          0.09263,
-          0.08862,
-          0.07958,
-          0.07172,
-          0.06487,
-          0.05891,
-          0.05459,
-          0.0537,
-          0.04912,
-          0.04505,
-          0.04143,
-          0.03821,
-          0.03799,
-          0.03533,
-          0.03274,
-          0.03041,
-          0.0283,
-          0.02688,
-          0.02638
-        ],
-        "cs2": [
-          0.2881,
-          0.2967,
-          0.302,
-          0.3052,
-          0.3066,
-          0.3064,
-          0.3047,
-          0.3019,
-          0.2982,
-          0.2938,
-          0.289,
-          0.284,
-          0.2789,
-          0.2739,
-          0.2689,
-          0.2642,
-          0.2596,
-          0.2552,
-          0.2511,
-          0.2471,
-          0.2433,
-          0.2397,
-          0.2361,
-          0.2328,
-          0.2295,
-          0.2262,
-          0.2231,
-          0.2199,
-          0.2168,
-          0.2138,
-          0.2108,
-          0.2078,
-          0.2048,
-          0.2019,
-          0.1989,
-          0.1961,
-          0.1932,
-          0.1904,
-          0.1876,
-          0.1849,
-          0.1822,
-          0.1796,
-          0.177,
-          0.1745,
-          0.172,
-          0.1696,
-          0.1672,
-          0.1649,
-          0.1626,
-          0.1604,
-          0.1582,
-          0.1561,
-          0.154,
-          0.152,
-          0.15,
-          0.148,
-          0.1461,
-          0.1442,
-          0.1424,
-          0.1405,
-          0.137,
-          0.1302,
-          0.1238,
-          0.1178,
-          0.1121,
-          0.1068,
-          0.1019,
-          0.0973,
-          0.09299,
-          0.08896,
-          0.07987,
-          0.07198,
-          0.0651,
-          0.05912,
-          0.05479,
-          0.0539,
-          0.0493,
-          0.04521,
-          0.04158,
-          0.03833,
-          0.03811,
-          0.03544,
-          0.03284,
-          0.0305,
-          0.02838,
-          0.02695,
-          0.02646
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          405.0,
-          410.0,
-          415.0,
-          420.0,
-          425.0,
-          430.0,
-          435.0,
-          440.0,
-          445.0,
-          450.0,
-          455.0,
-          460.0,
-          465.0,
-          470.0,
-          475.0,
-          480.0,
-          485.0,
-          490.0,
-          495.0,
-          500.0,
-          505.0,
-          510.0,
-          515.0,
-          520.0,
-          525.0,
-          530.0,
-          535.0,
-          540.0,
-          545.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.25649999999999995,
-          1.4849999999999999,
-          1.5909999999999997,
-          1.31,
-          1.1516666666666666,
-          1.068,
-          1.02,
-          0.9883333333333333,
-          0.9636666666666667,
-          0.9406666666666667,
-          0.9173333333333332,
-          0.8929999999999999,
-          0.8673333333333333,
-          0.8413333333333333,
-          0.815,
-          0.7889999999999999,
-          0.7633333333333333,
-          0.739,
-          0.7156666666666666,
-          0.6933333333333334,
-          0.6723333333333332,
-          0.6523333333333333,
-          0.6333333333333333,
-          0.6153333333333333,
-          0.598,
-          0.5813333333333333,
-          0.5653333333333332,
-          0.5499999999999999,
-          0.5349999999999999,
-          0.5203333333333333,
-          0.5063333333333333,
-          0.49233333333333335,
-          0.479,
-          0.4656666666666667,
-          0.45299999999999996,
-          0.44066666666666665,
-          0.42866666666666664,
-          0.41666666666666663,
-          0.4053333333333333,
-          0.3943333333333333,
-          0.38366666666666666,
-          0.37333333333333335,
-          0.36333333333333334,
-          0.35366666666666663,
-          0.3446666666666667,
-          0.3356666666666666,
-          0.32686666666666664,
-          0.3185,
-          0.31043333333333334,
-          0.3026,
-          0.29506666666666664,
-          0.2877666666666666,
-          0.28069999999999995,
-          0.27386666666666665,
-          0.2672333333333333,
-          0.2608333333333333,
-          0.2546,
-          0.24856666666666666,
-          0.2427333333333333,
-          0.23703333333333332,
-          0.22093333333333331,
-          0.20153333333333334,
-          0.18419999999999997,
-          0.16876666666666665,
-          0.155,
-          0.1427,
-          0.13169999999999998,
-          0.12179999999999999,
-          0.11286666666666667,
-          0.10476666666666667,
-          0.09736666666666667,
-          0.09063333333333332,
-          0.08443333333333333,
-          0.07116666666666666,
-          0.06046666666666667,
-          0.0518,
-          0.04466666666666667,
-          0.039766666666666665,
-          0.038766666666666665,
-          0.03386666666666666,
-          0.029756666666666667,
-          0.026266666666666664,
-          0.023276666666666668,
-          0.023079999999999996,
-          0.020696666666666665,
-          0.018453333333333332,
-          0.016506666666666666,
-          0.014809999999999999,
-          0.01371,
-          0.013333333333333332
-        ],
-        "cs1": [
-          0.25676666666666664,
-          1.486,
-          1.5909999999999997,
-          1.3096666666666665,
-          1.1506666666666665,
-          1.0673333333333332,
-          1.0193333333333332,
-          0.9876666666666667,
-          0.9629999999999999,
-          0.94,
-          0.9169999999999999,
-          0.8926666666666666,
-          0.8676666666666667,
-          0.8413333333333333,
-          0.8153333333333334,
-          0.7893333333333332,
-          0.7639999999999999,
-          0.7396666666666666,
-          0.7163333333333333,
-          0.694,
-          0.673,
-          0.653,
-          0.6339999999999999,
-          0.6156666666666666,
-          0.5983333333333333,
-          0.5816666666666667,
-          0.5656666666666667,
-          0.5499999999999999,
-          0.5349999999999999,
-          0.5203333333333333,
-          0.506,
-          0.49233333333333335,
-          0.47866666666666663,
-          0.4656666666666667,
-          0.45266666666666666,
-          0.4403333333333333,
-          0.4283333333333333,
-          0.41633333333333333,
-          0.405,
-          0.39399999999999996,
-          0.3833333333333333,
-          0.373,
-          0.363,
-          0.35333333333333333,
-          0.344,
-          0.3353333333333333,
-          0.32653333333333334,
-          0.31816666666666665,
-          0.3101333333333333,
-          0.30233333333333334,
-          0.2948333333333333,
-          0.28756666666666664,
-          0.2805333333333333,
-          0.27373333333333333,
-          0.26713333333333333,
-          0.26076666666666665,
-          0.25456666666666666,
-          0.24856666666666666,
-          0.2427333333333333,
-          0.23706666666666668,
-          0.22103333333333333,
-          0.2017,
-          0.1844,
-          0.16893333333333332,
-          0.15513333333333332,
-          0.14279999999999998,
-          0.1317333333333333,
-          0.12179999999999999,
-          0.11279999999999998,
-          0.10466666666666666,
-          0.09723333333333334,
-          0.0905,
-          0.08433333333333333,
-          0.0711,
-          0.0605,
-          0.05186666666666666,
-          0.04476666666666666,
-          0.03983333333333333,
-          0.03883333333333333,
-          0.0339,
-          0.029743333333333333,
-          0.026223333333333335,
-          0.023219999999999998,
-          0.023023333333333333,
-          0.020643333333333333,
-          0.018423333333333333,
-          0.016496666666666666,
-          0.014823333333333334,
-          0.013736666666666664,
-          0.013363333333333333
-        ],
-        "cs2": [
-          0.25649999999999995,
-          1.486333333333333,
-          1.5913333333333333,
-          1.3096666666666665,
-          1.1509999999999998,
-          1.0673333333333332,
-          1.0193333333333332,
-          0.988,
-          0.9629999999999999,
-          0.9403333333333334,
-          0.9173333333333332,
-          0.8929999999999999,
-          0.8676666666666667,
-          0.8416666666666666,
-          0.8156666666666667,
-          0.7896666666666667,
-          0.7643333333333333,
-          0.7396666666666666,
-          0.7163333333333333,
-          0.6943333333333334,
-          0.6733333333333333,
-          0.6533333333333333,
-          0.6339999999999999,
-          0.616,
-          0.5986666666666667,
-          0.582,
-          0.566,
-          0.5503333333333333,
-          0.5353333333333333,
-          0.5206666666666666,
-          0.5063333333333333,
-          0.49233333333333335,
-          0.479,
-          0.4656666666666667,
-          0.45299999999999996,
-          0.4403333333333333,
-          0.4283333333333333,
-          0.41666666666666663,
-          0.4053333333333333,
-          0.39399999999999996,
-          0.3833333333333333,
-          0.37333333333333335,
-          0.36333333333333334,
-          0.35366666666666663,
-          0.34433333333333327,
-          0.3353333333333333,
-          0.3267,
-          0.3183333333333333,
-          0.31029999999999996,
-          0.3025,
-          0.295,
-          0.2877333333333333,
-          0.28069999999999995,
-          0.2739,
-          0.2673,
-          0.26089999999999997,
-          0.2547,
-          0.24869999999999998,
-          0.24286666666666668,
-          0.2372,
-          0.22116666666666665,
-          0.2018,
-          0.1845,
-          0.1690333333333333,
-          0.1552,
-          0.14286666666666664,
-          0.13179999999999997,
-          0.12183333333333332,
-          0.11283333333333334,
-          0.10469999999999999,
-          0.0973,
-          0.09053333333333333,
-          0.08436666666666666,
-          0.07113333333333333,
-          0.0605,
-          0.05186666666666666,
-          0.04476666666666666,
-          0.03983333333333333,
-          0.03886666666666666,
-          0.0339,
-          0.029746666666666664,
-          0.026223333333333335,
-          0.023223333333333332,
-          0.023023333333333333,
-          0.020646666666666667,
-          0.018426666666666668,
-          0.0165,
-          0.014826666666666665,
-          0.013736666666666664,
-          0.013366666666666666
-        ],
-        "beta0": [
-          0.2393,
-          0.5806,
-          0.5954,
-          0.6346,
-          0.6913,
-          0.7525,
-          0.8124,
-          0.8685,
-          0.9203,
-          0.9675,
-          1.01,
-          1.049,
-          1.084,
-          1.116,
-          1.145,
-          1.171,
-          1.195,
-          1.216,
-          1.236,
-          1.254,
-          1.27,
-          1.285,
-          1.299,
-          1.312,
-          1.324,
-          1.335,
-          1.345,
-          1.354,
-          1.363,
-          1.371,
-          1.379,
-          1.386,
-          1.392,
-          1.399,
-          1.404,
-          1.41,
-          1.415,
-          1.42,
-          1.424,
-          1.428,
-          1.432,
-          1.436,
-          1.439,
-          1.442,
-          1.445,
-          1.448,
-          1.451,
-          1.453,
-          1.455,
-          1.457,
-          1.459,
-          1.461,
-          1.462,
-          1.463,
-          1.465,
-          1.466,
-          1.467,
-          1.468,
-          1.469,
-          1.47,
-          1.471,
-          1.473,
-          1.473,
-          1.473,
-          1.472,
-          1.47,
-          1.467,
-          1.465,
-          1.461,
-          1.458,
-          1.454,
-          1.45,
-          1.446,
-          1.434,
-          1.421,
-          1.407,
-          1.393,
-          1.381,
-          1.378,
-          1.364,
-          1.35,
-          1.336,
-          1.322,
-          1.321,
-          1.308,
-          1.294,
-          1.28,
-          1.267,
-          1.256,
-          1.253
-        ],
-        "beta1": [
-          0.2414,
-          0.5817,
-          0.5962,
-          0.6351,
-          0.6916,
-          0.7527,
-          0.8124,
-          0.8685,
-          0.9202,
-          0.9675,
-          1.01,
-          1.049,
-          1.084,
-          1.116,
-          1.145,
-          1.171,
-          1.195,
-          1.217,
-          1.236,
-          1.254,
-          1.271,
-          1.286,
-          1.299,
-          1.312,
-          1.324,
-          1.335,
-          1.345,
-          1.354,
-          1.363,
-          1.371,
-          1.379,
-          1.386,
-          1.392,
-          1.398,
-          1.404,
-          1.41,
-          1.415,
-          1.419,
-          1.424,
-          1.428,
-          1.432,
-          1.435,
-          1.439,
-          1.442,
-          1.445,
-          1.448,
-          1.45,
-          1.452,
-          1.455,
-          1.457,
-          1.458,
-          1.46,
-          1.462,
-          1.463,
-          1.464,
-          1.466,
-          1.467,
-          1.468,
-          1.469,
-          1.47,
-          1.472,
-          1.473,
-          1.474,
-          1.473,
-          1.472,
-          1.47,
-          1.468,
-          1.465,
-          1.462,
-          1.458,
-          1.454,
-          1.45,
-          1.445,
-          1.433,
-          1.421,
-          1.407,
-          1.393,
-          1.382,
-          1.379,
-          1.365,
-          1.351,
-          1.336,
-          1.322,
-          1.321,
-          1.308,
-          1.294,
-          1.28,
-          1.266,
-          1.256,
-          1.252
-        ],
-        "beta2": [
-          0.2456,
-          0.5842,
-          0.5986,
-          0.6372,
-          0.6934,
-          0.7541,
-          0.8135,
-          0.8693,
-          0.9208,
-          0.9678,
-          1.01,
-          1.049,
-          1.084,
-          1.116,
-          1.145,
-          1.171,
-          1.194,
-          1.216,
-          1.235,
-          1.253,
-          1.27,
-          1.284,
-          1.298,
-          1.311,
-          1.323,
-          1.333,
-          1.343,
-          1.353,
-          1.361,
-          1.37,
-          1.377,
-          1.384,
-          1.391,
-          1.397,
-          1.403,
-          1.408,
-          1.413,
-          1.418,
-          1.422,
-          1.426,
-          1.43,
-          1.434,
-          1.437,
-          1.44,
-          1.443,
-          1.446,
-          1.449,
-          1.451,
-          1.453,
-          1.455,
-          1.457,
-          1.459,
-          1.46,
-          1.462,
-          1.463,
-          1.464,
-          1.465,
-          1.466,
-          1.467,
-          1.468,
-          1.47,
-          1.472,
-          1.472,
-          1.472,
-          1.471,
-          1.469,
-          1.467,
-          1.464,
-          1.46,
-          1.457,
-          1.453,
-          1.449,
-          1.444,
-          1.433,
-          1.42,
-          1.406,
-          1.392,
-          1.381,
-          1.378,
-          1.364,
-          1.35,
-          1.336,
-          1.321,
-          1.32,
-          1.307,
-          1.293,
-          1.279,
-          1.266,
-          1.256,
-          1.252
-        ]
-      },
-      {
-        "photon_energy": [
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          405.0,
-          410.0,
-          415.0,
-          420.0,
-          425.0,
-          430.0,
-          435.0,
-          440.0,
-          445.0,
-          450.0,
-          455.0,
-          460.0,
-          465.0,
-          470.0,
-          475.0,
-          480.0,
-          485.0,
-          490.0,
-          495.0,
-          500.0,
-          505.0,
-          510.0,
-          515.0,
-          520.0,
-          525.0,
-          530.0,
-          535.0,
-          540.0,
-          545.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.5129999999999999,
-          2.9699999999999998,
-          3.1819999999999995,
-          2.62,
-          2.3033333333333332,
-          2.136,
-          2.04,
-          1.9766666666666666,
-          1.9273333333333333,
-          1.8813333333333333,
-          1.8346666666666664,
-          1.7859999999999998,
-          1.7346666666666666,
-          1.6826666666666665,
-          1.63,
-          1.5779999999999998,
-          1.5266666666666666,
-          1.478,
-          1.4313333333333331,
-          1.3866666666666667,
-          1.3446666666666665,
-          1.3046666666666666,
-          1.2666666666666666,
-          1.2306666666666666,
-          1.196,
-          1.1626666666666665,
-          1.1306666666666665,
-          1.0999999999999999,
-          1.0699999999999998,
-          1.0406666666666666,
-          1.0126666666666666,
-          0.9846666666666667,
-          0.958,
-          0.9313333333333333,
-          0.9059999999999999,
-          0.8813333333333333,
-          0.8573333333333333,
-          0.8333333333333333,
-          0.8106666666666666,
-          0.7886666666666666,
-          0.7673333333333333,
-          0.7466666666666667,
-          0.7266666666666667,
-          0.7073333333333333,
-          0.6893333333333334,
-          0.6713333333333332,
-          0.6537333333333333,
-          0.637,
-          0.6208666666666667,
-          0.6052,
-          0.5901333333333333,
-          0.5755333333333332,
-          0.5613999999999999,
-          0.5477333333333333,
-          0.5344666666666666,
-          0.5216666666666666,
-          0.5092,
-          0.4971333333333333,
-          0.4854666666666666,
-          0.47406666666666664,
-          0.44186666666666663,
-          0.4030666666666667,
-          0.36839999999999995,
-          0.3375333333333333,
-          0.31,
-          0.2854,
-          0.26339999999999997,
-          0.24359999999999998,
-          0.22573333333333334,
-          0.20953333333333335,
-          0.19473333333333334,
-          0.18126666666666663,
-          0.16886666666666666,
-          0.1423333333333333,
-          0.12093333333333334,
-          0.1036,
-          0.08933333333333333,
-          0.07953333333333333,
-          0.07753333333333333,
-          0.06773333333333333,
-          0.059513333333333335,
-          0.05253333333333333,
-          0.046553333333333335,
-          0.04615999999999999,
-          0.04139333333333333,
-          0.036906666666666664,
-          0.03301333333333333,
-          0.029619999999999997,
-          0.02742,
-          0.026666666666666665
-        ],
-        "cs1": [
-          0.5135333333333333,
-          2.972,
-          3.1819999999999995,
-          2.619333333333333,
-          2.301333333333333,
-          2.1346666666666665,
-          2.0386666666666664,
-          1.9753333333333334,
-          1.9259999999999997,
-          1.88,
-          1.8339999999999999,
-          1.7853333333333332,
-          1.7353333333333334,
-          1.6826666666666665,
-          1.6306666666666667,
-          1.5786666666666664,
-          1.5279999999999998,
-          1.4793333333333332,
-          1.4326666666666665,
-          1.388,
-          1.346,
-          1.306,
-          1.2679999999999998,
-          1.2313333333333332,
-          1.1966666666666665,
-          1.1633333333333333,
-          1.1313333333333333,
-          1.0999999999999999,
-          1.0699999999999998,
-          1.0406666666666666,
-          1.012,
-          0.9846666666666667,
-          0.9573333333333333,
-          0.9313333333333333,
-          0.9053333333333333,
-          0.8806666666666666,
-          0.8566666666666666,
-          0.8326666666666667,
-          0.81,
-          0.7879999999999999,
-          0.7666666666666666,
-          0.746,
-          0.726,
-          0.7066666666666667,
-          0.688,
-          0.6706666666666666,
-          0.6530666666666667,
-          0.6363333333333333,
-          0.6202666666666666,
-          0.6046666666666667,
-          0.5896666666666666,
-          0.5751333333333333,
-          0.5610666666666666,
-          0.5474666666666667,
-          0.5342666666666667,
-          0.5215333333333333,
-          0.5091333333333333,
-          0.4971333333333333,
-          0.4854666666666666,
-          0.47413333333333335,
-          0.44206666666666666,
-          0.4034,
-          0.3688,
-          0.33786666666666665,
-          0.31026666666666664,
-          0.28559999999999997,
-          0.2634666666666666,
-          0.24359999999999998,
-          0.22559999999999997,
-          0.20933333333333332,
-          0.19446666666666668,
-          0.181,
-          0.16866666666666666,
-          0.1422,
-          0.121,
-          0.10373333333333332,
-          0.08953333333333333,
-          0.07966666666666666,
-          0.07766666666666666,
-          0.0678,
-          0.05948666666666667,
-          0.05244666666666667,
-          0.046439999999999995,
-          0.046046666666666666,
-          0.041286666666666666,
-          0.036846666666666666,
-          0.03299333333333333,
-          0.02964666666666667,
-          0.02747333333333333,
-          0.026726666666666666
-        ],
-        "cs2": [
-          0.5129999999999999,
-          2.972666666666666,
-          3.1826666666666665,
-          2.619333333333333,
-          2.3019999999999996,
-          2.1346666666666665,
-          2.0386666666666664,
-          1.976,
-          1.9259999999999997,
-          1.8806666666666667,
-          1.8346666666666664,
-          1.7859999999999998,
-          1.7353333333333334,
-          1.6833333333333331,
-          1.6313333333333333,
-          1.5793333333333335,
-          1.5286666666666666,
-          1.4793333333333332,
-          1.4326666666666665,
-          1.3886666666666667,
-          1.3466666666666667,
-          1.3066666666666666,
-          1.2679999999999998,
-          1.232,
-          1.1973333333333334,
-          1.164,
-          1.132,
-          1.1006666666666667,
-          1.0706666666666667,
-          1.0413333333333332,
-          1.0126666666666666,
-          0.9846666666666667,
-          0.958,
-          0.9313333333333333,
-          0.9059999999999999,
-          0.8806666666666666,
-          0.8566666666666666,
-          0.8333333333333333,
-          0.8106666666666666,
-          0.7879999999999999,
-          0.7666666666666666,
-          0.7466666666666667,
-          0.7266666666666667,
-          0.7073333333333333,
-          0.6886666666666665,
-          0.6706666666666666,
-          0.6534,
-          0.6366666666666666,
-          0.6205999999999999,
-          0.605,
-          0.59,
-          0.5754666666666666,
-          0.5613999999999999,
-          0.5478,
-          0.5346,
-          0.5217999999999999,
-          0.5094,
-          0.49739999999999995,
-          0.48573333333333335,
-          0.4744,
-          0.4423333333333333,
-          0.4036,
-          0.369,
-          0.3380666666666666,
-          0.3104,
-          0.2857333333333333,
-          0.26359999999999995,
-          0.24366666666666664,
-          0.22566666666666668,
-          0.20939999999999998,
-          0.1946,
-          0.18106666666666665,
-          0.16873333333333332,
-          0.14226666666666665,
-          0.121,
-          0.10373333333333332,
-          0.08953333333333333,
-          0.07966666666666666,
-          0.07773333333333332,
-          0.0678,
-          0.05949333333333333,
-          0.05244666666666667,
-          0.046446666666666664,
-          0.046046666666666666,
-          0.041293333333333335,
-          0.036853333333333335,
-          0.033,
-          0.02965333333333333,
-          0.02747333333333333,
-          0.02673333333333333
-        ],
-        "beta0": [
-          0.2393,
-          0.5806,
-          0.5954,
-          0.6346,
-          0.6913,
-          0.7525,
-          0.8124,
-          0.8685,
-          0.9203,
-          0.9675,
-          1.01,
-          1.049,
-          1.084,
-          1.116,
-          1.145,
-          1.171,
-          1.195,
-          1.216,
-          1.236,
-          1.254,
-          1.27,
-          1.285,
-          1.299,
-          1.312,
-          1.324,
-          1.335,
-          1.345,
-          1.354,
-          1.363,
-          1.371,
-          1.379,
-          1.386,
-          1.392,
-          1.399,
-          1.404,
-          1.41,
-          1.415,
-          1.42,
-          1.424,
-          1.428,
-          1.432,
-          1.436,
-          1.439,
-          1.442,
-          1.445,
-          1.448,
-          1.451,
-          1.453,
-          1.455,
-          1.457,
-          1.459,
-          1.461,
-          1.462,
-          1.463,
-          1.465,
-          1.466,
-          1.467,
-          1.468,
-          1.469,
-          1.47,
-          1.471,
-          1.473,
-          1.473,
-          1.473,
-          1.472,
-          1.47,
-          1.467,
-          1.465,
-          1.461,
-          1.458,
-          1.454,
-          1.45,
-          1.446,
-          1.434,
-          1.421,
-          1.407,
-          1.393,
-          1.381,
-          1.378,
-          1.364,
-          1.35,
-          1.336,
-          1.322,
-          1.321,
-          1.308,
-          1.294,
-          1.28,
-          1.267,
-          1.256,
-          1.253
-        ],
-        "beta1": [
-          0.2414,
-          0.5817,
-          0.5962,
-          0.6351,
-          0.6916,
-          0.7527,
-          0.8124,
-          0.8685,
-          0.9202,
-          0.9675,
-          1.01,
-          1.049,
-          1.084,
-          1.116,
-          1.145,
-          1.171,
-          1.195,
-          1.217,
-          1.236,
-          1.254,
-          1.271,
-          1.286,
-          1.299,
-          1.312,
-          1.324,
-          1.335,
-          1.345,
-          1.354,
-          1.363,
-          1.371,
-          1.379,
-          1.386,
-          1.392,
-          1.398,
-          1.404,
-          1.41,
-          1.415,
-          1.419,
-          1.424,
-          1.428,
-          1.432,
-          1.435,
-          1.439,
-          1.442,
-          1.445,
-          1.448,
-          1.45,
-          1.452,
-          1.455,
-          1.457,
-          1.458,
-          1.46,
-          1.462,
-          1.463,
-          1.464,
-          1.466,
-          1.467,
-          1.468,
-          1.469,
-          1.47,
-          1.472,
-          1.473,
-          1.474,
-          1.473,
-          1.472,
-          1.47,
-          1.468,
-          1.465,
-          1.462,
-          1.458,
-          1.454,
-          1.45,
-          1.445,
-          1.433,
-          1.421,
-          1.407,
-          1.393,
-          1.382,
-          1.379,
-          1.365,
-          1.351,
-          1.336,
-          1.322,
-          1.321,
-          1.308,
-          1.294,
-          1.28,
-          1.266,
-          1.256,
-          1.252
-        ],
-        "beta2": [
-          0.2456,
-          0.5842,
-          0.5986,
-          0.6372,
-          0.6934,
-          0.7541,
-          0.8135,
-          0.8693,
-          0.9208,
-          0.9678,
-          1.01,
-          1.049,
-          1.084,
-          1.116,
-          1.145,
-          1.171,
-          1.194,
-          1.216,
-          1.235,
-          1.253,
-          1.27,
-          1.284,
-          1.298,
-          1.311,
-          1.323,
-          1.333,
-          1.343,
-          1.353,
-          1.361,
-          1.37,
-          1.377,
-          1.384,
-          1.391,
-          1.397,
-          1.403,
-          1.408,
-          1.413,
-          1.418,
-          1.422,
-          1.426,
-          1.43,
-          1.434,
-          1.437,
-          1.44,
-          1.443,
-          1.446,
-          1.449,
-          1.451,
-          1.453,
-          1.455,
-          1.457,
-          1.459,
-          1.46,
-          1.462,
-          1.463,
-          1.464,
-          1.465,
-          1.466,
-          1.467,
-          1.468,
-          1.47,
-          1.472,
-          1.472,
-          1.472,
-          1.471,
-          1.469,
-          1.467,
-          1.464,
-          1.46,
-          1.457,
-          1.453,
-          1.449,
-          1.444,
-          1.433,
-          1.42,
-          1.406,
-          1.392,
-          1.381,
-          1.378,
-          1.364,
-          1.35,
-          1.336,
-          1.321,
-          1.32,
-          1.307,
-          1.293,
-          1.279,
-          1.266,
-          1.256,
-          1.252
-        ]
-      },
-      {
-        "photon_energy": [
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.1293,
-          0.243,
-          0.3248,
-          0.3353,
-          0.3785,
-          0.4092,
-          0.422,
-          0.422,
-          0.4139,
-          0.4012,
-          0.3861,
-          0.3698,
-          0.3528,
-          0.3354,
-          0.3182,
-          0.3013,
-          0.2851,
-          0.2699,
-          0.2558,
-          0.243,
-          0.2312,
-          0.2204,
-          0.2157,
-          0.2103,
-          0.2009,
-          0.1921,
-          0.1836,
-          0.1813,
-          0.1755,
-          0.1679,
-          0.1606,
-          0.1538,
-          0.1474,
-          0.1414,
-          0.1358,
-          0.1307,
-          0.1258,
-          0.1213,
-          0.117,
-          0.1129,
-          0.1089,
-          0.1051,
-          0.1015,
-          0.09792,
-          0.09452,
-          0.09127,
-          0.08819,
-          0.08526,
-          0.08252,
-          0.07994,
-          0.07753,
-          0.07526,
-          0.07313,
-          0.07112,
-          0.06921,
-          0.06737,
-          0.0656,
-          0.06387,
-          0.06219,
-          0.06055,
-          0.05894,
-          0.05737,
-          0.05583,
-          0.05154,
-          0.04666,
-          0.04268,
-          0.03922,
-          0.03596,
-          0.03292,
-          0.03025,
-          0.02804,
-          0.02618,
-          0.02448,
-          0.02282,
-          0.02121,
-          0.01976,
-          0.01854,
-          0.01751,
-          0.0166,
-          0.0157,
-          0.0148,
-          0.01393,
-          0.01314,
-          0.01247,
-          0.01191,
-          0.01142,
-          0.01093,
-          0.009635,
-          0.008557,
-          0.007801,
-          0.007017,
-          0.006386,
-          0.006267,
-          0.005759,
-          0.005323,
-          0.004816,
-          0.004385,
-          0.004361,
-          0.004101,
-          0.00382,
-          0.003486,
-          0.00321,
-          0.00308,
-          0.00304
-        ],
-        "cs1": [
-          0.1283,
-          0.2433,
-          0.3263,
-          0.3366,
-          0.3787,
-          0.4079,
-          0.4204,
-          0.4212,
-          0.4143,
-          0.4022,
-          0.387,
-          0.3701,
-          0.3523,
-          0.3346,
-          0.3173,
-          0.3007,
-          0.285,
-          0.2702,
-          0.2565,
-          0.2436,
-          0.2317,
-          0.2206,
-          0.2157,
-          0.2102,
-          0.2005,
-          0.1914,
-          0.183,
-          0.1807,
-          0.175,
-          0.1676,
-          0.1606,
-          0.154,
-          0.1478,
-          0.142,
-          0.1364,
-          0.1312,
-          0.1262,
-          0.1215,
-          0.117,
-          0.1127,
-          0.1087,
-          0.1049,
-          0.1012,
-          0.09774,
-          0.09445,
-          0.09133,
-          0.08836,
-          0.08553,
-          0.08285,
-          0.08029,
-          0.07786,
-          0.07553,
-          0.07331,
-          0.07119,
-          0.06916,
-          0.06722,
-          0.06536,
-          0.06358,
-          0.06187,
-          0.06022,
-          0.05864,
-          0.05713,
-          0.05567,
-          0.05162,
-          0.04685,
-          0.04269,
-          0.03902,
-          0.03579,
-          0.03293,
-          0.03041,
-          0.02816,
-          0.02615,
-          0.02434,
-          0.02271,
-          0.02123,
-          0.0199,
-          0.01868,
-          0.01757,
-          0.01655,
-          0.01561,
-          0.01475,
-          0.01396,
-          0.01324,
-          0.01257,
-          0.01195,
-          0.01137,
-          0.01082,
-          0.009623,
-          0.008607,
-          0.007736,
-          0.006981,
-          0.006442,
-          0.006332,
-          0.005767,
-          0.005267,
-          0.004827,
-          0.004439,
-          0.004412,
-          0.004094,
-          0.003783,
-          0.003506,
-          0.003258,
-          0.003092,
-          0.003034
-        ],
-        "cs2": [
-          0.1386,
-          0.2553,
-          0.3379,
-          0.3482,
-          0.3895,
-          0.4178,
-          0.4294,
-          0.4295,
-          0.4217,
-          0.4088,
-          0.3929,
-          0.3753,
-          0.3571,
-          0.3389,
-          0.3213,
-          0.3044,
-          0.2884,
-          0.2734,
-          0.2593,
-          0.2463,
-          0.2341,
-          0.2228,
-          0.2178,
-          0.2123,
-          0.2024,
-          0.1933,
-          0.1847,
-          0.1824,
-          0.1767,
-          0.1692,
-          0.1621,
-          0.1554,
-          0.1491,
-          0.1432,
-          0.1376,
-          0.1323,
-          0.1272,
-          0.1224,
-          0.1179,
-          0.1136,
-          0.1095,
-          0.1057,
-          0.102,
-          0.09849,
-          0.09518,
-          0.09202,
-          0.08902,
-          0.08617,
-          0.08345,
-          0.08087,
-          0.0784,
-          0.07605,
-          0.07381,
-          0.07167,
-          0.06962,
-          0.06767,
-          0.06579,
-          0.064,
-          0.06228,
-          0.06063,
-          0.05904,
-          0.05751,
-          0.05605,
-          0.05196,
-          0.04715,
-          0.04295,
-          0.03926,
-          0.03601,
-          0.03314,
-          0.03059,
-          0.02832,
-          0.0263,
-          0.02448,
-          0.02284,
-          0.02135,
-          0.02001,
-          0.01878,
-          0.01766,
-          0.01663,
-          0.01569,
-          0.01483,
-          0.01403,
-          0.0133,
-          0.01262,
-          0.012,
-          0.01141,
-          0.01087,
-          0.009668,
-          0.008645,
-          0.007768,
-          0.007013,
-          0.006471,
-          0.006359,
-          0.005789,
-          0.005288,
-          0.004847,
-          0.004455,
-          0.004428,
-          0.004107,
-          0.003796,
-          0.003519,
-          0.003267,
-          0.0031,
-          0.003042
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          15.0,
-          20.0,
-          21.22,
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          5.573333333333332,
-          16.71,
-          12.669999999999998,
-          4.506666666666666,
-          2.6969999999999996,
-          1.1963333333333332,
-          0.422,
-          0.2522333333333333,
-          0.24466666666666664,
-          0.2424333333333333,
-          0.2746333333333333,
-          0.31116666666666665,
-          0.33999999999999997,
-          0.36,
-          0.3723333333333333,
-          0.3783333333333333,
-          0.3786666666666666,
-          0.37333333333333335,
-          0.36333333333333334,
-          0.3503333333333333,
-          0.33599999999999997,
-          0.32216666666666666,
-          0.3091,
-          0.2967666666666666,
-          0.28469999999999995,
-          0.2725333333333333,
-          0.2601,
-          0.25429999999999997,
-          0.24753333333333333,
-          0.23526666666666665,
-          0.2237,
-          0.21309999999999998,
-          0.2103,
-          0.20350000000000001,
-          0.1948,
-          0.18673333333333333,
-          0.179,
-          0.1714,
-          0.16383333333333333,
-          0.1563,
-          0.14889999999999998,
-          0.14186666666666664,
-          0.13526666666666665,
-          0.12926666666666664,
-          0.12386666666666665,
-          0.11896666666666667,
-          0.11446666666666666,
-          0.11026666666666665,
-          0.10619999999999999,
-          0.10219999999999999,
-          0.09819999999999998,
-          0.09426666666666667,
-          0.09036666666666666,
-          0.08663333333333334,
-          0.0831,
-          0.07983333333333333,
-          0.07683333333333334,
-          0.07416666666666666,
-          0.07173333333333333,
-          0.06946666666666666,
-          0.06736666666666666,
-          0.06536666666666666,
-          0.06333333333333332,
-          0.06133333333333333,
-          0.05926666666666667,
-          0.05516666666666667,
-          0.047766666666666666,
-          0.042499999999999996,
-          0.038266666666666664,
-          0.03383333333333333,
-          0.02973,
-          0.026776666666666664,
-          0.024586666666666666,
-          0.022296666666666666,
-          0.01986333333333333,
-          0.01786,
-          0.016493333333333332,
-          0.015369999999999998,
-          0.014076666666666664,
-          0.012693333333333334,
-          0.011556666666666666,
-          0.010796666666666666,
-          0.010199999999999999,
-          0.00951,
-          0.008693333333333332,
-          0.007946666666666666,
-          0.007416666666666666,
-          0.007063333333333333,
-          0.006716666666666667,
-          0.006266666666666667,
-          0.0051266666666666665,
-          0.004606666666666667,
-          0.003836666666666666,
-          0.0033399999999999997,
-          0.003112,
-          0.003031333333333333,
-          0.0025069999999999997,
-          0.0022956666666666663,
-          0.0020816666666666666,
-          0.0017356666666666666,
-          0.0017193333333333333,
-          0.001626,
-          0.0014946666666666667,
-          0.001253,
-          0.0011743333333333332,
-          0.001145,
-          0.0011149999999999999
-        ],
-        "cs1": [
-          5.566666666666666,
-          16.733333333333334,
-          12.673333333333334,
-          4.496666666666666,
-          2.692333333333333,
-          1.1993333333333331,
-          0.4243333333333333,
-          0.25253333333333333,
-          0.24480000000000002,
-          0.2419,
-          0.2731,
-          0.3096333333333333,
-          0.33999999999999997,
-          0.36166666666666664,
-          0.374,
-          0.3786666666666666,
-          0.3773333333333333,
-          0.371,
-          0.36166666666666664,
-          0.35,
-          0.3373333333333333,
-          0.3240333333333333,
-          0.3105,
-          0.297,
-          0.2838,
-          0.2709333333333333,
-          0.2585666666666666,
-          0.25306666666666666,
-          0.2467333333333333,
-          0.23546666666666666,
-          0.22473333333333334,
-          0.21456666666666668,
-          0.2118,
-          0.20486666666666667,
-          0.19563333333333333,
-          0.1868,
-          0.1784,
-          0.17043333333333333,
-          0.1628,
-          0.1556,
-          0.14876666666666666,
-          0.14226666666666665,
-          0.13616666666666666,
-          0.13036666666666666,
-          0.12486666666666665,
-          0.11966666666666666,
-          0.11473333333333333,
-          0.11006666666666666,
-          0.10563333333333333,
-          0.1014,
-          0.09743333333333333,
-          0.09363333333333332,
-          0.09006666666666666,
-          0.08666666666666667,
-          0.08346666666666666,
-          0.08043333333333333,
-          0.07753333333333333,
-          0.07476666666666666,
-          0.07216666666666666,
-          0.06963333333333332,
-          0.06723333333333333,
-          0.06496666666666666,
-          0.06276666666666667,
-          0.06066666666666666,
-          0.05863333333333333,
-          0.05486666666666666,
-          0.04823333333333333,
-          0.042633333333333336,
-          0.0378,
-          0.033633333333333335,
-          0.03008,
-          0.027023333333333333,
-          0.02435333333333333,
-          0.022013333333333333,
-          0.019963333333333333,
-          0.018173333333333333,
-          0.01659,
-          0.015173333333333332,
-          0.013906666666666666,
-          0.01278,
-          0.011783333333333333,
-          0.010886666666666666,
-          0.010073333333333333,
-          0.009336666666666667,
-          0.008673333333333333,
-          0.008073333333333332,
-          0.007529999999999999,
-          0.00703,
-          0.0065699999999999995,
-          0.006146666666666667,
-          0.0052366666666666655,
-          0.004496666666666666,
-          0.0038799999999999998,
-          0.0033766666666666667,
-          0.003020333333333333,
-          0.002948333333333333,
-          0.00259,
-          0.002288333333333333,
-          0.002026333333333333,
-          0.0018046666666666667,
-          0.0017903333333333332,
-          0.0016150000000000001,
-          0.0014466666666666666,
-          0.001302,
-          0.0011766666666666666,
-          0.0010923333333333332,
-          0.0010633333333333332
-        ],
-        "cs2": [
-          5.51,
-          16.673333333333332,
-          12.62,
-          4.466666666666667,
-          2.6696666666666666,
-          1.184,
-          0.41500000000000004,
-          0.2467333333333333,
-          0.23939999999999997,
-          0.23823333333333332,
-          0.2708,
-          0.3083,
-          0.3393333333333333,
-          0.36133333333333334,
-          0.374,
-          0.3786666666666666,
-          0.3773333333333333,
-          0.37133333333333335,
-          0.362,
-          0.3506666666666667,
-          0.33799999999999997,
-          0.3245,
-          0.3108666666666666,
-          0.29736666666666667,
-          0.28413333333333335,
-          0.2713333333333333,
-          0.259,
-          0.25349999999999995,
-          0.2472,
-          0.23593333333333333,
-          0.22516666666666665,
-          0.21493333333333334,
-          0.2121333333333333,
-          0.20516666666666666,
-          0.19586666666666666,
-          0.18703333333333333,
-          0.17863333333333334,
-          0.17066666666666666,
-          0.16306666666666667,
-          0.15586666666666665,
-          0.149,
-          0.14253333333333332,
-          0.13636666666666666,
-          0.13053333333333333,
-          0.12503333333333333,
-          0.11979999999999999,
-          0.11483333333333332,
-          0.11016666666666666,
-          0.10573333333333332,
-          0.10153333333333332,
-          0.09753333333333333,
-          0.09376666666666666,
-          0.0902,
-          0.0868,
-          0.08360000000000001,
-          0.08053333333333333,
-          0.07763333333333333,
-          0.07486666666666666,
-          0.07219999999999999,
-          0.0697,
-          0.0673,
-          0.065,
-          0.06283333333333332,
-          0.060733333333333334,
-          0.0587,
-          0.054966666666666664,
-          0.048299999999999996,
-          0.042666666666666665,
-          0.03783333333333333,
-          0.033699999999999994,
-          0.030123333333333335,
-          0.02704333333333333,
-          0.024373333333333334,
-          0.022039999999999997,
-          0.01999333333333333,
-          0.018189999999999998,
-          0.016596666666666666,
-          0.015179999999999999,
-          0.013919999999999998,
-          0.012793333333333332,
-          0.011789999999999998,
-          0.010886666666666666,
-          0.010073333333333333,
-          0.009343333333333332,
-          0.00868,
-          0.00808,
-          0.007529999999999999,
-          0.00703,
-          0.0065699999999999995,
-          0.00615,
-          0.00524,
-          0.004496666666666666,
-          0.0038833333333333333,
-          0.0033766666666666667,
-          0.0030216666666666664,
-          0.002950333333333333,
-          0.002591333333333333,
-          0.002287,
-          0.0020273333333333332,
-          0.0018046666666666667,
-          0.00179,
-          0.0016133333333333332,
-          0.001447,
-          0.001302,
-          0.0011749999999999998,
-          0.0010916666666666666,
-          0.0010633333333333332
-        ],
-        "beta0": [
-          1.948,
-          1.42,
-          1.542,
-          1.784,
-          1.829,
-          1.755,
-          1.05,
-          0.03177,
-          -0.06933,
-          -0.2104,
-          0.04932,
-          0.3569,
-          0.6035,
-          0.7903,
-          0.9334,
-          1.046,
-          1.135,
-          1.208,
-          1.266,
-          1.315,
-          1.356,
-          1.391,
-          1.421,
-          1.447,
-          1.469,
-          1.488,
-          1.504,
-          1.51,
-          1.518,
-          1.53,
-          1.541,
-          1.551,
-          1.554,
-          1.561,
-          1.57,
-          1.578,
-          1.585,
-          1.591,
-          1.595,
-          1.599,
-          1.602,
-          1.604,
-          1.607,
-          1.609,
-          1.612,
-          1.615,
-          1.618,
-          1.621,
-          1.623,
-          1.625,
-          1.626,
-          1.625,
-          1.625,
-          1.623,
-          1.622,
-          1.621,
-          1.621,
-          1.621,
-          1.621,
-          1.622,
-          1.623,
-          1.624,
-          1.624,
-          1.624,
-          1.623,
-          1.62,
-          1.609,
-          1.605,
-          1.605,
-          1.598,
-          1.583,
-          1.574,
-          1.572,
-          1.568,
-          1.555,
-          1.54,
-          1.531,
-          1.53,
-          1.526,
-          1.513,
-          1.498,
-          1.488,
-          1.485,
-          1.484,
-          1.475,
-          1.461,
-          1.447,
-          1.441,
-          1.44,
-          1.438,
-          1.407,
-          1.395,
-          1.381,
-          1.349,
-          1.347,
-          1.346,
-          1.324,
-          1.298,
-          1.297,
-          1.275,
-          1.272,
-          1.252,
-          1.25,
-          1.231,
-          1.208,
-          1.205,
-          1.204
-        ],
-        "beta1": [
-          1.948,
-          1.42,
-          1.542,
-          1.783,
-          1.829,
-          1.755,
-          1.051,
-          0.02726,
-          -0.07364,
-          -0.2104,
-          0.04945,
-          0.3546,
-          0.6013,
-          0.7897,
-          0.9341,
-          1.047,
-          1.136,
-          1.208,
-          1.267,
-          1.315,
-          1.356,
-          1.391,
-          1.42,
-          1.446,
-          1.468,
-          1.487,
-          1.504,
-          1.51,
-          1.518,
-          1.531,
-          1.543,
-          1.553,
-          1.555,
-          1.562,
-          1.57,
-          1.577,
-          1.583,
-          1.589,
-          1.594,
-          1.598,
-          1.602,
-          1.606,
-          1.609,
-          1.612,
-          1.615,
-          1.617,
-          1.618,
-          1.62,
-          1.621,
-          1.622,
-          1.623,
-          1.623,
-          1.624,
-          1.624,
-          1.624,
-          1.624,
-          1.624,
-          1.624,
-          1.624,
-          1.623,
-          1.623,
-          1.622,
-          1.621,
-          1.62,
-          1.619,
-          1.617,
-          1.612,
-          1.607,
-          1.601,
-          1.594,
-          1.586,
-          1.579,
-          1.571,
-          1.562,
-          1.554,
-          1.545,
-          1.537,
-          1.529,
-          1.52,
-          1.511,
-          1.503,
-          1.495,
-          1.487,
-          1.478,
-          1.47,
-          1.462,
-          1.454,
-          1.446,
-          1.439,
-          1.431,
-          1.412,
-          1.394,
-          1.375,
-          1.357,
-          1.343,
-          1.34,
-          1.323,
-          1.307,
-          1.29,
-          1.275,
-          1.273,
-          1.259,
-          1.244,
-          1.23,
-          1.215,
-          1.205,
-          1.202
-        ],
-        "beta2": [
-          1.941,
-          1.415,
-          1.535,
-          1.776,
-          1.824,
-          1.756,
-          1.055,
-          0.02178,
-          -0.07921,
-          -0.2104,
-          0.05498,
-          0.361,
-          0.6068,
-          0.7938,
-          0.9369,
-          1.048,
-          1.137,
-          1.208,
-          1.266,
-          1.315,
-          1.355,
-          1.39,
-          1.419,
-          1.444,
-          1.466,
-          1.485,
-          1.502,
-          1.508,
-          1.516,
-          1.529,
-          1.54,
-          1.55,
-          1.553,
-          1.559,
-          1.567,
-          1.575,
-          1.581,
-          1.587,
-          1.592,
-          1.596,
-          1.6,
-          1.604,
-          1.607,
-          1.61,
-          1.612,
-          1.614,
-          1.616,
-          1.617,
-          1.619,
-          1.62,
-          1.621,
-          1.621,
-          1.622,
-          1.622,
-          1.622,
-          1.622,
-          1.622,
-          1.622,
-          1.621,
-          1.621,
-          1.62,
-          1.62,
-          1.619,
-          1.618,
-          1.617,
-          1.615,
-          1.611,
-          1.605,
-          1.599,
-          1.592,
-          1.585,
-          1.577,
-          1.569,
-          1.561,
-          1.553,
-          1.544,
-          1.536,
-          1.527,
-          1.519,
-          1.51,
-          1.502,
-          1.494,
-          1.486,
-          1.477,
-          1.469,
-          1.461,
-          1.453,
-          1.445,
-          1.438,
-          1.43,
-          1.411,
-          1.393,
-          1.375,
-          1.357,
-          1.343,
-          1.34,
-          1.323,
-          1.306,
-          1.29,
-          1.274,
-          1.273,
-          1.259,
-          1.244,
-          1.229,
-          1.215,
-          1.205,
-          1.201
-        ]
-      },
-      {
-        "photon_energy": [
-          15.0,
-          20.0,
-          21.22,
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          11.146666666666665,
-          33.42,
-          25.339999999999996,
-          9.013333333333332,
-          5.393999999999999,
-          2.3926666666666665,
-          0.844,
-          0.5044666666666666,
-          0.4893333333333333,
-          0.4848666666666666,
-          0.5492666666666666,
-          0.6223333333333333,
-          0.6799999999999999,
-          0.72,
-          0.7446666666666666,
-          0.7566666666666666,
-          0.7573333333333332,
-          0.7466666666666667,
-          0.7266666666666667,
-          0.7006666666666665,
-          0.6719999999999999,
-          0.6443333333333333,
-          0.6182,
-          0.5935333333333332,
-          0.5693999999999999,
-          0.5450666666666666,
-          0.5202,
-          0.5085999999999999,
-          0.49506666666666665,
-          0.4705333333333333,
-          0.4474,
-          0.42619999999999997,
-          0.4206,
-          0.40700000000000003,
-          0.3896,
-          0.37346666666666667,
-          0.358,
-          0.3428,
-          0.32766666666666666,
-          0.3126,
-          0.29779999999999995,
-          0.2837333333333333,
-          0.2705333333333333,
-          0.2585333333333333,
-          0.2477333333333333,
-          0.23793333333333333,
-          0.22893333333333332,
-          0.2205333333333333,
-          0.21239999999999998,
-          0.20439999999999997,
-          0.19639999999999996,
-          0.18853333333333333,
-          0.18073333333333333,
-          0.17326666666666668,
-          0.1662,
-          0.15966666666666665,
-          0.15366666666666667,
-          0.14833333333333332,
-          0.14346666666666666,
-          0.13893333333333333,
-          0.13473333333333332,
-          0.1307333333333333,
-          0.12666666666666665,
-          0.12266666666666666,
-          0.11853333333333334,
-          0.11033333333333334,
-          0.09553333333333333,
-          0.08499999999999999,
-          0.07653333333333333,
-          0.06766666666666667,
-          0.05946,
-          0.05355333333333333,
-          0.04917333333333333,
-          0.04459333333333333,
-          0.03972666666666666,
-          0.03572,
-          0.032986666666666664,
-          0.030739999999999996,
-          0.02815333333333333,
-          0.02538666666666667,
-          0.023113333333333333,
-          0.021593333333333332,
-          0.020399999999999998,
-          0.01902,
-          0.017386666666666665,
-          0.015893333333333332,
-          0.014833333333333332,
-          0.014126666666666666,
-          0.013433333333333334,
-          0.012533333333333334,
-          0.010253333333333333,
-          0.009213333333333334,
-          0.007673333333333332,
-          0.006679999999999999,
-          0.006224,
-          0.006062666666666666,
-          0.005013999999999999,
-          0.004591333333333333,
-          0.004163333333333333,
-          0.003471333333333333,
-          0.0034386666666666667,
-          0.003252,
-          0.0029893333333333334,
-          0.002506,
-          0.0023486666666666664,
-          0.00229,
-          0.0022299999999999998
-        ],
-        "cs1": [
-          11.133333333333333,
-          33.46666666666667,
-          25.346666666666668,
-          8.993333333333332,
-          5.384666666666666,
-          2.3986666666666663,
-          0.8486666666666666,
-          0.5050666666666667,
-          0.48960000000000004,
-          0.4838,
-          0.5462,
-          0.6192666666666666,
-          0.6799999999999999,
-          0.7233333333333333,
-          0.748,
-          0.7573333333333332,
-          0.7546666666666666,
-          0.742,
-          0.7233333333333333,
-          0.7,
-          0.6746666666666666,
-          0.6480666666666666,
-          0.621,
-          0.594,
-          0.5676,
-          0.5418666666666666,
-          0.5171333333333332,
-          0.5061333333333333,
-          0.4934666666666666,
-          0.4709333333333333,
-          0.4494666666666667,
-          0.42913333333333337,
-          0.4236,
-          0.40973333333333334,
-          0.39126666666666665,
-          0.3736,
-          0.3568,
-          0.34086666666666665,
-          0.3256,
-          0.3112,
-          0.2975333333333333,
-          0.2845333333333333,
-          0.2723333333333333,
-          0.2607333333333333,
-          0.2497333333333333,
-          0.23933333333333331,
-          0.22946666666666665,
-          0.22013333333333332,
-          0.21126666666666666,
-          0.2028,
-          0.19486666666666666,
-          0.18726666666666664,
-          0.1801333333333333,
-          0.17333333333333334,
-          0.16693333333333332,
-          0.16086666666666666,
-          0.15506666666666666,
-          0.14953333333333332,
-          0.1443333333333333,
-          0.13926666666666665,
-          0.13446666666666665,
-          0.12993333333333332,
-          0.12553333333333333,
-          0.12133333333333332,
-          0.11726666666666666,
-          0.10973333333333332,
-          0.09646666666666666,
-          0.08526666666666667,
-          0.0756,
-          0.06726666666666667,
-          0.06016,
-          0.054046666666666666,
-          0.04870666666666666,
-          0.044026666666666665,
-          0.039926666666666666,
-          0.036346666666666666,
-          0.03318,
-          0.030346666666666664,
-          0.027813333333333332,
-          0.02556,
-          0.023566666666666666,
-          0.021773333333333332,
-          0.020146666666666667,
-          0.018673333333333333,
-          0.017346666666666666,
-          0.016146666666666663,
-          0.015059999999999999,
-          0.01406,
-          0.013139999999999999,
-          0.012293333333333333,
-          0.010473333333333331,
-          0.008993333333333332,
-          0.0077599999999999995,
-          0.006753333333333333,
-          0.006040666666666666,
-          0.005896666666666666,
-          0.00518,
-          0.004576666666666666,
-          0.004052666666666666,
-          0.0036093333333333333,
-          0.0035806666666666665,
-          0.0032300000000000002,
-          0.0028933333333333333,
-          0.002604,
-          0.002353333333333333,
-          0.0021846666666666664,
-          0.0021266666666666665
-        ],
-        "cs2": [
-          11.02,
-          33.346666666666664,
-          25.24,
-          8.933333333333334,
-          5.339333333333333,
-          2.368,
-          0.8300000000000001,
-          0.4934666666666666,
-          0.47879999999999995,
-          0.47646666666666665,
-          0.5416,
-          0.6166,
-          0.6786666666666666,
-          0.7226666666666667,
-          0.748,
-          0.7573333333333332,
-          0.7546666666666666,
-          0.7426666666666667,
-          0.724,
-          0.7013333333333334,
-          0.6759999999999999,
-          0.649,
-          0.6217333333333332,
-          0.5947333333333333,
-          0.5682666666666667,
-          0.5426666666666666,
-          0.518,
-          0.5069999999999999,
-          0.4944,
-          0.47186666666666666,
-          0.4503333333333333,
-          0.4298666666666667,
-          0.4242666666666666,
-          0.4103333333333333,
-          0.3917333333333333,
-          0.37406666666666666,
-          0.3572666666666667,
-          0.3413333333333333,
-          0.32613333333333333,
-          0.3117333333333333,
-          0.298,
-          0.28506666666666663,
-          0.2727333333333333,
-          0.26106666666666667,
-          0.25006666666666666,
-          0.23959999999999998,
-          0.22966666666666663,
-          0.22033333333333333,
-          0.21146666666666664,
-          0.20306666666666665,
-          0.19506666666666667,
-          0.18753333333333333,
-          0.1804,
-          0.1736,
-          0.16720000000000002,
-          0.16106666666666666,
-          0.15526666666666666,
-          0.14973333333333333,
-          0.14439999999999997,
-          0.1394,
-          0.1346,
-          0.13,
-          0.12566666666666665,
-          0.12146666666666667,
-          0.1174,
-          0.10993333333333333,
-          0.09659999999999999,
-          0.08533333333333333,
-          0.07566666666666666,
-          0.06739999999999999,
-          0.06024666666666667,
-          0.05408666666666666,
-          0.04874666666666667,
-          0.044079999999999994,
-          0.03998666666666666,
-          0.036379999999999996,
-          0.03319333333333333,
-          0.030359999999999998,
-          0.027839999999999997,
-          0.025586666666666664,
-          0.023579999999999997,
-          0.021773333333333332,
-          0.020146666666666667,
-          0.018686666666666664,
-          0.01736,
-          0.01616,
-          0.015059999999999999,
-          0.01406,
-          0.013139999999999999,
-          0.0123,
-          0.01048,
-          0.008993333333333332,
-          0.0077666666666666665,
-          0.006753333333333333,
-          0.006043333333333333,
-          0.005900666666666666,
-          0.005182666666666666,
-          0.004574,
-          0.0040546666666666665,
-          0.0036093333333333333,
-          0.00358,
-          0.0032266666666666663,
-          0.002894,
-          0.002604,
-          0.0023499999999999997,
-          0.002183333333333333,
-          0.0021266666666666665
-        ],
-        "beta0": [
-          1.948,
-          1.42,
-          1.542,
-          1.784,
-          1.829,
-          1.755,
-          1.05,
-          0.03177,
-          -0.06933,
-          -0.2104,
-          0.04932,
-          0.3569,
-          0.6035,
-          0.7903,
-          0.9334,
-          1.046,
-          1.135,
-          1.208,
-          1.266,
-          1.315,
-          1.356,
-          1.391,
-          1.421,
-          1.447,
-          1.469,
-          1.488,
-          1.504,
-          1.51,
-          1.518,
-          1.53,
-          1.541,
-          1.551,
-          1.554,
-          1.561,
-          1.57,
-          1.578,
-          1.585,
-          1.591,
-          1.595,
-          1.599,
-          1.602,
-          1.604,
-          1.607,
-          1.609,
-          1.612,
-          1.615,
-          1.618,
-          1.621,
-          1.623,
-          1.625,
-          1.626,
-          1.625,
-          1.625,
-          1.623,
-          1.622,
-          1.621,
-          1.621,
-          1.621,
-          1.621,
-          1.622,
-          1.623,
-          1.624,
-          1.624,
-          1.624,
-          1.623,
-          1.62,
-          1.609,
-          1.605,
-          1.605,
-          1.598,
-          1.583,
-          1.574,
-          1.572,
-          1.568,
-          1.555,
-          1.54,
-          1.531,
-          1.53,
-          1.526,
-          1.513,
-          1.498,
-          1.488,
-          1.485,
-          1.484,
-          1.475,
-          1.461,
-          1.447,
-          1.441,
-          1.44,
-          1.438,
-          1.407,
-          1.395,
-          1.381,
-          1.349,
-          1.347,
-          1.346,
-          1.324,
-          1.298,
-          1.297,
-          1.275,
-          1.272,
-          1.252,
-          1.25,
-          1.231,
-          1.208,
-          1.205,
-          1.204
-        ],
-        "beta1": [
-          1.948,
-          1.42,
-          1.542,
-          1.783,
-          1.829,
-          1.755,
-          1.051,
-          0.02726,
-          -0.07364,
-          -0.2104,
-          0.04945,
-          0.3546,
-          0.6013,
-          0.7897,
-          0.9341,
-          1.047,
-          1.136,
-          1.208,
-          1.267,
-          1.315,
-          1.356,
-          1.391,
-          1.42,
-          1.446,
-          1.468,
-          1.487,
-          1.504,
-          1.51,
-          1.518,
-          1.531,
-          1.543,
-          1.553,
-          1.555,
-          1.562,
-          1.57,
-          1.577,
-          1.583,
-          1.589,
-          1.594,
-          1.598,
-          1.602,
-          1.606,
-          1.609,
-          1.612,
-          1.615,
-          1.617,
-          1.618,
-          1.62,
-          1.621,
-          1.622,
-          1.623,
-          1.623,
-          1.624,
-          1.624,
-          1.624,
-          1.624,
-          1.624,
-          1.624,
-          1.624,
-          1.623,
-          1.623,
-          1.622,
-          1.621,
-          1.62,
-          1.619,
-          1.617,
-          1.612,
-          1.607,
-          1.601,
-          1.594,
-          1.586,
-          1.579,
-          1.571,
-          1.562,
-          1.554,
-          1.545,
-          1.537,
-          1.529,
-          1.52,
-          1.511,
-          1.503,
-          1.495,
-          1.487,
-          1.478,
-          1.47,
-          1.462,
-          1.454,
-          1.446,
-          1.439,
-          1.431,
-          1.412,
-          1.394,
-          1.375,
-          1.357,
-          1.343,
-          1.34,
-          1.323,
-          1.307,
-          1.29,
-          1.275,
-          1.273,
-          1.259,
-          1.244,
-          1.23,
-          1.215,
-          1.205,
-          1.202
-        ],
-        "beta2": [
-          1.941,
-          1.415,
-          1.535,
-          1.776,
-          1.824,
-          1.756,
-          1.055,
-          0.02178,
-          -0.07921,
-          -0.2104,
-          0.05498,
-          0.361,
-          0.6068,
-          0.7938,
-          0.9369,
-          1.048,
-          1.137,
-          1.208,
-          1.266,
-          1.315,
-          1.355,
-          1.39,
-          1.419,
-          1.444,
-          1.466,
-          1.485,
-          1.502,
-          1.508,
-          1.516,
-          1.529,
-          1.54,
-          1.55,
-          1.553,
-          1.559,
-          1.567,
-          1.575,
-          1.581,
-          1.587,
-          1.592,
-          1.596,
-          1.6,
-          1.604,
-          1.607,
-          1.61,
-          1.612,
-          1.614,
-          1.616,
-          1.617,
-          1.619,
-          1.62,
-          1.621,
-          1.621,
-          1.622,
-          1.622,
-          1.622,
-          1.622,
-          1.622,
-          1.622,
-          1.621,
-          1.621,
-          1.62,
-          1.62,
-          1.619,
-          1.618,
-          1.617,
-          1.615,
-          1.611,
-          1.605,
-          1.599,
-          1.592,
-          1.585,
-          1.577,
-          1.569,
-          1.561,
-          1.553,
-          1.544,
-          1.536,
-          1.527,
-          1.519,
-          1.51,
-          1.502,
-          1.494,
-          1.486,
-          1.477,
-          1.469,
-          1.461,
-          1.453,
-          1.445,
-          1.438,
-          1.43,
-          1.411,
-          1.393,
-          1.375,
-          1.357,
-          1.343,
-          1.34,
-          1.323,
-          1.306,
-          1.29,
-          1.274,
-          1.273,
-          1.259,
-          1.244,
-          1.229,
-          1.215,
-          1.205,
-          1.201
-        ]
-      }
-    ],
-    "auger_peaks": [
-      {
-        "peak_name": "Ar_LMM_10",
-        "kinetic_energy": 160.64,
-        "channel": "L23MM",
-        "intensity_factor": 0.00544069640914037,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_21",
-        "kinetic_energy": 171.6,
-        "channel": "L3MM",
-        "intensity_factor": 0.007616974972796518,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_22",
-        "kinetic_energy": 173.55,
-        "channel": "L23MM",
-        "intensity_factor": 0.006528835690968444,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_23",
-        "kinetic_energy": 173.81,
-        "channel": "L2MM",
-        "intensity_factor": 0.010438413361169102,
-        "origin": "2p1/2",
-        "origin_binding_key": "L2 2p1/2"
-      },
-      {
-        "peak_name": "Ar_LMM_24",
-        "kinetic_energy": 174.22,
-        "channel": "L23MM",
-        "intensity_factor": 0.011969532100108813,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_26",
-        "kinetic_energy": 175.76,
-        "channel": "L23MM",
-        "intensity_factor": 0.011969532100108813,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_32",
-        "kinetic_energy": 177.91,
-        "channel": "L3MM",
-        "intensity_factor": 0.036996735582154515,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_34",
-        "kinetic_energy": 178.66,
-        "channel": "L3MM",
-        "intensity_factor": 0.013057671381936888,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_35",
-        "kinetic_energy": 178.97,
-        "channel": "L3MM",
-        "intensity_factor": 0.022850924918389554,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_36",
-        "kinetic_energy": 179.48,
-        "channel": "L3MM",
-        "intensity_factor": 0.006528835690968444,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_37",
-        "kinetic_energy": 180.06,
-        "channel": "L2MM",
-        "intensity_factor": 0.037578288100208766,
-        "origin": "2p1/2",
-        "origin_binding_key": "L2 2p1/2"
-      },
-      {
-        "peak_name": "Ar_LMM_40",
-        "kinetic_energy": 181.14,
-        "channel": "L2MM",
-        "intensity_factor": 0.020876826722338204,
-        "origin": "2p1/2",
-        "origin_binding_key": "L2 2p1/2"
-      },
-      {
-        "peak_name": "Ar_LMM_45",
-        "kinetic_energy": 187.33,
-        "channel": "L3MM",
-        "intensity_factor": 0.05767138193688792,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_48",
-        "kinetic_energy": 189.49,
-        "channel": "L2MM",
-        "intensity_factor": 0.06680584551148225,
-        "origin": "2p1/2",
-        "origin_binding_key": "L2 2p1/2"
-      },
-      {
-        "peak_name": "Ar_LMM_5253",
-        "kinetic_energy": 191.16,
-        "channel": "L3MM",
-        "intensity_factor": 0.09466811751904244,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_60",
-        "kinetic_energy": 193.13,
-        "channel": "L2MM",
-        "intensity_factor": 0.07724425887265135,
-        "origin": "2p1/2",
-        "origin_binding_key": "L2 2p1/2"
-      },
-      {
-        "peak_name": "Ar_LMM_68",
-        "kinetic_energy": 196.67,
-        "channel": "L23MM",
-        "intensity_factor": 0.026115342763873776,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_72",
-        "kinetic_energy": 201.09,
-        "channel": "L23MM",
-        "intensity_factor": 0.1088139281828074,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_73",
-        "kinetic_energy": 203.23,
-        "channel": "L2MM",
-        "intensity_factor": 0.11482254697286012,
-        "origin": "2p1/2",
-        "origin_binding_key": "L2 2p1/2"
-      },
-      {
-        "peak_name": "Ar_LMM_74",
-        "kinetic_energy": 203.47,
-        "channel": "L23MM",
-        "intensity_factor": 0.29379760609357997,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_75",
-        "kinetic_energy": 205.21,
-        "channel": "L23MM",
-        "intensity_factor": 0.2959738846572361,
-        "origin": "2p3/2",
-        "origin_binding_key": "L3 2p3/2"
-      },
-      {
-        "peak_name": "Ar_LMM_76",
-        "kinetic_energy": 205.62,
-        "channel": "L2MM",
-        "intensity_factor": 0.38204592901878914,
-        "origin": "2p1/2",
-        "origin_binding_key": "L2 2p1/2"
-      },
-      {
-        "peak_name": "Ar_LMM_78",
-        "kinetic_energy": 207.23,
-        "channel": "L2MM",
-        "intensity_factor": 0.29018789144050106,
-        "origin": "2p1/2",
-        "origin_binding_key": "L2 2p1/2"
-      }
-    ]
-  },
-  "krypton": {
-    "name": "Krypton",
-    "symbol": "Kr",
-    "binding_energies": {
-      "3s": 292.8,
-      "3p1/2": 222.2,
-      "3p3/2": 214.4,
-      "3d3/2": 95.0,
-      "3d5/2": 93.8,
-      "4s": 27.5,
-      "4p1/2": 14.1,
-      "4p3/2": 14.1
-    },
-    "shell_data": [
-      {
-        "photon_energy": [
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          405.0,
-          410.0,
-          415.0,
-          420.0,
-          425.0,
-          430.0,
-          435.0,
-          440.0,
-          445.0,
-          450.0,
-          455.0,
-          460.0,
-          465.0,
-          470.0,
-          475.0,
-          480.0,
-          485.0,
-          490.0,
-          495.0,
-          500.0,
-          505.0,
-          510.0,
-          515.0,
-          520.0,
-          525.0,
-          530.0,
-          535.0,
-          540.0,
-          545.0,
-          550.0,
-          555.0,
-          560.0,
-          565.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.1958,
-          0.2063,
-          0.2125,
-          0.2164,
-          0.2183,
-          0.2186,
-          0.2174,
-          0.2153,
-          0.2124,
-          0.209,
-          0.2054,
-          0.2018,
-          0.1982,
-          0.1948,
-          0.1915,
-          0.1885,
-          0.1856,
-          0.1829,
-          0.1803,
-          0.1779,
-          0.1755,
-          0.1732,
-          0.171,
-          0.1688,
-          0.1666,
-          0.1644,
-          0.1622,
-          0.1601,
-          0.1579,
-          0.1557,
-          0.1536,
-          0.1515,
-          0.1494,
-          0.1473,
-          0.1452,
-          0.1432,
-          0.1412,
-          0.1393,
-          0.1374,
-          0.1355,
-          0.1337,
-          0.1319,
-          0.1302,
-          0.1285,
-          0.1268,
-          0.1252,
-          0.1236,
-          0.122,
-          0.1205,
-          0.1189,
-          0.1174,
-          0.116,
-          0.1145,
-          0.1131,
-          0.1117,
-          0.1103,
-          0.1089,
-          0.1075,
-          0.1062,
-          0.1049,
-          0.101,
-          0.09621,
-          0.09174,
-          0.08761,
-          0.08379,
-          0.08024,
-          0.07693,
-          0.07383,
-          0.07089,
-          0.06812,
-          0.06549,
-          0.06301,
-          0.05735,
-          0.05237,
-          0.04796,
-          0.04404,
-          0.04117,
-          0.04058,
-          0.03754,
-          0.03487,
-          0.03249,
-          0.03034,
-          0.03019,
-          0.02838,
-          0.02659,
-          0.02495,
-          0.02344,
-          0.0224,
-          0.02204
-        ],
-        "cs1": [
-          0.1955,
-          0.2059,
-          0.212,
-          0.2159,
-          0.2178,
-          0.2181,
-          0.2171,
-          0.215,
-          0.2121,
-          0.2089,
-          0.2054,
-          0.2018,
-          0.1983,
-          0.1949,
-          0.1917,
-          0.1887,
-          0.1859,
-          0.1832,
-          0.1806,
-          0.1782,
-          0.1758,
-          0.1735,
-          0.1713,
-          0.169,
-          0.1668,
-          0.1646,
-          0.1624,
-          0.1602,
-          0.158,
-          0.1558,
-          0.1536,
-          0.1514,
-          0.1493,
-          0.1472,
-          0.1451,
-          0.1431,
-          0.141,
-          0.1391,
-          0.1372,
-          0.1353,
-          0.1335,
-          0.1317,
-          0.1299,
-          0.1282,
-          0.1266,
-          0.1249,
-          0.1233,
-          0.1218,
-          0.1202,
-          0.1187,
-          0.1173,
-          0.1158,
-          0.1144,
-          0.1129,
-          0.1116,
-          0.1102,
-          0.1088,
-          0.1075,
-          0.1062,
-          0.1049,
-          0.1011,
-          0.09636,
-          0.09193,
-          0.08782,
-          0.08399,
-          0.08042,
-          0.07707,
-          0.07391,
-          0.07092,
-          0.0681,
-          0.06542,
-          0.0629,
-          0.0572,
-          0.05225,
-          0.04791,
-          0.04407,
-          0.04124,
-          0.04066,
-          0.03764,
-          0.03494,
-          0.03252,
-          0.03032,
-          0.03017,
-          0.02834,
-          0.02654,
-          0.02491,
-          0.02342,
-          0.02241,
-          0.02205
-        ],
-        "cs2": [
-          0.2017,
-          0.2123,
-          0.2185,
-          0.2224,
-          0.2243,
-          0.2245,
-          0.2233,
-          0.2211,
-          0.2181,
-          0.2147,
-          0.211,
-          0.2073,
-          0.2036,
-          0.2001,
-          0.1967,
-          0.1936,
-          0.1906,
-          0.1878,
-          0.1851,
-          0.1826,
-          0.1801,
-          0.1777,
-          0.1753,
-          0.173,
-          0.1707,
-          0.1684,
-          0.1661,
-          0.1638,
-          0.1615,
-          0.1592,
-          0.157,
-          0.1547,
-          0.1525,
-          0.1504,
-          0.1482,
-          0.1461,
-          0.144,
-          0.142,
-          0.14,
-          0.1381,
-          0.1362,
-          0.1344,
-          0.1326,
-          0.1308,
-          0.1291,
-          0.1274,
-          0.1258,
-          0.1242,
-          0.1226,
-          0.1211,
-          0.1195,
-          0.118,
-          0.1166,
-          0.1151,
-          0.1137,
-          0.1123,
-          0.1109,
-          0.1095,
-          0.1082,
-          0.1068,
-          0.103,
-          0.09809,
-          0.09355,
-          0.08933,
-          0.08541,
-          0.08175,
-          0.07832,
-          0.07509,
-          0.07204,
-          0.06915,
-          0.06643,
-          0.06385,
-          0.05805,
-          0.05302,
-          0.0486,
-          0.04469,
-          0.04181,
-          0.04122,
-          0.03814,
-          0.03539,
-          0.03293,
-          0.0307,
-          0.03055,
-          0.02868,
-          0.02686,
-          0.0252,
-          0.02369,
-          0.02267,
-          0.02231
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          405.0,
-          410.0,
-          415.0,
-          420.0,
-          425.0,
-          430.0,
-          435.0,
-          440.0,
-          445.0,
-          450.0,
-          455.0,
-          460.0,
-          465.0,
-          470.0,
-          475.0,
-          480.0,
-          485.0,
-          490.0,
-          495.0,
-          500.0,
-          505.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.1436,
-          0.2298,
-          0.2333333333333333,
-          0.22636666666666666,
-          0.22316666666666665,
-          0.22306666666666666,
-          0.2248,
-          0.22746666666666665,
-          0.2304,
-          0.23323333333333332,
-          0.2356333333333333,
-          0.2375,
-          0.2388,
-          0.23956666666666665,
-          0.23986666666666667,
-          0.23976666666666668,
-          0.23936666666666664,
-          0.2387333333333333,
-          0.23796666666666666,
-          0.23706666666666668,
-          0.23613333333333333,
-          0.2351,
-          0.23403333333333332,
-          0.23286666666666667,
-          0.23166666666666663,
-          0.2304,
-          0.22906666666666667,
-          0.22759999999999997,
-          0.22606666666666667,
-          0.22443333333333332,
-          0.2227,
-          0.22089999999999999,
-          0.21896666666666667,
-          0.217,
-          0.21493333333333334,
-          0.2128,
-          0.21063333333333334,
-          0.2084333333333333,
-          0.2062,
-          0.20396666666666666,
-          0.2017,
-          0.19946666666666668,
-          0.1972,
-          0.19496666666666665,
-          0.19276666666666667,
-          0.19056666666666666,
-          0.1884,
-          0.1862333333333333,
-          0.18409999999999999,
-          0.18196666666666667,
-          0.17989999999999998,
-          0.17779999999999999,
-          0.17576666666666665,
-          0.17373333333333332,
-          0.1717,
-          0.1697,
-          0.1677,
-          0.16573333333333332,
-          0.16376666666666667,
-          0.16183333333333333,
-          0.15613333333333332,
-          0.1488,
-          0.1418333333333333,
-          0.13526666666666665,
-          0.12906666666666666,
-          0.12323333333333332,
-          0.11773333333333333,
-          0.11246666666666666,
-          0.10746666666666667,
-          0.10269999999999999,
-          0.09816666666666665,
-          0.09386666666666667,
-          0.08979999999999999,
-          0.08596666666666666,
-          0.08236666666666666,
-          0.07419999999999999,
-          0.06713333333333332,
-          0.060899999999999996,
-          0.05539999999999999,
-          0.05136666666666666,
-          0.05053333333333333,
-          0.04616666666666667,
-          0.04226666666666666,
-          0.038766666666666665,
-          0.03563333333333333,
-          0.03543333333333333,
-          0.032856666666666666,
-          0.03039333333333333,
-          0.02818333333333333,
-          0.02618333333333333,
-          0.024829999999999998,
-          0.024356666666666665
-        ],
-        "cs1": [
-          0.14379999999999998,
-          0.23006666666666667,
-          0.23336666666666664,
-          0.22626666666666664,
-          0.223,
-          0.22286666666666666,
-          0.22463333333333335,
-          0.22733333333333333,
-          0.2303333333333333,
-          0.2332,
-          0.23566666666666664,
-          0.23759999999999998,
-          0.23896666666666666,
-          0.23976666666666668,
-          0.2401,
-          0.24003333333333332,
-          0.2396333333333333,
-          0.239,
-          0.23823333333333332,
-          0.2373333333333333,
-          0.2363333333333333,
-          0.23526666666666665,
-          0.23416666666666666,
-          0.23296666666666666,
-          0.23173333333333335,
-          0.2304,
-          0.229,
-          0.22749999999999998,
-          0.22593333333333332,
-          0.22426666666666664,
-          0.22249999999999998,
-          0.22063333333333335,
-          0.2187,
-          0.2167,
-          0.21463333333333334,
-          0.21249999999999997,
-          0.21033333333333332,
-          0.2081333333333333,
-          0.20593333333333333,
-          0.2037,
-          0.20146666666666668,
-          0.19923333333333332,
-          0.1970333333333333,
-          0.19483333333333333,
-          0.19263333333333332,
-          0.19046666666666667,
-          0.1883333333333333,
-          0.18619999999999998,
-          0.18409999999999999,
-          0.18203333333333332,
-          0.17996666666666666,
-          0.17789999999999997,
-          0.17586666666666664,
-          0.17386666666666664,
-          0.17186666666666664,
-          0.16986666666666667,
-          0.1679,
-          0.16593333333333332,
-          0.16399999999999998,
-          0.16206666666666666,
-          0.15636666666666665,
-          0.149,
-          0.14196666666666666,
-          0.13533333333333333,
-          0.12906666666666666,
-          0.12316666666666666,
-          0.1176,
-          0.11233333333333334,
-          0.10733333333333334,
-          0.1026,
-          0.09809999999999999,
-          0.09383333333333332,
-          0.08979999999999999,
-          0.086,
-          0.08243333333333333,
-          0.07429999999999999,
-          0.06716666666666667,
-          0.060899999999999996,
-          0.05533333333333333,
-          0.05126666666666666,
-          0.05043333333333333,
-          0.0461,
-          0.04226666666666666,
-          0.0388,
-          0.035699999999999996,
-          0.0355,
-          0.03294,
-          0.030453333333333332,
-          0.02821,
-          0.02617,
-          0.024796666666666665,
-          0.024319999999999998
-        ],
-        "cs2": [
-          0.1411,
-          0.22829999999999998,
-          0.2316333333333333,
-          0.22449999999999998,
-          0.2213,
-          0.22133333333333333,
-          0.2232333333333333,
-          0.2261,
-          0.22923333333333332,
-          0.23226666666666665,
-          0.23486666666666667,
-          0.2369,
-          0.23836666666666664,
-          0.23926666666666666,
-          0.23966666666666664,
-          0.2396333333333333,
-          0.23929999999999998,
-          0.2387333333333333,
-          0.238,
-          0.23713333333333333,
-          0.2362,
-          0.23516666666666666,
-          0.23406666666666667,
-          0.23293333333333333,
-          0.23170000000000002,
-          0.23043333333333332,
-          0.22903333333333334,
-          0.22756666666666664,
-          0.22603333333333334,
-          0.22436666666666666,
-          0.22263333333333335,
-          0.2208,
-          0.21889999999999998,
-          0.21689999999999998,
-          0.21483333333333332,
-          0.21273333333333333,
-          0.2106,
-          0.20839999999999997,
-          0.2062,
-          0.20396666666666666,
-          0.20176666666666665,
-          0.19953333333333334,
-          0.1973333333333333,
-          0.19513333333333333,
-          0.19296666666666665,
-          0.1908,
-          0.18866666666666665,
-          0.18653333333333333,
-          0.18443333333333334,
-          0.18236666666666668,
-          0.18030000000000002,
-          0.1782333333333333,
-          0.17619999999999997,
-          0.17419999999999997,
-          0.17219999999999996,
-          0.17020000000000002,
-          0.16823333333333335,
-          0.16626666666666667,
-          0.16433333333333333,
-          0.1624,
-          0.15666666666666665,
-          0.1493,
-          0.14226666666666665,
-          0.1356,
-          0.12933333333333333,
-          0.12343333333333334,
-          0.11786666666666668,
-          0.11259999999999999,
-          0.10759999999999999,
-          0.10283333333333333,
-          0.09833333333333333,
-          0.09406666666666666,
-          0.09003333333333333,
-          0.08623333333333333,
-          0.08263333333333334,
-          0.07446666666666665,
-          0.06733333333333333,
-          0.061033333333333335,
-          0.055466666666666664,
-          0.0514,
-          0.05056666666666666,
-          0.04623333333333333,
-          0.042333333333333334,
-          0.0389,
-          0.0358,
-          0.03556666666666666,
-          0.03300666666666666,
-          0.03051333333333333,
-          0.028259999999999997,
-          0.026216666666666666,
-          0.024843333333333332,
-          0.024363333333333334
-        ],
-        "beta0": [
-          -0.1883,
-          -0.5546,
-          -0.6082,
-          -0.5155,
-          -0.3903,
-          -0.2609,
-          -0.1348,
-          -0.01489,
-          0.09771,
-          0.2023,
-          0.2987,
-          0.3869,
-          0.4671,
-          0.54,
-          0.606,
-          0.6658,
-          0.7201,
-          0.7695,
-          0.8146,
-          0.8559,
-          0.894,
-          0.9292,
-          0.962,
-          0.9925,
-          1.021,
-          1.048,
-          1.073,
-          1.097,
-          1.12,
-          1.142,
-          1.162,
-          1.181,
-          1.2,
-          1.217,
-          1.234,
-          1.249,
-          1.264,
-          1.279,
-          1.292,
-          1.305,
-          1.317,
-          1.329,
-          1.34,
-          1.35,
-          1.36,
-          1.369,
-          1.378,
-          1.387,
-          1.395,
-          1.403,
-          1.411,
-          1.418,
-          1.425,
-          1.432,
-          1.438,
-          1.445,
-          1.451,
-          1.457,
-          1.462,
-          1.468,
-          1.483,
-          1.501,
-          1.516,
-          1.53,
-          1.542,
-          1.552,
-          1.561,
-          1.569,
-          1.576,
-          1.582,
-          1.587,
-          1.592,
-          1.595,
-          1.599,
-          1.602,
-          1.608,
-          1.612,
-          1.614,
-          1.615,
-          1.615,
-          1.615,
-          1.614,
-          1.611,
-          1.608,
-          1.605,
-          1.605,
-          1.601,
-          1.598,
-          1.594,
-          1.59,
-          1.588,
-          1.587
-        ],
-        "beta1": [
-          -0.1863,
-          -0.5524,
-          -0.6069,
-          -0.515,
-          -0.3904,
-          -0.2613,
-          -0.1354,
-          -0.0156,
-          0.097,
-          0.2017,
-          0.2981,
-          0.3864,
-          0.4668,
-          0.5397,
-          0.6058,
-          0.6658,
-          0.7201,
-          0.7696,
-          0.8147,
-          0.8561,
-          0.8942,
-          0.9294,
-          0.9621,
-          0.9927,
-          1.021,
-          1.048,
-          1.074,
-          1.097,
-          1.12,
-          1.142,
-          1.162,
-          1.181,
-          1.2,
-          1.217,
-          1.234,
-          1.249,
-          1.264,
-          1.279,
-          1.292,
-          1.305,
-          1.317,
-          1.329,
-          1.34,
-          1.35,
-          1.36,
-          1.37,
-          1.379,
-          1.387,
-          1.396,
-          1.404,
-          1.411,
-          1.418,
-          1.425,
-          1.432,
-          1.439,
-          1.445,
-          1.451,
-          1.457,
-          1.462,
-          1.468,
-          1.483,
-          1.501,
-          1.516,
-          1.53,
-          1.542,
-          1.552,
-          1.561,
-          1.569,
-          1.576,
-          1.582,
-          1.587,
-          1.592,
-          1.596,
-          1.599,
-          1.602,
-          1.608,
-          1.612,
-          1.614,
-          1.615,
-          1.614,
-          1.614,
-          1.613,
-          1.611,
-          1.609,
-          1.606,
-          1.606,
-          1.603,
-          1.599,
-          1.595,
-          1.591,
-          1.588,
-          1.586
-        ],
-        "beta2": [
-          -0.1699,
-          -0.5244,
-          -0.5785,
-          -0.4884,
-          -0.3654,
-          -0.2378,
-          -0.1133,
-          0.005122,
-          0.1162,
-          0.2194,
-          0.3144,
-          0.4012,
-          0.4802,
-          0.5519,
-          0.6168,
-          0.6756,
-          0.7289,
-          0.7774,
-          0.8216,
-          0.8622,
-          0.8996,
-          0.9341,
-          0.9662,
-          0.9961,
-          1.024,
-          1.051,
-          1.075,
-          1.099,
-          1.121,
-          1.142,
-          1.162,
-          1.181,
-          1.199,
-          1.216,
-          1.232,
-          1.248,
-          1.263,
-          1.276,
-          1.29,
-          1.302,
-          1.314,
-          1.326,
-          1.336,
-          1.347,
-          1.357,
-          1.366,
-          1.375,
-          1.383,
-          1.392,
-          1.399,
-          1.407,
-          1.414,
-          1.421,
-          1.428,
-          1.434,
-          1.44,
-          1.446,
-          1.452,
-          1.457,
-          1.463,
-          1.478,
-          1.495,
-          1.511,
-          1.524,
-          1.536,
-          1.546,
-          1.555,
-          1.563,
-          1.569,
-          1.576,
-          1.581,
-          1.586,
-          1.59,
-          1.593,
-          1.596,
-          1.602,
-          1.606,
-          1.608,
-          1.609,
-          1.609,
-          1.609,
-          1.608,
-          1.606,
-          1.604,
-          1.601,
-          1.601,
-          1.598,
-          1.594,
-          1.59,
-          1.586,
-          1.583,
-          1.582
-        ]
-      },
-      {
-        "photon_energy": [
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          405.0,
-          410.0,
-          415.0,
-          420.0,
-          425.0,
-          430.0,
-          435.0,
-          440.0,
-          445.0,
-          450.0,
-          455.0,
-          460.0,
-          465.0,
-          470.0,
-          475.0,
-          480.0,
-          485.0,
-          490.0,
-          495.0,
-          500.0,
-          505.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.2872,
-          0.4596,
-          0.4666666666666666,
-          0.4527333333333333,
-          0.4463333333333333,
-          0.4461333333333333,
-          0.4496,
-          0.4549333333333333,
-          0.4608,
-          0.46646666666666664,
-          0.4712666666666666,
-          0.475,
-          0.4776,
-          0.4791333333333333,
-          0.47973333333333334,
-          0.47953333333333337,
-          0.4787333333333333,
-          0.4774666666666666,
-          0.4759333333333333,
-          0.47413333333333335,
-          0.47226666666666667,
-          0.4702,
-          0.46806666666666663,
-          0.46573333333333333,
-          0.46333333333333326,
-          0.4608,
-          0.45813333333333334,
-          0.45519999999999994,
-          0.45213333333333333,
-          0.44886666666666664,
-          0.4454,
-          0.44179999999999997,
-          0.43793333333333334,
-          0.434,
-          0.4298666666666667,
-          0.4256,
-          0.4212666666666667,
-          0.4168666666666666,
-          0.4124,
-          0.4079333333333333,
-          0.4034,
-          0.39893333333333336,
-          0.3944,
-          0.3899333333333333,
-          0.38553333333333334,
-          0.3811333333333333,
-          0.3768,
-          0.3724666666666666,
-          0.36819999999999997,
-          0.36393333333333333,
-          0.35979999999999995,
-          0.35559999999999997,
-          0.3515333333333333,
-          0.34746666666666665,
-          0.3434,
-          0.3394,
-          0.3354,
-          0.33146666666666663,
-          0.32753333333333334,
-          0.32366666666666666,
-          0.31226666666666664,
-          0.2976,
-          0.2836666666666666,
-          0.2705333333333333,
-          0.2581333333333333,
-          0.24646666666666664,
-          0.23546666666666666,
-          0.22493333333333332,
-          0.21493333333333334,
-          0.20539999999999997,
-          0.1963333333333333,
-          0.18773333333333334,
-          0.17959999999999998,
-          0.17193333333333333,
-          0.16473333333333331,
-          0.14839999999999998,
-          0.13426666666666665,
-          0.12179999999999999,
-          0.11079999999999998,
-          0.10273333333333332,
-          0.10106666666666667,
-          0.09233333333333334,
-          0.08453333333333332,
-          0.07753333333333333,
-          0.07126666666666666,
-          0.07086666666666666,
-          0.06571333333333333,
-          0.06078666666666666,
-          0.05636666666666666,
-          0.05236666666666666,
-          0.049659999999999996,
-          0.04871333333333333
-        ],
-        "cs1": [
-          0.28759999999999997,
-          0.46013333333333334,
-          0.4667333333333333,
-          0.4525333333333333,
-          0.446,
-          0.4457333333333333,
-          0.4492666666666667,
-          0.45466666666666666,
-          0.4606666666666666,
-          0.4664,
-          0.47133333333333327,
-          0.47519999999999996,
-          0.4779333333333333,
-          0.47953333333333337,
-          0.4802,
-          0.48006666666666664,
-          0.4792666666666666,
-          0.478,
-          0.47646666666666665,
-          0.4746666666666666,
-          0.4726666666666666,
-          0.4705333333333333,
-          0.4683333333333333,
-          0.4659333333333333,
-          0.4634666666666667,
-          0.4608,
-          0.458,
-          0.45499999999999996,
-          0.45186666666666664,
-          0.4485333333333333,
-          0.44499999999999995,
-          0.4412666666666667,
-          0.4374,
-          0.4334,
-          0.4292666666666667,
-          0.42499999999999993,
-          0.42066666666666663,
-          0.4162666666666666,
-          0.41186666666666666,
-          0.4074,
-          0.40293333333333337,
-          0.39846666666666664,
-          0.3940666666666666,
-          0.38966666666666666,
-          0.38526666666666665,
-          0.38093333333333335,
-          0.3766666666666666,
-          0.37239999999999995,
-          0.36819999999999997,
-          0.36406666666666665,
-          0.3599333333333333,
-          0.35579999999999995,
-          0.3517333333333333,
-          0.3477333333333333,
-          0.3437333333333333,
-          0.33973333333333333,
-          0.3358,
-          0.33186666666666664,
-          0.32799999999999996,
-          0.32413333333333333,
-          0.3127333333333333,
-          0.298,
-          0.2839333333333333,
-          0.27066666666666667,
-          0.2581333333333333,
-          0.24633333333333332,
-          0.2352,
-          0.22466666666666668,
-          0.21466666666666667,
-          0.2052,
-          0.19619999999999999,
-          0.18766666666666665,
-          0.17959999999999998,
-          0.172,
-          0.16486666666666666,
-          0.14859999999999998,
-          0.13433333333333333,
-          0.12179999999999999,
-          0.11066666666666666,
-          0.10253333333333332,
-          0.10086666666666666,
-          0.0922,
-          0.08453333333333332,
-          0.0776,
-          0.07139999999999999,
-          0.071,
-          0.06588,
-          0.060906666666666665,
-          0.05642,
-          0.05234,
-          0.04959333333333333,
-          0.048639999999999996
-        ],
-        "cs2": [
-          0.2822,
-          0.45659999999999995,
-          0.4632666666666666,
-          0.44899999999999995,
-          0.4426,
-          0.44266666666666665,
-          0.4464666666666666,
-          0.4522,
-          0.45846666666666663,
-          0.4645333333333333,
-          0.46973333333333334,
-          0.4738,
-          0.4767333333333333,
-          0.4785333333333333,
-          0.4793333333333333,
-          0.4792666666666666,
-          0.47859999999999997,
-          0.4774666666666666,
-          0.476,
-          0.47426666666666667,
-          0.4724,
-          0.4703333333333333,
-          0.46813333333333335,
-          0.46586666666666665,
-          0.46340000000000003,
-          0.46086666666666665,
-          0.4580666666666667,
-          0.4551333333333333,
-          0.45206666666666667,
-          0.4487333333333333,
-          0.4452666666666667,
-          0.4416,
-          0.43779999999999997,
-          0.43379999999999996,
-          0.42966666666666664,
-          0.42546666666666666,
-          0.4212,
-          0.41679999999999995,
-          0.4124,
-          0.4079333333333333,
-          0.4035333333333333,
-          0.3990666666666667,
-          0.3946666666666666,
-          0.39026666666666665,
-          0.3859333333333333,
-          0.3816,
-          0.3773333333333333,
-          0.37306666666666666,
-          0.3688666666666667,
-          0.36473333333333335,
-          0.36060000000000003,
-          0.3564666666666666,
-          0.35239999999999994,
-          0.34839999999999993,
-          0.34439999999999993,
-          0.34040000000000004,
-          0.3364666666666667,
-          0.33253333333333335,
-          0.32866666666666666,
-          0.3248,
-          0.3133333333333333,
-          0.2986,
-          0.2845333333333333,
-          0.2712,
-          0.25866666666666666,
-          0.24686666666666668,
-          0.23573333333333335,
-          0.22519999999999998,
-          0.21519999999999997,
-          0.20566666666666666,
-          0.19666666666666666,
-          0.18813333333333332,
-          0.18006666666666665,
-          0.17246666666666666,
-          0.16526666666666667,
-          0.1489333333333333,
-          0.13466666666666666,
-          0.12206666666666667,
-          0.11093333333333333,
-          0.1028,
-          0.10113333333333333,
-          0.09246666666666666,
-          0.08466666666666667,
-          0.0778,
-          0.0716,
-          0.07113333333333333,
-          0.06601333333333333,
-          0.06102666666666666,
-          0.056519999999999994,
-          0.05243333333333333,
-          0.049686666666666664,
-          0.04872666666666667
-        ],
-        "beta0": [
-          -0.1883,
-          -0.5546,
-          -0.6082,
-          -0.5155,
-          -0.3903,
-          -0.2609,
-          -0.1348,
-          -0.01489,
-          0.09771,
-          0.2023,
-          0.2987,
-          0.3869,
-          0.4671,
-          0.54,
-          0.606,
-          0.6658,
-          0.7201,
-          0.7695,
-          0.8146,
-          0.8559,
-          0.894,
-          0.9292,
-          0.962,
-          0.9925,
-          1.021,
-          1.048,
-          1.073,
-          1.097,
-          1.12,
-          1.142,
-          1.162,
-          1.181,
-          1.2,
-          1.217,
-          1.234,
-          1.249,
-          1.264,
-          1.279,
-          1.292,
-          1.305,
-          1.317,
-          1.329,
-          1.34,
-          1.35,
-          1.36,
-          1.369,
-          1.378,
-          1.387,
-          1.395,
-          1.403,
-          1.411,
-          1.418,
-          1.425,
-          1.432,
-          1.438,
-          1.445,
-          1.451,
-          1.457,
-          1.462,
-          1.468,
-          1.483,
-          1.501,
-          1.516,
-          1.53,
-          1.542,
-          1.552,
-          1.561,
-          1.569,
-          1.576,
-          1.582,
-          1.587,
-          1.592,
-          1.595,
-          1.599,
-          1.602,
-          1.608,
-          1.612,
-          1.614,
-          1.615,
-          1.615,
-          1.615,
-          1.614,
-          1.611,
-          1.608,
-          1.605,
-          1.605,
-          1.601,
-          1.598,
-          1.594,
-          1.59,
-          1.588,
-          1.587
-        ],
-        "beta1": [
-          -0.1863,
-          -0.5524,
-          -0.6069,
-          -0.515,
-          -0.3904,
-          -0.2613,
-          -0.1354,
-          -0.0156,
-          0.097,
-          0.2017,
-          0.2981,
-          0.3864,
-          0.4668,
-          0.5397,
-          0.6058,
-          0.6658,
-          0.7201,
-          0.7696,
-          0.8147,
-          0.8561,
-          0.8942,
-          0.9294,
-          0.9621,
-          0.9927,
-          1.021,
-          1.048,
-          1.074,
-          1.097,
-          1.12,
-          1.142,
-          1.162,
-          1.181,
-          1.2,
-          1.217,
-          1.234,
-          1.249,
-          1.264,
-          1.279,
-          1.292,
-          1.305,
-          1.317,
-          1.329,
-          1.34,
-          1.35,
-          1.36,
-          1.37,
-          1.379,
-          1.387,
-          1.396,
-          1.404,
-          1.411,
-          1.418,
-          1.425,
-          1.432,
-          1.439,
-          1.445,
-          1.451,
-          1.457,
-          1.462,
-          1.468,
-          1.483,
-          1.501,
-          1.516,
-          1.53,
-          1.542,
-          1.552,
-          1.561,
-          1.569,
-          1.576,
-          1.582,
-          1.587,
-          1.592,
-          1.596,
-          1.599,
-          1.602,
-          1.608,
-          1.612,
-          1.614,
-          1.615,
-          1.614,
-          1.614,
-          1.613,
-          1.611,
-          1.609,
-          1.606,
-          1.606,
-          1.603,
-          1.599,
-          1.595,
-          1.591,
-          1.588,
-          1.586
-        ],
-        "beta2": [
-          -0.1699,
-          -0.5244,
-          -0.5785,
-          -0.4884,
-          -0.3654,
-          -0.2378,
-          -0.1133,
-          0.005122,
-          0.1162,
-          0.2194,
-          0.3144,
-          0.4012,
-          0.4802,
-          0.5519,
-          0.6168,
-          0.6756,
-          0.7289,
-          0.7774,
-          0.8216,
-          0.8622,
-          0.8996,
-          0.9341,
-          0.9662,
-          0.9961,
-          1.024,
-          1.051,
-          1.075,
-          1.099,
-          1.121,
-          1.142,
-          1.162,
-          1.181,
-          1.199,
-          1.216,
-          1.232,
-          1.248,
-          1.263,
-          1.276,
-          1.29,
-          1.302,
-          1.314,
-          1.326,
-          1.336,
-          1.347,
-          1.357,
-          1.366,
-          1.375,
-          1.383,
-          1.392,
-          1.399,
-          1.407,
-          1.414,
-          1.421,
-          1.428,
-          1.434,
-          1.44,
-          1.446,
-          1.452,
-          1.457,
-          1.463,
-          1.478,
-          1.495,
-          1.511,
-          1.524,
-          1.536,
-          1.546,
-          1.555,
-          1.563,
-          1.569,
-          1.576,
-          1.581,
-          1.586,
-          1.59,
-          1.593,
-          1.596,
-          1.602,
-          1.606,
-          1.608,
-          1.609,
-          1.609,
-          1.609,
-          1.608,
-          1.606,
-          1.604,
-          1.601,
-          1.601,
-          1.598,
-          1.594,
-          1.59,
-          1.586,
-          1.583,
-          1.582
-        ]
-      },
-      {
-        "photon_energy": [
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.22592,
-          0.26548,
-          0.36136,
-          0.5464000000000001,
-          0.802,
-          1.0828,
-          1.3424,
-          1.4476000000000002,
-          1.5588,
-          1.7316,
-          1.8704,
-          1.9844000000000002,
-          2.0128,
-          2.08,
-          2.1596,
-          2.2239999999999998,
-          2.2736,
-          2.3072,
-          2.326,
-          2.3304,
-          2.3224,
-          2.3036000000000003,
-          2.2764,
-          2.2428000000000003,
-          2.2044,
-          2.1624,
-          2.1184000000000003,
-          2.0732,
-          2.0268,
-          1.9800000000000002,
-          1.9332000000000003,
-          1.8860000000000001,
-          1.8388000000000002,
-          1.7916,
-          1.7448000000000001,
-          1.6980000000000002,
-          1.6516,
-          1.6056000000000001,
-          1.5604,
-          1.5156,
-          1.4720000000000002,
-          1.4288,
-          1.3872,
-          1.3464,
-          1.3068,
-          1.268,
-          1.2308000000000001,
-          1.1948,
-          1.16,
-          1.1264,
-          1.094,
-          1.0628,
-          1.0324,
-          1.0028000000000001,
-          0.9744,
-          0.9472,
-          0.9204000000000001,
-          0.8944000000000001,
-          0.8696,
-          0.8452000000000001,
-          0.8216,
-          0.7988000000000001,
-          0.7768,
-          0.6948000000000001,
-          0.6228,
-          0.5599999999999999,
-          0.5048,
-          0.4568,
-          0.41440000000000005,
-          0.3772,
-          0.34392,
-          0.31408,
-          0.28728,
-          0.26316,
-          0.24148000000000003,
-          0.22192,
-          0.20436,
-          0.18848,
-          0.17420000000000002,
-          0.16128,
-          0.1496,
-          0.13899999999999998,
-          0.12936,
-          0.10876,
-          0.09200000000000001,
-          0.0782,
-          0.06680000000000001,
-          0.059,
-          0.057440000000000005,
-          0.04976,
-          0.043480000000000005,
-          0.038156,
-          0.033596,
-          0.033292,
-          0.029624,
-          0.026164,
-          0.023180000000000003,
-          0.020636,
-          0.019024,
-          0.01848
-        ],
-        "cs1": [
-          0.22519999999999998,
-          0.26552,
-          0.36208,
-          0.5472,
-          0.8024,
-          1.0824,
-          1.3412000000000002,
-          1.4464000000000001,
-          1.5572,
-          1.7304,
-          1.87,
-          1.9852,
-          2.0136,
-          2.0812000000000004,
-          2.1616,
-          2.2264,
-          2.2756000000000003,
-          2.3092,
-          2.3272,
-          2.3312000000000004,
-          2.3228000000000004,
-          2.3032,
-          2.2752,
-          2.2412,
-          2.2024000000000004,
-          2.1604,
-          2.1164,
-          2.0707999999999998,
-          2.0248000000000004,
-          1.9784,
-          1.9316,
-          1.8848,
-          1.8384,
-          1.7916,
-          1.7448000000000001,
-          1.6984000000000004,
-          1.6524,
-          1.6068000000000002,
-          1.5616,
-          1.5168,
-          1.4732,
-          1.4300000000000002,
-          1.3880000000000001,
-          1.3472,
-          1.3076,
-          1.2688000000000001,
-          1.2312,
-          1.1952,
-          1.16,
-          1.1264,
-          1.0936000000000001,
-          1.062,
-          1.0316,
-          1.002,
-          0.9736000000000001,
-          0.9460000000000002,
-          0.9192,
-          0.8936000000000001,
-          0.8684,
-          0.8444000000000002,
-          0.8208000000000001,
-          0.798,
-          0.776,
-          0.6948000000000001,
-          0.6232000000000001,
-          0.5604,
-          0.5056,
-          0.45720000000000005,
-          0.4148,
-          0.37716,
-          0.34356000000000003,
-          0.31356000000000006,
-          0.28672000000000003,
-          0.26267999999999997,
-          0.24112,
-          0.2218,
-          0.20440000000000003,
-          0.18872,
-          0.17452,
-          0.16164,
-          0.14992000000000003,
-          0.1392,
-          0.12944,
-          0.10855999999999999,
-          0.09172000000000001,
-          0.07808000000000001,
-          0.06688,
-          0.059160000000000004,
-          0.057640000000000004,
-          0.04992,
-          0.043480000000000005,
-          0.038064,
-          0.033448,
-          0.033144,
-          0.029508000000000003,
-          0.026140000000000004,
-          0.02324,
-          0.020732,
-          0.019112000000000004,
-          0.01856
-        ],
-        "cs2": [
-          0.2214,
-          0.26204,
-          0.35892,
-          0.5444,
-          0.7996000000000001,
-          1.08,
-          1.3392,
-          1.4444000000000001,
-          1.5556,
-          1.7292000000000003,
-          1.8692000000000002,
-          1.9844000000000002,
-          2.0128,
-          2.0808,
-          2.1612,
-          2.2260000000000004,
-          2.2752,
-          2.3092,
-          2.3272,
-          2.3312000000000004,
-          2.3228000000000004,
-          2.3032,
-          2.2756000000000003,
-          2.2416,
-          2.2028,
-          2.1608,
-          2.1168,
-          2.0716,
-          2.0256000000000003,
-          1.9788000000000001,
-          1.9324000000000003,
-          1.8856000000000002,
-          1.8388000000000002,
-          1.7924,
-          1.7456,
-          1.6992000000000003,
-          1.6532,
-          1.6076000000000001,
-          1.562,
-          1.5176,
-          1.4736000000000002,
-          1.4308,
-          1.3888,
-          1.3476000000000001,
-          1.308,
-          1.2692,
-          1.2320000000000002,
-          1.1956,
-          1.1603999999999999,
-          1.1268,
-          1.094,
-          1.0624,
-          1.032,
-          1.0024,
-          0.9740000000000001,
-          0.9464000000000001,
-          0.9196,
-          0.894,
-          0.8688000000000001,
-          0.8448000000000001,
-          0.8212,
-          0.7984,
-          0.7764000000000001,
-          0.6952,
-          0.6236,
-          0.5608,
-          0.5056,
-          0.4576,
-          0.4148,
-          0.37724,
-          0.34364,
-          0.31364000000000003,
-          0.2868,
-          0.26276000000000005,
-          0.24124,
-          0.22188,
-          0.20448,
-          0.1888,
-          0.17456000000000002,
-          0.16168000000000002,
-          0.14992000000000003,
-          0.13924,
-          0.12944,
-          0.10855999999999999,
-          0.09176000000000001,
-          0.07812000000000001,
-          0.06692000000000001,
-          0.0592,
-          0.057640000000000004,
-          0.04992,
-          0.043480000000000005,
-          0.038052,
-          0.03344,
-          0.033136,
-          0.029508000000000003,
-          0.026140000000000004,
-          0.023236000000000003,
-          0.020728,
-          0.019104,
-          0.018552
-        ],
-        "beta0": [
-          0.6857,
-          1.008,
-          0.9028,
-          0.5428,
-          0.2581,
-          0.09776,
-          0.02567,
-          0.012,
-          0.006787,
-          0.01862,
-          0.04787,
-          0.08669,
-          0.09857,
-          0.1304,
-          0.1761,
-          0.2221,
-          0.2673,
-          0.311,
-          0.3528,
-          0.3925,
-          0.4301,
-          0.4656,
-          0.499,
-          0.5306,
-          0.5603,
-          0.5884,
-          0.615,
-          0.6402,
-          0.6641,
-          0.6869,
-          0.7086,
-          0.7292,
-          0.749,
-          0.7679,
-          0.7859,
-          0.8032,
-          0.8197,
-          0.8356,
-          0.8508,
-          0.8654,
-          0.8793,
-          0.8927,
-          0.9055,
-          0.9178,
-          0.9296,
-          0.9409,
-          0.9517,
-          0.9621,
-          0.9721,
-          0.9816,
-          0.9908,
-          0.9996,
-          1.008,
-          1.016,
-          1.024,
-          1.031,
-          1.039,
-          1.046,
-          1.052,
-          1.059,
-          1.065,
-          1.071,
-          1.076,
-          1.097,
-          1.115,
-          1.131,
-          1.144,
-          1.156,
-          1.167,
-          1.176,
-          1.184,
-          1.191,
-          1.197,
-          1.201,
-          1.204,
-          1.206,
-          1.208,
-          1.209,
-          1.21,
-          1.21,
-          1.21,
-          1.21,
-          1.21,
-          1.209,
-          1.206,
-          1.201,
-          1.193,
-          1.185,
-          1.184,
-          1.175,
-          1.167,
-          1.16,
-          1.153,
-          1.153,
-          1.145,
-          1.136,
-          1.125,
-          1.114,
-          1.106,
-          1.103
-        ],
-        "beta1": [
-          0.6915,
-          1.012,
-          0.9039,
-          0.543,
-          0.2576,
-          0.09646,
-          0.02389,
-          0.01012,
-          0.00493,
-          0.01703,
-          0.04674,
-          0.08609,
-          0.09812,
-          0.1303,
-          0.1765,
-          0.2228,
-          0.2682,
-          0.312,
-          0.3538,
-          0.3935,
-          0.431,
-          0.4663,
-          0.4996,
-          0.531,
-          0.5606,
-          0.5886,
-          0.615,
-          0.6402,
-          0.664,
-          0.6867,
-          0.7084,
-          0.7291,
-          0.7488,
-          0.7678,
-          0.7859,
-          0.8032,
-          0.8198,
-          0.8357,
-          0.8509,
-          0.8654,
-          0.8794,
-          0.8928,
-          0.9056,
-          0.9178,
-          0.9296,
-          0.9408,
-          0.9516,
-          0.9619,
-          0.9718,
-          0.9813,
-          0.9904,
-          0.9992,
-          1.008,
-          1.016,
-          1.023,
-          1.031,
-          1.038,
-          1.045,
-          1.052,
-          1.058,
-          1.064,
-          1.07,
-          1.076,
-          1.097,
-          1.116,
-          1.132,
-          1.145,
-          1.157,
-          1.167,
-          1.176,
-          1.184,
-          1.19,
-          1.195,
-          1.199,
-          1.203,
-          1.206,
-          1.208,
-          1.21,
-          1.211,
-          1.212,
-          1.212,
-          1.212,
-          1.211,
-          1.209,
-          1.204,
-          1.199,
-          1.192,
-          1.187,
-          1.185,
-          1.178,
-          1.169,
-          1.161,
-          1.152,
-          1.151,
-          1.143,
-          1.134,
-          1.124,
-          1.115,
-          1.108,
-          1.106
-        ],
-        "beta2": [
-          0.6963,
-          1.018,
-          0.9068,
-          0.5453,
-          0.2611,
-          0.1011,
-          0.02907,
-          0.01547,
-          0.01032,
-          0.02237,
-          0.05188,
-          0.09095,
-          0.1029,
-          0.1348,
-          0.1806,
-          0.2266,
-          0.2716,
-          0.3151,
-          0.3566,
-          0.3959,
-          0.4331,
-          0.4682,
-          0.5013,
-          0.5325,
-          0.5619,
-          0.5897,
-          0.616,
-          0.641,
-          0.6647,
-          0.6873,
-          0.7089,
-          0.7295,
-          0.7491,
-          0.768,
-          0.786,
-          0.8032,
-          0.8197,
-          0.8356,
-          0.8507,
-          0.8652,
-          0.8791,
-          0.8924,
-          0.9052,
-          0.9174,
-          0.9291,
-          0.9403,
-          0.951,
-          0.9613,
-          0.9712,
-          0.9806,
-          0.9897,
-          0.9984,
-          1.007,
-          1.015,
-          1.023,
-          1.03,
-          1.037,
-          1.044,
-          1.051,
-          1.057,
-          1.064,
-          1.07,
-          1.075,
-          1.097,
-          1.115,
-          1.131,
-          1.144,
-          1.156,
-          1.166,
-          1.175,
-          1.183,
-          1.189,
-          1.194,
-          1.199,
-          1.202,
-          1.205,
-          1.207,
-          1.209,
-          1.21,
-          1.211,
-          1.211,
-          1.211,
-          1.21,
-          1.208,
-          1.204,
-          1.198,
-          1.192,
-          1.186,
-          1.185,
-          1.177,
-          1.169,
-          1.16,
-          1.151,
-          1.151,
-          1.142,
-          1.133,
-          1.124,
-          1.115,
-          1.108,
-          1.105
-        ]
-      },
-      {
-        "photon_energy": [
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.33887999999999996,
-          0.39821999999999996,
-          0.54204,
-          0.8196,
-          1.2029999999999998,
-          1.6241999999999999,
-          2.0136,
-          2.1714,
-          2.3381999999999996,
-          2.5974,
-          2.8056,
-          2.9766,
-          3.0192,
-          3.12,
-          3.2394,
-          3.336,
-          3.4104,
-          3.4608,
-          3.4890000000000003,
-          3.4955999999999996,
-          3.4836,
-          3.4554,
-          3.4145999999999996,
-          3.3642,
-          3.3066,
-          3.2436,
-          3.1776,
-          3.1098,
-          3.0402,
-          2.97,
-          2.8998,
-          2.8289999999999997,
-          2.7582,
-          2.6874,
-          2.6172,
-          2.547,
-          2.4774,
-          2.4084,
-          2.3406,
-          2.2734,
-          2.208,
-          2.1431999999999998,
-          2.0808,
-          2.0196,
-          1.9602,
-          1.902,
-          1.8461999999999998,
-          1.7922,
-          1.74,
-          1.6895999999999998,
-          1.6409999999999998,
-          1.5942,
-          1.5486,
-          1.5042,
-          1.4616,
-          1.4207999999999998,
-          1.3806,
-          1.3416000000000001,
-          1.3044,
-          1.2678,
-          1.2324,
-          1.1982,
-          1.1652,
-          1.0422,
-          0.9341999999999999,
-          0.84,
-          0.7572,
-          0.6851999999999999,
-          0.6216,
-          0.5658,
-          0.51588,
-          0.47112,
-          0.43091999999999997,
-          0.39474000000000004,
-          0.36222,
-          0.33287999999999995,
-          0.30654,
-          0.28271999999999997,
-          0.2613,
-          0.24192,
-          0.2244,
-          0.2085,
-          0.19404000000000002,
-          0.16313999999999998,
-          0.138,
-          0.1173,
-          0.1002,
-          0.0885,
-          0.08616,
-          0.07464,
-          0.06522,
-          0.057234,
-          0.050393999999999994,
-          0.049937999999999996,
-          0.044435999999999996,
-          0.039245999999999996,
-          0.03477,
-          0.030953999999999995,
-          0.028536,
-          0.027719999999999998
-        ],
-        "cs1": [
-          0.33779999999999993,
-          0.39827999999999997,
-          0.5431199999999999,
-          0.8208000000000001,
-          1.2035999999999998,
-          1.6236,
-          2.0118,
-          2.1696,
-          2.3358,
-          2.5955999999999997,
-          2.8049999999999997,
-          2.9778,
-          3.0204,
-          3.1218,
-          3.2424,
-          3.3396,
-          3.4133999999999998,
-          3.4637999999999995,
-          3.4907999999999997,
-          3.4968,
-          3.4842,
-          3.4548,
-          3.4128,
-          3.3617999999999997,
-          3.3036,
-          3.2405999999999997,
-          3.1746000000000003,
-          3.1062,
-          3.0372,
-          2.9675999999999996,
-          2.8973999999999998,
-          2.8272,
-          2.7576,
-          2.6874,
-          2.6172,
-          2.5476,
-          2.4786,
-          2.4102,
-          2.3424,
-          2.2752,
-          2.2098,
-          2.145,
-          2.082,
-          2.0208,
-          1.9614,
-          1.9032,
-          1.8467999999999998,
-          1.7928,
-          1.74,
-          1.6895999999999998,
-          1.6403999999999999,
-          1.5929999999999997,
-          1.5474,
-          1.503,
-          1.4604000000000001,
-          1.419,
-          1.3788,
-          1.3404,
-          1.3025999999999998,
-          1.2666000000000002,
-          1.2312,
-          1.197,
-          1.164,
-          1.0422,
-          0.9348,
-          0.8406,
-          0.7584,
-          0.6858,
-          0.6222,
-          0.5657399999999999,
-          0.51534,
-          0.47034,
-          0.43007999999999996,
-          0.39402,
-          0.36168,
-          0.3327,
-          0.3066,
-          0.28308,
-          0.26178,
-          0.24246,
-          0.22488,
-          0.20879999999999999,
-          0.19416,
-          0.16283999999999998,
-          0.13758,
-          0.11712,
-          0.10031999999999999,
-          0.08874,
-          0.08646,
-          0.07487999999999999,
-          0.06522,
-          0.057095999999999994,
-          0.050172,
-          0.049716,
-          0.044262,
-          0.03921,
-          0.034859999999999995,
-          0.031098,
-          0.028668,
-          0.027839999999999997
-        ],
-        "cs2": [
-          0.3321,
-          0.39306,
-          0.53838,
-          0.8166,
-          1.1994,
-          1.62,
-          2.0088,
-          2.1666,
-          2.3333999999999997,
-          2.5938000000000003,
-          2.8038,
-          2.9766,
-          3.0192,
-          3.1212,
-          3.2417999999999996,
-          3.339,
-          3.4128,
-          3.4637999999999995,
-          3.4907999999999997,
-          3.4968,
-          3.4842,
-          3.4548,
-          3.4133999999999998,
-          3.3624,
-          3.3042,
-          3.2412,
-          3.1752,
-          3.1074,
-          3.0383999999999998,
-          2.9682,
-          2.8986,
-          2.8284000000000002,
-          2.7582,
-          2.6885999999999997,
-          2.6184,
-          2.5488,
-          2.4798,
-          2.4114,
-          2.343,
-          2.2763999999999998,
-          2.2104,
-          2.1462,
-          2.0831999999999997,
-          2.0214,
-          1.962,
-          1.9038,
-          1.8479999999999999,
-          1.7933999999999999,
-          1.7406,
-          1.6902000000000001,
-          1.6409999999999998,
-          1.5936000000000001,
-          1.548,
-          1.5035999999999998,
-          1.461,
-          1.4196,
-          1.3794,
-          1.341,
-          1.3032000000000001,
-          1.2672,
-          1.2318,
-          1.1976,
-          1.1646,
-          1.0428,
-          0.9353999999999999,
-          0.8412,
-          0.7584,
-          0.6863999999999999,
-          0.6222,
-          0.56586,
-          0.5154599999999999,
-          0.47046,
-          0.43019999999999997,
-          0.39414,
-          0.36185999999999996,
-          0.33281999999999995,
-          0.30672,
-          0.28319999999999995,
-          0.26184,
-          0.24251999999999999,
-          0.22488,
-          0.20886000000000002,
-          0.19416,
-          0.16283999999999998,
-          0.13763999999999998,
-          0.11717999999999999,
-          0.10038,
-          0.08879999999999999,
-          0.08646,
-          0.07487999999999999,
-          0.06522,
-          0.057078000000000004,
-          0.050159999999999996,
-          0.049704,
-          0.044262,
-          0.03921,
-          0.034854,
-          0.031091999999999998,
-          0.028655999999999997,
-          0.027828
-        ],
-        "beta0": [
-          0.6857,
-          1.008,
-          0.9028,
-          0.5428,
-          0.2581,
-          0.09776,
-          0.02567,
-          0.012,
-          0.006787,
-          0.01862,
-          0.04787,
-          0.08669,
-          0.09857,
-          0.1304,
-          0.1761,
-          0.2221,
-          0.2673,
-          0.311,
-          0.3528,
-          0.3925,
-          0.4301,
-          0.4656,
-          0.499,
-          0.5306,
-          0.5603,
-          0.5884,
-          0.615,
-          0.6402,
-          0.6641,
-          0.6869,
-          0.7086,
-          0.7292,
-          0.749,
-          0.7679,
-          0.7859,
-          0.8032,
-          0.8197,
-          0.8356,
-          0.8508,
-          0.8654,
-          0.8793,
-          0.8927,
-          0.9055,
-          0.9178,
-          0.9296,
-          0.9409,
-          0.9517,
-          0.9621,
-          0.9721,
-          0.9816,
-          0.9908,
-          0.9996,
-          1.008,
-          1.016,
-          1.024,
-          1.031,
-          1.039,
-          1.046,
-          1.052,
-          1.059,
-          1.065,
-          1.071,
-          1.076,
-          1.097,
-          1.115,
-          1.131,
-          1.144,
-          1.156,
-          1.167,
-          1.176,
-          1.184,
-          1.191,
-          1.197,
-          1.201,
-          1.204,
-          1.206,
-          1.208,
-          1.209,
-          1.21,
-          1.21,
-          1.21,
-          1.21,
-          1.21,
-          1.209,
-          1.206,
-          1.201,
-          1.193,
-          1.185,
-          1.184,
-          1.175,
-          1.167,
-          1.16,
-          1.153,
-          1.153,
-          1.145,
-          1.136,
-          1.125,
-          1.114,
-          1.106,
-          1.103
-        ],
-        "beta1": [
-          0.6915,
-          1.012,
-          0.9039,
-          0.543,
-          0.2576,
-          0.09646,
-          0.02389,
-          0.01012,
-          0.00493,
-          0.01703,
-          0.04674,
-          0.08609,
-          0.09812,
-          0.1303,
-          0.1765,
-          0.2228,
-          0.2682,
-          0.312,
-          0.3538,
-          0.3935,
-          0.431,
-          0.4663,
-          0.4996,
-          0.531,
-          0.5606,
-          0.5886,
-          0.615,
-          0.6402,
-          0.664,
-          0.6867,
-          0.7084,
-          0.7291,
-          0.7488,
-          0.7678,
-          0.7859,
-          0.8032,
-          0.8198,
-          0.8357,
-          0.8509,
-          0.8654,
-          0.8794,
-          0.8928,
-          0.9056,
-          0.9178,
-          0.9296,
-          0.9408,
-          0.9516,
-          0.9619,
-          0.9718,
-          0.9813,
-          0.9904,
-          0.9992,
-          1.008,
-          1.016,
-          1.023,
-          1.031,
-          1.038,
-          1.045,
-          1.052,
-          1.058,
-          1.064,
-          1.07,
-          1.076,
-          1.097,
-          1.116,
-          1.132,
-          1.145,
-          1.157,
-          1.167,
-          1.176,
-          1.184,
-          1.19,
-          1.195,
-          1.199,
-          1.203,
-          1.206,
-          1.208,
-          1.21,
-          1.211,
-          1.212,
-          1.212,
-          1.212,
-          1.211,
-          1.209,
-          1.204,
-          1.199,
-          1.192,
-          1.187,
-          1.185,
-          1.178,
-          1.169,
-          1.161,
-          1.152,
-          1.151,
-          1.143,
-          1.134,
-          1.124,
-          1.115,
-          1.108,
-          1.106
-        ],
-        "beta2": [
-          0.6963,
-          1.018,
-          0.9068,
-          0.5453,
-          0.2611,
-          0.1011,
-          0.02907,
-          0.01547,
-          0.01032,
-          0.02237,
-          0.05188,
-          0.09095,
-          0.1029,
-          0.1348,
-          0.1806,
-          0.2266,
-          0.2716,
-          0.3151,
-          0.3566,
-          0.3959,
-          0.4331,
-          0.4682,
-          0.5013,
-          0.5325,
-          0.5619,
-          0.5897,
-          0.616,
-          0.641,
-          0.6647,
-          0.6873,
-          0.7089,
-          0.7295,
-          0.7491,
-          0.768,
-          0.786,
-          0.8032,
-          0.8197,
-          0.8356,
-          0.8507,
-          0.8652,
-          0.8791,
-          0.8924,
-          0.9052,
-          0.9174,
-          0.9291,
-          0.9403,
-          0.951,
-          0.9613,
-          0.9712,
-          0.9806,
-          0.9897,
-          0.9984,
-          1.007,
-          1.015,
-          1.023,
-          1.03,
-          1.037,
-          1.044,
-          1.051,
-          1.057,
-          1.064,
-          1.07,
-          1.075,
-          1.097,
-          1.115,
-          1.131,
-          1.144,
-          1.156,
-          1.166,
-          1.175,
-          1.183,
-          1.189,
-          1.194,
-          1.199,
-          1.202,
-          1.205,
-          1.207,
-          1.209,
-          1.21,
-          1.211,
-          1.211,
-          1.211,
-          1.21,
-          1.208,
-          1.204,
-          1.198,
-          1.192,
-          1.186,
-          1.185,
-          1.177,
-          1.169,
-          1.16,
-          1.151,
-          1.151,
-          1.142,
-          1.133,
-          1.124,
-          1.115,
-          1.108,
-          1.105
-        ]
-      },
-      {
-        "photon_energy": [
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.03392,
-          0.099,
-          0.1556,
-          0.1634,
-          0.1971,
-          0.223,
-          0.2357,
-          0.2389,
-          0.2364,
-          0.2309,
-          0.2238,
-          0.2157,
-          0.2068,
-          0.1975,
-          0.1879,
-          0.1784,
-          0.1693,
-          0.1608,
-          0.1531,
-          0.1462,
-          0.1399,
-          0.1341,
-          0.1316,
-          0.1287,
-          0.1234,
-          0.1183,
-          0.1134,
-          0.112,
-          0.1085,
-          0.1039,
-          0.09945,
-          0.09532,
-          0.0915,
-          0.088,
-          0.0848,
-          0.08187,
-          0.07914,
-          0.07657,
-          0.07413,
-          0.07176,
-          0.06944,
-          0.06717,
-          0.06494,
-          0.06278,
-          0.06069,
-          0.0587,
-          0.05682,
-          0.05507,
-          0.05344,
-          0.05195,
-          0.05056,
-          0.04928,
-          0.04809,
-          0.04695,
-          0.04585,
-          0.04479,
-          0.04373,
-          0.04267,
-          0.04162,
-          0.04057,
-          0.03953,
-          0.0385,
-          0.03749,
-          0.03471,
-          0.03172,
-          0.02941,
-          0.0273,
-          0.02517,
-          0.02314,
-          0.02146,
-          0.02017,
-          0.01909,
-          0.01799,
-          0.01681,
-          0.01566,
-          0.0147,
-          0.01397,
-          0.01339,
-          0.01282,
-          0.01217,
-          0.01148,
-          0.01082,
-          0.01027,
-          0.00985,
-          0.009521,
-          0.009202,
-          0.008835,
-          0.007779,
-          0.007049,
-          0.006557,
-          0.005898,
-          0.005417,
-          0.00534,
-          0.005025,
-          0.004656,
-          0.004219,
-          0.003941,
-          0.003928,
-          0.003757,
-          0.003479,
-          0.003182,
-          0.003017,
-          0.002941,
-          0.002906
-        ],
-        "cs1": [
-          0.03337,
-          0.09996,
-          0.157,
-          0.1647,
-          0.1971,
-          0.2217,
-          0.2344,
-          0.2387,
-          0.2372,
-          0.2319,
-          0.2243,
-          0.2154,
-          0.2059,
-          0.1964,
-          0.187,
-          0.178,
-          0.1695,
-          0.1615,
-          0.154,
-          0.147,
-          0.1404,
-          0.1342,
-          0.1314,
-          0.1283,
-          0.1228,
-          0.1176,
-          0.1127,
-          0.1114,
-          0.1081,
-          0.1038,
-          0.09963,
-          0.09575,
-          0.09208,
-          0.0886,
-          0.08532,
-          0.0822,
-          0.07925,
-          0.07646,
-          0.07381,
-          0.07129,
-          0.06891,
-          0.06666,
-          0.06452,
-          0.0625,
-          0.06058,
-          0.05876,
-          0.05703,
-          0.05538,
-          0.05382,
-          0.05232,
-          0.05089,
-          0.04952,
-          0.04821,
-          0.04695,
-          0.04573,
-          0.04456,
-          0.04344,
-          0.04235,
-          0.0413,
-          0.0403,
-          0.03932,
-          0.03839,
-          0.03749,
-          0.03497,
-          0.032,
-          0.0294,
-          0.0271,
-          0.02507,
-          0.02328,
-          0.02169,
-          0.02026,
-          0.01897,
-          0.01779,
-          0.01671,
-          0.01575,
-          0.01487,
-          0.01407,
-          0.01333,
-          0.01265,
-          0.01202,
-          0.01144,
-          0.0109,
-          0.0104,
-          0.009934,
-          0.009497,
-          0.009085,
-          0.008698,
-          0.007838,
-          0.007107,
-          0.006468,
-          0.00591,
-          0.005508,
-          0.005426,
-          0.004999,
-          0.004617,
-          0.00428,
-          0.003981,
-          0.00396,
-          0.003708,
-          0.00346,
-          0.003239,
-          0.003038,
-          0.002902,
-          0.002853
-        ],
-        "cs2": [
-          0.06055,
-          0.1357,
-          0.1935,
-          0.201,
-          0.2315,
-          0.2532,
-          0.2629,
-          0.2641,
-          0.2598,
-          0.2519,
-          0.2421,
-          0.2312,
-          0.2201,
-          0.2091,
-          0.1986,
-          0.1885,
-          0.1791,
-          0.1703,
-          0.162,
-          0.1543,
-          0.1471,
-          0.1404,
-          0.1375,
-          0.1341,
-          0.1282,
-          0.1227,
-          0.1175,
-          0.1161,
-          0.1126,
-          0.108,
-          0.1036,
-          0.09946,
-          0.09556,
-          0.09188,
-          0.08839,
-          0.08511,
-          0.082,
-          0.07906,
-          0.07628,
-          0.07366,
-          0.07117,
-          0.06882,
-          0.0666,
-          0.06449,
-          0.06248,
-          0.06058,
-          0.05878,
-          0.05706,
-          0.05542,
-          0.05385,
-          0.05236,
-          0.05093,
-          0.04956,
-          0.04824,
-          0.04698,
-          0.04577,
-          0.04461,
-          0.04348,
-          0.0424,
-          0.04136,
-          0.04036,
-          0.03939,
-          0.03846,
-          0.03585,
-          0.03276,
-          0.03007,
-          0.02771,
-          0.02563,
-          0.02379,
-          0.02214,
-          0.02067,
-          0.01934,
-          0.01813,
-          0.01704,
-          0.01605,
-          0.01515,
-          0.01432,
-          0.01357,
-          0.01287,
-          0.01223,
-          0.01164,
-          0.01109,
-          0.01058,
-          0.0101,
-          0.00965,
-          0.009232,
-          0.00884,
-          0.007965,
-          0.007214,
-          0.006566,
-          0.006,
-          0.005588,
-          0.005504,
-          0.005068,
-          0.004682,
-          0.004339,
-          0.004031,
-          0.00401,
-          0.003754,
-          0.003505,
-          0.003278,
-          0.003073,
-          0.002935,
-          0.002886
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          15.0,
-          16.71,
-          20.0,
-          21.22,
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          25.96666666666667,
-          21.746666666666663,
-          12.103333333333333,
-          9.503333333333334,
-          4.613333333333333,
-          3.330333333333333,
-          2.019333333333333,
-          1.0203333333333333,
-          0.573,
-          0.526,
-          0.3503333333333333,
-          0.23393333333333333,
-          0.17079999999999998,
-          0.13523333333333332,
-          0.1144,
-          0.1018,
-          0.09383333333333332,
-          0.08863333333333334,
-          0.08510000000000001,
-          0.08276666666666666,
-          0.0812,
-          0.08003333333333333,
-          0.0788,
-          0.0773,
-          0.07546666666666665,
-          0.0735,
-          0.07163333333333333,
-          0.07003333333333334,
-          0.06939999999999999,
-          0.06873333333333333,
-          0.0676,
-          0.06646666666666666,
-          0.06516666666666666,
-          0.06476666666666667,
-          0.06366666666666666,
-          0.06196666666666667,
-          0.060200000000000004,
-          0.058499999999999996,
-          0.057,
-          0.05573333333333333,
-          0.05466666666666667,
-          0.0537,
-          0.05273333333333333,
-          0.051699999999999996,
-          0.05053333333333333,
-          0.04923333333333333,
-          0.0479,
-          0.04656666666666666,
-          0.04529999999999999,
-          0.044199999999999996,
-          0.04326666666666666,
-          0.042466666666666666,
-          0.04176666666666666,
-          0.0411,
-          0.0404,
-          0.03966666666666666,
-          0.03883333333333333,
-          0.037899999999999996,
-          0.03696666666666666,
-          0.036,
-          0.0351,
-          0.0343,
-          0.0336,
-          0.033,
-          0.032486666666666664,
-          0.032016666666666665,
-          0.031076666666666662,
-          0.02864,
-          0.02606666666666667,
-          0.024436666666666666,
-          0.023079999999999996,
-          0.021249999999999998,
-          0.019576666666666666,
-          0.018576666666666665,
-          0.017696666666666666,
-          0.01644333333333333,
-          0.015186666666666668,
-          0.014396666666666665,
-          0.013853333333333332,
-          0.013103333333333331,
-          0.012173333333333331,
-          0.011436666666666666,
-          0.011026666666666666,
-          0.010656666666666665,
-          0.010069999999999999,
-          0.009373333333333332,
-          0.008839999999999999,
-          0.008553333333333333,
-          0.00832,
-          0.007943333333333333,
-          0.007446666666666666,
-          0.006673333333333333,
-          0.006023333333333333,
-          0.0052966666666666665,
-          0.005026666666666666,
-          0.0044666666666666665,
-          0.00435,
-          0.004059999999999999,
-          0.0037266666666666668,
-          0.0033499999999999997,
-          0.0031993333333333335,
-          0.0031796666666666666,
-          0.002816,
-          0.00262,
-          0.0025356666666666665,
-          0.0022276666666666664,
-          0.0021016666666666666,
-          0.002090333333333333
-        ],
-        "cs1": [
-          25.976666666666667,
-          21.763333333333335,
-          12.083333333333332,
-          9.483333333333333,
-          4.613333333333333,
-          3.3366666666666664,
-          2.024,
-          1.0173333333333332,
-          0.57,
-          0.5236666666666666,
-          0.3506666666666667,
-          0.23516666666666666,
-          0.17136666666666667,
-          0.13496666666666665,
-          0.11376666666666665,
-          0.10119999999999998,
-          0.09359999999999999,
-          0.0888,
-          0.08563333333333334,
-          0.08333333333333333,
-          0.08146666666666666,
-          0.0798,
-          0.07823333333333332,
-          0.07669999999999999,
-          0.07516666666666666,
-          0.07363333333333333,
-          0.07213333333333333,
-          0.07063333333333333,
-          0.06993333333333332,
-          0.06913333333333332,
-          0.06763333333333332,
-          0.06613333333333332,
-          0.06466666666666666,
-          0.06423333333333334,
-          0.06316666666666666,
-          0.061733333333333335,
-          0.0603,
-          0.05893333333333334,
-          0.05756666666666666,
-          0.056266666666666666,
-          0.054966666666666664,
-          0.05366666666666667,
-          0.05243333333333333,
-          0.051199999999999996,
-          0.05003333333333333,
-          0.04886666666666667,
-          0.04773333333333333,
-          0.04666666666666667,
-          0.04563333333333333,
-          0.04463333333333333,
-          0.043666666666666666,
-          0.04273333333333333,
-          0.041833333333333333,
-          0.040933333333333335,
-          0.04006666666666667,
-          0.03923333333333333,
-          0.0384,
-          0.037599999999999995,
-          0.03683333333333333,
-          0.03609999999999999,
-          0.035366666666666664,
-          0.034666666666666665,
-          0.033999999999999996,
-          0.03332333333333333,
-          0.03267,
-          0.03203333333333333,
-          0.030789999999999998,
-          0.02847,
-          0.02639,
-          0.024516666666666666,
-          0.02280333333333333,
-          0.021256666666666663,
-          0.01987,
-          0.018609999999999998,
-          0.01744333333333333,
-          0.016376666666666664,
-          0.015406666666666666,
-          0.01452,
-          0.013699999999999999,
-          0.01294,
-          0.012243333333333332,
-          0.011606666666666664,
-          0.011016666666666668,
-          0.010459999999999999,
-          0.00994,
-          0.009456666666666665,
-          0.009006666666666666,
-          0.008586666666666666,
-          0.008186666666666665,
-          0.007809999999999999,
-          0.007456666666666667,
-          0.006673333333333333,
-          0.005993333333333333,
-          0.0054066666666666655,
-          0.004893333333333333,
-          0.00452,
-          0.004443333333333333,
-          0.004053333333333333,
-          0.003703333333333333,
-          0.0033966666666666663,
-          0.00312,
-          0.003101,
-          0.002872333333333333,
-          0.002653666666666666,
-          0.0024523333333333333,
-          0.0022719999999999997,
-          0.0021526666666666664,
-          0.002111333333333333
-        ],
-        "cs2": [
-          25.43333333333333,
-          21.30333333333333,
-          11.79,
-          9.239999999999998,
-          4.466666666666667,
-          3.218,
-          1.9386666666666665,
-          0.9629999999999999,
-          0.5336666666666666,
-          0.4893333333333333,
-          0.32499999999999996,
-          0.21639999999999998,
-          0.15726666666666667,
-          0.12419999999999999,
-          0.10543333333333334,
-          0.09466666666666665,
-          0.08839999999999999,
-          0.08466666666666667,
-          0.08226666666666665,
-          0.08053333333333333,
-          0.07913333333333333,
-          0.07786666666666667,
-          0.07663333333333333,
-          0.07536666666666667,
-          0.07406666666666667,
-          0.07273333333333333,
-          0.07136666666666666,
-          0.06996666666666666,
-          0.06933333333333333,
-          0.06856666666666666,
-          0.06716666666666667,
-          0.06573333333333332,
-          0.06433333333333333,
-          0.06393333333333333,
-          0.06293333333333333,
-          0.06153333333333333,
-          0.06016666666666666,
-          0.0588,
-          0.057466666666666666,
-          0.05616666666666667,
-          0.05486666666666666,
-          0.053633333333333325,
-          0.0524,
-          0.051199999999999996,
-          0.05003333333333333,
-          0.0489,
-          0.047799999999999995,
-          0.04673333333333333,
-          0.0457,
-          0.0447,
-          0.04373333333333333,
-          0.04276666666666666,
-          0.04186666666666666,
-          0.040966666666666665,
-          0.040133333333333326,
-          0.0393,
-          0.0385,
-          0.0377,
-          0.03693333333333333,
-          0.036199999999999996,
-          0.03546666666666666,
-          0.03476666666666667,
-          0.03406666666666666,
-          0.0334,
-          0.03274,
-          0.0321,
-          0.03086,
-          0.028556666666666664,
-          0.026466666666666666,
-          0.024576666666666667,
-          0.02287,
-          0.021326666666666664,
-          0.01993,
-          0.018656666666666665,
-          0.017493333333333333,
-          0.01643,
-          0.015453333333333333,
-          0.014559999999999998,
-          0.013736666666666664,
-          0.01298,
-          0.012283333333333334,
-          0.01164,
-          0.011043333333333332,
-          0.01049,
-          0.009973333333333332,
-          0.009486666666666666,
-          0.009033333333333332,
-          0.00861,
-          0.008209999999999999,
-          0.007836666666666665,
-          0.007483333333333333,
-          0.006693333333333333,
-          0.006013333333333333,
-          0.005423333333333333,
-          0.004906666666666667,
-          0.004533333333333333,
-          0.004456666666666666,
-          0.004063333333333333,
-          0.0037133333333333332,
-          0.0034033333333333333,
-          0.0031276666666666666,
-          0.0031086666666666663,
-          0.002880333333333333,
-          0.0026579999999999998,
-          0.0024576666666666666,
-          0.0022773333333333335,
-          0.002156333333333333,
-          0.002114333333333333
-        ],
-        "beta0": [
-          0.9997,
-          1.294,
-          1.612,
-          1.686,
-          1.825,
-          1.856,
-          1.864,
-          1.773,
-          1.564,
-          1.52,
-          1.252,
-          0.8771,
-          0.5014,
-          0.1846,
-          -0.03238,
-          -0.1355,
-          -0.1412,
-          -0.08364,
-          0.006078,
-          0.1088,
-          0.2152,
-          0.3203,
-          0.4204,
-          0.5127,
-          0.5956,
-          0.6692,
-          0.735,
-          0.7946,
-          0.8205,
-          0.8498,
-          0.9016,
-          0.9501,
-          0.9951,
-          1.007,
-          1.037,
-          1.074,
-          1.109,
-          1.14,
-          1.169,
-          1.197,
-          1.222,
-          1.246,
-          1.269,
-          1.29,
-          1.31,
-          1.329,
-          1.346,
-          1.362,
-          1.377,
-          1.391,
-          1.405,
-          1.418,
-          1.43,
-          1.441,
-          1.451,
-          1.461,
-          1.47,
-          1.479,
-          1.487,
-          1.495,
-          1.503,
-          1.511,
-          1.518,
-          1.526,
-          1.533,
-          1.54,
-          1.551,
-          1.568,
-          1.585,
-          1.603,
-          1.614,
-          1.62,
-          1.629,
-          1.64,
-          1.647,
-          1.647,
-          1.649,
-          1.657,
-          1.664,
-          1.664,
-          1.661,
-          1.663,
-          1.67,
-          1.674,
-          1.671,
-          1.665,
-          1.664,
-          1.669,
-          1.674,
-          1.672,
-          1.665,
-          1.665,
-          1.662,
-          1.649,
-          1.661,
-          1.644,
-          1.64,
-          1.641,
-          1.64,
-          1.625,
-          1.634,
-          1.634,
-          1.616,
-          1.606,
-          1.62,
-          1.599,
-          1.586,
-          1.588
-        ],
-        "beta1": [
-          0.9996,
-          1.294,
-          1.612,
-          1.685,
-          1.825,
-          1.856,
-          1.864,
-          1.773,
-          1.564,
-          1.52,
-          1.255,
-          0.8803,
-          0.4997,
-          0.1793,
-          -0.03504,
-          -0.1347,
-          -0.1407,
-          -0.08475,
-          0.005559,
-          0.1107,
-          0.2188,
-          0.3231,
-          0.4207,
-          0.5103,
-          0.592,
-          0.6663,
-          0.734,
-          0.7957,
-          0.8223,
-          0.8522,
-          0.9039,
-          0.9514,
-          0.9951,
-          1.007,
-          1.035,
-          1.073,
-          1.107,
-          1.139,
-          1.169,
-          1.197,
-          1.223,
-          1.247,
-          1.27,
-          1.291,
-          1.31,
-          1.329,
-          1.346,
-          1.362,
-          1.377,
-          1.391,
-          1.405,
-          1.417,
-          1.429,
-          1.44,
-          1.451,
-          1.461,
-          1.47,
-          1.479,
-          1.488,
-          1.496,
-          1.504,
-          1.512,
-          1.519,
-          1.525,
-          1.532,
-          1.538,
-          1.55,
-          1.57,
-          1.587,
-          1.601,
-          1.613,
-          1.623,
-          1.631,
-          1.638,
-          1.644,
-          1.649,
-          1.653,
-          1.657,
-          1.66,
-          1.662,
-          1.664,
-          1.666,
-          1.667,
-          1.668,
-          1.669,
-          1.669,
-          1.669,
-          1.669,
-          1.668,
-          1.667,
-          1.667,
-          1.664,
-          1.66,
-          1.656,
-          1.652,
-          1.648,
-          1.647,
-          1.642,
-          1.637,
-          1.631,
-          1.626,
-          1.625,
-          1.62,
-          1.614,
-          1.608,
-          1.602,
-          1.598,
-          1.596
-        ],
-        "beta2": [
-          1.004,
-          1.277,
-          1.578,
-          1.651,
-          1.795,
-          1.832,
-          1.851,
-          1.777,
-          1.582,
-          1.539,
-          1.276,
-          0.8929,
-          0.4982,
-          0.1667,
-          -0.05022,
-          -0.145,
-          -0.1426,
-          -0.07812,
-          0.01891,
-          0.1284,
-          0.2388,
-          0.344,
-          0.4415,
-          0.5306,
-          0.6114,
-          0.6846,
-          0.751,
-          0.8113,
-          0.8372,
-          0.8663,
-          0.9166,
-          0.9628,
-          1.005,
-          1.017,
-          1.044,
-          1.081,
-          1.114,
-          1.145,
-          1.174,
-          1.201,
-          1.226,
-          1.25,
-          1.272,
-          1.292,
-          1.311,
-          1.329,
-          1.346,
-          1.361,
-          1.376,
-          1.39,
-          1.403,
-          1.415,
-          1.427,
-          1.437,
-          1.448,
-          1.458,
-          1.467,
-          1.476,
-          1.484,
-          1.492,
-          1.5,
-          1.507,
-          1.514,
-          1.52,
-          1.527,
-          1.533,
-          1.544,
-          1.564,
-          1.581,
-          1.594,
-          1.606,
-          1.616,
-          1.624,
-          1.631,
-          1.637,
-          1.642,
-          1.647,
-          1.65,
-          1.653,
-          1.656,
-          1.658,
-          1.659,
-          1.661,
-          1.662,
-          1.662,
-          1.662,
-          1.663,
-          1.662,
-          1.662,
-          1.661,
-          1.661,
-          1.658,
-          1.655,
-          1.651,
-          1.646,
-          1.643,
-          1.642,
-          1.637,
-          1.632,
-          1.627,
-          1.621,
-          1.621,
-          1.616,
-          1.61,
-          1.604,
-          1.598,
-          1.594,
-          1.592
-        ]
-      },
-      {
-        "photon_energy": [
-          15.0,
-          16.71,
-          20.0,
-          21.22,
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          51.93333333333334,
-          43.493333333333325,
-          24.206666666666667,
-          19.006666666666668,
-          9.226666666666667,
-          6.660666666666666,
-          4.038666666666666,
-          2.0406666666666666,
-          1.146,
-          1.052,
-          0.7006666666666665,
-          0.46786666666666665,
-          0.34159999999999996,
-          0.27046666666666663,
-          0.2288,
-          0.2036,
-          0.18766666666666665,
-          0.17726666666666668,
-          0.17020000000000002,
-          0.1655333333333333,
-          0.1624,
-          0.16006666666666666,
-          0.1576,
-          0.1546,
-          0.1509333333333333,
-          0.147,
-          0.14326666666666665,
-          0.14006666666666667,
-          0.13879999999999998,
-          0.13746666666666665,
-          0.1352,
-          0.13293333333333332,
-          0.13033333333333333,
-          0.12953333333333333,
-          0.12733333333333333,
-          0.12393333333333334,
-          0.12040000000000001,
-          0.11699999999999999,
-          0.114,
-          0.11146666666666666,
-          0.10933333333333334,
-          0.1074,
-          0.10546666666666667,
-          0.10339999999999999,
-          0.10106666666666667,
-          0.09846666666666666,
-          0.0958,
-          0.09313333333333332,
-          0.09059999999999999,
-          0.08839999999999999,
-          0.08653333333333332,
-          0.08493333333333333,
-          0.08353333333333332,
-          0.0822,
-          0.0808,
-          0.07933333333333333,
-          0.07766666666666666,
-          0.07579999999999999,
-          0.07393333333333332,
-          0.072,
-          0.0702,
-          0.0686,
-          0.0672,
-          0.066,
-          0.06497333333333333,
-          0.06403333333333333,
-          0.062153333333333324,
-          0.05728,
-          0.05213333333333334,
-          0.04887333333333333,
-          0.04615999999999999,
-          0.042499999999999996,
-          0.03915333333333333,
-          0.03715333333333333,
-          0.03539333333333333,
-          0.03288666666666666,
-          0.030373333333333336,
-          0.02879333333333333,
-          0.027706666666666664,
-          0.026206666666666663,
-          0.024346666666666662,
-          0.022873333333333332,
-          0.02205333333333333,
-          0.02131333333333333,
-          0.020139999999999998,
-          0.018746666666666665,
-          0.017679999999999998,
-          0.017106666666666666,
-          0.01664,
-          0.015886666666666667,
-          0.014893333333333331,
-          0.013346666666666666,
-          0.012046666666666666,
-          0.010593333333333333,
-          0.010053333333333333,
-          0.008933333333333333,
-          0.0087,
-          0.008119999999999999,
-          0.0074533333333333335,
-          0.006699999999999999,
-          0.006398666666666667,
-          0.006359333333333333,
-          0.005632,
-          0.00524,
-          0.005071333333333333,
-          0.004455333333333333,
-          0.004203333333333333,
-          0.004180666666666666
-        ],
-        "cs1": [
-          51.95333333333333,
-          43.52666666666667,
-          24.166666666666664,
-          18.966666666666665,
-          9.226666666666667,
-          6.673333333333333,
-          4.048,
-          2.0346666666666664,
-          1.14,
-          1.0473333333333332,
-          0.7013333333333334,
-          0.4703333333333333,
-          0.34273333333333333,
-          0.2699333333333333,
-          0.2275333333333333,
-          0.20239999999999997,
-          0.18719999999999998,
-          0.1776,
-          0.17126666666666668,
-          0.16666666666666666,
-          0.16293333333333332,
-          0.1596,
-          0.15646666666666664,
-          0.15339999999999998,
-          0.15033333333333332,
-          0.14726666666666666,
-          0.14426666666666665,
-          0.14126666666666665,
-          0.13986666666666664,
-          0.13826666666666665,
-          0.13526666666666665,
-          0.13226666666666664,
-          0.12933333333333333,
-          0.12846666666666667,
-          0.12633333333333333,
-          0.12346666666666667,
-          0.1206,
-          0.11786666666666668,
-          0.11513333333333332,
-          0.11253333333333333,
-          0.10993333333333333,
-          0.10733333333333334,
-          0.10486666666666666,
-          0.10239999999999999,
-          0.10006666666666666,
-          0.09773333333333334,
-          0.09546666666666666,
-          0.09333333333333334,
-          0.09126666666666666,
-          0.08926666666666666,
-          0.08733333333333333,
-          0.08546666666666666,
-          0.08366666666666667,
-          0.08186666666666667,
-          0.08013333333333333,
-          0.07846666666666666,
-          0.0768,
-          0.07519999999999999,
-          0.07366666666666666,
-          0.07219999999999999,
-          0.07073333333333333,
-          0.06933333333333333,
-          0.06799999999999999,
-          0.06664666666666666,
-          0.06534,
-          0.06406666666666666,
-          0.061579999999999996,
-          0.05694,
-          0.05278,
-          0.04903333333333333,
-          0.04560666666666666,
-          0.04251333333333333,
-          0.03974,
-          0.037219999999999996,
-          0.03488666666666666,
-          0.03275333333333333,
-          0.03081333333333333,
-          0.02904,
-          0.027399999999999997,
-          0.02588,
-          0.024486666666666664,
-          0.02321333333333333,
-          0.022033333333333335,
-          0.020919999999999998,
-          0.01988,
-          0.01891333333333333,
-          0.018013333333333333,
-          0.017173333333333332,
-          0.01637333333333333,
-          0.015619999999999998,
-          0.014913333333333334,
-          0.013346666666666666,
-          0.011986666666666666,
-          0.010813333333333331,
-          0.009786666666666666,
-          0.00904,
-          0.008886666666666666,
-          0.008106666666666667,
-          0.007406666666666666,
-          0.006793333333333333,
-          0.00624,
-          0.006202,
-          0.005744666666666666,
-          0.005307333333333332,
-          0.0049046666666666665,
-          0.004543999999999999,
-          0.004305333333333333,
-          0.004222666666666666
-        ],
-        "cs2": [
-          50.86666666666666,
-          42.60666666666666,
-          23.58,
-          18.479999999999997,
-          8.933333333333334,
-          6.436,
-          3.877333333333333,
-          1.9259999999999997,
-          1.0673333333333332,
-          0.9786666666666666,
-          0.6499999999999999,
-          0.43279999999999996,
-          0.31453333333333333,
-          0.24839999999999998,
-          0.21086666666666667,
-          0.1893333333333333,
-          0.17679999999999998,
-          0.16933333333333334,
-          0.1645333333333333,
-          0.16106666666666666,
-          0.15826666666666667,
-          0.15573333333333333,
-          0.15326666666666666,
-          0.15073333333333333,
-          0.14813333333333334,
-          0.14546666666666666,
-          0.14273333333333332,
-          0.13993333333333333,
-          0.13866666666666666,
-          0.13713333333333333,
-          0.13433333333333333,
-          0.13146666666666665,
-          0.12866666666666665,
-          0.12786666666666666,
-          0.12586666666666665,
-          0.12306666666666666,
-          0.12033333333333332,
-          0.1176,
-          0.11493333333333333,
-          0.11233333333333334,
-          0.10973333333333332,
-          0.10726666666666665,
-          0.1048,
-          0.10239999999999999,
-          0.10006666666666666,
-          0.0978,
-          0.09559999999999999,
-          0.09346666666666666,
-          0.0914,
-          0.0894,
-          0.08746666666666666,
-          0.08553333333333332,
-          0.08373333333333333,
-          0.08193333333333333,
-          0.08026666666666665,
-          0.0786,
-          0.077,
-          0.0754,
-          0.07386666666666666,
-          0.07239999999999999,
-          0.07093333333333332,
-          0.06953333333333334,
-          0.06813333333333332,
-          0.0668,
-          0.06548,
-          0.0642,
-          0.06172,
-          0.05711333333333333,
-          0.05293333333333333,
-          0.049153333333333334,
-          0.04574,
-          0.04265333333333333,
-          0.03986,
-          0.03731333333333333,
-          0.034986666666666666,
-          0.03286,
-          0.030906666666666666,
-          0.029119999999999997,
-          0.02747333333333333,
-          0.02596,
-          0.024566666666666667,
-          0.02328,
-          0.022086666666666664,
-          0.02098,
-          0.019946666666666665,
-          0.01897333333333333,
-          0.018066666666666665,
-          0.01722,
-          0.016419999999999997,
-          0.01567333333333333,
-          0.014966666666666666,
-          0.013386666666666667,
-          0.012026666666666666,
-          0.010846666666666666,
-          0.009813333333333334,
-          0.009066666666666666,
-          0.008913333333333332,
-          0.008126666666666666,
-          0.0074266666666666665,
-          0.006806666666666667,
-          0.006255333333333333,
-          0.0062173333333333325,
-          0.005760666666666666,
-          0.0053159999999999995,
-          0.004915333333333333,
-          0.004554666666666667,
-          0.004312666666666666,
-          0.004228666666666666
-        ],
-        "beta0": [
-          0.9997,
-          1.294,
-          1.612,
-          1.686,
-          1.825,
-          1.856,
-          1.864,
-          1.773,
-          1.564,
-          1.52,
-          1.252,
-          0.8771,
-          0.5014,
-          0.1846,
-          -0.03238,
-          -0.1355,
-          -0.1412,
-          -0.08364,
-          0.006078,
-          0.1088,
-          0.2152,
-          0.3203,
-          0.4204,
-          0.5127,
-          0.5956,
-          0.6692,
-          0.735,
-          0.7946,
-          0.8205,
-          0.8498,
-          0.9016,
-          0.9501,
-          0.9951,
-          1.007,
-          1.037,
-          1.074,
-          1.109,
-          1.14,
-          1.169,
-          1.197,
-          1.222,
-          1.246,
-          1.269,
-          1.29,
-          1.31,
-          1.329,
-          1.346,
-          1.362,
-          1.377,
-          1.391,
-          1.405,
-          1.418,
-          1.43,
-          1.441,
-          1.451,
-          1.461,
-          1.47,
-          1.479,
-          1.487,
-          1.495,
-          1.503,
-          1.511,
-          1.518,
-          1.526,
-          1.533,
-          1.54,
-          1.551,
-          1.568,
-          1.585,
-          1.603,
-          1.614,
-          1.62,
-          1.629,
-          1.64,
-          1.647,
-          1.647,
-          1.649,
-          1.657,
-          1.664,
-          1.664,
-          1.661,
-          1.663,
-          1.67,
-          1.674,
-          1.671,
-          1.665,
-          1.664,
-          1.669,
-          1.674,
-          1.672,
-          1.665,
-          1.665,
-          1.662,
-          1.649,
-          1.661,
-          1.644,
-          1.64,
-          1.641,
-          1.64,
-          1.625,
-          1.634,
-          1.634,
-          1.616,
-          1.606,
-          1.62,
-          1.599,
-          1.586,
-          1.588
-        ],
-        "beta1": [
-          0.9996,
-          1.294,
-          1.612,
-          1.685,
-          1.825,
-          1.856,
-          1.864,
-          1.773,
-          1.564,
-          1.52,
-          1.255,
-          0.8803,
-          0.4997,
-          0.1793,
-          -0.03504,
-          -0.1347,
-          -0.1407,
-          -0.08475,
-          0.005559,
-          0.1107,
-          0.2188,
-          0.3231,
-          0.4207,
-          0.5103,
-          0.592,
-          0.6663,
-          0.734,
-          0.7957,
-          0.8223,
-          0.8522,
-          0.9039,
-          0.9514,
-          0.9951,
-          1.007,
-          1.035,
-          1.073,
-          1.107,
-          1.139,
-          1.169,
-          1.197,
-          1.223,
-          1.247,
-          1.27,
-          1.291,
-          1.31,
-          1.329,
-          1.346,
-          1.362,
-          1.377,
-          1.391,
-          1.405,
-          1.417,
-          1.429,
-          1.44,
-          1.451,
-          1.461,
-          1.47,
-          1.479,
-          1.488,
-          1.496,
-          1.504,
-          1.512,
-          1.519,
-          1.525,
-          1.532,
-          1.538,
-          1.55,
-          1.57,
-          1.587,
-          1.601,
-          1.613,
-          1.623,
-          1.631,
-          1.638,
-          1.644,
-          1.649,
-          1.653,
-          1.657,
-          1.66,
-          1.662,
-          1.664,
-          1.666,
-          1.667,
-          1.668,
-          1.669,
-          1.669,
-          1.669,
-          1.669,
-          1.668,
-          1.667,
-          1.667,
-          1.664,
-          1.66,
-          1.656,
-          1.652,
-          1.648,
-          1.647,
-          1.642,
-          1.637,
-          1.631,
-          1.626,
-          1.625,
-          1.62,
-          1.614,
-          1.608,
-          1.602,
-          1.598,
-          1.596
-        ],
-        "beta2": [
-          1.004,
-          1.277,
-          1.578,
-          1.651,
-          1.795,
-          1.832,
-          1.851,
-          1.777,
-          1.582,
-          1.539,
-          1.276,
-          0.8929,
-          0.4982,
-          0.1667,
-          -0.05022,
-          -0.145,
-          -0.1426,
-          -0.07812,
-          0.01891,
-          0.1284,
-          0.2388,
-          0.344,
-          0.4415,
-          0.5306,
-          0.6114,
-          0.6846,
-          0.751,
-          0.8113,
-          0.8372,
-          0.8663,
-          0.9166,
-          0.9628,
-          1.005,
-          1.017,
-          1.044,
-          1.081,
-          1.114,
-          1.145,
-          1.174,
-          1.201,
-          1.226,
-          1.25,
-          1.272,
-          1.292,
-          1.311,
-          1.329,
-          1.346,
-          1.361,
-          1.376,
-          1.39,
-          1.403,
-          1.415,
-          1.427,
-          1.437,
-          1.448,
-          1.458,
-          1.467,
-          1.476,
-          1.484,
-          1.492,
-          1.5,
-          1.507,
-          1.514,
-          1.52,
-          1.527,
-          1.533,
-          1.544,
-          1.564,
-          1.581,
-          1.594,
-          1.606,
-          1.616,
-          1.624,
-          1.631,
-          1.637,
-          1.642,
-          1.647,
-          1.65,
-          1.653,
-          1.656,
-          1.658,
-          1.659,
-          1.661,
-          1.662,
-          1.662,
-          1.662,
-          1.663,
-          1.662,
-          1.662,
-          1.661,
-          1.661,
-          1.658,
-          1.655,
-          1.651,
-          1.646,
-          1.643,
-          1.642,
-          1.637,
-          1.632,
-          1.627,
-          1.621,
-          1.621,
-          1.616,
-          1.61,
-          1.604,
-          1.598,
-          1.594,
-          1.592
-        ]
-      }
-    ],
-    "auger_peaks": [
-      {
-        "peak_name": "Kr_MNN_01",
-        "kinetic_energy": 56.51,
-        "channel": "M4NN",
-        "intensity_factor": 0.02826379542395693,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_02",
-        "kinetic_energy": 55.94,
-        "channel": "M4NN",
-        "intensity_factor": 0.051144010767160165,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_03",
-        "kinetic_energy": 55.26,
-        "channel": "M5NN",
-        "intensity_factor": 0.09240246406570841,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      },
-      {
-        "peak_name": "Kr_MNN_04",
-        "kinetic_energy": 54.7,
-        "channel": "M4NN",
-        "intensity_factor": 0.2018842530282638,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_06",
-        "kinetic_energy": 53.45,
-        "channel": "M5NN",
-        "intensity_factor": 0.14168377823408623,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      },
-      {
-        "peak_name": "Kr_MNN_07",
-        "kinetic_energy": 52.41,
-        "channel": "M4NN",
-        "intensity_factor": 0.13458950201884254,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_10",
-        "kinetic_energy": 51.15,
-        "channel": "M5NN",
-        "intensity_factor": 0.11396303901437373,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      },
-      {
-        "peak_name": "Kr_MNN_20",
-        "kinetic_energy": 42.14,
-        "channel": "M4NN",
-        "intensity_factor": 0.07806191117092867,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_21",
-        "kinetic_energy": 41.69,
-        "channel": "M4NN",
-        "intensity_factor": 0.013458950201884255,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_23",
-        "kinetic_energy": 40.89,
-        "channel": "M5NN",
-        "intensity_factor": 0.04722792607802875,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      },
-      {
-        "peak_name": "Kr_MNN_24",
-        "kinetic_energy": 40.46,
-        "channel": "M5NN",
-        "intensity_factor": 0.06365503080082136,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      },
-      {
-        "peak_name": "Kr_MNN_25",
-        "kinetic_energy": 40.19,
-        "channel": "M5NN",
-        "intensity_factor": 0.021560574948665298,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      },
-      {
-        "peak_name": "Kr_MNN_27",
-        "kinetic_energy": 38.71,
-        "channel": "M4NN",
-        "intensity_factor": 0.2113055181695828,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_30",
-        "kinetic_energy": 37.67,
-        "channel": "M5NN",
-        "intensity_factor": 0.2166324435318275,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      },
-      {
-        "peak_name": "Kr_MNN_35",
-        "kinetic_energy": 32.14,
-        "channel": "M4NN",
-        "intensity_factor": 0.1749663526244953,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_40",
-        "kinetic_energy": 30.89,
-        "channel": "M5NN",
-        "intensity_factor": 0.18583162217659138,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      },
-      {
-        "peak_name": "Kr_MNN_51",
-        "kinetic_energy": 25.23,
-        "channel": "M4NN",
-        "intensity_factor": 0.1063257065948856,
-        "origin": "3d3/2",
-        "origin_binding_key": "3d3/2"
-      },
-      {
-        "peak_name": "Kr_MNN_52",
-        "kinetic_energy": 23.98,
-        "channel": "M5NN",
-        "intensity_factor": 0.11704312114989732,
-        "origin": "3d5/2",
-        "origin_binding_key": "3d5/2"
-      }
-    ]
-  },
-  "xenon": {
-    "name": "Xenon",
-    "symbol": "Xe",
-    "binding_energies": {
-      "M1 3s": 1148.7,
-      "M2 3p1/2": 1002.1,
-      "M3 3p3/2": 940.6,
-      "M4 3d3/2": 689,
-      "M5 3d5/2": 676.4,
-      "N1 4s": 213.2,
-      "N2 4p1/2": 146.7,
-      "N3 4p3/2": 145.5,
-      "N4 4d3/2": 69.5,
-      "N5 4d5/2": 67.5,
-      "O1 5s": 23.3,
-      "O2 5p1/2": 13.4,
-      "O3 5p3/2": 12.1
-    },
-    "shell_data": [
-      {
-        "photon_energy": [
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.07818,
-          0.08504,
-          0.08022,
-          0.07531,
-          0.07108,
-          0.0708,
-          0.06713,
-          0.06348,
-          0.0602,
-          0.05712,
-          0.05501,
-          0.05427
-        ],
-        "cs1": [
-          0.07805,
-          0.08498,
-          0.08022,
-          0.07536,
-          0.07115,
-          0.07086,
-          0.06718,
-          0.06352,
-          0.0602,
-          0.05709,
-          0.05496,
-          0.05421
-        ],
-        "cs2": [
-          0.08044,
-          0.08751,
-          0.08255,
-          0.0775,
-          0.07312,
-          0.07282,
-          0.069,
-          0.0652,
-          0.06176,
-          0.05854,
-          0.05634,
-          0.05557
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.13406666666666667,
-          0.13106666666666666,
-          0.12563333333333332,
-          0.1245,
-          0.11723333333333333,
-          0.11059999999999999,
-          0.10426666666666667,
-          0.09836666666666666,
-          0.09796666666666666,
-          0.093,
-          0.08793333333333332,
-          0.0832,
-          0.07883333333333332,
-          0.07576666666666666,
-          0.07469999999999999
-        ],
-        "cs1": [
-          0.13383333333333333,
-          0.13093333333333332,
-          0.1256,
-          0.1245,
-          0.11733333333333332,
-          0.11069999999999999,
-          0.10439999999999999,
-          0.09846666666666666,
-          0.09806666666666666,
-          0.09303333333333333,
-          0.08789999999999999,
-          0.08313333333333334,
-          0.07873333333333332,
-          0.07566666666666666,
-          0.07456666666666667
-        ],
-        "cs2": [
-          0.13379999999999997,
-          0.131,
-          0.1257333333333333,
-          0.12463333333333333,
-          0.11746666666666666,
-          0.11086666666666667,
-          0.10456666666666665,
-          0.09863333333333332,
-          0.09823333333333334,
-          0.0932,
-          0.08806666666666665,
-          0.0833,
-          0.07886666666666667,
-          0.07579999999999999,
-          0.07473333333333333
-        ],
-        "beta0": [
-          0.3243,
-          0.7976,
-          0.9806,
-          1.012,
-          1.15,
-          1.243,
-          1.313,
-          1.366,
-          1.37,
-          1.408,
-          1.442,
-          1.47,
-          1.492,
-          1.507,
-          1.512
-        ],
-        "beta1": [
-          0.3244,
-          0.7974,
-          0.9805,
-          1.012,
-          1.15,
-          1.244,
-          1.313,
-          1.366,
-          1.37,
-          1.408,
-          1.442,
-          1.469,
-          1.492,
-          1.506,
-          1.511
-        ],
-        "beta2": [
-          0.3462,
-          0.8059,
-          0.9838,
-          1.015,
-          1.149,
-          1.24,
-          1.308,
-          1.36,
-          1.363,
-          1.4,
-          1.433,
-          1.46,
-          1.483,
-          1.497,
-          1.501
-        ]
-      },
-      {
-        "photon_energy": [
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.26813333333333333,
-          0.26213333333333333,
-          0.25126666666666664,
-          0.249,
-          0.23446666666666666,
-          0.22119999999999998,
-          0.20853333333333335,
-          0.19673333333333332,
-          0.19593333333333332,
-          0.186,
-          0.17586666666666664,
-          0.1664,
-          0.15766666666666665,
-          0.15153333333333333,
-          0.14939999999999998
-        ],
-        "cs1": [
-          0.26766666666666666,
-          0.26186666666666664,
-          0.2512,
-          0.249,
-          0.23466666666666663,
-          0.22139999999999999,
-          0.20879999999999999,
-          0.19693333333333332,
-          0.19613333333333333,
-          0.18606666666666666,
-          0.17579999999999998,
-          0.16626666666666667,
-          0.15746666666666664,
-          0.15133333333333332,
-          0.14913333333333334
-        ],
-        "cs2": [
-          0.26759999999999995,
-          0.262,
-          0.2514666666666666,
-          0.24926666666666666,
-          0.23493333333333333,
-          0.22173333333333334,
-          0.2091333333333333,
-          0.19726666666666665,
-          0.19646666666666668,
-          0.1864,
-          0.1761333333333333,
-          0.1666,
-          0.15773333333333334,
-          0.15159999999999998,
-          0.14946666666666666
-        ],
-        "beta0": [
-          0.3243,
-          0.7976,
-          0.9806,
-          1.012,
-          1.15,
-          1.243,
-          1.313,
-          1.366,
-          1.37,
-          1.408,
-          1.442,
-          1.47,
-          1.492,
-          1.507,
-          1.512
-        ],
-        "beta1": [
-          0.3244,
-          0.7974,
-          0.9805,
-          1.012,
-          1.15,
-          1.244,
-          1.313,
-          1.366,
-          1.37,
-          1.408,
-          1.442,
-          1.469,
-          1.492,
-          1.506,
-          1.511
-        ],
-        "beta2": [
-          0.3462,
-          0.8059,
-          0.9838,
-          1.015,
-          1.149,
-          1.24,
-          1.308,
-          1.36,
-          1.363,
-          1.4,
-          1.433,
-          1.46,
-          1.483,
-          1.497,
-          1.501
-        ]
-      },
-      {
-        "photon_energy": [
-          695.0,
-          700.0,
-          705.0,
-          710.0,
-          715.0,
-          720.0,
-          725.0,
-          730.0,
-          735.0,
-          740.0,
-          745.0,
-          750.0,
-          755.0,
-          760.0,
-          765.0,
-          770.0,
-          775.0,
-          780.0,
-          785.0,
-          790.0,
-          795.0,
-          800.0,
-          805.0,
-          810.0,
-          815.0,
-          820.0,
-          825.0,
-          830.0,
-          835.0,
-          840.0,
-          845.0,
-          850.0,
-          855.0,
-          860.0,
-          865.0,
-          870.0,
-          875.0,
-          880.0,
-          885.0,
-          890.0,
-          895.0,
-          900.0,
-          905.0,
-          910.0,
-          915.0,
-          920.0,
-          925.0,
-          930.0,
-          935.0,
-          940.0,
-          945.0,
-          950.0,
-          955.0,
-          960.0,
-          965.0,
-          970.0,
-          975.0,
-          980.0,
-          985.0,
-          990.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.047560000000000005,
-          1.242,
-          7.572,
-          2.5776000000000003,
-          1.8803999999999998,
-          1.6732,
-          1.5416,
-          1.4296,
-          1.3348000000000002,
-          1.2592,
-          1.2012,
-          1.1576000000000002,
-          1.1236000000000002,
-          1.0968,
-          1.0736,
-          1.0524,
-          1.0328,
-          1.0136,
-          0.9948000000000001,
-          0.9763999999999999,
-          0.9588,
-          0.9424,
-          0.9264,
-          0.9119999999999999,
-          0.8980000000000001,
-          0.8852000000000001,
-          0.8732,
-          0.8616,
-          0.8504,
-          0.8396000000000001,
-          0.8288000000000001,
-          0.8184,
-          0.808,
-          0.7976000000000001,
-          0.7872,
-          0.7772000000000001,
-          0.7668,
-          0.7572000000000001,
-          0.7472000000000001,
-          0.7376,
-          0.7280000000000001,
-          0.7188,
-          0.71,
-          0.7008000000000001,
-          0.6924000000000001,
-          0.6836000000000001,
-          0.6756000000000001,
-          0.6672,
-          0.6592,
-          0.6512,
-          0.6436000000000001,
-          0.6356,
-          0.6280000000000001,
-          0.6204000000000001,
-          0.6132,
-          0.6056,
-          0.5984,
-          0.5912000000000001,
-          0.584,
-          0.5772,
-          0.5636,
-          0.5115999999999999,
-          0.5012,
-          0.44720000000000004,
-          0.4004,
-          0.35936,
-          0.32336000000000004,
-          0.32092000000000004,
-          0.29164,
-          0.26372,
-          0.23904000000000003,
-          0.21711999999999998,
-          0.20268000000000003,
-          0.19768
-        ],
-        "cs1": [
-          0.04752000000000001,
-          1.2432,
-          7.58,
-          2.5788,
-          1.8808,
-          1.6732,
-          1.5416,
-          1.4292,
-          1.3344,
-          1.2588,
-          1.2008,
-          1.1568,
-          1.1232,
-          1.096,
-          1.0728,
-          1.052,
-          1.032,
-          1.0128000000000001,
-          0.994,
-          0.976,
-          0.9584,
-          0.9420000000000001,
-          0.9264,
-          0.9116,
-          0.8980000000000001,
-          0.8852000000000001,
-          0.8728,
-          0.8612000000000001,
-          0.8504,
-          0.8396000000000001,
-          0.8288000000000001,
-          0.8184,
-          0.808,
-          0.7976000000000001,
-          0.7872,
-          0.7772000000000001,
-          0.7672,
-          0.7572000000000001,
-          0.7476,
-          0.738,
-          0.7284,
-          0.7192000000000001,
-          0.71,
-          0.7012,
-          0.6924000000000001,
-          0.684,
-          0.6756000000000001,
-          0.6676000000000001,
-          0.6596000000000001,
-          0.6516000000000001,
-          0.6436000000000001,
-          0.6360000000000001,
-          0.6284000000000001,
-          0.6208,
-          0.6132,
-          0.606,
-          0.5988000000000001,
-          0.5916,
-          0.5844,
-          0.5772,
-          0.5636,
-          0.5115999999999999,
-          0.5012,
-          0.44720000000000004,
-          0.4,
-          0.359,
-          0.32304,
-          0.32064000000000004,
-          0.29140000000000005,
-          0.26356,
-          0.23896000000000003,
-          0.21716000000000002,
-          0.20276000000000002,
-          0.19776000000000002
-        ],
-        "cs2": [
-          0.04728,
-          1.2436,
-          7.5840000000000005,
-          2.5804,
-          1.8820000000000001,
-          1.674,
-          1.5424,
-          1.4300000000000002,
-          1.3352000000000002,
-          1.2596,
-          1.2016,
-          1.1576000000000002,
-          1.1236000000000002,
-          1.0968,
-          1.0736,
-          1.0524,
-          1.0328,
-          1.0136,
-          0.9948000000000001,
-          0.9763999999999999,
-          0.9592,
-          0.9424,
-          0.9268000000000001,
-          0.9119999999999999,
-          0.8984000000000001,
-          0.8856,
-          0.8736000000000002,
-          0.862,
-          0.8508,
-          0.8400000000000001,
-          0.8292,
-          0.8188000000000001,
-          0.8084,
-          0.7984,
-          0.788,
-          0.778,
-          0.7676000000000001,
-          0.7576,
-          0.7480000000000001,
-          0.7384000000000001,
-          0.7288000000000001,
-          0.7196,
-          0.7108,
-          0.702,
-          0.6932,
-          0.6848000000000001,
-          0.6764000000000001,
-          0.668,
-          0.66,
-          0.652,
-          0.6444000000000001,
-          0.6364000000000001,
-          0.6288,
-          0.6212,
-          0.614,
-          0.6064,
-          0.5992000000000001,
-          0.592,
-          0.5848,
-          0.5780000000000001,
-          0.564,
-          0.512,
-          0.5016,
-          0.4476,
-          0.4004,
-          0.35928000000000004,
-          0.32332000000000005,
-          0.32092000000000004,
-          0.29164,
-          0.2638,
-          0.2392,
-          0.21732,
-          0.20292,
-          0.19796000000000002
-        ],
-        "beta0": [
-          -0.08067,
-          0.8505,
-          0.9301,
-          0.8695,
-          0.7715,
-          0.6771,
-          0.5995,
-          0.5394,
-          0.4946,
-          0.4622,
-          0.4399,
-          0.4254,
-          0.4169,
-          0.4132,
-          0.413,
-          0.4156,
-          0.4203,
-          0.4266,
-          0.4342,
-          0.4428,
-          0.4522,
-          0.4622,
-          0.4729,
-          0.4839,
-          0.4953,
-          0.507,
-          0.5189,
-          0.5309,
-          0.543,
-          0.5551,
-          0.5671,
-          0.5791,
-          0.5909,
-          0.6026,
-          0.6141,
-          0.6255,
-          0.6366,
-          0.6475,
-          0.6582,
-          0.6687,
-          0.679,
-          0.6891,
-          0.699,
-          0.7087,
-          0.7183,
-          0.7276,
-          0.7368,
-          0.7459,
-          0.7547,
-          0.7635,
-          0.772,
-          0.7804,
-          0.7886,
-          0.7967,
-          0.8046,
-          0.8124,
-          0.82,
-          0.8274,
-          0.8347,
-          0.8419,
-          0.8557,
-          0.9069,
-          0.917,
-          0.9675,
-          1.009,
-          1.044,
-          1.073,
-          1.075,
-          1.097,
-          1.117,
-          1.134,
-          1.148,
-          1.157,
-          1.16
-        ],
-        "beta1": [
-          -0.07965,
-          0.8504,
-          0.9299,
-          0.8694,
-          0.7716,
-          0.6773,
-          0.5997,
-          0.5396,
-          0.4947,
-          0.4623,
-          0.4398,
-          0.4253,
-          0.4168,
-          0.413,
-          0.4128,
-          0.4153,
-          0.42,
-          0.4262,
-          0.4338,
-          0.4424,
-          0.4517,
-          0.4618,
-          0.4724,
-          0.4834,
-          0.4949,
-          0.5065,
-          0.5184,
-          0.5305,
-          0.5426,
-          0.5547,
-          0.5667,
-          0.5787,
-          0.5906,
-          0.6023,
-          0.6138,
-          0.6252,
-          0.6363,
-          0.6473,
-          0.658,
-          0.6685,
-          0.6788,
-          0.6889,
-          0.6989,
-          0.7086,
-          0.7182,
-          0.7276,
-          0.7368,
-          0.7458,
-          0.7547,
-          0.7634,
-          0.772,
-          0.7804,
-          0.7886,
-          0.7967,
-          0.8046,
-          0.8124,
-          0.82,
-          0.8274,
-          0.8347,
-          0.8419,
-          0.8557,
-          0.9068,
-          0.9169,
-          0.9672,
-          1.009,
-          1.043,
-          1.072,
-          1.074,
-          1.097,
-          1.117,
-          1.134,
-          1.148,
-          1.157,
-          1.161
-        ],
-        "beta2": [
-          -0.07645,
-          0.8501,
-          0.9289,
-          0.869,
-          0.7718,
-          0.6782,
-          0.6012,
-          0.5414,
-          0.4968,
-          0.4647,
-          0.4424,
-          0.4279,
-          0.4195,
-          0.4157,
-          0.4154,
-          0.418,
-          0.4226,
-          0.4288,
-          0.4363,
-          0.4448,
-          0.4541,
-          0.4641,
-          0.4746,
-          0.4856,
-          0.4969,
-          0.5085,
-          0.5203,
-          0.5322,
-          0.5443,
-          0.5563,
-          0.5683,
-          0.5802,
-          0.592,
-          0.6036,
-          0.6151,
-          0.6263,
-          0.6374,
-          0.6483,
-          0.6589,
-          0.6694,
-          0.6796,
-          0.6897,
-          0.6996,
-          0.7092,
-          0.7187,
-          0.7281,
-          0.7372,
-          0.7462,
-          0.755,
-          0.7637,
-          0.7722,
-          0.7806,
-          0.7887,
-          0.7968,
-          0.8047,
-          0.8124,
-          0.8199,
-          0.8273,
-          0.8346,
-          0.8417,
-          0.8555,
-          0.9063,
-          0.9164,
-          0.9664,
-          1.008,
-          1.042,
-          1.071,
-          1.073,
-          1.095,
-          1.116,
-          1.133,
-          1.147,
-          1.156,
-          1.159
-        ]
-      },
-      {
-        "photon_energy": [
-          695.0,
-          700.0,
-          705.0,
-          710.0,
-          715.0,
-          720.0,
-          725.0,
-          730.0,
-          735.0,
-          740.0,
-          745.0,
-          750.0,
-          755.0,
-          760.0,
-          765.0,
-          770.0,
-          775.0,
-          780.0,
-          785.0,
-          790.0,
-          795.0,
-          800.0,
-          805.0,
-          810.0,
-          815.0,
-          820.0,
-          825.0,
-          830.0,
-          835.0,
-          840.0,
-          845.0,
-          850.0,
-          855.0,
-          860.0,
-          865.0,
-          870.0,
-          875.0,
-          880.0,
-          885.0,
-          890.0,
-          895.0,
-          900.0,
-          905.0,
-          910.0,
-          915.0,
-          920.0,
-          925.0,
-          930.0,
-          935.0,
-          940.0,
-          945.0,
-          950.0,
-          955.0,
-          960.0,
-          965.0,
-          970.0,
-          975.0,
-          980.0,
-          985.0,
-          990.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.07134,
-          1.863,
-          11.357999999999999,
-          3.8663999999999996,
-          2.8205999999999998,
-          2.5098,
-          2.3124,
-          2.1443999999999996,
-          2.0022,
-          1.8888,
-          1.8018,
-          1.7364,
-          1.6854,
-          1.6452,
-          1.6104,
-          1.5785999999999998,
-          1.5492,
-          1.5203999999999998,
-          1.4922,
-          1.4646,
-          1.4382,
-          1.4136,
-          1.3896,
-          1.3679999999999999,
-          1.347,
-          1.3278,
-          1.3097999999999999,
-          1.2924,
-          1.2755999999999998,
-          1.2594,
-          1.2432,
-          1.2275999999999998,
-          1.212,
-          1.1964,
-          1.1807999999999998,
-          1.1658,
-          1.1502,
-          1.1358,
-          1.1208,
-          1.1064,
-          1.092,
-          1.0781999999999998,
-          1.065,
-          1.0512,
-          1.0386,
-          1.0254,
-          1.0134,
-          1.0008,
-          0.9887999999999999,
-          0.9767999999999999,
-          0.9653999999999999,
-          0.9533999999999999,
-          0.942,
-          0.9305999999999999,
-          0.9198,
-          0.9084,
-          0.8976,
-          0.8867999999999999,
-          0.876,
-          0.8658,
-          0.8454,
-          0.7674,
-          0.7517999999999999,
-          0.6708000000000001,
-          0.6005999999999999,
-          0.53904,
-          0.48503999999999997,
-          0.48138,
-          0.43745999999999996,
-          0.39558,
-          0.35856,
-          0.32567999999999997,
-          0.30402,
-          0.29651999999999995
-        ],
-        "cs1": [
-          0.07128,
-          1.8648,
-          11.37,
-          3.8682,
-          2.8211999999999997,
-          2.5098,
-          2.3124,
-          2.1437999999999997,
-          2.0016,
-          1.8881999999999999,
-          1.8011999999999997,
-          1.7351999999999999,
-          1.6847999999999999,
-          1.6440000000000001,
-          1.6092,
-          1.5779999999999998,
-          1.548,
-          1.5191999999999999,
-          1.4909999999999999,
-          1.464,
-          1.4376,
-          1.413,
-          1.3896,
-          1.3674,
-          1.347,
-          1.3278,
-          1.3092,
-          1.2918,
-          1.2755999999999998,
-          1.2594,
-          1.2432,
-          1.2275999999999998,
-          1.212,
-          1.1964,
-          1.1807999999999998,
-          1.1658,
-          1.1507999999999998,
-          1.1358,
-          1.1214,
-          1.107,
-          1.0926,
-          1.0788,
-          1.065,
-          1.0517999999999998,
-          1.0386,
-          1.026,
-          1.0134,
-          1.0014,
-          0.9894,
-          0.9773999999999999,
-          0.9653999999999999,
-          0.954,
-          0.9425999999999999,
-          0.9312,
-          0.9198,
-          0.9089999999999999,
-          0.8982,
-          0.8874000000000001,
-          0.8766,
-          0.8658,
-          0.8454,
-          0.7674,
-          0.7517999999999999,
-          0.6708000000000001,
-          0.6,
-          0.5385,
-          0.48456,
-          0.48095999999999994,
-          0.4371,
-          0.39534,
-          0.35844000000000004,
-          0.32574000000000003,
-          0.30414,
-          0.29664
-        ],
-        "cs2": [
-          0.07092,
-          1.8654,
-          11.376,
-          3.8705999999999996,
-          2.823,
-          2.5109999999999997,
-          2.3135999999999997,
-          2.145,
-          2.0028,
-          1.8894,
-          1.8024,
-          1.7364,
-          1.6854,
-          1.6452,
-          1.6104,
-          1.5785999999999998,
-          1.5492,
-          1.5203999999999998,
-          1.4922,
-          1.4646,
-          1.4388,
-          1.4136,
-          1.3902,
-          1.3679999999999999,
-          1.3476,
-          1.3284,
-          1.3104,
-          1.293,
-          1.2761999999999998,
-          1.26,
-          1.2438,
-          1.2282,
-          1.2126,
-          1.1976,
-          1.182,
-          1.167,
-          1.1514,
-          1.1363999999999999,
-          1.122,
-          1.1076,
-          1.0932,
-          1.0794,
-          1.0661999999999998,
-          1.053,
-          1.0398,
-          1.0272,
-          1.0146,
-          1.002,
-          0.9899999999999999,
-          0.9779999999999999,
-          0.9665999999999999,
-          0.9545999999999999,
-          0.9432,
-          0.9318,
-          0.9209999999999999,
-          0.9096,
-          0.8987999999999999,
-          0.888,
-          0.8772,
-          0.867,
-          0.846,
-          0.768,
-          0.7524,
-          0.6714,
-          0.6005999999999999,
-          0.53892,
-          0.48497999999999997,
-          0.48138,
-          0.43745999999999996,
-          0.3957,
-          0.35879999999999995,
-          0.32598,
-          0.30438,
-          0.29694
-        ],
-        "beta0": [
-          -0.08067,
-          0.8505,
-          0.9301,
-          0.8695,
-          0.7715,
-          0.6771,
-          0.5995,
-          0.5394,
-          0.4946,
-          0.4622,
-          0.4399,
-          0.4254,
-          0.4169,
-          0.4132,
-          0.413,
-          0.4156,
-          0.4203,
-          0.4266,
-          0.4342,
-          0.4428,
-          0.4522,
-          0.4622,
-          0.4729,
-          0.4839,
-          0.4953,
-          0.507,
-          0.5189,
-          0.5309,
-          0.543,
-          0.5551,
-          0.5671,
-          0.5791,
-          0.5909,
-          0.6026,
-          0.6141,
-          0.6255,
-          0.6366,
-          0.6475,
-          0.6582,
-          0.6687,
-          0.679,
-          0.6891,
-          0.699,
-          0.7087,
-          0.7183,
-          0.7276,
-          0.7368,
-          0.7459,
-          0.7547,
-          0.7635,
-          0.772,
-          0.7804,
-          0.7886,
-          0.7967,
-          0.8046,
-          0.8124,
-          0.82,
-          0.8274,
-          0.8347,
-          0.8419,
-          0.8557,
-          0.9069,
-          0.917,
-          0.9675,
-          1.009,
-          1.044,
-          1.073,
-          1.075,
-          1.097,
-          1.117,
-          1.134,
-          1.148,
-          1.157,
-          1.16
-        ],
-        "beta1": [
-          -0.07965,
-          0.8504,
-          0.9299,
-          0.8694,
-          0.7716,
-          0.6773,
-          0.5997,
-          0.5396,
-          0.4947,
-          0.4623,
-          0.4398,
-          0.4253,
-          0.4168,
-          0.413,
-          0.4128,
-          0.4153,
-          0.42,
-          0.4262,
-          0.4338,
-          0.4424,
-          0.4517,
-          0.4618,
-          0.4724,
-          0.4834,
-          0.4949,
-          0.5065,
-          0.5184,
-          0.5305,
-          0.5426,
-          0.5547,
-          0.5667,
-          0.5787,
-          0.5906,
-          0.6023,
-          0.6138,
-          0.6252,
-          0.6363,
-          0.6473,
-          0.658,
-          0.6685,
-          0.6788,
-          0.6889,
-          0.6989,
-          0.7086,
-          0.7182,
-          0.7276,
-          0.7368,
-          0.7458,
-          0.7547,
-          0.7634,
-          0.772,
-          0.7804,
-          0.7886,
-          0.7967,
-          0.8046,
-          0.8124,
-          0.82,
-          0.8274,
-          0.8347,
-          0.8419,
-          0.8557,
-          0.9068,
-          0.9169,
-          0.9672,
-          1.009,
-          1.043,
-          1.072,
-          1.074,
-          1.097,
-          1.117,
-          1.134,
-          1.148,
-          1.157,
-          1.161
-        ],
-        "beta2": [
-          -0.07645,
-          0.8501,
-          0.9289,
-          0.869,
-          0.7718,
-          0.6782,
-          0.6012,
-          0.5414,
-          0.4968,
-          0.4647,
-          0.4424,
-          0.4279,
-          0.4195,
-          0.4157,
-          0.4154,
-          0.418,
-          0.4226,
-          0.4288,
-          0.4363,
-          0.4448,
-          0.4541,
-          0.4641,
-          0.4746,
-          0.4856,
-          0.4969,
-          0.5085,
-          0.5203,
-          0.5322,
-          0.5443,
-          0.5563,
-          0.5683,
-          0.5802,
-          0.592,
-          0.6036,
-          0.6151,
-          0.6263,
-          0.6374,
-          0.6483,
-          0.6589,
-          0.6694,
-          0.6796,
-          0.6897,
-          0.6996,
-          0.7092,
-          0.7187,
-          0.7281,
-          0.7372,
-          0.7462,
-          0.755,
-          0.7637,
-          0.7722,
-          0.7806,
-          0.7887,
-          0.7968,
-          0.8047,
-          0.8124,
-          0.8199,
-          0.8273,
-          0.8346,
-          0.8417,
-          0.8555,
-          0.9063,
-          0.9164,
-          0.9664,
-          1.008,
-          1.042,
-          1.071,
-          1.073,
-          1.095,
-          1.116,
-          1.133,
-          1.147,
-          1.156,
-          1.159
-        ]
-      },
-      {
-        "photon_energy": [
-          200.0,
-          220.0,
-          240.0,
-          260.0,
-          280.0,
-          300.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.2135,
-          0.2211,
-          0.2036,
-          0.1874,
-          0.1748,
-          0.1634,
-          0.1521,
-          0.1415,
-          0.132,
-          0.1233,
-          0.1154,
-          0.1081,
-          0.1014,
-          0.09536,
-          0.08987,
-          0.08489,
-          0.08035,
-          0.07616,
-          0.07227,
-          0.06864,
-          0.06524,
-          0.06207,
-          0.05911,
-          0.05634,
-          0.05375,
-          0.05133,
-          0.04907,
-          0.04696,
-          0.045,
-          0.04318,
-          0.04148,
-          0.03768,
-          0.03439,
-          0.03147,
-          0.02886,
-          0.02694,
-          0.02654,
-          0.02447,
-          0.02266,
-          0.02107,
-          0.01967,
-          0.01957,
-          0.01841,
-          0.01727,
-          0.0162,
-          0.01521,
-          0.01454,
-          0.0143
-        ],
-        "cs1": [
-          0.2131,
-          0.221,
-          0.204,
-          0.1879,
-          0.1752,
-          0.1634,
-          0.1519,
-          0.1412,
-          0.1316,
-          0.1231,
-          0.1153,
-          0.1081,
-          0.1016,
-          0.09551,
-          0.09,
-          0.08497,
-          0.08036,
-          0.07609,
-          0.07214,
-          0.06847,
-          0.06507,
-          0.06192,
-          0.05899,
-          0.05627,
-          0.05373,
-          0.05136,
-          0.04914,
-          0.04706,
-          0.04511,
-          0.04328,
-          0.04156,
-          0.03768,
-          0.03431,
-          0.03136,
-          0.02878,
-          0.0269,
-          0.02651,
-          0.0245,
-          0.02271,
-          0.02111,
-          0.01967,
-          0.01957,
-          0.01838,
-          0.0172,
-          0.01613,
-          0.01516,
-          0.01451,
-          0.01428
-        ],
-        "cs2": [
-          0.2356,
-          0.2421,
-          0.2219,
-          0.2032,
-          0.1885,
-          0.1751,
-          0.1622,
-          0.1503,
-          0.1398,
-          0.1304,
-          0.1219,
-          0.1141,
-          0.107,
-          0.1005,
-          0.09455,
-          0.08914,
-          0.0842,
-          0.07964,
-          0.07543,
-          0.07153,
-          0.06792,
-          0.06458,
-          0.06148,
-          0.0586,
-          0.05592,
-          0.05342,
-          0.05108,
-          0.04888,
-          0.04683,
-          0.0449,
-          0.04309,
-          0.03901,
-          0.03549,
-          0.03241,
-          0.02972,
-          0.02776,
-          0.02736,
-          0.02526,
-          0.0234,
-          0.02173,
-          0.02024,
-          0.02014,
-          0.01889,
-          0.01768,
-          0.01657,
-          0.01557,
-          0.0149,
-          0.01466
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          150.0,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          405.0,
-          410.0,
-          415.0,
-          420.0,
-          425.0,
-          430.0,
-          435.0,
-          440.0,
-          445.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.16396666666666665,
-          0.17796666666666666,
-          0.17666666666666667,
-          0.17426666666666668,
-          0.172,
-          0.17016666666666663,
-          0.16879999999999998,
-          0.16786666666666666,
-          0.16716666666666663,
-          0.16656666666666664,
-          0.16596666666666665,
-          0.1653,
-          0.16456666666666667,
-          0.16373333333333334,
-          0.16286666666666666,
-          0.16193333333333332,
-          0.16096666666666665,
-          0.15999999999999998,
-          0.15896666666666665,
-          0.15789999999999998,
-          0.15676666666666667,
-          0.15563333333333332,
-          0.15439999999999998,
-          0.15313333333333332,
-          0.1518,
-          0.15039999999999998,
-          0.14896666666666666,
-          0.14746666666666666,
-          0.14589999999999997,
-          0.14429999999999998,
-          0.1427,
-          0.14106666666666667,
-          0.13943333333333333,
-          0.13776666666666665,
-          0.13613333333333333,
-          0.1345,
-          0.13286666666666666,
-          0.13126666666666664,
-          0.12966666666666665,
-          0.1281,
-          0.12656666666666666,
-          0.125,
-          0.1235,
-          0.122,
-          0.1205,
-          0.11906666666666667,
-          0.1176,
-          0.11616666666666665,
-          0.11476666666666666,
-          0.11336666666666667,
-          0.112,
-          0.11063333333333332,
-          0.10930000000000001,
-          0.10796666666666667,
-          0.10666666666666666,
-          0.1054,
-          0.10413333333333333,
-          0.10286666666666666,
-          0.10163333333333333,
-          0.10043333333333333,
-          0.0969,
-          0.0924,
-          0.08809999999999998,
-          0.08399999999999999,
-          0.0801,
-          0.0764,
-          0.07289999999999999,
-          0.06966666666666665,
-          0.06666666666666667,
-          0.06383333333333333,
-          0.061233333333333334,
-          0.05876666666666667,
-          0.056466666666666665,
-          0.054266666666666664,
-          0.052199999999999996,
-          0.0502,
-          0.048333333333333325,
-          0.0465,
-          0.042300000000000004,
-          0.038566666666666666,
-          0.0353,
-          0.03249333333333333,
-          0.030466666666666663,
-          0.030046666666666666,
-          0.02786,
-          0.025859999999999998,
-          0.024013333333333334,
-          0.02230333333333333,
-          0.022186666666666664,
-          0.020743333333333332,
-          0.01934333333333333,
-          0.018103333333333332,
-          0.017006666666666666,
-          0.016276666666666665,
-          0.016023333333333334
-        ],
-        "cs1": [
-          0.1639,
-          0.17779999999999999,
-          0.17643333333333333,
-          0.17409999999999998,
-          0.17186666666666664,
-          0.1701333333333333,
-          0.16886666666666666,
-          0.1680333333333333,
-          0.16743333333333332,
-          0.1669,
-          0.16636666666666666,
-          0.16576666666666667,
-          0.1650333333333333,
-          0.16419999999999998,
-          0.1633,
-          0.16233333333333333,
-          0.1613,
-          0.16023333333333334,
-          0.1591,
-          0.15796666666666664,
-          0.15676666666666667,
-          0.15553333333333333,
-          0.15426666666666666,
-          0.1529333333333333,
-          0.15153333333333333,
-          0.15009999999999998,
-          0.14863333333333334,
-          0.14713333333333334,
-          0.14556666666666665,
-          0.144,
-          0.1424,
-          0.14079999999999998,
-          0.1392,
-          0.1376,
-          0.13599999999999998,
-          0.1344,
-          0.13283333333333333,
-          0.13126666666666664,
-          0.1297333333333333,
-          0.12819999999999998,
-          0.12666666666666665,
-          0.12516666666666665,
-          0.12366666666666666,
-          0.12219999999999999,
-          0.12073333333333333,
-          0.11926666666666666,
-          0.11783333333333332,
-          0.1164,
-          0.11496666666666666,
-          0.11356666666666666,
-          0.11216666666666666,
-          0.11076666666666665,
-          0.1094,
-          0.10806666666666666,
-          0.10673333333333332,
-          0.1054,
-          0.1041,
-          0.10283333333333333,
-          0.10156666666666667,
-          0.10033333333333333,
-          0.09673333333333334,
-          0.09216666666666667,
-          0.08786666666666666,
-          0.0838,
-          0.07996666666666666,
-          0.07636666666666667,
-          0.073,
-          0.0698,
-          0.06683333333333333,
-          0.064,
-          0.06133333333333333,
-          0.05883333333333333,
-          0.056466666666666665,
-          0.0542,
-          0.052066666666666664,
-          0.05006666666666666,
-          0.04816666666666666,
-          0.04636666666666667,
-          0.04223333333333333,
-          0.038599999999999995,
-          0.0354,
-          0.03257333333333333,
-          0.030483333333333335,
-          0.030049999999999997,
-          0.02778333333333333,
-          0.025746666666666668,
-          0.023916666666666662,
-          0.022266666666666664,
-          0.022156666666666665,
-          0.02077333333333333,
-          0.01941333333333333,
-          0.018179999999999998,
-          0.017056666666666664,
-          0.016293333333333333,
-          0.016026666666666665
-        ],
-        "cs2": [
-          0.1477,
-          0.1625333333333333,
-          0.16166666666666665,
-          0.1603,
-          0.1593,
-          0.15873333333333334,
-          0.1586,
-          0.1588,
-          0.15906666666666666,
-          0.15933333333333333,
-          0.15949999999999998,
-          0.15946666666666665,
-          0.15926666666666667,
-          0.15889999999999999,
-          0.15839999999999999,
-          0.1578,
-          0.1571,
-          0.15636666666666665,
-          0.15553333333333333,
-          0.15466666666666667,
-          0.15373333333333333,
-          0.15273333333333333,
-          0.15166666666666667,
-          0.15053333333333332,
-          0.14936666666666665,
-          0.14809999999999998,
-          0.14679999999999999,
-          0.14543333333333333,
-          0.144,
-          0.14256666666666667,
-          0.1411,
-          0.1396,
-          0.1381,
-          0.13656666666666667,
-          0.13506666666666667,
-          0.13353333333333334,
-          0.13203333333333334,
-          0.13056666666666666,
-          0.12906666666666666,
-          0.1276,
-          0.12613333333333332,
-          0.12466666666666666,
-          0.12323333333333332,
-          0.12179999999999999,
-          0.12036666666666665,
-          0.11893333333333334,
-          0.11753333333333334,
-          0.11613333333333332,
-          0.11473333333333333,
-          0.11333333333333334,
-          0.11196666666666666,
-          0.11063333333333332,
-          0.10926666666666665,
-          0.10793333333333333,
-          0.10663333333333333,
-          0.10533333333333333,
-          0.10406666666666665,
-          0.1028,
-          0.10153333333333332,
-          0.10033333333333333,
-          0.09673333333333334,
-          0.09223333333333333,
-          0.08796666666666667,
-          0.08396666666666666,
-          0.08016666666666666,
-          0.07656666666666666,
-          0.07316666666666666,
-          0.06999999999999999,
-          0.067,
-          0.0642,
-          0.06153333333333333,
-          0.059,
-          0.05663333333333333,
-          0.05436666666666666,
-          0.05223333333333333,
-          0.05023333333333333,
-          0.048333333333333325,
-          0.04653333333333333,
-          0.0424,
-          0.038766666666666665,
-          0.03553333333333333,
-          0.0327,
-          0.030600000000000002,
-          0.030163333333333334,
-          0.027889999999999998,
-          0.025846666666666664,
-          0.024013333333333334,
-          0.022359999999999998,
-          0.022246666666666665,
-          0.020859999999999997,
-          0.01949333333333333,
-          0.01825,
-          0.017116666666666665,
-          0.01635,
-          0.01608333333333333
-        ],
-        "beta0": [
-          -0.3971,
-          -0.9318,
-          -0.8664,
-          -0.7662,
-          -0.6676,
-          -0.5663,
-          -0.4606,
-          -0.3516,
-          -0.2424,
-          -0.1361,
-          -0.03508,
-          0.05919,
-          0.1461,
-          0.2259,
-          0.299,
-          0.3661,
-          0.428,
-          0.4855,
-          0.5392,
-          0.5896,
-          0.6371,
-          0.6821,
-          0.7247,
-          0.7652,
-          0.8035,
-          0.8398,
-          0.8743,
-          0.9068,
-          0.9375,
-          0.9666,
-          0.994,
-          1.02,
-          1.044,
-          1.067,
-          1.089,
-          1.11,
-          1.13,
-          1.148,
-          1.166,
-          1.183,
-          1.199,
-          1.215,
-          1.23,
-          1.244,
-          1.258,
-          1.271,
-          1.284,
-          1.296,
-          1.308,
-          1.32,
-          1.331,
-          1.342,
-          1.352,
-          1.362,
-          1.371,
-          1.38,
-          1.389,
-          1.398,
-          1.406,
-          1.414,
-          1.436,
-          1.462,
-          1.486,
-          1.506,
-          1.525,
-          1.541,
-          1.556,
-          1.57,
-          1.582,
-          1.593,
-          1.603,
-          1.612,
-          1.62,
-          1.628,
-          1.635,
-          1.641,
-          1.647,
-          1.652,
-          1.662,
-          1.671,
-          1.678,
-          1.684,
-          1.688,
-          1.689,
-          1.693,
-          1.696,
-          1.697,
-          1.697,
-          1.697,
-          1.697,
-          1.697,
-          1.697,
-          1.696,
-          1.696,
-          1.696
-        ],
-        "beta1": [
-          -0.3986,
-          -0.9332,
-          -0.8665,
-          -0.766,
-          -0.6675,
-          -0.5666,
-          -0.461,
-          -0.3521,
-          -0.2429,
-          -0.1364,
-          -0.03512,
-          0.05943,
-          0.1466,
-          0.2266,
-          0.2999,
-          0.3671,
-          0.4291,
-          0.4866,
-          0.5402,
-          0.5906,
-          0.638,
-          0.6829,
-          0.7254,
-          0.7657,
-          0.8039,
-          0.8401,
-          0.8744,
-          0.9068,
-          0.9375,
-          0.9664,
-          0.9938,
-          1.02,
-          1.044,
-          1.067,
-          1.089,
-          1.11,
-          1.129,
-          1.148,
-          1.166,
-          1.183,
-          1.199,
-          1.215,
-          1.23,
-          1.244,
-          1.258,
-          1.271,
-          1.284,
-          1.296,
-          1.308,
-          1.32,
-          1.331,
-          1.342,
-          1.352,
-          1.362,
-          1.371,
-          1.38,
-          1.389,
-          1.398,
-          1.406,
-          1.414,
-          1.436,
-          1.462,
-          1.486,
-          1.506,
-          1.525,
-          1.542,
-          1.556,
-          1.57,
-          1.582,
-          1.593,
-          1.603,
-          1.612,
-          1.62,
-          1.628,
-          1.634,
-          1.641,
-          1.646,
-          1.651,
-          1.663,
-          1.672,
-          1.679,
-          1.684,
-          1.688,
-          1.689,
-          1.692,
-          1.694,
-          1.696,
-          1.697,
-          1.697,
-          1.698,
-          1.698,
-          1.698,
-          1.697,
-          1.696,
-          1.696
-        ],
-        "beta2": [
-          -0.4135,
-          -0.9691,
-          -0.8918,
-          -0.7779,
-          -0.6666,
-          -0.5544,
-          -0.4396,
-          -0.3236,
-          -0.2091,
-          -0.09924,
-          0.003994,
-          0.09944,
-          0.1868,
-          0.2663,
-          0.3388,
-          0.4049,
-          0.4657,
-          0.5218,
-          0.574,
-          0.6228,
-          0.6687,
-          0.712,
-          0.7529,
-          0.7916,
-          0.8283,
-          0.863,
-          0.8959,
-          0.9269,
-          0.9562,
-          0.9839,
-          1.01,
-          1.035,
-          1.058,
-          1.08,
-          1.101,
-          1.12,
-          1.139,
-          1.157,
-          1.174,
-          1.19,
-          1.206,
-          1.221,
-          1.235,
-          1.248,
-          1.262,
-          1.274,
-          1.286,
-          1.298,
-          1.31,
-          1.32,
-          1.331,
-          1.341,
-          1.351,
-          1.36,
-          1.369,
-          1.378,
-          1.387,
-          1.395,
-          1.402,
-          1.41,
-          1.431,
-          1.456,
-          1.479,
-          1.499,
-          1.516,
-          1.532,
-          1.547,
-          1.56,
-          1.571,
-          1.582,
-          1.592,
-          1.6,
-          1.608,
-          1.616,
-          1.622,
-          1.628,
-          1.634,
-          1.639,
-          1.65,
-          1.659,
-          1.666,
-          1.671,
-          1.675,
-          1.676,
-          1.679,
-          1.682,
-          1.684,
-          1.685,
-          1.685,
-          1.685,
-          1.686,
-          1.685,
-          1.685,
-          1.684,
-          1.684
-        ]
-      },
-      {
-        "photon_energy": [
-          150.0,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          375.0,
-          380.0,
-          385.0,
-          390.0,
-          395.0,
-          400.0,
-          405.0,
-          410.0,
-          415.0,
-          420.0,
-          425.0,
-          430.0,
-          435.0,
-          440.0,
-          445.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.3279333333333333,
-          0.3559333333333333,
-          0.35333333333333333,
-          0.34853333333333336,
-          0.344,
-          0.34033333333333327,
-          0.33759999999999996,
-          0.33573333333333333,
-          0.33433333333333326,
-          0.3331333333333333,
-          0.3319333333333333,
-          0.3306,
-          0.32913333333333333,
-          0.3274666666666667,
-          0.3257333333333333,
-          0.32386666666666664,
-          0.3219333333333333,
-          0.31999999999999995,
-          0.3179333333333333,
-          0.31579999999999997,
-          0.31353333333333333,
-          0.31126666666666664,
-          0.30879999999999996,
-          0.30626666666666663,
-          0.3036,
-          0.30079999999999996,
-          0.29793333333333333,
-          0.2949333333333333,
-          0.29179999999999995,
-          0.28859999999999997,
-          0.2854,
-          0.28213333333333335,
-          0.27886666666666665,
-          0.2755333333333333,
-          0.27226666666666666,
-          0.269,
-          0.2657333333333333,
-          0.2625333333333333,
-          0.2593333333333333,
-          0.2562,
-          0.2531333333333333,
-          0.25,
-          0.247,
-          0.244,
-          0.241,
-          0.23813333333333334,
-          0.2352,
-          0.2323333333333333,
-          0.2295333333333333,
-          0.22673333333333334,
-          0.224,
-          0.22126666666666664,
-          0.21860000000000002,
-          0.21593333333333334,
-          0.21333333333333332,
-          0.2108,
-          0.20826666666666666,
-          0.20573333333333332,
-          0.20326666666666665,
-          0.20086666666666667,
-          0.1938,
-          0.1848,
-          0.17619999999999997,
-          0.16799999999999998,
-          0.1602,
-          0.1528,
-          0.14579999999999999,
-          0.1393333333333333,
-          0.13333333333333333,
-          0.12766666666666665,
-          0.12246666666666667,
-          0.11753333333333334,
-          0.11293333333333333,
-          0.10853333333333333,
-          0.10439999999999999,
-          0.1004,
-          0.09666666666666665,
-          0.093,
-          0.08460000000000001,
-          0.07713333333333333,
-          0.0706,
-          0.06498666666666666,
-          0.060933333333333325,
-          0.06009333333333333,
-          0.05572,
-          0.051719999999999995,
-          0.04802666666666667,
-          0.04460666666666666,
-          0.04437333333333333,
-          0.041486666666666665,
-          0.03868666666666666,
-          0.036206666666666665,
-          0.03401333333333333,
-          0.03255333333333333,
-          0.03204666666666667
-        ],
-        "cs1": [
-          0.3278,
-          0.35559999999999997,
-          0.35286666666666666,
-          0.34819999999999995,
-          0.3437333333333333,
-          0.3402666666666666,
-          0.33773333333333333,
-          0.3360666666666666,
-          0.33486666666666665,
-          0.3338,
-          0.3327333333333333,
-          0.33153333333333335,
-          0.3300666666666666,
-          0.32839999999999997,
-          0.3266,
-          0.32466666666666666,
-          0.3226,
-          0.3204666666666667,
-          0.3182,
-          0.3159333333333333,
-          0.31353333333333333,
-          0.31106666666666666,
-          0.3085333333333333,
-          0.3058666666666666,
-          0.30306666666666665,
-          0.30019999999999997,
-          0.2972666666666667,
-          0.2942666666666667,
-          0.2911333333333333,
-          0.288,
-          0.2848,
-          0.28159999999999996,
-          0.2784,
-          0.2752,
-          0.27199999999999996,
-          0.2688,
-          0.26566666666666666,
-          0.2625333333333333,
-          0.2594666666666666,
-          0.25639999999999996,
-          0.2533333333333333,
-          0.2503333333333333,
-          0.24733333333333332,
-          0.24439999999999998,
-          0.24146666666666666,
-          0.23853333333333332,
-          0.23566666666666664,
-          0.2328,
-          0.22993333333333332,
-          0.22713333333333333,
-          0.22433333333333333,
-          0.2215333333333333,
-          0.2188,
-          0.21613333333333332,
-          0.21346666666666664,
-          0.2108,
-          0.2082,
-          0.20566666666666666,
-          0.20313333333333333,
-          0.20066666666666666,
-          0.19346666666666668,
-          0.18433333333333335,
-          0.17573333333333332,
-          0.1676,
-          0.15993333333333332,
-          0.15273333333333333,
-          0.146,
-          0.1396,
-          0.13366666666666666,
-          0.128,
-          0.12266666666666666,
-          0.11766666666666666,
-          0.11293333333333333,
-          0.1084,
-          0.10413333333333333,
-          0.10013333333333332,
-          0.09633333333333333,
-          0.09273333333333333,
-          0.08446666666666666,
-          0.07719999999999999,
-          0.0708,
-          0.06514666666666666,
-          0.06096666666666667,
-          0.060099999999999994,
-          0.05556666666666666,
-          0.051493333333333335,
-          0.047833333333333325,
-          0.04453333333333333,
-          0.04431333333333333,
-          0.04154666666666666,
-          0.03882666666666666,
-          0.036359999999999996,
-          0.03411333333333333,
-          0.03258666666666667,
-          0.03205333333333333
-        ],
-        "cs2": [
-          0.2954,
-          0.3250666666666666,
-          0.3233333333333333,
-          0.3206,
-          0.3186,
-          0.3174666666666667,
-          0.3172,
-          0.3176,
-          0.3181333333333333,
-          0.31866666666666665,
-          0.31899999999999995,
-          0.3189333333333333,
-          0.31853333333333333,
-          0.31779999999999997,
-          0.31679999999999997,
-          0.3156,
-          0.3142,
-          0.3127333333333333,
-          0.31106666666666666,
-          0.30933333333333335,
-          0.30746666666666667,
-          0.30546666666666666,
-          0.30333333333333334,
-          0.30106666666666665,
-          0.2987333333333333,
-          0.29619999999999996,
-          0.29359999999999997,
-          0.29086666666666666,
-          0.288,
-          0.28513333333333335,
-          0.2822,
-          0.2792,
-          0.2762,
-          0.27313333333333334,
-          0.27013333333333334,
-          0.2670666666666667,
-          0.26406666666666667,
-          0.26113333333333333,
-          0.2581333333333333,
-          0.2552,
-          0.25226666666666664,
-          0.24933333333333332,
-          0.24646666666666664,
-          0.24359999999999998,
-          0.2407333333333333,
-          0.23786666666666667,
-          0.23506666666666667,
-          0.23226666666666665,
-          0.22946666666666665,
-          0.22666666666666668,
-          0.22393333333333332,
-          0.22126666666666664,
-          0.2185333333333333,
-          0.21586666666666665,
-          0.21326666666666666,
-          0.21066666666666667,
-          0.2081333333333333,
-          0.2056,
-          0.20306666666666665,
-          0.20066666666666666,
-          0.19346666666666668,
-          0.18446666666666667,
-          0.17593333333333333,
-          0.16793333333333332,
-          0.16033333333333333,
-          0.15313333333333332,
-          0.14633333333333332,
-          0.13999999999999999,
-          0.134,
-          0.1284,
-          0.12306666666666666,
-          0.118,
-          0.11326666666666665,
-          0.10873333333333332,
-          0.10446666666666667,
-          0.10046666666666666,
-          0.09666666666666665,
-          0.09306666666666666,
-          0.0848,
-          0.07753333333333333,
-          0.07106666666666667,
-          0.0654,
-          0.061200000000000004,
-          0.06032666666666667,
-          0.055779999999999996,
-          0.05169333333333333,
-          0.04802666666666667,
-          0.044719999999999996,
-          0.04449333333333333,
-          0.04171999999999999,
-          0.03898666666666666,
-          0.0365,
-          0.03423333333333333,
-          0.0327,
-          0.03216666666666666
-        ],
-        "beta0": [
-          -0.3971,
-          -0.9318,
-          -0.8664,
-          -0.7662,
-          -0.6676,
-          -0.5663,
-          -0.4606,
-          -0.3516,
-          -0.2424,
-          -0.1361,
-          -0.03508,
-          0.05919,
-          0.1461,
-          0.2259,
-          0.299,
-          0.3661,
-          0.428,
-          0.4855,
-          0.5392,
-          0.5896,
-          0.6371,
-          0.6821,
-          0.7247,
-          0.7652,
-          0.8035,
-          0.8398,
-          0.8743,
-          0.9068,
-          0.9375,
-          0.9666,
-          0.994,
-          1.02,
-          1.044,
-          1.067,
-          1.089,
-          1.11,
-          1.13,
-          1.148,
-          1.166,
-          1.183,
-          1.199,
-          1.215,
-          1.23,
-          1.244,
-          1.258,
-          1.271,
-          1.284,
-          1.296,
-          1.308,
-          1.32,
-          1.331,
-          1.342,
-          1.352,
-          1.362,
-          1.371,
-          1.38,
-          1.389,
-          1.398,
-          1.406,
-          1.414,
-          1.436,
-          1.462,
-          1.486,
-          1.506,
-          1.525,
-          1.541,
-          1.556,
-          1.57,
-          1.582,
-          1.593,
-          1.603,
-          1.612,
-          1.62,
-          1.628,
-          1.635,
-          1.641,
-          1.647,
-          1.652,
-          1.662,
-          1.671,
-          1.678,
-          1.684,
-          1.688,
-          1.689,
-          1.693,
-          1.696,
-          1.697,
-          1.697,
-          1.697,
-          1.697,
-          1.697,
-          1.697,
-          1.696,
-          1.696,
-          1.696
-        ],
-        "beta1": [
-          -0.3986,
-          -0.9332,
-          -0.8665,
-          -0.766,
-          -0.6675,
-          -0.5666,
-          -0.461,
-          -0.3521,
-          -0.2429,
-          -0.1364,
-          -0.03512,
-          0.05943,
-          0.1466,
-          0.2266,
-          0.2999,
-          0.3671,
-          0.4291,
-          0.4866,
-          0.5402,
-          0.5906,
-          0.638,
-          0.6829,
-          0.7254,
-          0.7657,
-          0.8039,
-          0.8401,
-          0.8744,
-          0.9068,
-          0.9375,
-          0.9664,
-          0.9938,
-          1.02,
-          1.044,
-          1.067,
-          1.089,
-          1.11,
-          1.129,
-          1.148,
-          1.166,
-          1.183,
-          1.199,
-          1.215,
-          1.23,
-          1.244,
-          1.258,
-          1.271,
-          1.284,
-          1.296,
-          1.308,
-          1.32,
-          1.331,
-          1.342,
-          1.352,
-          1.362,
-          1.371,
-          1.38,
-          1.389,
-          1.398,
-          1.406,
-          1.414,
-          1.436,
-          1.462,
-          1.486,
-          1.506,
-          1.525,
-          1.542,
-          1.556,
-          1.57,
-          1.582,
-          1.593,
-          1.603,
-          1.612,
-          1.62,
-          1.628,
-          1.634,
-          1.641,
-          1.646,
-          1.651,
-          1.663,
-          1.672,
-          1.679,
-          1.684,
-          1.688,
-          1.689,
-          1.692,
-          1.694,
-          1.696,
-          1.697,
-          1.697,
-          1.698,
-          1.698,
-          1.698,
-          1.697,
-          1.696,
-          1.696
-        ],
-        "beta2": [
-          -0.4135,
-          -0.9691,
-          -0.8918,
-          -0.7779,
-          -0.6666,
-          -0.5544,
-          -0.4396,
-          -0.3236,
-          -0.2091,
-          -0.09924,
-          0.003994,
-          0.09944,
-          0.1868,
-          0.2663,
-          0.3388,
-          0.4049,
-          0.4657,
-          0.5218,
-          0.574,
-          0.6228,
-          0.6687,
-          0.712,
-          0.7529,
-          0.7916,
-          0.8283,
-          0.863,
-          0.8959,
-          0.9269,
-          0.9562,
-          0.9839,
-          1.01,
-          1.035,
-          1.058,
-          1.08,
-          1.101,
-          1.12,
-          1.139,
-          1.157,
-          1.174,
-          1.19,
-          1.206,
-          1.221,
-          1.235,
-          1.248,
-          1.262,
-          1.274,
-          1.286,
-          1.298,
-          1.31,
-          1.32,
-          1.331,
-          1.341,
-          1.351,
-          1.36,
-          1.369,
-          1.378,
-          1.387,
-          1.395,
-          1.402,
-          1.41,
-          1.431,
-          1.456,
-          1.479,
-          1.499,
-          1.516,
-          1.532,
-          1.547,
-          1.56,
-          1.571,
-          1.582,
-          1.592,
-          1.6,
-          1.608,
-          1.616,
-          1.622,
-          1.628,
-          1.634,
-          1.639,
-          1.65,
-          1.659,
-          1.666,
-          1.671,
-          1.675,
-          1.676,
-          1.679,
-          1.682,
-          1.684,
-          1.685,
-          1.685,
-          1.685,
-          1.686,
-          1.685,
-          1.685,
-          1.684,
-          1.684
-        ]
-      },
-      {
-        "photon_energy": [
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          2.0556,
-          47.96000000000001,
-          20.32,
-          8.536,
-          5.0520000000000005,
-          3.2568,
-          2.1476,
-          1.4324000000000001,
-          0.968,
-          0.6648000000000001,
-          0.4664,
-          0.33716,
-          0.2942,
-          0.25416,
-          0.20299999999999999,
-          0.17408,
-          0.16068000000000002,
-          0.15904000000000001,
-          0.15808,
-          0.1628,
-          0.17228000000000002,
-          0.18472,
-          0.19884000000000002,
-          0.21368,
-          0.22868,
-          0.24344000000000002,
-          0.25772,
-          0.27128,
-          0.28404,
-          0.29592,
-          0.30688000000000004,
-          0.31692000000000004,
-          0.326,
-          0.33412000000000003,
-          0.34128000000000003,
-          0.34748,
-          0.35284000000000004,
-          0.35736,
-          0.36104,
-          0.36400000000000005,
-          0.36628,
-          0.36788,
-          0.36892,
-          0.36944,
-          0.36944,
-          0.36904000000000003,
-          0.3682,
-          0.36704000000000003,
-          0.36552,
-          0.36372000000000004,
-          0.36164,
-          0.35932000000000003,
-          0.35684000000000005,
-          0.35412,
-          0.35128000000000004,
-          0.34828000000000003,
-          0.34516,
-          0.34196000000000004,
-          0.33864000000000005,
-          0.33528,
-          0.33184,
-          0.32836,
-          0.32128,
-          0.3068,
-          0.29216000000000003,
-          0.27748,
-          0.26288,
-          0.24860000000000004,
-          0.23496000000000003,
-          0.22208000000000003,
-          0.21008000000000002,
-          0.19896000000000003,
-          0.18852000000000002,
-          0.17872,
-          0.16944,
-          0.16056,
-          0.15208,
-          0.14404,
-          0.13640000000000002,
-          0.12928,
-          0.12264,
-          0.11648000000000001,
-          0.11076,
-          0.10548,
-          0.09364,
-          0.08328,
-          0.074,
-          0.06596,
-          0.06024000000000001,
-          0.05912,
-          0.05336,
-          0.04832,
-          0.04376,
-          0.039588000000000005,
-          0.039304000000000006,
-          0.035856,
-          0.032632,
-          0.029896000000000002,
-          0.027516000000000002,
-          0.025916,
-          0.025348
-        ],
-        "cs1": [
-          2.0588,
-          47.96000000000001,
-          20.308000000000003,
-          8.532,
-          5.056000000000001,
-          3.2600000000000002,
-          2.1492,
-          1.4324000000000001,
-          0.9668,
-          0.6632,
-          0.4648,
-          0.33588,
-          0.29308,
-          0.25324,
-          0.20244,
-          0.17376000000000003,
-          0.16056,
-          0.15896,
-          0.15808,
-          0.16284,
-          0.17232000000000003,
-          0.18480000000000002,
-          0.19892,
-          0.21388,
-          0.22896000000000002,
-          0.24384000000000003,
-          0.2582,
-          0.27188,
-          0.28468,
-          0.29664,
-          0.30760000000000004,
-          0.31760000000000005,
-          0.3266,
-          0.33456,
-          0.34156000000000003,
-          0.34764,
-          0.3528,
-          0.35712000000000005,
-          0.36064,
-          0.36344,
-          0.36560000000000004,
-          0.36716000000000004,
-          0.36816000000000004,
-          0.36864,
-          0.36868,
-          0.36836,
-          0.36764,
-          0.36656,
-          0.3652,
-          0.36352000000000007,
-          0.36160000000000003,
-          0.35948,
-          0.35708000000000006,
-          0.35452,
-          0.35176,
-          0.34884000000000004,
-          0.34576,
-          0.34256000000000003,
-          0.33924,
-          0.33584,
-          0.33236,
-          0.3288,
-          0.32152000000000003,
-          0.30664,
-          0.29168,
-          0.27692,
-          0.26252000000000003,
-          0.24860000000000004,
-          0.23528,
-          0.22260000000000002,
-          0.21056,
-          0.19924,
-          0.18856,
-          0.17848,
-          0.16896,
-          0.16004000000000002,
-          0.1516,
-          0.14372000000000001,
-          0.13636,
-          0.12940000000000002,
-          0.12292000000000002,
-          0.1168,
-          0.11104000000000001,
-          0.10564000000000001,
-          0.09344000000000001,
-          0.08296,
-          0.07392,
-          0.06612,
-          0.06044000000000001,
-          0.05932,
-          0.05336,
-          0.04816,
-          0.0436,
-          0.039548,
-          0.039276000000000005,
-          0.035980000000000005,
-          0.032816000000000005,
-          0.030008000000000003,
-          0.027496,
-          0.02582,
-          0.025235999999999998
-        ],
-        "cs2": [
-          2.0324000000000004,
-          47.800000000000004,
-          20.22,
-          8.484,
-          5.0200000000000005,
-          3.2316000000000003,
-          2.1264,
-          1.4140000000000001,
-          0.9516,
-          0.6508,
-          0.45439999999999997,
-          0.32716,
-          0.28508,
-          0.24596,
-          0.19636,
-          0.16872,
-          0.15636000000000003,
-          0.15496000000000001,
-          0.15460000000000002,
-          0.15996,
-          0.17004,
-          0.18296,
-          0.19752000000000003,
-          0.21280000000000002,
-          0.22824,
-          0.24340000000000003,
-          0.258,
-          0.27188,
-          0.28488,
-          0.29696,
-          0.30808,
-          0.31820000000000004,
-          0.32728,
-          0.33536000000000005,
-          0.34244,
-          0.34856,
-          0.35376,
-          0.35812,
-          0.36172000000000004,
-          0.36456,
-          0.36676000000000003,
-          0.36832,
-          0.36936,
-          0.36988,
-          0.36996000000000007,
-          0.36964,
-          0.36892,
-          0.36788,
-          0.36648000000000003,
-          0.36484000000000005,
-          0.36292,
-          0.36076,
-          0.35836,
-          0.3558,
-          0.353,
-          0.35008,
-          0.34700000000000003,
-          0.34376000000000007,
-          0.34044,
-          0.337,
-          0.33348,
-          0.32992,
-          0.3226,
-          0.30764,
-          0.29264,
-          0.2778,
-          0.26336,
-          0.24940000000000004,
-          0.236,
-          0.22328000000000003,
-          0.21120000000000003,
-          0.1998,
-          0.18904,
-          0.17896,
-          0.1694,
-          0.16044000000000003,
-          0.15204,
-          0.14412,
-          0.13672,
-          0.12976000000000001,
-          0.1232,
-          0.11708000000000002,
-          0.11128,
-          0.10588,
-          0.09364,
-          0.08316000000000001,
-          0.07408000000000001,
-          0.06624000000000001,
-          0.06056,
-          0.0594,
-          0.05344,
-          0.048240000000000005,
-          0.043640000000000005,
-          0.03961200000000001,
-          0.03934000000000001,
-          0.036032,
-          0.032856,
-          0.03004,
-          0.027520000000000003,
-          0.025840000000000002,
-          0.02526
-        ],
-        "beta0": [
-          1.421,
-          0.6303,
-          0.507,
-          0.6682,
-          0.8979,
-          1.141,
-          1.376,
-          1.589,
-          1.767,
-          1.887,
-          1.921,
-          1.826,
-          1.729,
-          1.567,
-          1.136,
-          0.5937,
-          0.05422,
-          -0.08083,
-          -0.3768,
-          -0.6552,
-          -0.795,
-          -0.834,
-          -0.8094,
-          -0.7486,
-          -0.6691,
-          -0.5818,
-          -0.4926,
-          -0.405,
-          -0.3207,
-          -0.2405,
-          -0.1649,
-          -0.09378,
-          -0.02714,
-          0.03524,
-          0.0936,
-          0.1482,
-          0.1993,
-          0.2471,
-          0.2919,
-          0.334,
-          0.3735,
-          0.4107,
-          0.4457,
-          0.4788,
-          0.51,
-          0.5396,
-          0.5677,
-          0.5944,
-          0.6198,
-          0.644,
-          0.6671,
-          0.6892,
-          0.7103,
-          0.7305,
-          0.7498,
-          0.7684,
-          0.7862,
-          0.8033,
-          0.8197,
-          0.8355,
-          0.8507,
-          0.8653,
-          0.8929,
-          0.9422,
-          0.985,
-          1.022,
-          1.055,
-          1.084,
-          1.11,
-          1.133,
-          1.154,
-          1.173,
-          1.191,
-          1.206,
-          1.22,
-          1.232,
-          1.242,
-          1.252,
-          1.26,
-          1.267,
-          1.275,
-          1.281,
-          1.288,
-          1.294,
-          1.307,
-          1.316,
-          1.32,
-          1.322,
-          1.324,
-          1.325,
-          1.328,
-          1.331,
-          1.33,
-          1.327,
-          1.327,
-          1.322,
-          1.318,
-          1.315,
-          1.314,
-          1.313,
-          1.313
-        ],
-        "beta1": [
-          1.42,
-          0.6303,
-          0.5067,
-          0.668,
-          0.898,
-          1.141,
-          1.376,
-          1.589,
-          1.767,
-          1.887,
-          1.92,
-          1.825,
-          1.728,
-          1.565,
-          1.134,
-          0.5927,
-          0.05512,
-          -0.0794,
-          -0.3744,
-          -0.6526,
-          -0.7931,
-          -0.8332,
-          -0.8095,
-          -0.7493,
-          -0.6701,
-          -0.5827,
-          -0.4932,
-          -0.4051,
-          -0.3203,
-          -0.2397,
-          -0.1637,
-          -0.09233,
-          -0.02552,
-          0.03694,
-          0.09527,
-          0.1497,
-          0.2007,
-          0.2483,
-          0.2929,
-          0.3347,
-          0.3739,
-          0.4109,
-          0.4457,
-          0.4786,
-          0.5097,
-          0.5392,
-          0.5673,
-          0.5939,
-          0.6193,
-          0.6435,
-          0.6667,
-          0.6888,
-          0.71,
-          0.7302,
-          0.7496,
-          0.7683,
-          0.7861,
-          0.8032,
-          0.8197,
-          0.8355,
-          0.8507,
-          0.8653,
-          0.8928,
-          0.9421,
-          0.9848,
-          1.022,
-          1.055,
-          1.084,
-          1.111,
-          1.134,
-          1.155,
-          1.173,
-          1.19,
-          1.205,
-          1.218,
-          1.23,
-          1.241,
-          1.251,
-          1.26,
-          1.269,
-          1.276,
-          1.283,
-          1.289,
-          1.294,
-          1.305,
-          1.314,
-          1.32,
-          1.324,
-          1.326,
-          1.327,
-          1.328,
-          1.328,
-          1.328,
-          1.326,
-          1.326,
-          1.324,
-          1.321,
-          1.318,
-          1.315,
-          1.312,
-          1.311
-        ],
-        "beta2": [
-          1.417,
-          0.6337,
-          0.5122,
-          0.6706,
-          0.8973,
-          1.138,
-          1.371,
-          1.585,
-          1.764,
-          1.887,
-          1.923,
-          1.829,
-          1.731,
-          1.566,
-          1.128,
-          0.5768,
-          0.03256,
-          -0.1027,
-          -0.3972,
-          -0.6704,
-          -0.8039,
-          -0.8374,
-          -0.8085,
-          -0.7444,
-          -0.6627,
-          -0.5737,
-          -0.4833,
-          -0.3949,
-          -0.3101,
-          -0.2297,
-          -0.154,
-          -0.08308,
-          -0.01678,
-          0.04513,
-          0.1029,
-          0.1569,
-          0.2073,
-          0.2544,
-          0.2985,
-          0.3399,
-          0.3787,
-          0.4153,
-          0.4497,
-          0.4823,
-          0.5131,
-          0.5423,
-          0.57,
-          0.5964,
-          0.6216,
-          0.6456,
-          0.6685,
-          0.6904,
-          0.7113,
-          0.7314,
-          0.7506,
-          0.7691,
-          0.7868,
-          0.8037,
-          0.82,
-          0.8357,
-          0.8507,
-          0.8652,
-          0.8925,
-          0.9413,
-          0.9837,
-          1.021,
-          1.054,
-          1.083,
-          1.109,
-          1.132,
-          1.152,
-          1.171,
-          1.187,
-          1.202,
-          1.216,
-          1.228,
-          1.239,
-          1.249,
-          1.258,
-          1.266,
-          1.274,
-          1.28,
-          1.286,
-          1.292,
-          1.303,
-          1.311,
-          1.317,
-          1.322,
-          1.324,
-          1.324,
-          1.326,
-          1.326,
-          1.326,
-          1.324,
-          1.324,
-          1.322,
-          1.319,
-          1.316,
-          1.313,
-          1.31,
-          1.309
-        ]
-      },
-      {
-        "photon_energy": [
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          325.0,
-          330.0,
-          335.0,
-          340.0,
-          345.0,
-          350.0,
-          355.0,
-          360.0,
-          365.0,
-          370.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          3.0834,
-          71.94,
-          30.479999999999997,
-          12.804,
-          7.578,
-          4.885199999999999,
-          3.2213999999999996,
-          2.1486,
-          1.452,
-          0.9971999999999999,
-          0.6995999999999999,
-          0.50574,
-          0.4413,
-          0.38123999999999997,
-          0.30449999999999994,
-          0.26111999999999996,
-          0.24101999999999998,
-          0.23856,
-          0.23712,
-          0.24419999999999997,
-          0.25842,
-          0.27708,
-          0.29825999999999997,
-          0.32051999999999997,
-          0.34302,
-          0.36516,
-          0.38658,
-          0.40692,
-          0.42605999999999994,
-          0.44388,
-          0.46031999999999995,
-          0.47537999999999997,
-          0.48899999999999993,
-          0.50118,
-          0.5119199999999999,
-          0.52122,
-          0.52926,
-          0.53604,
-          0.5415599999999999,
-          0.546,
-          0.5494199999999999,
-          0.55182,
-          0.55338,
-          0.55416,
-          0.55416,
-          0.5535599999999999,
-          0.5523,
-          0.5505599999999999,
-          0.54828,
-          0.54558,
-          0.5424599999999999,
-          0.53898,
-          0.53526,
-          0.53118,
-          0.5269199999999999,
-          0.52242,
-          0.51774,
-          0.51294,
-          0.50796,
-          0.5029199999999999,
-          0.49776,
-          0.49254,
-          0.48192,
-          0.4602,
-          0.43824,
-          0.41622,
-          0.39432,
-          0.3729,
-          0.35244000000000003,
-          0.33312,
-          0.31512,
-          0.29844,
-          0.28278,
-          0.26808,
-          0.25416,
-          0.24083999999999997,
-          0.22812,
-          0.21605999999999997,
-          0.2046,
-          0.19391999999999998,
-          0.18395999999999998,
-          0.17472000000000001,
-          0.16613999999999998,
-          0.15822,
-          0.14046,
-          0.12491999999999999,
-          0.111,
-          0.09893999999999999,
-          0.09036000000000001,
-          0.08868,
-          0.08003999999999999,
-          0.07248,
-          0.06563999999999999,
-          0.059382,
-          0.058955999999999995,
-          0.053784,
-          0.048948,
-          0.044844,
-          0.041274,
-          0.038874,
-          0.03802199999999999
-        ],
-        "cs1": [
-          3.0882,
-          71.94,
-          30.462,
-          12.797999999999998,
-          7.584,
-          4.89,
-          3.2238,
-          2.1486,
-          1.4502,
-          0.9947999999999999,
-          0.6971999999999999,
-          0.5038199999999999,
-          0.43962,
-          0.37986,
-          0.30366,
-          0.26064,
-          0.24083999999999997,
-          0.23843999999999999,
-          0.23712,
-          0.24426,
-          0.25848,
-          0.2772,
-          0.29838,
-          0.32081999999999994,
-          0.34344,
-          0.36576000000000003,
-          0.3873,
-          0.40781999999999996,
-          0.42702,
-          0.44496,
-          0.4614,
-          0.4764,
-          0.4899,
-          0.50184,
-          0.51234,
-          0.5214599999999999,
-          0.5292,
-          0.53568,
-          0.54096,
-          0.54516,
-          0.5484,
-          0.55074,
-          0.55224,
-          0.55296,
-          0.55302,
-          0.55254,
-          0.55146,
-          0.54984,
-          0.5478,
-          0.54528,
-          0.5424,
-          0.53922,
-          0.53562,
-          0.5317799999999999,
-          0.52764,
-          0.52326,
-          0.51864,
-          0.51384,
-          0.50886,
-          0.50376,
-          0.49854,
-          0.49319999999999997,
-          0.48227999999999993,
-          0.4599599999999999,
-          0.43751999999999996,
-          0.41538,
-          0.39377999999999996,
-          0.3729,
-          0.35291999999999996,
-          0.3339,
-          0.31583999999999995,
-          0.29885999999999996,
-          0.28284,
-          0.26771999999999996,
-          0.25344,
-          0.24006,
-          0.2274,
-          0.21558,
-          0.20453999999999997,
-          0.1941,
-          0.18438000000000002,
-          0.1752,
-          0.16656,
-          0.15846,
-          0.14016,
-          0.12444,
-          0.11087999999999999,
-          0.09918,
-          0.09066,
-          0.08897999999999999,
-          0.08003999999999999,
-          0.07224,
-          0.0654,
-          0.059322,
-          0.058913999999999994,
-          0.05397,
-          0.049224,
-          0.045012,
-          0.041243999999999996,
-          0.038729999999999994,
-          0.03785399999999999
-        ],
-        "cs2": [
-          3.0486,
-          71.7,
-          30.33,
-          12.726,
-          7.53,
-          4.8474,
-          3.1896,
-          2.121,
-          1.4274,
-          0.9762,
-          0.6815999999999999,
-          0.49073999999999995,
-          0.42762,
-          0.36894,
-          0.29453999999999997,
-          0.25307999999999997,
-          0.23454,
-          0.23244,
-          0.2319,
-          0.23994,
-          0.25505999999999995,
-          0.27443999999999996,
-          0.29628,
-          0.3192,
-          0.34236,
-          0.36510000000000004,
-          0.387,
-          0.40781999999999996,
-          0.42732000000000003,
-          0.44543999999999995,
-          0.46212,
-          0.47729999999999995,
-          0.49092,
-          0.50304,
-          0.51366,
-          0.52284,
-          0.53064,
-          0.53718,
-          0.54258,
-          0.54684,
-          0.55014,
-          0.55248,
-          0.55404,
-          0.55482,
-          0.55494,
-          0.55446,
-          0.55338,
-          0.55182,
-          0.54972,
-          0.54726,
-          0.54438,
-          0.54114,
-          0.53754,
-          0.5337,
-          0.5295,
-          0.5251199999999999,
-          0.5205,
-          0.51564,
-          0.51066,
-          0.5055,
-          0.50022,
-          0.49488,
-          0.4839,
-          0.46146,
-          0.43896,
-          0.4167,
-          0.39504,
-          0.37410000000000004,
-          0.354,
-          0.33492,
-          0.3168,
-          0.29969999999999997,
-          0.28356,
-          0.26844,
-          0.2541,
-          0.24065999999999999,
-          0.22805999999999998,
-          0.21618,
-          0.20507999999999998,
-          0.19464,
-          0.1848,
-          0.17562,
-          0.16691999999999999,
-          0.15882,
-          0.14046,
-          0.12473999999999999,
-          0.11112,
-          0.09935999999999999,
-          0.09084,
-          0.0891,
-          0.08016,
-          0.07236,
-          0.06546,
-          0.059418,
-          0.05901,
-          0.05404799999999999,
-          0.049284,
-          0.045059999999999996,
-          0.04128,
-          0.03876,
-          0.03789
-        ],
-        "beta0": [
-          1.421,
-          0.6303,
-          0.507,
-          0.6682,
-          0.8979,
-          1.141,
-          1.376,
-          1.589,
-          1.767,
-          1.887,
-          1.921,
-          1.826,
-          1.729,
-          1.567,
-          1.136,
-          0.5937,
-          0.05422,
-          -0.08083,
-          -0.3768,
-          -0.6552,
-          -0.795,
-          -0.834,
-          -0.8094,
-          -0.7486,
-          -0.6691,
-          -0.5818,
-          -0.4926,
-          -0.405,
-          -0.3207,
-          -0.2405,
-          -0.1649,
-          -0.09378,
-          -0.02714,
-          0.03524,
-          0.0936,
-          0.1482,
-          0.1993,
-          0.2471,
-          0.2919,
-          0.334,
-          0.3735,
-          0.4107,
-          0.4457,
-          0.4788,
-          0.51,
-          0.5396,
-          0.5677,
-          0.5944,
-          0.6198,
-          0.644,
-          0.6671,
-          0.6892,
-          0.7103,
-          0.7305,
-          0.7498,
-          0.7684,
-          0.7862,
-          0.8033,
-          0.8197,
-          0.8355,
-          0.8507,
-          0.8653,
-          0.8929,
-          0.9422,
-          0.985,
-          1.022,
-          1.055,
-          1.084,
-          1.11,
-          1.133,
-          1.154,
-          1.173,
-          1.191,
-          1.206,
-          1.22,
-          1.232,
-          1.242,
-          1.252,
-          1.26,
-          1.267,
-          1.275,
-          1.281,
-          1.288,
-          1.294,
-          1.307,
-          1.316,
-          1.32,
-          1.322,
-          1.324,
-          1.325,
-          1.328,
-          1.331,
-          1.33,
-          1.327,
-          1.327,
-          1.322,
-          1.318,
-          1.315,
-          1.314,
-          1.313,
-          1.313
-        ],
-        "beta1": [
-          1.42,
-          0.6303,
-          0.5067,
-          0.668,
-          0.898,
-          1.141,
-          1.376,
-          1.589,
-          1.767,
-          1.887,
-          1.92,
-          1.825,
-          1.728,
-          1.565,
-          1.134,
-          0.5927,
-          0.05512,
-          -0.0794,
-          -0.3744,
-          -0.6526,
-          -0.7931,
-          -0.8332,
-          -0.8095,
-          -0.7493,
-          -0.6701,
-          -0.5827,
-          -0.4932,
-          -0.4051,
-          -0.3203,
-          -0.2397,
-          -0.1637,
-          -0.09233,
-          -0.02552,
-          0.03694,
-          0.09527,
-          0.1497,
-          0.2007,
-          0.2483,
-          0.2929,
-          0.3347,
-          0.3739,
-          0.4109,
-          0.4457,
-          0.4786,
-          0.5097,
-          0.5392,
-          0.5673,
-          0.5939,
-          0.6193,
-          0.6435,
-          0.6667,
-          0.6888,
-          0.71,
-          0.7302,
-          0.7496,
-          0.7683,
-          0.7861,
-          0.8032,
-          0.8197,
-          0.8355,
-          0.8507,
-          0.8653,
-          0.8928,
-          0.9421,
-          0.9848,
-          1.022,
-          1.055,
-          1.084,
-          1.111,
-          1.134,
-          1.155,
-          1.173,
-          1.19,
-          1.205,
-          1.218,
-          1.23,
-          1.241,
-          1.251,
-          1.26,
-          1.269,
-          1.276,
-          1.283,
-          1.289,
-          1.294,
-          1.305,
-          1.314,
-          1.32,
-          1.324,
-          1.326,
-          1.327,
-          1.328,
-          1.328,
-          1.328,
-          1.326,
-          1.326,
-          1.324,
-          1.321,
-          1.318,
-          1.315,
-          1.312,
-          1.311
-        ],
-        "beta2": [
-          1.417,
-          0.6337,
-          0.5122,
-          0.6706,
-          0.8973,
-          1.138,
-          1.371,
-          1.585,
-          1.764,
-          1.887,
-          1.923,
-          1.829,
-          1.731,
-          1.566,
-          1.128,
-          0.5768,
-          0.03256,
-          -0.1027,
-          -0.3972,
-          -0.6704,
-          -0.8039,
-          -0.8374,
-          -0.8085,
-          -0.7444,
-          -0.6627,
-          -0.5737,
-          -0.4833,
-          -0.3949,
-          -0.3101,
-          -0.2297,
-          -0.154,
-          -0.08308,
-          -0.01678,
-          0.04513,
-          0.1029,
-          0.1569,
-          0.2073,
-          0.2544,
-          0.2985,
-          0.3399,
-          0.3787,
-          0.4153,
-          0.4497,
-          0.4823,
-          0.5131,
-          0.5423,
-          0.57,
-          0.5964,
-          0.6216,
-          0.6456,
-          0.6685,
-          0.6904,
-          0.7113,
-          0.7314,
-          0.7506,
-          0.7691,
-          0.7868,
-          0.8037,
-          0.82,
-          0.8357,
-          0.8507,
-          0.8652,
-          0.8925,
-          0.9413,
-          0.9837,
-          1.021,
-          1.054,
-          1.083,
-          1.109,
-          1.132,
-          1.152,
-          1.171,
-          1.187,
-          1.202,
-          1.216,
-          1.228,
-          1.239,
-          1.249,
-          1.258,
-          1.266,
-          1.274,
-          1.28,
-          1.286,
-          1.292,
-          1.303,
-          1.311,
-          1.317,
-          1.322,
-          1.324,
-          1.324,
-          1.326,
-          1.326,
-          1.326,
-          1.324,
-          1.324,
-          1.322,
-          1.319,
-          1.316,
-          1.313,
-          1.31,
-          1.309
-        ]
-      },
-      {
-        "photon_energy": [
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          315.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          0.0371,
-          0.06575,
-          0.1132,
-          0.1739,
-          0.2107,
-          0.2146,
-          0.227,
-          0.23,
-          0.2261,
-          0.219,
-          0.2099,
-          0.1994,
-          0.1882,
-          0.1768,
-          0.1661,
-          0.1564,
-          0.1478,
-          0.1402,
-          0.1332,
-          0.1265,
-          0.1201,
-          0.1139,
-          0.1079,
-          0.1023,
-          0.09992,
-          0.09723,
-          0.09262,
-          0.08851,
-          0.08482,
-          0.08384,
-          0.08143,
-          0.07825,
-          0.0752,
-          0.07223,
-          0.06934,
-          0.06653,
-          0.06386,
-          0.06135,
-          0.05905,
-          0.05695,
-          0.05506,
-          0.05335,
-          0.05177,
-          0.0503,
-          0.04888,
-          0.04749,
-          0.04611,
-          0.04472,
-          0.04334,
-          0.04199,
-          0.04068,
-          0.03942,
-          0.03825,
-          0.03716,
-          0.03616,
-          0.03525,
-          0.03441,
-          0.03363,
-          0.03288,
-          0.03216,
-          0.03144,
-          0.03072,
-          0.02999,
-          0.02925,
-          0.02634,
-          0.02396,
-          0.02223,
-          0.0207,
-          0.01908,
-          0.01754,
-          0.01634,
-          0.01545,
-          0.01462,
-          0.01367,
-          0.01271,
-          0.01192,
-          0.01135,
-          0.01087,
-          0.01035,
-          0.009739,
-          0.009143,
-          0.008662,
-          0.008312,
-          0.008017,
-          0.007684,
-          0.007286,
-          0.006877,
-          0.006532,
-          0.006038,
-          0.00548,
-          0.004878,
-          0.004567,
-          0.004249,
-          0.004165,
-          0.003775,
-          0.003593,
-          0.003307,
-          0.002961,
-          0.002943,
-          0.002819,
-          0.002713,
-          0.00248,
-          0.00229,
-          0.00222,
-          0.002196
-        ],
-        "cs1": [
-          0.03718,
-          0.0666,
-          0.1151,
-          0.1746,
-          0.2101,
-          0.214,
-          0.227,
-          0.2313,
-          0.2279,
-          0.2199,
-          0.2096,
-          0.1985,
-          0.1873,
-          0.1766,
-          0.1665,
-          0.1571,
-          0.1484,
-          0.1404,
-          0.1329,
-          0.126,
-          0.1195,
-          0.1135,
-          0.1079,
-          0.1027,
-          0.1004,
-          0.09784,
-          0.09333,
-          0.08911,
-          0.08517,
-          0.08411,
-          0.08148,
-          0.07803,
-          0.07481,
-          0.0718,
-          0.06898,
-          0.06635,
-          0.06388,
-          0.06157,
-          0.05941,
-          0.05737,
-          0.05544,
-          0.05362,
-          0.05189,
-          0.05024,
-          0.04867,
-          0.04717,
-          0.04574,
-          0.04438,
-          0.04307,
-          0.04183,
-          0.04064,
-          0.0395,
-          0.03841,
-          0.03737,
-          0.03637,
-          0.03542,
-          0.0345,
-          0.03361,
-          0.03276,
-          0.03194,
-          0.03115,
-          0.03039,
-          0.02966,
-          0.02896,
-          0.0264,
-          0.0242,
-          0.02226,
-          0.02055,
-          0.01903,
-          0.01769,
-          0.0165,
-          0.01543,
-          0.01446,
-          0.01358,
-          0.01278,
-          0.01205,
-          0.01139,
-          0.01077,
-          0.0102,
-          0.009679,
-          0.009197,
-          0.008752,
-          0.008339,
-          0.007952,
-          0.007589,
-          0.007251,
-          0.006938,
-          0.006647,
-          0.005995,
-          0.005428,
-          0.004943,
-          0.00452,
-          0.00421,
-          0.004146,
-          0.003821,
-          0.003531,
-          0.003269,
-          0.00304,
-          0.003024,
-          0.002836,
-          0.002648,
-          0.002479,
-          0.002327,
-          0.002225,
-          0.002189
-        ],
-        "cs2": [
-          0.1497,
-          0.1894,
-          0.2425,
-          0.2943,
-          0.3162,
-          0.3177,
-          0.3189,
-          0.3101,
-          0.2952,
-          0.2776,
-          0.2594,
-          0.2418,
-          0.2252,
-          0.21,
-          0.1961,
-          0.1836,
-          0.1722,
-          0.1618,
-          0.1523,
-          0.1436,
-          0.1357,
-          0.1283,
-          0.1216,
-          0.1153,
-          0.1126,
-          0.1095,
-          0.1041,
-          0.09908,
-          0.09444,
-          0.0932,
-          0.09012,
-          0.08612,
-          0.08239,
-          0.07892,
-          0.07569,
-          0.07267,
-          0.06985,
-          0.06722,
-          0.06474,
-          0.06242,
-          0.06023,
-          0.05816,
-          0.0562,
-          0.05435,
-          0.05259,
-          0.05092,
-          0.04933,
-          0.04781,
-          0.04637,
-          0.04499,
-          0.04367,
-          0.04241,
-          0.0412,
-          0.04004,
-          0.03894,
-          0.03788,
-          0.03687,
-          0.03589,
-          0.03496,
-          0.03406,
-          0.0332,
-          0.03238,
-          0.03159,
-          0.03082,
-          0.02804,
-          0.02564,
-          0.02354,
-          0.02169,
-          0.02007,
-          0.01862,
-          0.01734,
-          0.01619,
-          0.01516,
-          0.01422,
-          0.01337,
-          0.0126,
-          0.01189,
-          0.01124,
-          0.01064,
-          0.01009,
-          0.009578,
-          0.009107,
-          0.008669,
-          0.008262,
-          0.007883,
-          0.00753,
-          0.0072,
-          0.006892,
-          0.006205,
-          0.005617,
-          0.005109,
-          0.004667,
-          0.004346,
-          0.00428,
-          0.003939,
-          0.003638,
-          0.003369,
-          0.00313,
-          0.003113,
-          0.002916,
-          0.002722,
-          0.002549,
-          0.00239,
-          0.002284,
-          0.002247
-        ],
-        "beta0": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta1": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ],
-        "beta2": [
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2,
-          2
-        ]
-      },
-      {
-        "photon_energy": [
-          15.0,
-          16.71,
-          20.0,
-          21.22,
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          18.233333333333334,
-          11.653333333333332,
-          5.4833333333333325,
-          4.289999999999999,
-          2.2206666666666663,
-          1.6856666666666666,
-          1.1203333333333334,
-          0.6486666666666666,
-          0.4096666666666667,
-          0.383,
-          0.2798333333333333,
-          0.20676666666666665,
-          0.16283333333333333,
-          0.13419999999999999,
-          0.11426666666666666,
-          0.09986666666666666,
-          0.08936666666666666,
-          0.08176666666666665,
-          0.07626666666666666,
-          0.07196666666666666,
-          0.06823333333333333,
-          0.06459999999999999,
-          0.061,
-          0.05766666666666666,
-          0.05483333333333333,
-          0.05266666666666667,
-          0.051,
-          0.04959999999999999,
-          0.048966666666666665,
-          0.0482,
-          0.0466,
-          0.04479999999999999,
-          0.04293333333333333,
-          0.04243333333333333,
-          0.04123333333333333,
-          0.03983333333333333,
-          0.03873333333333333,
-          0.03793333333333333,
-          0.03726666666666666,
-          0.036599999999999994,
-          0.03576666666666667,
-          0.03473333333333333,
-          0.0336,
-          0.03245666666666666,
-          0.03139333333333333,
-          0.03051333333333333,
-          0.029846666666666664,
-          0.02936,
-          0.028983333333333333,
-          0.028623333333333334,
-          0.02819,
-          0.027633333333333333,
-          0.02695,
-          0.026173333333333333,
-          0.025369999999999997,
-          0.024613333333333334,
-          0.02396,
-          0.023439999999999996,
-          0.023053333333333332,
-          0.022766666666666664,
-          0.02253333333333333,
-          0.022289999999999997,
-          0.02199,
-          0.021606666666666666,
-          0.02112666666666667,
-          0.020576666666666667,
-          0.01942,
-          0.017856666666666667,
-          0.017189999999999997,
-          0.015886666666666667,
-          0.01439,
-          0.013763333333333332,
-          0.013306666666666665,
-          0.012249999999999999,
-          0.011276666666666666,
-          0.010936666666666666,
-          0.010646666666666667,
-          0.009886666666666665,
-          0.0091,
-          0.00878,
-          0.008653333333333332,
-          0.008216666666666666,
-          0.007553333333333333,
-          0.007123333333333333,
-          0.007019999999999999,
-          0.006886666666666667,
-          0.00647,
-          0.00596,
-          0.005679999999999999,
-          0.0056366666666666666,
-          0.00556,
-          0.00473,
-          0.0046033333333333325,
-          0.003979999999999999,
-          0.003763333333333333,
-          0.0035566666666666667,
-          0.0034466666666666665,
-          0.0030843333333333335,
-          0.0030536666666666668,
-          0.0025946666666666666,
-          0.0025473333333333333,
-          0.002549,
-          0.0023413333333333333,
-          0.002111333333333333,
-          0.002166333333333333,
-          0.0018666666666666666,
-          0.0017199999999999997,
-          0.001725
-        ],
-        "cs1": [
-          18.25333333333333,
-          11.636666666666665,
-          5.466666666666666,
-          4.286666666666666,
-          2.23,
-          1.6923333333333332,
-          1.1193333333333333,
-          0.6436666666666666,
-          0.40900000000000003,
-          0.383,
-          0.28169999999999995,
-          0.2076,
-          0.1621,
-          0.1329,
-          0.11336666666666667,
-          0.0998,
-          0.08993333333333332,
-          0.08243333333333333,
-          0.0765,
-          0.0716,
-          0.06746666666666666,
-          0.0639,
-          0.06076666666666666,
-          0.057999999999999996,
-          0.05553333333333333,
-          0.05329999999999999,
-          0.05126666666666666,
-          0.0494,
-          0.04856666666666666,
-          0.04763333333333333,
-          0.04596666666666666,
-          0.04446666666666666,
-          0.043033333333333326,
-          0.042666666666666665,
-          0.04173333333333333,
-          0.040499999999999994,
-          0.03933333333333333,
-          0.03823333333333333,
-          0.03716666666666667,
-          0.036166666666666666,
-          0.035199999999999995,
-          0.0343,
-          0.03343333333333333,
-          0.0326,
-          0.03182,
-          0.031076666666666662,
-          0.030363333333333332,
-          0.029676666666666664,
-          0.029009999999999998,
-          0.02836,
-          0.02772333333333333,
-          0.02711,
-          0.026513333333333333,
-          0.025939999999999998,
-          0.02538666666666667,
-          0.024856666666666666,
-          0.02434333333333333,
-          0.02384666666666667,
-          0.023366666666666664,
-          0.022893333333333335,
-          0.022433333333333333,
-          0.02198333333333333,
-          0.021543333333333334,
-          0.02111333333333333,
-          0.020696666666666665,
-          0.02029333333333333,
-          0.01953,
-          0.01815,
-          0.0169,
-          0.01576,
-          0.014753333333333334,
-          0.013849999999999998,
-          0.013013333333333332,
-          0.012253333333333333,
-          0.011573333333333333,
-          0.010949999999999998,
-          0.010363333333333332,
-          0.009819999999999999,
-          0.009326666666666667,
-          0.00887,
-          0.008436666666666665,
-          0.008029999999999999,
-          0.007653333333333333,
-          0.0073100000000000005,
-          0.006983333333333333,
-          0.006673333333333333,
-          0.00638,
-          0.006113333333333333,
-          0.005863333333333333,
-          0.005626666666666666,
-          0.005399999999999999,
-          0.00489,
-          0.0044533333333333334,
-          0.004063333333333333,
-          0.0037266666666666668,
-          0.0034733333333333335,
-          0.003423333333333333,
-          0.0031579999999999998,
-          0.0029163333333333333,
-          0.002702,
-          0.0025126666666666665,
-          0.0024993333333333334,
-          0.002337333333333333,
-          0.0021836666666666667,
-          0.0020406666666666663,
-          0.0019096666666666665,
-          0.0018243333333333332,
-          0.001795
-        ],
-        "cs2": [
-          16.883333333333333,
-          10.653333333333332,
-          4.8966666666666665,
-          3.8066666666666666,
-          1.93,
-          1.4466666666666665,
-          0.9383333333333332,
-          0.526,
-          0.3280666666666666,
-          0.30656666666666665,
-          0.2235333333333333,
-          0.16443333333333332,
-          0.1293,
-          0.10746666666666667,
-          0.0933,
-          0.08366666666666667,
-          0.07676666666666666,
-          0.07153333333333334,
-          0.06736666666666666,
-          0.06393333333333333,
-          0.06096666666666667,
-          0.058366666666666664,
-          0.05603333333333333,
-          0.05393333333333333,
-          0.05196666666666667,
-          0.0502,
-          0.04853333333333333,
-          0.046966666666666664,
-          0.046266666666666664,
-          0.0455,
-          0.04413333333333333,
-          0.042833333333333334,
-          0.0416,
-          0.04126666666666666,
-          0.040433333333333335,
-          0.0393,
-          0.038266666666666664,
-          0.03726666666666666,
-          0.0363,
-          0.035366666666666664,
-          0.034499999999999996,
-          0.033666666666666664,
-          0.032869999999999996,
-          0.03210333333333333,
-          0.031363333333333326,
-          0.03065333333333333,
-          0.02997,
-          0.029309999999999996,
-          0.028673333333333332,
-          0.028053333333333333,
-          0.027456666666666664,
-          0.026876666666666663,
-          0.02631,
-          0.025763333333333333,
-          0.025233333333333333,
-          0.02471333333333333,
-          0.02421333333333333,
-          0.023723333333333332,
-          0.023246666666666665,
-          0.02278333333333333,
-          0.022333333333333334,
-          0.021896666666666665,
-          0.021473333333333334,
-          0.02106,
-          0.020656666666666663,
-          0.020266666666666665,
-          0.019516666666666665,
-          0.018136666666666666,
-          0.0169,
-          0.015786666666666664,
-          0.014779999999999998,
-          0.013866666666666666,
-          0.01304,
-          0.012289999999999999,
-          0.011603333333333334,
-          0.010973333333333331,
-          0.010393333333333333,
-          0.009856666666666666,
-          0.00936,
-          0.008896666666666666,
-          0.008466666666666666,
-          0.008066666666666666,
-          0.00769,
-          0.00734,
-          0.00701,
-          0.006703333333333333,
-          0.006413333333333333,
-          0.006143333333333332,
-          0.005886666666666666,
-          0.005646666666666666,
-          0.0054199999999999995,
-          0.004913333333333333,
-          0.00447,
-          0.004083333333333333,
-          0.0037400000000000003,
-          0.00349,
-          0.0034399999999999995,
-          0.003170333333333333,
-          0.0029299999999999994,
-          0.0027149999999999995,
-          0.002522333333333333,
-          0.002509,
-          0.0023483333333333333,
-          0.0021913333333333333,
-          0.0020489999999999996,
-          0.0019196666666666667,
-          0.0018316666666666666,
-          0.0018009999999999999
-        ],
-        "beta0": [
-          1.631,
-          1.765,
-          1.873,
-          1.882,
-          1.84,
-          1.789,
-          1.671,
-          1.416,
-          1.109,
-          1.057,
-          0.7911,
-          0.5021,
-          0.2598,
-          0.07533,
-          -0.04057,
-          -0.09025,
-          -0.09143,
-          -0.06338,
-          -0.0174,
-          0.04162,
-          0.1097,
-          0.1814,
-          0.2511,
-          0.3159,
-          0.3762,
-          0.4343,
-          0.4925,
-          0.5514,
-          0.5785,
-          0.6097,
-          0.6651,
-          0.7156,
-          0.7607,
-          0.7723,
-          0.8007,
-          0.8374,
-          0.8725,
-          0.9072,
-          0.9418,
-          0.9758,
-          1.008,
-          1.038,
-          1.066,
-          1.09,
-          1.112,
-          1.133,
-          1.153,
-          1.172,
-          1.192,
-          1.211,
-          1.23,
-          1.249,
-          1.266,
-          1.282,
-          1.297,
-          1.31,
-          1.323,
-          1.336,
-          1.348,
-          1.36,
-          1.371,
-          1.382,
-          1.393,
-          1.404,
-          1.414,
-          1.423,
-          1.441,
-          1.472,
-          1.5,
-          1.522,
-          1.544,
-          1.565,
-          1.581,
-          1.592,
-          1.607,
-          1.623,
-          1.632,
-          1.637,
-          1.646,
-          1.659,
-          1.667,
-          1.669,
-          1.67,
-          1.679,
-          1.689,
-          1.693,
-          1.69,
-          1.69,
-          1.697,
-          1.707,
-          1.71,
-          1.704,
-          1.723,
-          1.709,
-          1.725,
-          1.722,
-          1.717,
-          1.719,
-          1.73,
-          1.708,
-          1.725,
-          1.727,
-          1.716,
-          1.71,
-          1.731,
-          1.704,
-          1.695,
-          1.701
-        ],
-        "beta1": [
-          1.631,
-          1.765,
-          1.873,
-          1.882,
-          1.84,
-          1.789,
-          1.669,
-          1.414,
-          1.111,
-          1.06,
-          0.7939,
-          0.4971,
-          0.2501,
-          0.07078,
-          -0.03847,
-          -0.08743,
-          -0.09092,
-          -0.06309,
-          -0.01527,
-          0.04425,
-          0.1097,
-          0.1773,
-          0.245,
-          0.3115,
-          0.3762,
-          0.4388,
-          0.4988,
-          0.5561,
-          0.5814,
-          0.6104,
-          0.6616,
-          0.7099,
-          0.7554,
-          0.7677,
-          0.7983,
-          0.8386,
-          0.8767,
-          0.9125,
-          0.9462,
-          0.9778,
-          1.008,
-          1.036,
-          1.062,
-          1.087,
-          1.111,
-          1.133,
-          1.155,
-          1.175,
-          1.195,
-          1.214,
-          1.231,
-          1.248,
-          1.265,
-          1.28,
-          1.295,
-          1.309,
-          1.323,
-          1.336,
-          1.349,
-          1.361,
-          1.372,
-          1.383,
-          1.394,
-          1.404,
-          1.414,
-          1.423,
-          1.441,
-          1.472,
-          1.499,
-          1.523,
-          1.545,
-          1.563,
-          1.58,
-          1.595,
-          1.608,
-          1.62,
-          1.63,
-          1.64,
-          1.649,
-          1.656,
-          1.663,
-          1.669,
-          1.675,
-          1.68,
-          1.685,
-          1.689,
-          1.693,
-          1.696,
-          1.7,
-          1.703,
-          1.705,
-          1.71,
-          1.714,
-          1.717,
-          1.719,
-          1.72,
-          1.72,
-          1.721,
-          1.72,
-          1.72,
-          1.719,
-          1.719,
-          1.718,
-          1.717,
-          1.715,
-          1.713,
-          1.711,
-          1.711
-        ],
-        "beta2": [
-          1.525,
-          1.655,
-          1.79,
-          1.814,
-          1.821,
-          1.792,
-          1.703,
-          1.474,
-          1.169,
-          1.115,
-          0.8277,
-          0.5002,
-          0.2294,
-          0.03958,
-          -0.06761,
-          -0.1062,
-          -0.09556,
-          -0.05348,
-          0.006691,
-          0.07593,
-          0.1487,
-          0.2216,
-          0.2929,
-          0.3617,
-          0.4274,
-          0.4899,
-          0.5491,
-          0.605,
-          0.6296,
-          0.6576,
-          0.7072,
-          0.7537,
-          0.7974,
-          0.8091,
-          0.8383,
-          0.8766,
-          0.9125,
-          0.9461,
-          0.9777,
-          1.007,
-          1.035,
-          1.061,
-          1.086,
-          1.11,
-          1.132,
-          1.153,
-          1.173,
-          1.192,
-          1.21,
-          1.228,
-          1.244,
-          1.26,
-          1.275,
-          1.29,
-          1.304,
-          1.317,
-          1.33,
-          1.342,
-          1.354,
-          1.365,
-          1.376,
-          1.386,
-          1.396,
-          1.405,
-          1.414,
-          1.423,
-          1.44,
-          1.469,
-          1.495,
-          1.518,
-          1.538,
-          1.556,
-          1.571,
-          1.585,
-          1.598,
-          1.609,
-          1.619,
-          1.629,
-          1.637,
-          1.644,
-          1.651,
-          1.657,
-          1.663,
-          1.668,
-          1.672,
-          1.676,
-          1.68,
-          1.683,
-          1.686,
-          1.689,
-          1.692,
-          1.697,
-          1.701,
-          1.704,
-          1.706,
-          1.707,
-          1.707,
-          1.708,
-          1.708,
-          1.707,
-          1.707,
-          1.707,
-          1.706,
-          1.704,
-          1.703,
-          1.701,
-          1.699,
-          1.699
-        ]
-      },
-      {
-        "photon_energy": [
-          15.0,
-          16.71,
-          20.0,
-          21.22,
-          25.0,
-          26.86,
-          30.0,
-          35.0,
-          40.0,
-          40.81,
-          45.0,
-          50.0,
-          55.0,
-          60.0,
-          65.0,
-          70.0,
-          75.0,
-          80.0,
-          85.0,
-          90.0,
-          95.0,
-          100.0,
-          105.0,
-          110.0,
-          115.0,
-          120.0,
-          125.0,
-          130.0,
-          132.3,
-          135.0,
-          140.0,
-          145.0,
-          150.0,
-          151.4,
-          155.0,
-          160.0,
-          165.0,
-          170.0,
-          175.0,
-          180.0,
-          185.0,
-          190.0,
-          195.0,
-          200.0,
-          205.0,
-          210.0,
-          215.0,
-          220.0,
-          225.0,
-          230.0,
-          235.0,
-          240.0,
-          245.0,
-          250.0,
-          255.0,
-          260.0,
-          265.0,
-          270.0,
-          275.0,
-          280.0,
-          285.0,
-          290.0,
-          295.0,
-          300.0,
-          305.0,
-          310.0,
-          320.0,
-          340.0,
-          360.0,
-          380.0,
-          400.0,
-          420.0,
-          440.0,
-          460.0,
-          480.0,
-          500.0,
-          520.0,
-          540.0,
-          560.0,
-          580.0,
-          600.0,
-          620.0,
-          640.0,
-          660.0,
-          680.0,
-          700.0,
-          720.0,
-          740.0,
-          760.0,
-          780.0,
-          800.0,
-          850.0,
-          900.0,
-          950.0,
-          1000.0,
-          1041.0,
-          1050.0,
-          1100.0,
-          1150.0,
-          1200.0,
-          1250.0,
-          1253.6,
-          1300.0,
-          1350.0,
-          1400.0,
-          1450.0,
-          1486.6,
-          1500.0
-        ],
-        "cs0": [
-          36.46666666666667,
-          23.306666666666665,
-          10.966666666666665,
-          8.579999999999998,
-          4.441333333333333,
-          3.3713333333333333,
-          2.240666666666667,
-          1.2973333333333332,
-          0.8193333333333334,
-          0.766,
-          0.5596666666666666,
-          0.4135333333333333,
-          0.32566666666666666,
-          0.26839999999999997,
-          0.2285333333333333,
-          0.19973333333333332,
-          0.17873333333333333,
-          0.1635333333333333,
-          0.15253333333333333,
-          0.14393333333333333,
-          0.13646666666666665,
-          0.12919999999999998,
-          0.122,
-          0.11533333333333332,
-          0.10966666666666666,
-          0.10533333333333333,
-          0.102,
-          0.09919999999999998,
-          0.09793333333333333,
-          0.0964,
-          0.0932,
-          0.08959999999999999,
-          0.08586666666666666,
-          0.08486666666666666,
-          0.08246666666666666,
-          0.07966666666666666,
-          0.07746666666666666,
-          0.07586666666666667,
-          0.07453333333333333,
-          0.07319999999999999,
-          0.07153333333333334,
-          0.06946666666666666,
-          0.0672,
-          0.06491333333333332,
-          0.06278666666666666,
-          0.06102666666666666,
-          0.05969333333333333,
-          0.05872,
-          0.057966666666666666,
-          0.05724666666666667,
-          0.05638,
-          0.055266666666666665,
-          0.0539,
-          0.052346666666666666,
-          0.05073999999999999,
-          0.04922666666666667,
-          0.04792,
-          0.04687999999999999,
-          0.046106666666666664,
-          0.04553333333333333,
-          0.04506666666666666,
-          0.044579999999999995,
-          0.04398,
-          0.04321333333333333,
-          0.04225333333333334,
-          0.04115333333333333,
-          0.03884,
-          0.03571333333333333,
-          0.034379999999999994,
-          0.031773333333333334,
-          0.02878,
-          0.027526666666666665,
-          0.02661333333333333,
-          0.024499999999999997,
-          0.02255333333333333,
-          0.02187333333333333,
-          0.021293333333333334,
-          0.01977333333333333,
-          0.0182,
-          0.01756,
-          0.017306666666666665,
-          0.01643333333333333,
-          0.015106666666666666,
-          0.014246666666666666,
-          0.014039999999999999,
-          0.013773333333333334,
-          0.01294,
-          0.01192,
-          0.011359999999999999,
-          0.011273333333333333,
-          0.01112,
-          0.00946,
-          0.009206666666666665,
-          0.007959999999999998,
-          0.007526666666666666,
-          0.0071133333333333335,
-          0.006893333333333333,
-          0.006168666666666667,
-          0.0061073333333333335,
-          0.005189333333333333,
-          0.005094666666666667,
-          0.005098,
-          0.004682666666666667,
-          0.004222666666666666,
-          0.004332666666666666,
-          0.0037333333333333333,
-          0.0034399999999999995,
-          0.00345
-        ],
-        "cs1": [
-          36.50666666666666,
-          23.27333333333333,
-          10.933333333333332,
-          8.573333333333332,
-          4.46,
-          3.3846666666666665,
-          2.2386666666666666,
-          1.2873333333333332,
-          0.8180000000000001,
-          0.766,
-          0.5633999999999999,
-          0.4152,
-          0.3242,
-          0.2658,
-          0.22673333333333334,
-          0.1996,
-          0.17986666666666665,
-          0.16486666666666666,
-          0.153,
-          0.1432,
-          0.13493333333333332,
-          0.1278,
-          0.12153333333333333,
-          0.11599999999999999,
-          0.11106666666666666,
-          0.10659999999999999,
-          0.10253333333333332,
-          0.0988,
-          0.09713333333333332,
-          0.09526666666666667,
-          0.09193333333333333,
-          0.08893333333333332,
-          0.08606666666666665,
-          0.08533333333333333,
-          0.08346666666666666,
-          0.08099999999999999,
-          0.07866666666666666,
-          0.07646666666666666,
-          0.07433333333333333,
-          0.07233333333333333,
-          0.07039999999999999,
-          0.0686,
-          0.06686666666666666,
-          0.0652,
-          0.06364,
-          0.062153333333333324,
-          0.060726666666666665,
-          0.05935333333333333,
-          0.058019999999999995,
-          0.05672,
-          0.05544666666666666,
-          0.05422,
-          0.053026666666666666,
-          0.051879999999999996,
-          0.05077333333333334,
-          0.04971333333333333,
-          0.04868666666666666,
-          0.04769333333333334,
-          0.04673333333333333,
-          0.04578666666666667,
-          0.044866666666666666,
-          0.04396666666666666,
-          0.04308666666666667,
-          0.04222666666666666,
-          0.04139333333333333,
-          0.04058666666666666,
-          0.03906,
-          0.0363,
-          0.0338,
-          0.03152,
-          0.029506666666666667,
-          0.027699999999999995,
-          0.026026666666666663,
-          0.024506666666666666,
-          0.023146666666666666,
-          0.021899999999999996,
-          0.020726666666666664,
-          0.019639999999999998,
-          0.018653333333333334,
-          0.01774,
-          0.01687333333333333,
-          0.016059999999999998,
-          0.015306666666666666,
-          0.014620000000000001,
-          0.013966666666666665,
-          0.013346666666666666,
-          0.01276,
-          0.012226666666666665,
-          0.011726666666666666,
-          0.011253333333333332,
-          0.010799999999999999,
-          0.00978,
-          0.008906666666666667,
-          0.008126666666666666,
-          0.0074533333333333335,
-          0.006946666666666667,
-          0.006846666666666666,
-          0.0063159999999999996,
-          0.0058326666666666666,
-          0.005404,
-          0.005025333333333333,
-          0.004998666666666667,
-          0.004674666666666666,
-          0.004367333333333333,
-          0.004081333333333333,
-          0.003819333333333333,
-          0.0036486666666666664,
-          0.00359
-        ],
-        "cs2": [
-          33.766666666666666,
-          21.306666666666665,
-          9.793333333333333,
-          7.613333333333333,
-          3.86,
-          2.893333333333333,
-          1.8766666666666665,
-          1.052,
-          0.6561333333333332,
-          0.6131333333333333,
-          0.4470666666666666,
-          0.32886666666666664,
-          0.2586,
-          0.21493333333333334,
-          0.1866,
-          0.16733333333333333,
-          0.15353333333333333,
-          0.14306666666666668,
-          0.13473333333333332,
-          0.12786666666666666,
-          0.12193333333333334,
-          0.11673333333333333,
-          0.11206666666666666,
-          0.10786666666666667,
-          0.10393333333333334,
-          0.1004,
-          0.09706666666666666,
-          0.09393333333333333,
-          0.09253333333333333,
-          0.091,
-          0.08826666666666666,
-          0.08566666666666667,
-          0.0832,
-          0.08253333333333332,
-          0.08086666666666667,
-          0.0786,
-          0.07653333333333333,
-          0.07453333333333333,
-          0.0726,
-          0.07073333333333333,
-          0.06899999999999999,
-          0.06733333333333333,
-          0.06573999999999999,
-          0.06420666666666666,
-          0.06272666666666665,
-          0.06130666666666666,
-          0.05994,
-          0.05861999999999999,
-          0.057346666666666664,
-          0.056106666666666666,
-          0.05491333333333333,
-          0.05375333333333333,
-          0.05262,
-          0.051526666666666665,
-          0.05046666666666667,
-          0.04942666666666666,
-          0.04842666666666666,
-          0.047446666666666665,
-          0.04649333333333333,
-          0.04556666666666666,
-          0.04466666666666667,
-          0.04379333333333333,
-          0.04294666666666667,
-          0.04212,
-          0.04131333333333333,
-          0.04053333333333333,
-          0.03903333333333333,
-          0.03627333333333333,
-          0.0338,
-          0.03157333333333333,
-          0.029559999999999996,
-          0.027733333333333332,
-          0.02608,
-          0.024579999999999998,
-          0.023206666666666667,
-          0.021946666666666663,
-          0.020786666666666665,
-          0.019713333333333333,
-          0.01872,
-          0.01779333333333333,
-          0.01693333333333333,
-          0.016133333333333333,
-          0.01538,
-          0.01468,
-          0.01402,
-          0.013406666666666666,
-          0.012826666666666667,
-          0.012286666666666664,
-          0.011773333333333332,
-          0.011293333333333332,
-          0.010839999999999999,
-          0.009826666666666666,
-          0.00894,
-          0.008166666666666666,
-          0.0074800000000000005,
-          0.00698,
-          0.006879999999999999,
-          0.006340666666666666,
-          0.005859999999999999,
-          0.005429999999999999,
-          0.005044666666666666,
-          0.005018,
-          0.004696666666666667,
-          0.004382666666666667,
-          0.004097999999999999,
-          0.0038393333333333335,
-          0.003663333333333333,
-          0.0036019999999999997
-        ],
-        "beta0": [
-          1.631,
-          1.765,
-          1.873,
-          1.882,
-          1.84,
-          1.789,
-          1.671,
-          1.416,
-          1.109,
-          1.057,
-          0.7911,
-          0.5021,
-          0.2598,
-          0.07533,
-          -0.04057,
-          -0.09025,
-          -0.09143,
-          -0.06338,
-          -0.0174,
-          0.04162,
-          0.1097,
-          0.1814,
-          0.2511,
-          0.3159,
-          0.3762,
-          0.4343,
-          0.4925,
-          0.5514,
-          0.5785,
-          0.6097,
-          0.6651,
-          0.7156,
-          0.7607,
-          0.7723,
-          0.8007,
-          0.8374,
-          0.8725,
-          0.9072,
-          0.9418,
-          0.9758,
-          1.008,
-          1.038,
-          1.066,
-          1.09,
-          1.112,
-          1.133,
-          1.153,
-          1.172,
-          1.192,
-          1.211,
-          1.23,
-          1.249,
-          1.266,
-          1.282,
-          1.297,
-          1.31,
-          1.323,
-          1.336,
-          1.348,
-          1.36,
-          1.371,
-          1.382,
-          1.393,
-          1.404,
-          1.414,
-          1.423,
-          1.441,
-          1.472,
-          1.5,
-          1.522,
-          1.544,
-          1.565,
-          1.581,
-          1.592,
-          1.607,
-          1.623,
-          1.632,
-          1.637,
-          1.646,
-          1.659,
-          1.667,
-          1.669,
-          1.67,
-          1.679,
-          1.689,
-          1.693,
-          1.69,
-          1.69,
-          1.697,
-          1.707,
-          1.71,
-          1.704,
-          1.723,
-          1.709,
-          1.725,
-          1.722,
-          1.717,
-          1.719,
-          1.73,
-          1.708,
-          1.725,
-          1.727,
-          1.716,
-          1.71,
-          1.731,
-          1.704,
-          1.695,
-          1.701
-        ],
-        "beta1": [
-          1.631,
-          1.765,
-          1.873,
-          1.882,
-          1.84,
-          1.789,
-          1.669,
-          1.414,
-          1.111,
-          1.06,
-          0.7939,
-          0.4971,
-          0.2501,
-          0.07078,
-          -0.03847,
-          -0.08743,
-          -0.09092,
-          -0.06309,
-          -0.01527,
-          0.04425,
-          0.1097,
-          0.1773,
-          0.245,
-          0.3115,
-          0.3762,
-          0.4388,
-          0.4988,
-          0.5561,
-          0.5814,
-          0.6104,
-          0.6616,
-          0.7099,
-          0.7554,
-          0.7677,
-          0.7983,
-          0.8386,
-          0.8767,
-          0.9125,
-          0.9462,
-          0.9778,
-          1.008,
-          1.036,
-          1.062,
-          1.087,
-          1.111,
-          1.133,
-          1.155,
-          1.175,
-          1.195,
-          1.214,
-          1.231,
-          1.248,
-          1.265,
-          1.28,
-          1.295,
-          1.309,
-          1.323,
-          1.336,
-          1.349,
-          1.361,
-          1.372,
-          1.383,
-          1.394,
-          1.404,
-          1.414,
-          1.423,
-          1.441,
-          1.472,
-          1.499,
-          1.523,
-          1.545,
-          1.563,
-          1.58,
-          1.595,
-          1.608,
-          1.62,
-          1.63,
-          1.64,
-          1.649,
-          1.656,
-          1.663,
-          1.669,
-          1.675,
-          1.68,
-          1.685,
-          1.689,
-          1.693,
-          1.696,
-          1.7,
-          1.703,
-          1.705,
-          1.71,
-          1.714,
-          1.717,
-          1.719,
-          1.72,
-          1.72,
-          1.721,
-          1.72,
-          1.72,
-          1.719,
-          1.719,
-          1.718,
-          1.717,
-          1.715,
-          1.713,
-          1.711,
-          1.711
-        ],
-        "beta2": [
-          1.525,
-          1.655,
-          1.79,
-          1.814,
-          1.821,
-          1.792,
-          1.703,
-          1.474,
-          1.169,
-          1.115,
-          0.8277,
-          0.5002,
-          0.2294,
-          0.03958,
-          -0.06761,
-          -0.1062,
-          -0.09556,
-          -0.05348,
-          0.006691,
-          0.07593,
-          0.1487,
-          0.2216,
-          0.2929,
-          0.3617,
-          0.4274,
-          0.4899,
-          0.5491,
-          0.605,
-          0.6296,
-          0.6576,
-          0.7072,
-          0.7537,
-          0.7974,
-          0.8091,
-          0.8383,
-          0.8766,
-          0.9125,
-          0.9461,
-          0.9777,
-          1.007,
-          1.035,
-          1.061,
-          1.086,
-          1.11,
-          1.132,
-          1.153,
-          1.173,
-          1.192,
-          1.21,
-          1.228,
-          1.244,
-          1.26,
-          1.275,
-          1.29,
-          1.304,
-          1.317,
-          1.33,
-          1.342,
-          1.354,
-          1.365,
-          1.376,
-          1.386,
-          1.396,
-          1.405,
-          1.414,
-          1.423,
-          1.44,
-          1.469,
-          1.495,
-          1.518,
-          1.538,
-          1.556,
-          1.571,
-          1.585,
-          1.598,
-          1.609,
-          1.619,
-          1.629,
-          1.637,
-          1.644,
-          1.651,
-          1.657,
-          1.663,
-          1.668,
-          1.672,
-          1.676,
-          1.68,
-          1.683,
-          1.686,
-          1.689,
-          1.692,
-          1.697,
-          1.701,
-          1.704,
-          1.706,
-          1.707,
-          1.707,
-          1.708,
-          1.708,
-          1.707,
-          1.707,
-          1.707,
-          1.706,
-          1.704,
-          1.703,
-          1.701,
-          1.699,
-          1.699
-        ]
-      }
-    ],
-    "auger_peaks": [
-      {
-        "peak_name": "Xe_NOO_01",
-        "kinetic_energy": 36.422,
-        "channel": "N4OO",
-        "intensity_factor": 0.02669039145907473,
-        "origin": "4d3/2",
-        "origin_binding_key": "N4 4d3/2"
-      },
-      {
-        "peak_name": "Xe_NOO_02",
-        "kinetic_energy": 35.208,
-        "channel": "N4OO",
-        "intensity_factor": 0.07651245551601424,
-        "origin": "4d3/2",
-        "origin_binding_key": "N4 4d3/2"
-      },
-      {
-        "peak_name": "Xe_NOO_03",
-        "kinetic_energy": 34.443,
-        "channel": "N5OO",
-        "intensity_factor": 0.10487804878048781,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_04",
-        "kinetic_energy": 34.302,
-        "channel": "N4OO",
-        "intensity_factor": 0.18505338078291816,
-        "origin": "4d3/2",
-        "origin_binding_key": "N4 4d3/2"
-      },
-      {
-        "peak_name": "Xe_NOO_05",
-        "kinetic_energy": 33.435,
-        "channel": "N5OO",
-        "intensity_factor": 0.05853658536585366,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_06",
-        "kinetic_energy": 33.229,
-        "channel": "N5OO",
-        "intensity_factor": 0.047560975609756105,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_07",
-        "kinetic_energy": 32.323,
-        "channel": "N5OO",
-        "intensity_factor": 0.11829268292682928,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_08",
-        "kinetic_energy": 31.946,
-        "channel": "N4OO",
-        "intensity_factor": 0.17793594306049823,
-        "origin": "4d3/2",
-        "origin_binding_key": "N4 4d3/2"
-      },
-      {
-        "peak_name": "Xe_NOO_09",
-        "kinetic_energy": 29.97,
-        "channel": "N5OO",
-        "intensity_factor": 0.08902439024390245,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_16",
-        "kinetic_energy": 21.67,
-        "channel": "N4OO",
-        "intensity_factor": 0.11032028469750889,
-        "origin": "4d3/2",
-        "origin_binding_key": "N4 4d3/2"
-      },
-      {
-        "peak_name": "Xe_NOO_18",
-        "kinetic_energy": 19.69,
-        "channel": "N5OO",
-        "intensity_factor": 0.09756097560975611,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_22",
-        "kinetic_energy": 17.25,
-        "channel": "N4OO",
-        "intensity_factor": 0.07295373665480427,
-        "origin": "4d3/2",
-        "origin_binding_key": "N4 4d3/2"
-      },
-      {
-        "peak_name": "Xe_NOO_24",
-        "kinetic_energy": 16.15,
-        "channel": "N4OO",
-        "intensity_factor": 0.1601423487544484,
-        "origin": "4d3/2",
-        "origin_binding_key": "N4 4d3/2"
-      },
-      {
-        "peak_name": "Xe_NOO_25",
-        "kinetic_energy": 15.27,
-        "channel": "N5OO",
-        "intensity_factor": 0.0902439024390244,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_26",
-        "kinetic_energy": 14.703,
-        "channel": "N45OO",
-        "intensity_factor": 0.037804878048780494,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_27",
-        "kinetic_energy": 14.17,
-        "channel": "N5OO",
-        "intensity_factor": 0.1634146341463415,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_28",
-        "kinetic_energy": 12.741,
-        "channel": "N45OO",
-        "intensity_factor": 0.030487804878048783,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NOO_29",
-        "kinetic_energy": 10.279,
-        "channel": "N4OO",
-        "intensity_factor": 0.1903914590747331,
-        "origin": "4d3/2",
-        "origin_binding_key": "N4 4d3/2"
-      },
-      {
-        "peak_name": "Xe_NOO_30",
-        "kinetic_energy": 8.3,
-        "channel": "N5OO",
-        "intensity_factor": 0.16219512195121955,
-        "origin": "4d5/2",
-        "origin_binding_key": "N5 4d5/2"
-      },
-      {
-        "peak_name": "Xe_NNO_01",
-        "kinetic_energy": 51.31,
-        "channel": "N3NO",
-        "intensity_factor": 0.061842918985776124,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_02",
-        "kinetic_energy": 52.18,
-        "channel": "N3NO",
-        "intensity_factor": 0.04081632653061224,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_03",
-        "kinetic_energy": 52.93,
-        "channel": "N3NO",
-        "intensity_factor": 0.10636982065553492,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_04",
-        "kinetic_energy": 53.24,
-        "channel": "N3NO",
-        "intensity_factor": 0.05627705627705627,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_05",
-        "kinetic_energy": 53.75,
-        "channel": "N3NO",
-        "intensity_factor": 0.06493506493506493,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_06",
-        "kinetic_energy": 54.06,
-        "channel": "N3NO",
-        "intensity_factor": 0.0494743351886209,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_07",
-        "kinetic_energy": 54.66,
-        "channel": "N3NO",
-        "intensity_factor": 0.08410636982065553,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_08",
-        "kinetic_energy": 54.98,
-        "channel": "N3NO",
-        "intensity_factor": 0.05132962275819418,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_09",
-        "kinetic_energy": 55.43,
-        "channel": "N3NO",
-        "intensity_factor": 0.05194805194805194,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_10",
-        "kinetic_energy": 55.58,
-        "channel": "N3NO",
-        "intensity_factor": 0.10080395794681507,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_11",
-        "kinetic_energy": 55.91,
-        "channel": "N3NO",
-        "intensity_factor": 0.06926406926406926,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_12",
-        "kinetic_energy": 56.36,
-        "channel": "N3NO",
-        "intensity_factor": 0.05689548546691404,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_13",
-        "kinetic_energy": 56.76,
-        "channel": "N3NO",
-        "intensity_factor": 0.04700061842918985,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_14",
-        "kinetic_energy": 57.23,
-        "channel": "N3NO",
-        "intensity_factor": 0.04329004329004328,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_15",
-        "kinetic_energy": 57.61,
-        "channel": "N3NO",
-        "intensity_factor": 0.04081632653061224,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_16",
-        "kinetic_energy": 57.97,
-        "channel": "N3NO",
-        "intensity_factor": 0.042053184910327765,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      },
-      {
-        "peak_name": "Xe_NNO_17",
-        "kinetic_energy": 58.42,
-        "channel": "N3NO",
-        "intensity_factor": 0.032776747062461344,
-        "origin": "4p3/2",
-        "origin_binding_key": "N3 4p3/2"
-      }
-    ]
-  }
+// Boot stub: full shell tables are fetched from data/<element>.json
+const ELEMENTS_DATA = {"neon":{"name":"Neon","symbol":"Ne","binding_energies":{"1s":870.2,"2s":48.5,"2p1/2":21.7,"2p3/2":21.6}},"argon":{"name":"Argon","symbol":"Ar","binding_energies":{"L1 2s":326.3,"L2 2p1/2":250.6,"L3 2p3/2":248.4,"M1 3s":29.3,"M2 3p1/2":15.9,"M3 3p3/2":15.7}},"krypton":{"name":"Krypton","symbol":"Kr","binding_energies":{"3s":292.8,"3p1/2":222.2,"3p3/2":214.4,"3d3/2":95.0,"3d5/2":93.8,"4s":27.5,"4p1/2":14.1,"4p3/2":14.1}}};
+
+// Available photon energies (eV)
+const PHOTON_ENERGIES = [1000, 1486.6];
+
+// Default parameters
+const DEFAULT_PARAMS = {
+    emax: 800,
+    emin: 0,
+    ret: 0,
+    element: 'neon',
+    photon_energy: 1486.6
 };
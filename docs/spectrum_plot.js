@@ -678,16 +678,53 @@ class SpectrumPlotter {
         });
     }
     
-    updateBindingEnergies() {
+    // Lazily fetch an element's shell tables. The boot stub in
+    // elements_data.js only carries names and binding energies; the
+    // full tables live in data/<element>.json and are merged into
+    // ELEMENTS_DATA the first time an element is actually plotted.
+    async ensureElementData(elementKey) {
+        const element = ELEMENTS_DATA[elementKey];
+        if (!element || element.shell_data) return element;
+        if (!element._loading) {
+            element._loading = fetch(`data/${elementKey}.json`)
+                .then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                    return response.json();
+                })
+                .then(data => {
+                    Object.assign(element, data);
+                    delete element._loading;
+                    return element;
+                })
+                .catch(error => {
+                    // Degrade to an empty plot rather than crashing the
+                    // shell_data consumers (e.g. file:// blocks fetch)
+                    console.error(`Failed to load data for ${elementKey}:`, error);
+                    delete element._loading;
+                    element.shell_data = element.shell_data || [];
+                    return element;
+                });
+        }
+        return element._loading;
+    }
+
+    async ensureSelectedElementData() {
+        await Promise.all(this.selectedElements.map(key => this.ensureElementData(key)));
+    }
+
+    async updateBindingEnergies() {
         const bindingList = document.getElementById('binding-list');
-        
+
         if (this.selectedElements.length === 0) {
             bindingList.innerHTML = '<p class="no-elements">No elements selected</p>';
             return;
         }
-        
+
+        // The beta column shown next to each shell needs the full tables
+        await this.ensureSelectedElementData();
+
         let html = '';
-        
+
         this.selectedElements.forEach(elementKey => {
             const element = ELEMENTS_DATA[elementKey];
             const color = ELEMENT_COLORS[elementKey]?.fill || '#667eea';
@@ -697,7 +734,8 @@ class SpectrumPlotter {
                 <div class="binding-grid">`;
             
             Object.entries(element.binding_energies).forEach(([shell, bindingEnergy], shellIndex) => {
-                const shellData = element.shell_data[Math.min(shellIndex, element.shell_data.length - 1)];
+                const shellTables = element.shell_data || [];
+                const shellData = shellTables[Math.min(shellIndex, shellTables.length - 1)];
                 
                 // Calculate beta for each selected photon energy
                 let betaDisplay = 'N/A';
@@ -781,7 +819,8 @@ class SpectrumPlotter {
             // Only include positive kinetic energies
             if (kineticEnergy > 0) {
                 // Get cross-section data for this shell
-                const shellData = element.shell_data[Math.min(shellIndex, element.shell_data.length - 1)];
+                const shellTables = element.shell_data || [];
+                const shellData = shellTables[Math.min(shellIndex, shellTables.length - 1)];
                 
                 if (shellData && shellData.photon_energy.length > 0) {
                     // Find nearest photon energy in data
@@ -843,7 +882,8 @@ class SpectrumPlotter {
             
             // Find the cross-section of the origin shell at this photon energy
             const shellIndex = Object.keys(element.binding_energies).indexOf(originBindingKey);
-            const shellData = element.shell_data[Math.min(shellIndex, element.shell_data.length - 1)];
+            const shellTables = element.shell_data || [];
+            const shellData = shellTables[Math.min(shellIndex, shellTables.length - 1)];
             
             if (!shellData || !shellData.photon_energy || shellData.photon_energy.length === 0) {
                 return;
@@ -882,7 +922,7 @@ class SpectrumPlotter {
         return augerData;
     }
     
-    plotSpectrum(xRangeOverride = null, yRangeOverride = null) {
+    async plotSpectrum(xRangeOverride = null, yRangeOverride = null) {
         const yAxisType = this.logScale ? 'log' : 'linear';
         
         // Helper function to transform x values based on axis type
@@ -914,7 +954,11 @@ class SpectrumPlotter {
             Plotly.newPlot('spectrum-plot', [], layout);
             return;
         }
-        
+
+        // Shell tables are fetched on demand; make sure every selected
+        // element's data has arrived before calculating traces
+        await this.ensureSelectedElementData();
+
         // Calculate spectrum data for all combinations of elements and energies
         const allSpectrumData = [];
         const traces = [];
@@ -6,123 +6,115 @@ This script reads the element data (binding energies and shell cross-section dat
 and outputs a JavaScript file for use in the interactive web application.
 """
 
-import pandas as pd
+import csv
 import os
 import json
 
-# Set up data directory path
-data_dir = "database"
-output_file = "docs/elements_data.js"
+import numpy as np
+import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def safe_read_csv(filename):
-    """Safely read CSV file, return None if file doesn't exist"""
-    filepath = os.path.join(data_dir, filename)
-    if os.path.exists(filepath):
-        return pd.read_csv(filepath, sep="\t", names=["Photon Energy", "cs0", "cs1", "cs2", "beta0", "beta1", "beta2"])
-    else:
-        print(f"Warning: {filename} not found, using dummy data")
-        # Return dummy data with typical structure
-        return pd.DataFrame({
-            "Photon Energy": [100, 200, 500, 1000],
-            "cs0": [1.0, 0.8, 0.5, 0.3],
-            "cs1": [0.0, 0.0, 0.0, 0.0],
-            "cs2": [0.0, 0.0, 0.0, 0.0],
-            "beta0": [1.5, 1.4, 1.3, 1.2],
-            "beta1": [0.0, 0.0, 0.0, 0.0],
-            "beta2": [0.0, 0.0, 0.0, 0.0]
-        })
+from shell_data import (
+    PE, CS0, CS1, CS2, BETA0, BETA1, BETA2,
+    data_dir, load_shell_array, preload_shell_arrays, scale_shell_variants,
+)
 
+output_file = "docs/elements_data.js"
 
-def scale_cross_section(df, factor):
-    """Scale cross-section values in a DataFrame by a given factor
-    
-    Args:
-        df: DataFrame with cross-section data
-        factor: Multiplicative factor to scale cs0, cs1, cs2
-    
-    Returns:
-        New DataFrame with scaled cross-sections
-    """
-    scaled_df = df.copy()
-    scaled_df["cs0"] = df["cs0"] * factor
-    scaled_df["cs1"] = df["cs1"] * factor
-    scaled_df["cs2"] = df["cs2"] * factor
-    # Note: beta values are not scaled, they're angular distribution parameters
-    return scaled_df
 
+def shell_array_to_data(arr, energy_grid_id):
+    """Convert an (N, 7) shell array to a shell data dictionary
+
+    Columns stay numpy arrays all the way to the serializer; orjson
+    consumes them directly, so no per-element Python float boxing.
+    They only need to be made contiguous for the serializer.
 
-def df_to_shell_data(df):
-    """Convert a pandas DataFrame to shell data dictionary"""
+    The photon-energy axis is not embedded per shell; shells reference
+    one of the element's shared energy_grids by index instead, since all
+    shells split from the same source file use an identical grid.
+    """
+    columns = np.ascontiguousarray(arr.T)
     return {
-        "photon_energy": df["Photon Energy"].tolist(),
-        "cs0": df["cs0"].tolist(),
-        "cs1": df["cs1"].tolist(),
-        "cs2": df["cs2"].tolist(),
-        "beta0": df["beta0"].tolist(),
-        "beta1": df["beta1"].tolist(),
-        "beta2": df["beta2"].tolist()
+        "energy_grid_id": energy_grid_id,
+        "cs0": columns[CS0],
+        "cs1": columns[CS1],
+        "cs2": columns[CS2],
+        "beta0": columns[BETA0],
+        "beta1": columns[BETA1],
+        "beta2": columns[BETA2]
     }
 
 
 def read_auger_file(filename):
     """Read Auger data file and return list of Auger peak dictionaries
-    
+
     File format: 'peak_name', kinetic_energy, 'channel', relative_intensity, 'origin'
     """
     filepath = os.path.join(data_dir, filename)
     if not os.path.exists(filepath):
         print(f"Note: {filename} not found, skipping Auger data")
         return []
-    
-    auger_peaks = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            # Parse the CSV-like format with quotes
-            parts = [p.strip().strip("'") for p in line.split(',')]
-            if len(parts) >= 5:
-                try:
-                    peak = {
-                        "peak_name": parts[0],
-                        "kinetic_energy": float(parts[1]),
-                        "channel": parts[2].strip().strip("'"),
-                        "relative_intensity": float(parts[3]),
-                        "origin": parts[4].strip().strip("'")
-                    }
-                    auger_peaks.append(peak)
-                except (ValueError, IndexError) as e:
-                    print(f"Warning: Could not parse Auger line: {line} - {e}")
-    
-    return auger_peaks
+
+    try:
+        # QUOTE_NONE + manual quote stripping instead of quotechar="'"
+        # because peak names like Ne_KLL'_1D2 contain interior primes
+        df = pd.read_csv(
+            filepath, header=None,
+            names=["peak_name", "kinetic_energy", "channel", "relative_intensity", "origin"],
+            quoting=csv.QUOTE_NONE, skipinitialspace=True,
+            float_precision="round_trip", memory_map=True,
+            dtype={"kinetic_energy": float, "relative_intensity": float},
+        )
+    except (ValueError, pd.errors.ParserError) as e:
+        print(f"Warning: Could not parse Auger file {filename} - {e}")
+        return []
+
+    for col in ("peak_name", "channel", "origin"):
+        df[col] = df[col].str.strip().str.strip("'")
+    return df.to_dict(orient="records")
+
+
+def _origin_index(binding_energies):
+    """Map every way an Auger origin can name a shell to its binding key
+
+    Each key is reachable as itself and as its post-space tail, so e.g.
+    "L3 2p3/2" resolves from both "L3 2p3/2" and "2p3/2". The first key
+    registering a suffix wins, matching shell order in the tables.
+    """
+    index = {}
+    for key in binding_energies:
+        for suffix in (key, key.split(" ", 1)[-1]):
+            index.setdefault(suffix, key)
+    return index
 
 
 def process_auger_data(auger_peaks, binding_energies):
     """Process Auger peaks - use relative_intensity factors directly.
-    
+
     The relative_intensity values in the file are already the correct scaling
     factors. Each Auger peak intensity = origin_cross_section × relative_intensity.
-    
+
     Returns list of processed Auger peak dictionaries.
     """
     if not auger_peaks:
         return []
-    
+
+    # One reverse index per element instead of scanning every binding key
+    # per peak; also removes the order-dependent substring matching
+    origin_index = _origin_index(binding_energies)
+
     # Create processed peaks without normalization
     processed = []
     for peak in auger_peaks:
         origin = peak["origin"]
-        
-        # Find the binding energy key that contains this origin
-        # e.g., "2p3/2" matches "L3 2p3/2" in Argon
-        origin_binding_key = None
-        for key in binding_energies:
-            if origin in key or key == origin:
-                origin_binding_key = key
-                break
-        
+
+        # e.g. "2p3/2" resolves to "L3 2p3/2" in Argon
+        origin_binding_key = origin_index.get(origin)
+
         if origin_binding_key is None:
             print(f"Warning: Could not find binding energy for Auger origin '{origin}'")
             continue
@@ -140,151 +132,144 @@ def process_auger_data(auger_peaks, binding_energies):
     return processed
 
 
-def build_element_data():
-    """Build the complete elements data dictionary"""
-    
-    elements = {}
-    
-    # Neon
-    neon_binding = {"1s": 870.2, "2s": 48.5, "2p1/2": 21.7, "2p3/2": 21.6}
-    ne1s = safe_read_csv("ne1s.txt")
-    ne2s = safe_read_csv("ne2s.txt")
-    ne2p = safe_read_csv("ne2p.txt")
-    # Divide 2p cross-section: 2p1/2 gets 1/3, 2p3/2 gets 2/3 (based on degeneracy)
-    ne2p_1half = scale_cross_section(ne2p, 1/3)  # j=1/2 has 2 states
-    ne2p_3half = scale_cross_section(ne2p, 2/3)  # j=3/2 has 4 states
-    neon_shells = [ne1s, ne2s, ne2p_1half, ne2p_3half]
-    
-    # Load and process Neon Auger data
-    neon_auger_raw = read_auger_file("neAuger.txt")
-    neon_auger = process_auger_data(neon_auger_raw, neon_binding)
-    
-    elements["neon"] = {
+# j-degeneracy fractions each orbital type's cross-section is split into;
+# s shells keep the full cross-section
+SPLIT_FACTORS = {"p": (1/3, 2/3), "d": (2/5, 3/5)}  # p: 2+4 states, d: 4+6 states
+
+# Declarative per-element build table: shell files in output order with
+# their orbital type, plus binding energies and the Auger file
+ELEMENT_SPECS = {
+    "neon": {
         "name": "Neon",
         "symbol": "Ne",
-        "binding_energies": neon_binding,
-        "shell_data": [df_to_shell_data(df) for df in neon_shells],
-        "auger_peaks": neon_auger
-    }
-    
-    # Argon
-    argon_binding = {
-        "L1 2s": 326.3, "L2 2p1/2": 250.6, "L3 2p3/2": 248.4,
-        "M1 3s": 29.3, "M2 3p1/2": 15.9, "M3 3p3/2": 15.7
-    }
-    ar2s = safe_read_csv("ar2s.txt")
-    ar2p = safe_read_csv("ar2p.txt")
-    ar3s = safe_read_csv("ar3s.txt")
-    ar3p = safe_read_csv("ar3p.txt")
-    # Divide cross-sections for p orbitals
-    ar2p_1half = scale_cross_section(ar2p, 1/3)
-    ar2p_3half = scale_cross_section(ar2p, 2/3)
-    ar3p_1half = scale_cross_section(ar3p, 1/3)
-    ar3p_3half = scale_cross_section(ar3p, 2/3)
-    argon_shells = [ar2s, ar2p_1half, ar2p_3half, ar3s, ar3p_1half, ar3p_3half]
-    
-    # Load and process Argon Auger data
-    argon_auger_raw = read_auger_file("arAuger.txt")
-    argon_auger = process_auger_data(argon_auger_raw, argon_binding)
-    
-    elements["argon"] = {
+        "binding_energies": {"1s": 870.2, "2s": 48.5, "2p1/2": 21.7, "2p3/2": 21.6},
+        "shells": [("ne1s.txt", "s"), ("ne2s.txt", "s"), ("ne2p.txt", "p")],
+        "auger_file": "neAuger.txt",
+    },
+    "argon": {
         "name": "Argon",
         "symbol": "Ar",
-        "binding_energies": argon_binding,
-        "shell_data": [df_to_shell_data(df) for df in argon_shells],
-        "auger_peaks": argon_auger
-    }
-    
-    # Krypton
-    krypton_binding = {
-        "3s": 292.8, "3p1/2": 222.2, "3p3/2": 214.4, 
-        "3d3/2": 95.0, "3d5/2": 93.8,
-        "4s": 27.5, "4p1/2": 14.1, "4p3/2": 14.1
-    }
-    kr3s = safe_read_csv("kr3s.txt")
-    kr3p = safe_read_csv("kr3p.txt")
-    kr3d = safe_read_csv("kr3d.txt")
-    kr4s = safe_read_csv("kr4s.txt")
-    kr4p = safe_read_csv("kr4p.txt")
-    # Divide cross-sections for p and d orbitals
-    kr3p_1half = scale_cross_section(kr3p, 1/3)
-    kr3p_3half = scale_cross_section(kr3p, 2/3)
-    kr3d_3half = scale_cross_section(kr3d, 2/5)  # j=3/2 has 4 states
-    kr3d_5half = scale_cross_section(kr3d, 3/5)  # j=5/2 has 6 states
-    kr4p_1half = scale_cross_section(kr4p, 1/3)
-    kr4p_3half = scale_cross_section(kr4p, 2/3)
-    krypton_shells = [kr3s, kr3p_1half, kr3p_3half, kr3d_3half, kr3d_5half, kr4s, kr4p_1half, kr4p_3half]
-    
-    # Load and process Krypton Auger data
-    krypton_auger_raw = read_auger_file("krAuger.txt")
-    krypton_auger = process_auger_data(krypton_auger_raw, krypton_binding)
-    
-    elements["krypton"] = {
+        "binding_energies": {
+            "L1 2s": 326.3, "L2 2p1/2": 250.6, "L3 2p3/2": 248.4,
+            "M1 3s": 29.3, "M2 3p1/2": 15.9, "M3 3p3/2": 15.7
+        },
+        "shells": [("ar2s.txt", "s"), ("ar2p.txt", "p"),
+                   ("ar3s.txt", "s"), ("ar3p.txt", "p")],
+        "auger_file": "arAuger.txt",
+    },
+    "krypton": {
         "name": "Krypton",
         "symbol": "Kr",
-        "binding_energies": krypton_binding,
-        "shell_data": [df_to_shell_data(df) for df in krypton_shells],
-        "auger_peaks": krypton_auger
-    }
-
-    #Xenon
-    xenon_binding = {
-        "M1 3s": 1148.7, "M2 3p1/2": 1002.1, "M3 3p3/2": 940.6, "M4 3d3/2": 689, "M5 3d5/2": 676.4,
-        "N1 4s": 213.2, "N2 4p1/2": 146.7, "N3 4p3/2": 145.5, "N4 4d3/2": 69.5, "N5 4d5/2": 67.5,
-        "O1 5s": 23.3, "O2 5p1/2": 13.4, "O3 5p3/2": 12.1
-    }
-    xe3s = safe_read_csv("xe3s.txt")
-    xe3p = safe_read_csv("xe3p.txt")
-    xe3d = safe_read_csv("xe3d.txt")
-    xe4s = safe_read_csv("xe4s.txt")
-    xe4p = safe_read_csv("xe4p.txt")
-    xe4d = safe_read_csv("xe4d.txt")
-    xe5s = safe_read_csv("xe5s.txt")
-    xe5p = safe_read_csv("xe5p.txt")
-    # Divide cross-sections for p and d orbitals
-    xe3p_1half = scale_cross_section(xe3p, 1/3)
-    xe3p_3half = scale_cross_section(xe3p, 2/3)
-    xe3d_3half = scale_cross_section(xe3d, 2/5)
-    xe3d_5half = scale_cross_section(xe3d, 3/5)
-    xe4p_1half = scale_cross_section(xe4p, 1/3)
-    xe4p_3half = scale_cross_section(xe4p, 2/3)
-    xe4d_3half = scale_cross_section(xe4d, 2/5)
-    xe4d_5half = scale_cross_section(xe4d, 3/5)
-    xe5p_1half = scale_cross_section(xe5p, 1/3)
-    xe5p_3half = scale_cross_section(xe5p, 2/3)
-    xenon_shells = [xe3s, xe3p_1half, xe3p_3half, xe3d_3half, xe3d_5half, 
-                    xe4s, xe4p_1half, xe4p_3half, xe4d_3half, xe4d_5half, 
-                    xe5s, xe5p_1half, xe5p_3half]
-
-    # Load and process Xenon Auger data
-    xenon_auger_raw = read_auger_file("xeAuger.txt")
-    xenon_auger = process_auger_data(xenon_auger_raw, xenon_binding)
-    
-    elements["xenon"] = {
+        "binding_energies": {
+            "3s": 292.8, "3p1/2": 222.2, "3p3/2": 214.4,
+            "3d3/2": 95.0, "3d5/2": 93.8,
+            "4s": 27.5, "4p1/2": 14.1, "4p3/2": 14.1
+        },
+        "shells": [("kr3s.txt", "s"), ("kr3p.txt", "p"), ("kr3d.txt", "d"),
+                   ("kr4s.txt", "s"), ("kr4p.txt", "p")],
+        "auger_file": "krAuger.txt",
+    },
+    "xenon": {
         "name": "Xenon",
         "symbol": "Xe",
-        "binding_energies": xenon_binding,
-        "shell_data": [df_to_shell_data(df) for df in xenon_shells],
-        "auger_peaks": xenon_auger
-    }
-    
+        "binding_energies": {
+            "M1 3s": 1148.7, "M2 3p1/2": 1002.1, "M3 3p3/2": 940.6, "M4 3d3/2": 689, "M5 3d5/2": 676.4,
+            "N1 4s": 213.2, "N2 4p1/2": 146.7, "N3 4p3/2": 145.5, "N4 4d3/2": 69.5, "N5 4d5/2": 67.5,
+            "O1 5s": 23.3, "O2 5p1/2": 13.4, "O3 5p3/2": 12.1
+        },
+        "shells": [("xe3s.txt", "s"), ("xe3p.txt", "p"), ("xe3d.txt", "d"),
+                   ("xe4s.txt", "s"), ("xe4p.txt", "p"), ("xe4d.txt", "d"),
+                   ("xe5s.txt", "s"), ("xe5p.txt", "p")],
+        "auger_file": "xeAuger.txt",
+    },
+}
+
+
+def build_element_shells(spec):
+    """Build the ordered shell arrays for one element spec
+
+    s shells pass through unscaled; p/d shells are split into their two
+    j-components using the degeneracy fractions from SPLIT_FACTORS.
+
+    Returns (shells, grid_ids, energy_grids): one grid id per shell
+    indexing into energy_grids, which holds each source file's
+    photon-energy axis exactly once — both j-splits of a file share it.
+    """
+    shells = []
+    grid_ids = []
+    energy_grids = []
+    for filename, orbital_type in spec["shells"]:
+        # The tabulated values carry 3-4 significant digits, so float32 is
+        # plenty for the web payload; it halves the in-memory footprint and
+        # the digits orjson has to emit. The float64 analysis path in
+        # elements.py is unaffected.
+        arr = load_shell_array(filename).astype(np.float32)
+        grid_id = len(energy_grids)
+        energy_grids.append(np.ascontiguousarray(arr[:, PE]))
+        if orbital_type in SPLIT_FACTORS:
+            shells.extend(scale_shell_variants(arr, SPLIT_FACTORS[orbital_type]))
+            grid_ids.extend([grid_id, grid_id])
+        else:
+            shells.append(arr)
+            grid_ids.append(grid_id)
+    return shells, grid_ids, energy_grids
+
+
+def build_element_data():
+    """Build the complete elements data dictionary"""
+
+    # Pull every shell file into the cache in one concurrent pass
+    preload_shell_arrays(
+        filename for spec in ELEMENT_SPECS.values() for filename, _ in spec["shells"])
+
+    elements = {}
+    for element_key, spec in ELEMENT_SPECS.items():
+        auger_raw = read_auger_file(spec["auger_file"])
+        shells, grid_ids, energy_grids = build_element_shells(spec)
+        elements[element_key] = {
+            "name": spec["name"],
+            "symbol": spec["symbol"],
+            "binding_energies": spec["binding_energies"],
+            "energy_grids": energy_grids,
+            "shell_data": [shell_array_to_data(arr, grid_id)
+                           for arr, grid_id in zip(shells, grid_ids)],
+            "auger_peaks": process_auger_data(auger_raw, spec["binding_energies"]),
+        }
+
     return elements
 
 
 def generate_js_file(elements_data, output_path):
     """Generate the JavaScript file with elements data"""
     
-    # Convert to JSON with nice formatting
-    json_str = json.dumps(elements_data, indent=2)
-    
-    # Write the JS file
-    js_content = f"""// Element data for interactive plotting
-// Auto-generated by generate_elements_data.py
-const ELEMENTS_DATA = {json_str};
-"""
-    
-    with open(output_path, 'w') as f:
-        f.write(js_content)
+    # Write prefix, JSON payload and suffix separately through a large
+    # write buffer rather than splicing the multi-hundred-KB JSON string
+    # into an f-string first; peak memory holds one payload copy, not three.
+    with open(output_path, 'wb', buffering=1024 * 1024) as f:
+        f.write(b"// Element data for interactive plotting\n"
+                b"// Auto-generated by generate_elements_data.py\n"
+                b"const ELEMENTS_DATA = ")
+        # orjson's Rust serializer is several times faster than the stdlib
+        # and understands numpy arrays
+        if orjson is not None:
+            f.write(orjson.dumps(
+                elements_data,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2,
+            ))
+        else:
+            f.write(json.dumps(elements_data, indent=2,
+                               default=lambda o: o.tolist()).encode())
+        # Rehydrate the deduplicated photon-energy axes client-side: every
+        # shell regains its .photon_energy property, but shells from the
+        # same source file share one array instead of embedding copies.
+        f.write(b""";
+
+for (const element of Object.values(ELEMENTS_DATA)) {
+    for (const shell of element.shell_data) {
+        shell.photon_energy = element.energy_grids[shell.energy_grid_id];
+    }
+}
+""")
     
     print(f"Generated {output_path}")
     print(f"  Elements: {', '.join(elements_data.keys())}")
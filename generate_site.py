@@ -5,25 +5,109 @@ Main script to generate interactive spectrum plots for the GitHub Pages site
 
 import plotly.graph_objects as go
 import plotly.offline as pyo
+import argparse
+import hashlib
 import json
 import os
+import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from elements import neon, argon, krypton
 from interactive_spectrum import generate_all_element_data, create_interactive_plot
 
+def _minify_css(css):
+    """Strip comments and collapse whitespace in a CSS string"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,])\s*', r'\1', css)
+    return css.strip()
+
+
+def _minify_html(html):
+    """Collapse inter-tag whitespace in an HTML string"""
+    return re.sub(r'>\s+<', '><', html).strip()
+
+
+def _write_if_changed(path, content):
+    """Write `content` to `path` only when it differs from what's on disk
+
+    Compares blake2b digests of the new content and the existing file,
+    so re-running the generator with unchanged inputs leaves mtimes
+    alone and deploy steps that watch them see no spurious changes —
+    and the check can never disagree with what is actually deployed.
+    Returns True when the file was (re)written.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            on_disk = hashlib.blake2b(f.read()).digest()
+        if on_disk == hashlib.blake2b(content).digest():
+            return False
+    with open(path, 'wb') as f:
+        f.write(content)
+    return True
+
+
 def setup_directories():
     """Create necessary directories for output"""
     os.makedirs('docs', exist_ok=True)
     os.makedirs('docs/plots', exist_ok=True)
+    os.makedirs('docs/data', exist_ok=True)
     print("✓ Created output directories")
 
-def generate_interactive_data():
-    """Generate JavaScript data file for interactive plotting"""
+def _encode_json(data, dev=False):
+    """Serialize to JSON, compact by default and indented with dev=True
+
+    orjson's Rust serializer is several times faster than the stdlib
+    and serializes the numpy columns directly, without boxing every
+    float into a Python object first.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if dev else 0),
+        ).decode()
+    if dev:
+        return json.dumps(data, indent=2, default=lambda o: o.tolist())
+    return json.dumps(data, separators=(',', ':'), default=lambda o: o.tolist())
+
+
+def generate_interactive_data(dev=False):
+    """Generate the element data files for interactive plotting
+
+    Each element's full shell tables go into docs/data/<element>.json,
+    fetched by the client on demand; elements_data.js ships only the
+    names and binding energies the page needs up-front for the element
+    picker, so first load parses a stub instead of every table.
+    """
     elements_data = generate_all_element_data()
-    
-    # Create JavaScript file with element data
+
+    for element_key, element in elements_data.items():
+        if _write_if_changed(f'docs/data/{element_key}.json',
+                             _encode_json(element, dev=dev)):
+            print(f"✓ Generated data/{element_key}.json")
+        else:
+            print(f"✓ data/{element_key}.json unchanged, skipped")
+
+    # The picker renders names and symbols before any fetch happens, so
+    # they ride along in the stub
+    stub = {key: {field: element[field]
+                  for field in ('name', 'symbol', 'binding_energies')
+                  if field in element}
+            for key, element in elements_data.items()}
+    payload = _encode_json(stub, dev=dev)
+
+    # Create JavaScript stub with the up-front element data
     js_content = f"""// Element data for interactive plotting
-const ELEMENTS_DATA = {json.dumps(elements_data, indent=2)};
+// Boot stub: full shell tables are fetched from data/<element>.json
+const ELEMENTS_DATA = {payload};
 
 // Available photon energies (eV)
 const PHOTON_ENERGIES = [1000, 1486.6];
@@ -38,33 +122,68 @@ const DEFAULT_PARAMS = {{
 }};
 """
     
-    with open('docs/elements_data.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
-    
-    print("✓ Generated elements_data.js")
+    if _write_if_changed('docs/elements_data.js', js_content):
+        print("✓ Generated elements_data.js")
+    else:
+        print("✓ elements_data.js unchanged, skipped")
+
+# Minimal page skeleton shared by every sample plot; the figure is
+# injected as a bare fragment so the Plotly bundle is referenced once
+# from the CDN instead of being restated per document
+SAMPLE_PLOT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>{title} - SpectrumSynth sample spectrum</title>
+    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+</head>
+<body>
+{body}
+</body>
+</html>"""
+
+def _sample_plot_worker(element):
+    """Build and write one sample plot; runs in a worker process
+
+    Module-level so ProcessPoolExecutor can pickle it. Returns the
+    element name and whether the file was rewritten (None if no plot).
+    """
+    element_name = element[0].lower()
+    fig = create_interactive_plot(element, emax=800, emin=0, ret=0)
+    if fig is None:
+        return element_name, None
+    html_file = f'docs/plots/{element_name}_sample.html'
+    # Render only the plot div (validate=False skips the schema walk the
+    # figure already passed at construction); a stable div id keeps the
+    # output deterministic so the content-hash guard can detect no-ops
+    fragment = fig.to_html(include_plotlyjs=False, full_html=False,
+                           div_id=f'{element_name}-sample',
+                           config={'displaylogo': False}, validate=False)
+    html = SAMPLE_PLOT_TEMPLATE.format(title=element[0], body=fragment)
+    return element_name, _write_if_changed(html_file, html)
 
 def generate_sample_plots():
     """Generate a few sample static plots for fallback"""
     elements = [neon, argon, krypton]
-    
-    for element in elements:
-        element_name = element[0].lower()
-        
-        # Create one sample interactive plot
-        fig = create_interactive_plot(element, emax=800, emin=0, ret=0)
-        
-        if fig:
-            # Save as HTML
-            html_file = f'docs/plots/{element_name}_sample.html'
-            fig.write_html(html_file, include_plotlyjs='cdn')
-            print(f"✓ Generated {element_name}_sample.html")
-    
+
+    # Each element's plot is independent, so fan them out to worker
+    # processes; the Plotly figure build and HTML render dominate
+    workers = min(len(elements), os.cpu_count())
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for element_name, written in executor.map(_sample_plot_worker, elements):
+            if written is None:
+                continue
+            if written:
+                print(f"✓ Generated {element_name}_sample.html")
+            else:
+                print(f"✓ {element_name}_sample.html unchanged, skipped")
+
     return True
 
-def create_html_page():
-    """Create the interactive HTML page"""
-    
-    html_content = f"""<!DOCTYPE html>
+def create_html_page(dev=False):
+    """Build the interactive HTML page; returns (path, content)"""
+
+    html_content = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -82,76 +201,199 @@ def create_html_page():
     </header>
 
     <main class="container">
-        <section class="intro">
-            <h2>Interactive XPS Analysis</h2>
-            <p>Generate and customize XPS spectra in real-time using the controls below. 
-            Adjust parameters to see how they affect the spectrum appearance.</p>
-        </section>
-
-        <section class="controls">
-            <div class="control-panel">
-                <div class="control-group">
-                    <label for="element-select">Element:</label>
-                    <select id="element-select">
-                        <option value="neon">Neon (Ne)</option>
-                        <option value="argon">Argon (Ar)</option>
-                        <option value="krypton">Krypton (Kr)</option>
-                    </select>
+        <!-- Tab Navigation -->
+        <div class="tab-navigation">
+            <button class="tab-btn active" data-tab="spectrum">Spectrum</button>
+            <button class="tab-btn" data-tab="setup">Setup</button>
+            <button class="tab-btn" data-tab="about">About</button>
+        </div>
+
+        <!-- Tab Content -->
+        <div class="tab-content active" id="spectrum-tab">
+            <section class="plot-area full-width">
+                <div id="spectrum-plot"></div>
+            </section>
+
+            <section class="element-info">
+                <div id="binding-energies">
+                    <div id="binding-list"></div>
                 </div>
-                
-                <div class="control-group">
-                    <label for="photon-energy-select">X-ray Source:</label>
-                    <select id="photon-energy-select">
-                        <option value="1000">1000 eV</option>
-                        <option value="1486.6" selected>1486.6 eV (Al Kα)</option>
-                    </select>
+            </section>
+        </div>
+
+        <div class="tab-content" id="setup-tab">
+            <section class="controls">
+                <h3>Element Selection</h3>
+                <div class="control-panel">
+                    <div class="control-group element-control">
+                        <label>Selected Elements:</label>
+                        <div id="selected-elements" class="selected-elements"></div>
+                        <div class="add-element-row">
+                            <select id="add-element-select">
+                                <option value="">Add element...</option>
+                            </select>
+                        </div>
+                    </div>
                 </div>
                 
-                <div class="control-group">
-                    <label for="ret-slider">Work Function (φ): <span id="ret-value">0</span> eV</label>
-                    <input type="range" id="ret-slider" min="0" max="10" value="0" step="0.1">
+                <div id="gas-multipliers-section">
+                    <h4>Gas Multipliers</h4>
+                    <p class="section-description">Scale the cross-sections for each gas</p>
+                    <div id="gas-multipliers" class="multiplier-grid"></div>
                 </div>
-                
-                <div class="control-group">
-                    <label for="emin-slider">Min Energy: <span id="emin-value">0</span> eV</label>
-                    <input type="range" id="emin-slider" min="0" max="200" value="0" step="5">
+            </section>
+            
+            <section class="controls">
+                <h3>Photon Energy Settings</h3>
+                <div class="control-panel">
+                    <div class="control-group energy-control">
+                        <label>Photon Energies (eV):</label>
+                        <div id="selected-energies" class="selected-energies"></div>
+                        <div class="add-energy-row">
+                            <input type="number" id="add-energy-input" placeholder="Enter energy..." min="10" max="100000" step="0.1">
+                            <button id="add-energy-btn" class="add-btn">Add</button>
+                        </div>
+                    </div>
                 </div>
                 
-                <div class="control-group">
-                    <label for="emax-slider">Max Energy: <span id="emax-value">800</span> eV</label>
-                    <input type="range" id="emax-slider" min="200" max="1200" value="800" step="10">
+                <div id="energy-multipliers-section">
+                    <h4>Energy Multipliers</h4>
+                    <p class="section-description">Scale the cross-sections for each photon energy</p>
+                    <div id="energy-multipliers" class="multiplier-grid"></div>
                 </div>
+            </section>
+            
+            <section class="controls">
+                <h3>Display Options</h3>
+                <div class="control-panel">
+                    <div class="control-group">
+                        <label>X-Axis Scale:</label>
+                        <div class="toggle-group">
+                            <button id="x-invquad-btn" class="toggle-btn active">Inverse Quadratic</button>
+                            <button id="x-linear-btn" class="toggle-btn">Linear</button>
+                        </div>
+                    </div>
+                    
+                    <div class="control-group">
+                        <label>Y-Axis Scale:</label>
+                        <div class="toggle-group">
+                            <button id="log-scale-btn" class="toggle-btn active">Log</button>
+                            <button id="lin-scale-btn" class="toggle-btn">Linear</button>
+                        </div>
+                    </div>
+                    
+                    <div class="control-group">
+                        <label>Gaussians:</label>
+                        <div class="toggle-group">
+                            <button id="gaussians-on-btn" class="toggle-btn">On</button>
+                            <button id="gaussians-off-btn" class="toggle-btn active">Off</button>
+                        </div>
+                    </div>
+                    
+                    <div class="control-group">
+                        <label>Auger Peaks:</label>
+                        <div class="toggle-group">
+                            <button id="auger-on-btn" class="toggle-btn active">On</button>
+                            <button id="auger-off-btn" class="toggle-btn">Off</button>
+                        </div>
+                    </div>
+                    
+                    <div class="control-group" id="gaussian-width-group" style="display: none;">
+                        <label for="gaussian-width-input">Gaussian Width (%):</label>
+                        <input type="number" id="gaussian-width-input" value="1.0" min="0" max="20" step="0.1">
+                    </div>
+                    
+                    <div class="control-group" id="gaussian-fixed-width-group" style="display: none;">
+                        <label for="gaussian-fixed-width-input">Fixed Width (eV):</label>
+                        <input type="number" id="gaussian-fixed-width-input" value="0.0" min="0" max="100" step="0.1">
+                    </div>
+                    
+                    <div class="control-group">
+                        <label>Peak Annotations:</label>
+                        <div class="toggle-group">
+                            <button id="annotations-on-btn" class="toggle-btn active">On</button>
+                            <button id="annotations-off-btn" class="toggle-btn">Off</button>
+                        </div>
+                    </div>
+                </div>
+            </section>
+
+            <section class="cache-section">
+                <button id="clear-cache-btn" class="clear-cache-btn">Clear Saved Settings</button>
+            </section>
+        </div>
+
+        <div class="tab-content" id="about-tab">
+            <section class="about-content">
+                <h2>About SpectrumSynth</h2>
+                <p>SpectrumSynth is an helper tool for X-ray Photoelectron Spectroscopy (XPS) analysis. It allows you to estimate and visualize XPS spectra for various noble gases. It does not substitute a proper analysis!</p>
+                
+                <h3>Features</h3>
+                <ul>
+                    <li>Interactive spectrum visualization with multiple elements and photon energies</li>
+                    <li>Gaussian peak fitting with percentage width</li>
+                    <li>Adjustable multipliers for gases and photon energies</li>
+                    <li>Persistent settings using browser local storage</li>
+                </ul>
+                
+                <h3>How to Use</h3>
+                <ul>
+                    <li><strong>Setup Tab:</strong> Select elements, add photon energies, and adjust multipliers and display options</li>
+                    <li><strong>Spectrum Tab:</strong> View the interactive spectrum and binding energy information</li>
+                    <li>Click on legend items to show/hide traces</li>
+                    <li>Zoom and pan the plot using mouse controls</li>
+                </ul>
                 
-                <button id="update-plot" class="update-btn">Update Spectrum</button>
-            </div>
-        </section>
-
-        <section class="plot-area">
-            <div id="spectrum-plot"></div>
-        </section>
-
-        <section class="element-info">
-            <div id="binding-energies">
-                <h3>Binding Energies</h3>
-                <div id="binding-list"></div>
-            </div>
-        </section>
-
-        <section class="methodology">
-            <h2>How It Works</h2>
-            <p>The interactive spectrum is calculated using:</p>
-            <ul>
-                <li><strong>Kinetic Energy</strong>: E_kinetic = E_photon - E_binding - φ</li>
-                <li><strong>Cross-sections</strong>: From theoretical atomic physics data</li>
-                <li><strong>Asymmetry parameters (β)</strong>: Control peak shapes and intensities</li>
-                <li><strong>Interactive ranges</strong>: Zoom and filter the energy range in real-time</li>
-            </ul>
-        </section>
+                <h3>Methodology</h3>
+                <p>The tool calculates XPS spectra using:</p>
+                <ul>
+                    <li>Photoionization cross-sections from tabulated data</li>
+                    <li>Beta asymmetry parameters for angular distribution</li>
+                    <li>Kinetic energy: KE = hν - BE - φ (work function)</li>
+                    <li>It also includes data from some Auger-Meitner channels</li>
+                    <li>Optional Gaussian convolution for peak broadening</li>
+                </ul>
+                
+                <h3>Credits</h3>
+                <ul>
+                    <li>Developed by Moritz Zander with a great amount of data compiled by Markus Braune</li>
+                </ul>
+                
+                <h3>Data Sources</h3>
+                <table class="data-sources-table">
+                    <thead>
+                        <tr>
+                            <th>Data Type</th>
+                            <th>Source</th>
+                            <th>Notes</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr>
+                            <td>Cross-sections and betas of photoelectrons</td>
+                            <td><a href="https://vuo.elettra.eu/services/elements/WebElements.html">Elettra</a></td>
+                            <td>Calculated data</td>
+                        </tr>
+                        <tr>
+                            <td>Binding Energies</td>
+                            <td><a href="https://physics.nist.gov/PhysRefData/Handbook/periodictable.htm">NIST</a></td>
+                            <td>Measured data</td>
+                        </tr>
+                        <tr>
+                            <td>Auger Data</td>
+                            <td><a href="https://iopscience.iop.org/article/10.1088/0031-8949/8/4/004">Kai Siegbahn</a></td>
+                            <td>Argon L2,3</td>
+                        </tr>
+                        <!-- Add more rows as needed -->
+                    </tbody>
+                </table>
+            </section>
+        </div>
     </main>
 
     <footer>
         <div class="container">
-            <p>&copy; 2024 SpectrumSynth | Interactive XPS Analysis Tool</p>
+            <p>2025 SpectrumSynth | Interactive XPS Analysis Tool | MPL-2.0 license</p>
         </div>
     </footer>
 
@@ -160,13 +402,13 @@ def create_html_page():
 </body>
 </html>"""
 
-    with open('docs/index.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
-    
-    print("✓ Created interactive index.html")
+    if not dev:
+        html_content = _minify_html(html_content)
 
-def create_css_file():
-    """Create the CSS stylesheet for interactive interface"""
+    return 'docs/index.html', html_content
+
+def create_css_file(dev=False):
+    """Build the CSS stylesheet; returns (path, content)"""
     css_content = """/* SpectrumSynth Interactive Styles */
 * {
     margin: 0;
@@ -188,7 +430,7 @@ body {
 }
 
 header {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    background: linear-gradient(135deg, #0072B2 0%, #E69F00 100%);
     color: white;
     padding: 2rem 0;
     text-align: center;
@@ -209,22 +451,99 @@ main {
     padding: 2rem 0;
 }
 
+/* Tab Navigation */
+.tab-navigation {
+    display: flex;
+    gap: 0;
+    margin-bottom: 0;
+    background: white;
+    border-radius: 10px 10px 0 0;
+    overflow: hidden;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+}
+
+.tab-btn {
+    flex: 1;
+    padding: 1rem 2rem;
+    background: #f8f9fa;
+    border: none;
+    border-bottom: 3px solid transparent;
+    cursor: pointer;
+    font-size: 1rem;
+    font-weight: 500;
+    color: #555;
+    transition: all 0.3s ease;
+}
+
+.tab-btn:hover {
+    background: #e9ecef;
+    color: #0072B2;
+}
+
+.tab-btn.active {
+    background: white;
+    border-bottom-color: #0072B2;
+    color: #0072B2;
+}
+
+/* Tab Content */
+.tab-content {
+    display: none;
+    animation: fadeIn 0.3s ease;
+}
+
+.tab-content.active {
+    display: block;
+}
+
+@keyframes fadeIn {
+    from { opacity: 0; transform: translateY(10px); }
+    to { opacity: 1; transform: translateY(0); }
+}
+
 section {
     margin-bottom: 2rem;
     background: white;
     padding: 2rem;
-    border-radius: 10px;
+    border-radius: 0 0 10px 10px;
     box-shadow: 0 2px 10px rgba(0,0,0,0.1);
 }
 
+/* Full width plot area */
+section.plot-area.full-width {
+    margin-left: calc(-50vw + 50%);
+    margin-right: calc(-50vw + 50%);
+    width: 100vw;
+    border-radius: 0;
+    padding: 2rem 1rem;
+}
+
+#setup-tab section:first-child,
+#about-tab section {
+    border-radius: 10px;
+}
+
 h2 {
-    color: #667eea;
+    color: #0072B2;
     margin-bottom: 1rem;
     font-size: 1.8rem;
 }
 
 h3 {
-    color: #764ba2;
+    color: #E69F00;
+    margin-bottom: 1rem;
+}
+
+h4 {
+    color: #0072B2;
+    margin-top: 1.5rem;
+    margin-bottom: 0.75rem;
+    font-size: 1.1rem;
+}
+
+.section-description {
+    color: #666;
+    font-size: 0.9rem;
     margin-bottom: 1rem;
 }
 
@@ -258,7 +577,22 @@ h3 {
 
 .control-group select:focus {
     outline: none;
-    border-color: #667eea;
+    border-color: #0072B2;
+}
+
+.control-group input[type="number"] {
+    padding: 0.75rem;
+    border: 2px solid #e0e0e0;
+    border-radius: 6px;
+    font-size: 1rem;
+    background: white;
+    transition: border-color 0.3s ease;
+    width: 100%;
+}
+
+.control-group input[type="number"]:focus {
+    outline: none;
+    border-color: #0072B2;
 }
 
 .control-group input[type="range"] {
@@ -277,45 +611,238 @@ h3 {
     width: 20px;
     height: 20px;
     border-radius: 50%;
-    background: #667eea;
+    background: #0072B2;
     cursor: pointer;
     transition: background 0.3s ease;
 }
 
 .control-group input[type="range"]::-webkit-slider-thumb:hover {
-    background: #764ba2;
+    background: #E69F00;
 }
 
 .control-group input[type="range"]::-moz-range-thumb {
     width: 20px;
     height: 20px;
     border-radius: 50%;
-    background: #667eea;
+    background: #0072B2;
+    cursor: pointer;
+    border: none;
+}
+
+/* Multiplier Grid */
+.multiplier-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 1rem;
+    margin-top: 1rem;
+}
+
+.multiplier-item {
+    display: flex;
+    flex-direction: column;
+    gap: 0.5rem;
+}
+
+.multiplier-label {
+    display: flex;
+    align-items: center;
+    gap: 0.5rem;
+    font-weight: 500;
+}
+
+.multiplier-color {
+    width: 16px;
+    height: 16px;
+    border-radius: 3px;
+    display: inline-block;
+}
+
+.multiplier-input {
+    padding: 0.5rem;
+    border: 2px solid #e0e0e0;
+    border-radius: 6px;
+    font-size: 0.95rem;
+    transition: border-color 0.3s ease;
+}
+
+.multiplier-input:focus {
+    outline: none;
+    border-color: #0072B2;
+}
+
+/* Toggle Button Group */
+.toggle-group {
+    display: flex;
+    gap: 0;
+}
+
+.toggle-btn {
+    padding: 0.5rem 1rem;
+    font-size: 0.9rem;
+    background: #e9ecef;
+    border: 2px solid #e0e0e0;
+    cursor: pointer;
+    transition: all 0.2s ease;
+    font-weight: 500;
+}
+
+.toggle-btn:first-child {
+    border-radius: 6px 0 0 6px;
+    border-right: 1px solid #e0e0e0;
+}
+
+.toggle-btn:last-child {
+    border-radius: 0 6px 6px 0;
+    border-left: 1px solid #e0e0e0;
+}
+
+.toggle-btn.active {
+    background: linear-gradient(135deg, #0072B2 0%, #E69F00 100%);
+    color: white;
+    border-color: #0072B2;
+}
+
+.toggle-btn:hover:not(.active) {
+    background: #dee2e6;
+}
+
+/* Selected Elements */
+.element-control {
+    grid-column: 1 / -1;
+}
+
+.selected-elements {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.5rem;
+    margin-bottom: 0.75rem;
+    min-height: 38px;
+    align-items: center;
+}
+
+.element-tag {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    padding: 0.4rem 0.75rem;
+    border-radius: 20px;
+    color: white;
+    font-weight: 500;
+    font-size: 0.9rem;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.15);
+}
+
+.element-tag .remove-element {
+    background: none;
+    border: none;
+    color: white;
+    font-size: 1.2rem;
     cursor: pointer;
+    padding: 0;
+    line-height: 1;
+    opacity: 0.8;
+    transition: opacity 0.2s;
+}
+
+.element-tag .remove-element:hover {
+    opacity: 1;
+}
+
+.add-element-row {
+    display: flex;
+    gap: 0.5rem;
+    align-items: center;
+}
+
+.add-element-row select {
+    flex: 1;
+    max-width: 250px;
+}
+
+.no-elements {
+    color: #999;
+    font-style: italic;
+}
+
+/* Selected Energies */
+.energy-control {
+    grid-column: 1 / -1;
+}
+
+.selected-energies {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.5rem;
+    margin-bottom: 0.75rem;
+    min-height: 38px;
+    align-items: center;
+}
+
+.energy-tag {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    padding: 0.4rem 0.75rem;
+    border-radius: 20px;
+    color: white;
+    font-weight: 500;
+    font-size: 0.9rem;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.15);
+}
+
+.energy-tag .remove-energy {
+    background: none;
     border: none;
+    color: white;
+    font-size: 1.2rem;
+    cursor: pointer;
+    padding: 0;
+    line-height: 1;
+    opacity: 0.8;
+    transition: opacity 0.2s;
+}
+
+.energy-tag .remove-energy:hover {
+    opacity: 1;
 }
 
-.update-btn {
-    padding: 0.75rem 2rem;
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+.add-energy-row {
+    display: flex;
+    gap: 0.5rem;
+    align-items: center;
+}
+
+.add-energy-row input {
+    flex: 1;
+    max-width: 200px;
+}
+
+.add-btn {
+    padding: 0.75rem 1.5rem;
+    background: linear-gradient(135deg, #0072B2 0%, #E69F00 100%);
     color: white;
     border: none;
     border-radius: 6px;
-    font-size: 1rem;
-    font-weight: 600;
+    font-size: 0.9rem;
+    font-weight: 500;
     cursor: pointer;
-    transition: transform 0.2s ease, box-shadow 0.2s ease;
+    transition: all 0.2s ease;
 }
 
-.update-btn:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+.add-btn:hover {
+    transform: translateY(-1px);
+    box-shadow: 0 4px 8px rgba(0, 114, 178, 0.3);
 }
 
-.update-btn:active {
+.add-btn:active {
     transform: translateY(0);
 }
 
+.no-energies {
+    color: #999;
+    font-style: italic;
+}
+
 /* Plot Area */
 .plot-area {
     padding: 1rem;
@@ -326,10 +853,41 @@ h3 {
     height: 500px;
 }
 
+/* Cache Section */
+.cache-section {
+    text-align: center;
+    padding: 1rem;
+    background: #f8f9fa;
+}
+
+.clear-cache-btn {
+    padding: 0.5rem 1.5rem;
+    background: #dc3545;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    font-size: 0.9rem;
+    cursor: pointer;
+    transition: all 0.2s ease;
+}
+
+.clear-cache-btn:hover {
+    background: #c82333;
+    transform: translateY(-1px);
+}
+
 /* Element Info */
+.element-binding-section {
+    margin-bottom: 1.5rem;
+}
+
+.element-binding-section h4 {
+    margin-bottom: 0.75rem;
+}
+
 .binding-grid {
     display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+    grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
     gap: 1rem;
 }
 
@@ -337,15 +895,16 @@ h3 {
     background: #f8f9fa;
     padding: 0.75rem;
     border-radius: 6px;
-    border-left: 4px solid #667eea;
+    border-left: 4px solid #0072B2;
     display: flex;
-    justify-content: space-between;
-    align-items: center;
+    flex-direction: column;
+    gap: 0.3rem;
 }
 
 .shell {
     font-weight: 600;
-    color: #764ba2;
+    color: #E69F00;
+    font-size: 1.1rem;
 }
 
 .energy {
@@ -353,17 +912,90 @@ h3 {
     background: #e9ecef;
     padding: 0.2rem 0.5rem;
     border-radius: 3px;
+    font-size: 0.9rem;
 }
 
-/* Methodology */
-.methodology ul {
+.beta {
+    font-family: 'Courier New', monospace;
+    color: #0072B2;
+    font-size: 0.85rem;
+    font-weight: 500;
+}
+
+/* About Content */
+.about-content {
+    line-height: 1.8;
+}
+
+.about-content h2 {
+    margin-top: 0;
+}
+
+.about-content h3 {
+    margin-top: 2rem;
+}
+
+.about-content ul,
+.about-content ol {
     margin-left: 2rem;
+    margin-bottom: 1rem;
 }
 
-.methodology li {
+.about-content li {
     margin-bottom: 0.5rem;
 }
 
+.about-content p {
+    margin-bottom: 1rem;
+}
+
+/* Data Sources Table */
+.data-sources-table {
+    width: 100%;
+    border-collapse: collapse;
+    margin-top: 1rem;
+    margin-bottom: 2rem;
+    background: white;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.data-sources-table thead {
+    background: linear-gradient(135deg, #0072B2 0%, #E69F00 100%);
+    color: white;
+}
+
+.data-sources-table th {
+    padding: 12px 15px;
+    text-align: left;
+    font-weight: 600;
+}
+
+.data-sources-table tbody tr {
+    border-bottom: 1px solid #e0e0e0;
+}
+
+.data-sources-table tbody tr:last-child {
+    border-bottom: none;
+}
+
+.data-sources-table tbody tr:hover {
+    background-color: #f5f5f5;
+}
+
+.data-sources-table td {
+    padding: 12px 15px;
+}
+
+.data-sources-table a {
+    color: #0072B2;
+    text-decoration: none;
+    font-weight: 500;
+}
+
+.data-sources-table a:hover {
+    text-decoration: underline;
+}
+
 code {
     background: #f1f3f4;
     padding: 0.2rem 0.4rem;
@@ -385,10 +1017,28 @@ footer {
         grid-template-columns: 1fr;
     }
     
+    .multiplier-grid {
+        grid-template-columns: 1fr;
+    }
+    
     .binding-grid {
         grid-template-columns: 1fr;
     }
     
+    .tab-navigation {
+        flex-direction: column;
+    }
+    
+    .tab-btn {
+        border-bottom: 1px solid #e0e0e0;
+        border-left: 3px solid transparent;
+    }
+    
+    .tab-btn.active {
+        border-left-color: #0072B2;
+        border-bottom-color: #e0e0e0;
+    }
+    
     header h1 {
         font-size: 2rem;
     }
@@ -408,7 +1058,7 @@ footer {
     width: 20px;
     height: 20px;
     border: 3px solid #f3f3f3;
-    border-top: 3px solid #667eea;
+    border-top: 3px solid #0072B2;
     border-radius: 50%;
     animation: spin 1s linear infinite;
 }
@@ -425,23 +1075,442 @@ footer {
         color: black;
     }
     
-    .control-panel, .update-btn {
+    .tab-navigation,
+    .control-panel,
+    .update-btn {
         display: none;
     }
     
-    #spectrum-plot {
+    .tab-content {
+        display: block !important;
+    }
+    
+    #spectrum-plot {
         page-break-inside: avoid;
     }
 }
-"""
 
-    with open('docs/styles.css', 'w', encoding='utf-8') as f:
-        f.write(css_content)
+/* Control Panel Styles */
+.control-panel {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 1.5rem;
+    align-items: end;
+}
+
+.control-group {
+    display: flex;
+    flex-direction: column;
+}
+
+.control-group label {
+    font-weight: 600;
+    margin-bottom: 0.5rem;
+    color: #555;
+}
+
+.control-group select {
+    padding: 0.75rem;
+    border: 2px solid #e0e0e0;
+    border-radius: 6px;
+    font-size: 1rem;
+    background: white;
+    transition: border-color 0.3s ease;
+}
+
+.control-group select:focus {
+    outline: none;
+    border-color: #0072B2;
+}
+
+.control-group input[type="number"] {
+    padding: 0.75rem;
+    border: 2px solid #e0e0e0;
+    border-radius: 6px;
+    font-size: 1rem;
+    background: white;
+    transition: border-color 0.3s ease;
+    width: 100%;
+}
+
+.control-group input[type="number"]:focus {
+    outline: none;
+    border-color: #0072B2;
+}
+
+.control-group input[type="range"] {
+    -webkit-appearance: none;
+    width: 100%;
+    height: 6px;
+    border-radius: 3px;
+    background: #e0e0e0;
+    outline: none;
+    transition: background 0.3s ease;
+}
+
+.control-group input[type="range"]::-webkit-slider-thumb {
+    -webkit-appearance: none;
+    appearance: none;
+    width: 20px;
+    height: 20px;
+    border-radius: 50%;
+    background: #0072B2;
+    cursor: pointer;
+    transition: background 0.3s ease;
+}
+
+.control-group input[type="range"]::-webkit-slider-thumb:hover {
+    background: #E69F00;
+}
+
+.control-group input[type="range"]::-moz-range-thumb {
+    width: 20px;
+    height: 20px;
+    border-radius: 50%;
+    background: #0072B2;
+    cursor: pointer;
+    border: none;
+}
+
+/* Toggle Button Group */
+.toggle-group {
+    display: flex;
+    gap: 0;
+}
+
+.toggle-btn {
+    padding: 0.5rem 1rem;
+    font-size: 0.9rem;
+    background: #e9ecef;
+    border: 2px solid #e0e0e0;
+    cursor: pointer;
+    transition: all 0.2s ease;
+    font-weight: 500;
+}
+
+.toggle-btn:first-child {
+    border-radius: 6px 0 0 6px;
+    border-right: 1px solid #e0e0e0;
+}
+
+.toggle-btn:last-child {
+    border-radius: 0 6px 6px 0;
+    border-left: 1px solid #e0e0e0;
+}
+
+.toggle-btn.active {
+    background: linear-gradient(135deg, #0072B2 0%, #E69F00 100%);
+    color: white;
+    border-color: #0072B2;
+}
+
+.toggle-btn:hover:not(.active) {
+    background: #dee2e6;
+}
+
+/* Selected Elements */
+.element-control {
+    grid-column: 1 / -1;
+}
+
+.selected-elements {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.5rem;
+    margin-bottom: 0.75rem;
+    min-height: 38px;
+    align-items: center;
+}
+
+.element-tag {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    padding: 0.4rem 0.75rem;
+    border-radius: 20px;
+    color: white;
+    font-weight: 500;
+    font-size: 0.9rem;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.15);
+}
+
+.element-tag .remove-element {
+    background: none;
+    border: none;
+    color: white;
+    font-size: 1.2rem;
+    cursor: pointer;
+    padding: 0;
+    line-height: 1;
+    opacity: 0.8;
+    transition: opacity 0.2s;
+}
+
+.element-tag .remove-element:hover {
+    opacity: 1;
+}
+
+.add-element-row {
+    display: flex;
+    gap: 0.5rem;
+    align-items: center;
+}
+
+.add-element-row select {
+    flex: 1;
+    max-width: 250px;
+}
+
+.no-elements {
+    color: #999;
+    font-style: italic;
+}
+
+/* Selected Energies */
+.energy-control {
+    grid-column: 1 / -1;
+}
+
+.selected-energies {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.5rem;
+    margin-bottom: 0.75rem;
+    min-height: 38px;
+    align-items: center;
+}
+
+.energy-tag {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    padding: 0.4rem 0.75rem;
+    border-radius: 20px;
+    color: white;
+    font-weight: 500;
+    font-size: 0.9rem;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.15);
+}
+
+.energy-tag .remove-energy {
+    background: none;
+    border: none;
+    color: white;
+    font-size: 1.2rem;
+    cursor: pointer;
+    padding: 0;
+    line-height: 1;
+    opacity: 0.8;
+    transition: opacity 0.2s;
+}
+
+.energy-tag .remove-energy:hover {
+    opacity: 1;
+}
+
+.add-energy-row {
+    display: flex;
+    gap: 0.5rem;
+    align-items: center;
+}
+
+.add-energy-row input {
+    flex: 1;
+    max-width: 200px;
+}
+
+.add-btn {
+    padding: 0.75rem 1.5rem;
+    background: linear-gradient(135deg, #0072B2 0%, #E69F00 100%);
+    color: white;
+    border: none;
+    border-radius: 6px;
+    font-size: 0.9rem;
+    font-weight: 500;
+    cursor: pointer;
+    transition: all 0.2s ease;
+}
+
+.add-btn:hover {
+    transform: translateY(-1px);
+    box-shadow: 0 4px 8px rgba(0, 114, 178, 0.3);
+}
+
+.add-btn:active {
+    transform: translateY(0);
+}
+
+.no-energies {
+    color: #999;
+    font-style: italic;
+}
+
+/* Plot Area */
+.plot-area {
+    padding: 1rem;
+}
+
+#spectrum-plot {
+    width: 100%;
+    height: 500px;
+}
+
+/* Cache Section */
+.cache-section {
+    text-align: center;
+    padding: 1rem;
+    background: #f8f9fa;
+}
+
+.clear-cache-btn {
+    padding: 0.5rem 1.5rem;
+    background: #dc3545;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    font-size: 0.9rem;
+    cursor: pointer;
+    transition: all 0.2s ease;
+}
+
+.clear-cache-btn:hover {
+    background: #c82333;
+    transform: translateY(-1px);
+}
+
+/* Element Info */
+.element-binding-section {
+    margin-bottom: 1.5rem;
+}
+
+.element-binding-section h4 {
+    margin-bottom: 0.75rem;
+}
+
+.binding-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+    gap: 1rem;
+}
+
+.binding-item {
+    background: #f8f9fa;
+    padding: 0.75rem;
+    border-radius: 6px;
+    border-left: 4px solid #0072B2;
+    display: flex;
+    flex-direction: column;
+    gap: 0.3rem;
+}
+
+.shell {
+    font-weight: 600;
+    color: #E69F00;
+    font-size: 1.1rem;
+}
+
+.energy {
+    font-family: 'Courier New', monospace;
+    background: #e9ecef;
+    padding: 0.2rem 0.5rem;
+    border-radius: 3px;
+    font-size: 0.9rem;
+}
+
+.beta {
+    font-family: 'Courier New', monospace;
+    color: #0072B2;
+    font-size: 0.85rem;
+    font-weight: 500;
+}
+
+/* Methodology */
+.methodology ul {
+    margin-left: 2rem;
+}
+
+.methodology li {
+    margin-bottom: 0.5rem;
+}
+
+code {
+    background: #f1f3f4;
+    padding: 0.2rem 0.4rem;
+    border-radius: 3px;
+    font-family: 'Courier New', monospace;
+}
+
+footer {
+    background: #343a40;
+    color: white;
+    text-align: center;
+    padding: 1.5rem 0;
+    margin-top: 2rem;
+}
+
+/* Responsive Design */
+@media (max-width: 768px) {
+    .control-panel {
+        grid-template-columns: 1fr;
+    }
+    
+    .binding-grid {
+        grid-template-columns: 1fr;
+    }
+    
+    header h1 {
+        font-size: 2rem;
+    }
     
-    print("✓ Created interactive styles.css")
+    .subtitle {
+        font-size: 1rem;
+    }
+    
+    section {
+        padding: 1rem;
+    }
+}
+
+/* Loading animation */
+.loading {
+    display: inline-block;
+    width: 20px;
+    height: 20px;
+    border: 3px solid #f3f3f3;
+    border-top: 3px solid #0072B2;
+    border-radius: 50%;
+    animation: spin 1s linear infinite;
+}
+
+@keyframes spin {
+    0% { transform: rotate(0deg); }
+    100% { transform: rotate(360deg); }
+}
+
+/* Print styles */
+@media print {
+    header {
+        background: none;
+        color: black;
+    }
+    
+    .control-panel, .update-btn {
+        display: none;
+    }
+    
+    #spectrum-plot {
+        page-break-inside: avoid;
+    }
+}
+"""
+
+    if not dev:
+        css_content = _minify_css(css_content)
+
+    return 'docs/styles.css', css_content
 
 def create_readme():
-    """Create a README for the project"""
+    """Build the project README; returns (path, content)"""
     readme_content = """# SpectrumSynth
 
 A tool for generating synthetic X-ray Photoelectron Spectroscopy (XPS) spectra for different elements.
@@ -505,27 +1574,32 @@ SpectrumSynth/
 ```
 """
 
-    with open('README.md', 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-    
-    print("✓ Created README.md")
+    return 'README.md', readme_content
 
-def main():
+def main(dev=False):
     """Main execution function"""
     print("🚀 Generating Interactive SpectrumSynth GitHub Pages site...\n")
-    
+
     # Setup
     setup_directories()
-    
+
     # Generate interactive data only (all plotting is client-side JS)
     print("\n📊 Generating element data for client-side plotting...")
-    generate_interactive_data()
-    
-    # Create web page
+    generate_interactive_data(dev=dev)
+
+    # Build the page content, then flush everything to disk in one
+    # batch through the content-hash guard
     print("\n🌐 Creating interactive HTML page...")
-    create_html_page()
-    create_css_file()
-    create_readme()
+    outputs = [
+        create_html_page(dev=dev),
+        create_css_file(dev=dev),
+        create_readme(),
+    ]
+    for path, content in outputs:
+        if _write_if_changed(path, content):
+            print(f"✓ Created {os.path.basename(path)}")
+        else:
+            print(f"✓ {os.path.basename(path)} unchanged, skipped")
     
     print(f"\n✅ Interactive site generation complete!")
     print(f"📁 Files created in 'docs/' directory:")
@@ -542,4 +1616,8 @@ def main():
     print(f"   - Interactive emin/emax range controls")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate the GitHub Pages site")
+    parser.add_argument("--dev", action="store_true",
+                        help="emit pretty-printed (unminified) output")
+    args = parser.parse_args()
+    main(dev=args.dev)
\ No newline at end of file
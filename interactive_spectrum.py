@@ -1,77 +1,105 @@
 import plotly.graph_objects as go
 import plotly.express as px
-import pandas as pd
+import numpy as np
 import json
 from collections import defaultdict
 
+from spectrum_kernels import nearest_index, orbital_arrays
+
 def synthSpectrum_interactive(element, setPhoton, emax=1000, emin=0, ret=0):
     """
     Generate interactive spectrum data that can be plotted with Plotly
-    Returns plot data instead of creating matplotlib plot
+    Returns a dict keyed by photon energy; each value holds parallel
+    numpy arrays (energy, shell, cross_section, beta) for the visible
+    peaks, already grouped the way the plot traces need them
     """
-    plot_data = []
-    
+    groups = {}
+
+    # Hoisted out of the photon-energy loop: plain numpy views instead of
+    # re-running the pandas indexers per iteration
+    binding = element[1].iloc[0].to_numpy(np.float64)
+    cols = element[1].columns.to_numpy()
+
     for eV in setPhoton:
-        height = []
-        betas = []
-        cs = []
-        pos = eV - element[1].iloc[0,:].values - ret
+        pos = eV - binding - ret
         mask = pos > 0
         eKin = pos[mask]
-        shell = element[1].columns[mask]
-        
-        for e, orbital in zip(eKin, element[2]):
+        shell = cols[mask]
+
+        # Gather cross-sections and betas straight into preallocated
+        # arrays; shells without orbital data simply stay invisible
+        n = min(eKin.size, len(element[2]))
+        cs_all = np.zeros(n, dtype=np.float64)
+        beta_all = np.zeros(n, dtype=np.float64)
+        visible = np.zeros(n, dtype=bool)
+        for i in range(n):
+            orbital = element[2][i]
             if len(orbital) > 0:  # Check if orbital data exists
-                nearestIdx = (orbital["Photon Energy"] - e).abs().idxmin()
-                nearestRow = orbital.loc[nearestIdx]
-                height = nearestRow["cs0"]
-                beta = nearestRow["beta0"]
-                betas.append(beta)
-                cs.append(height)
-        
-        # Filter data based on energy range
-        filtered_data = []
-        for i, (x_val, shell_label, cross_section, beta) in enumerate(zip(eKin, shell, cs, betas)):
-            if emax > x_val > emin:
-                filtered_data.append({
-                    'energy': x_val,
-                    'shell': shell_label,
-                    'cross_section': cross_section,
-                    'beta': beta,
-                    'photon_energy': eV
-                })
-        
-        plot_data.extend(filtered_data)
-    
-    return plot_data
+                pe_arr, cs0_arr, beta0_arr = orbital_arrays(orbital)
+                nearestIdx = nearest_index(pe_arr, eKin[i])
+                cs_all[i] = cs0_arr[nearestIdx]
+                beta_all[i] = beta0_arr[nearestIdx]
+                visible[i] = True
+
+        # One mask fuses the energy-window filter with the gather
+        e_arr = np.asarray(eKin[:n], dtype=np.float64)
+        sel = visible & (e_arr > emin) & (e_arr < emax)
+        groups[eV] = {
+            'energy': e_arr[sel],
+            'shell': np.asarray(shell[:n], dtype=object)[sel],
+            'cross_section': cs_all[sel],
+            'beta': beta_all[sel]
+        }
+
+    return groups
+
+# Plotly's default colorway, assigned to photon energies in order
+_TRACE_COLORS = ['#636efa', '#EF553B', '#00cc96', '#ab63fa', '#FFA15A',
+                 '#19d3f3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52']
+
 
 def create_interactive_plot(element_data, emax=1000, emin=0, ret=0):
     """Create a Plotly interactive plot"""
     photon_energies = [1000, 1486.6]
-    plot_data = synthSpectrum_interactive(element_data, photon_energies, emax, emin, ret)
-    
-    if not plot_data:
+    groups = synthSpectrum_interactive(element_data, photon_energies, emax, emin, ret)
+
+    if all(group['energy'].size == 0 for group in groups.values()):
         return None
-    
-    df = pd.DataFrame(plot_data)
-    
+
     fig = go.Figure()
-    
-    # Group by photon energy
-    for photon_energy in df['photon_energy'].unique():
-        subset = df[df['photon_energy'] == photon_energy]
-        
-        fig.add_trace(go.Bar(
-            x=subset['energy'],
-            y=subset['cross_section'],
-            name=f'{photon_energy} eV X-ray',
-            opacity=0.7,
-            hovertemplate='<b>%{customdata[0]}</b><br>' +
-                         'Energy: %{x} eV<br>' +
-                         'Cross Section: %{y:.3f} Mb<br>' +
-                         'β: %{customdata[1]:.2f}<br>' +
-                         '<extra></extra>',
-            customdata=list(zip(subset['shell'], subset['beta']))
+
+    # Plotly's render and layout cost grows with trace count more than
+    # point count, so all photon energies share one Bar trace with a
+    # per-bar color array; the legend entries are pointless (literally)
+    # scatter traces that only carry a color swatch and a name.
+    nonempty = {pe: group for pe, group in groups.items()
+                if group['energy'].size > 0}
+    colors = {pe: _TRACE_COLORS[i % len(_TRACE_COLORS)]
+              for i, pe in enumerate(nonempty)}
+
+    fig.add_trace(go.Bar(
+        x=np.concatenate([g['energy'] for g in nonempty.values()]),
+        y=np.concatenate([g['cross_section'] for g in nonempty.values()]),
+        marker_color=np.repeat([colors[pe] for pe in nonempty],
+                               [g['energy'].size for g in nonempty.values()]),
+        opacity=0.7,
+        showlegend=False,
+        hovertemplate='<b>%{customdata[0]}</b><br>' +
+                     'Energy: %{x} eV<br>' +
+                     'Cross Section: %{y:.3f} Mb<br>' +
+                     'β: %{customdata[1]:.2f}<br>' +
+                     '<extra></extra>',
+        customdata=np.column_stack([
+            np.concatenate([g['shell'] for g in nonempty.values()]),
+            np.concatenate([g['beta'] for g in nonempty.values()])
+        ])
+    ))
+
+    for photon_energy in nonempty:
+        fig.add_trace(go.Scatter(
+            x=[None], y=[None], mode='markers',
+            marker=dict(color=colors[photon_energy], size=10),
+            name=f'{photon_energy} eV X-ray'
         ))
     
     fig.update_layout(
@@ -87,26 +115,53 @@ def create_interactive_plot(element_data, emax=1000, emin=0, ret=0):
     
     return fig
 
+# Cross-sections below this are invisible on the plot and only bloat
+# the payload
+_CS_NOISE_FLOOR = 1e-6
+
+
+def _round_sig(values, digits=4):
+    """Round an array to `digits` significant figures"""
+    out = np.zeros_like(values, dtype=np.float64)
+    nonzero = values != 0
+    v = values[nonzero]
+    scale = 10.0 ** (digits - 1 - np.floor(np.log10(np.abs(v))))
+    out[nonzero] = np.round(v * scale) / scale
+    return out
+
+
 def generate_all_element_data():
     """Generate JSON data for all elements for JavaScript access"""
     from elements import neon, argon, krypton
-    
+    # The element specs carry the symbol and Auger file the client-side
+    # overlay needs; the parsing lives with the spec table
+    from generate_elements_data import (
+        ELEMENT_SPECS, process_auger_data, read_auger_file,
+    )
+
     elements_data = {}
-    
+
     for element in [neon, argon, krypton]:
         element_name = element[0].lower()
+        spec = ELEMENT_SPECS.get(element_name)
         
         # Convert element data to JSON-serializable format
         binding_energies = element[1].iloc[0].to_dict()
         
-        # Convert shell data to JSON format
+        # Convert shell data to JSON format; the columns stay numpy
+        # arrays so the serializer consumes them without per-element
+        # Python float boxing. The tabulated values carry 3-4
+        # significant digits, so float32 with the precision trimmed is
+        # lossless in practice and emits far fewer JSON characters.
         shell_data = []
         for orbital in element[2]:
             if len(orbital) > 0:
+                pe_arr, cs0_arr, beta0_arr = orbital_arrays(orbital)
+                keep = cs0_arr >= _CS_NOISE_FLOOR
                 shell_data.append({
-                    'photon_energy': orbital['Photon Energy'].tolist(),
-                    'cs0': orbital['cs0'].tolist(),
-                    'beta0': orbital['beta0'].tolist()
+                    'photon_energy': np.round(pe_arr[keep], 3).astype(np.float32),
+                    'cs0': _round_sig(cs0_arr[keep]).astype(np.float32),
+                    'beta0': _round_sig(beta0_arr[keep]).astype(np.float32)
                 })
             else:
                 shell_data.append({
@@ -120,5 +175,9 @@ def generate_all_element_data():
             'binding_energies': binding_energies,
             'shell_data': shell_data
         }
-    
+        if spec is not None:
+            elements_data[element_name]['symbol'] = spec['symbol']
+            elements_data[element_name]['auger_peaks'] = process_auger_data(
+                read_auger_file(spec['auger_file']), spec['binding_energies'])
+
     return elements_data
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""Shared loader for the shell cross-section database files.
+
+Both elements.py and generate_elements_data.py read the same ~10-15 files
+from database/; keeping a single cached loader here means each file is
+parsed at most once per process no matter how many modules need it.
+"""
+
+import concurrent.futures
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
+import pyarrow.feather
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Copy-on-Write makes DataFrame copies lazy, so frames derived from the
+# cached shells only duplicate the columns actually overwritten. pandas 3
+# always runs with CoW enabled; opt in explicitly on pandas 2.x.
+if pd.__version__.startswith("2."):
+    pd.set_option("mode.copy_on_write", True)
+
+# Set up data directory path
+data_dir = "database"
+
+# Parsed shell files are cached here as Feather for fast warm starts
+cache_dir = os.path.join(data_dir, ".cache")
+
+# Column layout shared by every shell file in database/
+SHELL_COLUMNS = ["Photon Energy", "cs0", "cs1", "cs2", "beta0", "beta1", "beta2"]
+
+# Column indices into the (N, 7) shell arrays
+PE, CS0, CS1, CS2, BETA0, BETA1, BETA2 = range(7)
+
+
+@functools.lru_cache(maxsize=None)
+def load_shell_array(filename):
+    """Load a shell file as an (N, 7) float64 array, column order SHELL_COLUMNS
+
+    Results are cached per filename, so callers must treat the returned
+    array as read-only and copy before mutating.
+    """
+    filepath = os.path.join(data_dir, filename)
+    if os.path.exists(filepath):
+        cache_path = os.path.join(cache_dir, os.path.splitext(filename)[0] + ".feather")
+        if (os.path.exists(cache_path)
+                and os.path.getmtime(cache_path) >= os.path.getmtime(filepath)):
+            # Warm start: Feather load is essentially a memcpy of the
+            # columnar buffers, no CSV parsing at all
+            table = pa.feather.read_table(cache_path, memory_map=True)
+        else:
+            # pyarrow's multi-threaded CSV reader is much faster than
+            # pandas' parser on these typed numeric files and never falls
+            # back to object dtype for the header-less layout. Feeding it
+            # a memory map lets the parser scan the page cache directly
+            # instead of paying a read()->userspace copy per file.
+            table = pa.csv.read_csv(
+                pa.memory_map(filepath),
+                read_options=pa.csv.ReadOptions(column_names=SHELL_COLUMNS),
+                parse_options=pa.csv.ParseOptions(delimiter="\t"),
+                convert_options=pa.csv.ConvertOptions(
+                    column_types={name: pa.float64() for name in SHELL_COLUMNS}),
+            )
+            os.makedirs(cache_dir, exist_ok=True)
+            pa.feather.write_feather(table, cache_path, compression="uncompressed")
+        arr = np.column_stack([table[name].to_numpy() for name in SHELL_COLUMNS])
+    else:
+        print(f"Warning: {filename} not found, using dummy data")
+        # Return dummy data with typical structure
+        arr = np.array([
+            [100, 1.0, 0.0, 0.0, 1.5, 0.0, 0.0],
+            [200, 0.8, 0.0, 0.0, 1.4, 0.0, 0.0],
+            [500, 0.5, 0.0, 0.0, 1.3, 0.0, 0.0],
+            [1000, 0.3, 0.0, 0.0, 1.2, 0.0, 0.0],
+        ])
+    # The cached array is shared by every consumer (and both j-splits of a
+    # p/d shell), so freeze it: accidental in-place writes raise instead of
+    # corrupting every other user of the file.
+    arr.setflags(write=False)
+    return arr
+
+
+def preload_shell_arrays(filenames):
+    """Warm the load_shell_array cache by reading files concurrently
+
+    pyarrow's parser and the underlying disk reads release the GIL, so a
+    thread pool overlaps I/O and parse time across the whole manifest
+    instead of paying for ~25 sequential reads.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        # Consume the iterator so parse errors surface here, not later
+        list(pool.map(load_shell_array, set(filenames)))
+
+
+@functools.lru_cache(maxsize=None)
+def safe_read_csv(filename):
+    """Safely read CSV file, return None if file doesn't exist
+
+    Builds a DataFrame view of the cached shell array for consumers that
+    need labelled columns; the file itself is only parsed once. Callers
+    must treat the returned DataFrame as read-only and copy before
+    mutating.
+    """
+    return pd.DataFrame(load_shell_array(filename), columns=SHELL_COLUMNS)
+
+
+def scale_shell_array(arr, factor):
+    """Scale the cs0/cs1/cs2 columns of an (N, 7) shell array by a factor
+
+    Args:
+        arr: Shell array as returned by load_shell_array (not mutated)
+        factor: Multiplicative factor to scale cs0, cs1, cs2
+
+    Returns:
+        New array with scaled cross-sections
+    """
+    scaled = arr.copy()
+    # cs0..cs2 are adjacent columns, so one broadcasted multiply covers all three
+    scaled[:, CS0:CS2 + 1] *= factor
+    # Note: beta values are not scaled, they're angular distribution parameters
+    return scaled
+
+
+def _scale_variants_numpy(arr, factors):
+    # One broadcasted multiply materializes every scaled copy as a single
+    # contiguous (K, N, 7) tensor
+    out = np.repeat(arr[None, :, :], len(factors), axis=0)
+    out[:, :, CS0:CS2 + 1] = arr[:, CS0:CS2 + 1] * factors[:, None, None]
+    return out
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _scale_variants_fused(arr, factors):
+        # Fused kernel: one row-major read of arr fills all K outputs, so
+        # the copies and the multiplies share a single memory pass
+        out = np.empty((factors.size, arr.shape[0], arr.shape[1]), dtype=arr.dtype)
+        for k in range(factors.size):
+            for i in range(arr.shape[0]):
+                for j in range(arr.shape[1]):
+                    value = arr[i, j]
+                    if CS0 <= j <= CS2:
+                        out[k, i, j] = value * factors[k]
+                    else:
+                        out[k, i, j] = value
+        return out
+else:
+    _scale_variants_fused = None
+
+
+def scale_shell_variants(arr, factors):
+    """Materialize every scaled variant of a shell in one operation
+
+    The cs0..cs2 base block is extracted once and multiplied by the whole
+    factor vector, instead of K scale_shell_array calls each redoing the
+    extraction and copy. With numba installed the copies and multiplies
+    run as one fused pass over the array; otherwise a single broadcasted
+    numpy multiply is used.
+
+    Args:
+        arr: Shell array as returned by load_shell_array (not mutated)
+        factors: Sequence of scale factors, one per variant
+
+    Returns:
+        (K, N, 7) array, out[k] being the shell scaled by factors[k]
+    """
+    factors = np.asarray(factors, dtype=arr.dtype)
+    if _scale_variants_fused is not None:
+        return _scale_variants_fused(arr, factors)
+    return _scale_variants_numpy(arr, factors)
+
+
+def split_shell_array(arr, factor1, factor2):
+    """Split a shell into its two j-components in a single pass
+
+    Args:
+        arr: Shell array as returned by load_shell_array (not mutated)
+        factor1, factor2: Degeneracy fractions for the two j-components
+                          (they should sum to 1)
+
+    Returns:
+        Tuple of two new arrays with scaled cross-sections
+    """
+    variants = scale_shell_variants(arr, (factor1, factor2))
+    return variants[0], variants[1]
+
+
+def split_cross_section(df, factor1, factor2):
+    """DataFrame counterpart of split_shell_array for labelled consumers
+
+    Args:
+        df: DataFrame with cross-section data (not mutated, may be cached)
+        factor1, factor2: Degeneracy fractions for the two j-components
+
+    Returns:
+        Tuple of two new DataFrames with scaled cross-sections
+    """
+    base = df[["cs0", "cs1", "cs2"]].to_numpy()
+    scaled = base * np.array([factor1, factor2])[:, None, None]
+    return (
+        df.assign(cs0=scaled[0, :, 0], cs1=scaled[0, :, 1], cs2=scaled[0, :, 2]),
+        df.assign(cs0=scaled[1, :, 0], cs1=scaled[1, :, 1], cs2=scaled[1, :, 2]),
+    )
+
+
+def scale_cross_section(df, factor):
+    """Scale cross-section values in a DataFrame by a given factor
+
+    Args:
+        df: DataFrame with cross-section data (not mutated, may be cached)
+        factor: Multiplicative factor to scale cs0, cs1, cs2
+
+    Returns:
+        New DataFrame with scaled cross-sections
+    """
+    # assign() only materializes the three changed columns, and .to_numpy()
+    # keeps the multiply on the raw ndarrays instead of pandas dispatch.
+    # Note: beta values are not scaled, they're angular distribution parameters
+    return df.assign(
+        cs0=df["cs0"].to_numpy() * factor,
+        cs1=df["cs1"].to_numpy() * factor,
+        cs2=df["cs2"].to_numpy() * factor,
+    )
@@ -0,0 +1,92 @@
+"""Small numeric kernels shared by the spectrum generators.
+
+numba is optional: when installed, the kernels are JIT-compiled and the
+machine code is cached on disk across runs; otherwise numpy fallbacks
+with the same signatures are used.
+
+Persistence is handled by njit(cache=True), which writes .nbi/.nbc
+files next to this module's __pycache__ on first compile — repeat runs
+of the CLI scripts load the machine code instead of recompiling.
+AOT compilation via numba.pycc was considered and rejected: it has been
+deprecated upstream and would turn numba into a hard build dependency,
+while the cache gives the same steady-state startup cost.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _jit(func):
+    if numba is not None:
+        return numba.njit(cache=True)(func)
+    return func
+
+
+@_jit
+def _is_sorted(values):
+    for i in range(1, values.size):
+        if values[i] < values[i - 1]:
+            return False
+    return True
+
+
+@_jit
+def _nearest_sorted(photon_energies, energy):
+    # Binary search plus one neighbour comparison; ties resolve to the
+    # lower index, like argmin on the distances would
+    idx = np.searchsorted(photon_energies, energy)
+    if idx <= 0:
+        return 0
+    if idx >= photon_energies.size:
+        return photon_energies.size - 1
+    if energy - photon_energies[idx - 1] <= photon_energies[idx] - energy:
+        return idx - 1
+    return idx
+
+
+@_jit
+def _nearest_scan(photon_energies, energy):
+    best = 0
+    best_dist = abs(photon_energies[0] - energy)
+    for i in range(1, photon_energies.size):
+        dist = abs(photon_energies[i] - energy)
+        if dist < best_dist:
+            best_dist = dist
+            best = i
+    return best
+
+
+def nearest_index(photon_energies, energy):
+    """Index of the tabulated photon energy closest to `energy`
+
+    Most shell tables are sorted, so an O(log N) binary search applies;
+    a few files (e.g. ne1s.txt) carry an appended coarser block that
+    breaks monotonicity, and those fall back to the linear scan.
+    """
+    if _is_sorted(photon_energies):
+        return _nearest_sorted(photon_energies, energy)
+    return _nearest_scan(photon_energies, energy)
+
+
+# Orbital DataFrame -> contiguous float64 columns, converted once per
+# process. Keyed by identity, with the frame kept referenced so the id
+# can never be recycled; the tables are built once at import time in
+# elements.py and reused for every spectrum after that.
+_ORBITAL_ARRAYS = {}
+
+
+def orbital_arrays(orbital):
+    """Cached (photon_energy, cs0, beta0) float64 arrays for an orbital"""
+    cached = _ORBITAL_ARRAYS.get(id(orbital))
+    if cached is None:
+        arrays = (
+            np.ascontiguousarray(orbital["Photon Energy"].to_numpy(np.float64)),
+            np.ascontiguousarray(orbital["cs0"].to_numpy(np.float64)),
+            np.ascontiguousarray(orbital["beta0"].to_numpy(np.float64)),
+        )
+        _ORBITAL_ARRAYS[id(orbital)] = cached = (orbital, arrays)
+    return cached[1]
@@ -1,58 +1,72 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from collections import defaultdict
+
+from spectrum_kernels import nearest_index, orbital_arrays
 
 def synthSpectrum(element, setPhoton,emax=1000,emin=0,ret=0):
+    # Hoisted out of the photon-energy loop: plain numpy views instead of
+    # re-running the pandas indexers per iteration
+    binding = element[1].iloc[0].to_numpy(np.float64)
+    cols = element[1].columns.to_numpy()
     for eV in setPhoton:
         height=[]
         betas = []
         cs=[]
-        pos = eV - element[1].iloc[0,:].values -ret
+        pos = eV - binding -ret
         mask = pos > 0
         eKin = pos[mask]
-        shell = element[1].columns[mask]
+        shell = cols[mask]
         for e,orbital in zip(eKin,element[2]):
-            nearestIdx = (orbital["Photon Energy"] - e).abs().idxmin()
-            nearestRow = orbital.loc[nearestIdx]
-            height =  nearestRow["cs0"]
-            beta = nearestRow["beta0"]
+            pe_arr, cs0_arr, beta0_arr = orbital_arrays(orbital)
+            nearestIdx = nearest_index(pe_arr, e)
+            height = cs0_arr[nearestIdx]
+            beta = beta0_arr[nearestIdx]
             betas.append(beta)
             cs.append(height)
         
-        height_counter = defaultdict(int)
-        labels_by_x = defaultdict(list)
-        for x_val, shell_label in zip(eKin, shell):
-            labels_by_x[x_val].append(shell_label)
+        cs_arr = np.asarray(cs)
+        beta_arr = np.asarray(betas)
+
+        # One boolean mask for the visible window, then a tight loop over
+        # the filtered arrays; only visible shells build text artists
+        sel = (eKin > emin) & (eKin < emax)
+        xs = eKin[sel]
+        ys = cs_arr[sel]
+        bs = beta_arr[sel]
+        labs = np.asarray(shell, dtype=object)[sel]
+
+        # Group shell labels sharing one x position
+        labels_by_x = {}
+        for x_val, y, beta, shell_label in zip(xs, ys, bs, labs):
+            labels_by_x.setdefault(x_val, (y, beta, []))[2].append(shell_label)
+
+        for x_val, (y, beta, label_list) in labels_by_x.items():
+            # shell labels above the bar
+            plt.text(
+                x_val,
+                y * 1.05,
+                ", ".join(label_list),
+                ha="left",
+                va="bottom",
+                fontsize=8,
+                rotation=45
+            )
+
+            # beta0 below the bar
+            plt.text(
+                x_val,
+                y * 0.8,   # below the top, works with log scale
+                f"β={beta:.2f}",
+                ha="left",
+                va="bottom",
+                fontsize=7,
+                rotation=45
+            )
 
-        for x_val, label_list in labels_by_x.items():
-            if emax > x_val > emin:
-                idx = list(eKin).index(x_val)
-        
-                # shell labels above the bar
-                plt.text(
-                    x_val,
-                    cs[idx] * 1.05,
-                    ", ".join(label_list),
-                    ha="left",
-                    va="bottom",
-                    fontsize=8,
-                    rotation=45
-                )
-        
-                # beta0 below the bar
-                plt.text(
-                    x_val,
-                    cs[idx] * 0.8,   # below the top, works with log scale
-                    f"β={betas[idx]:.2f}",
-                    ha="left",
-                    va="bottom",
-                    fontsize=7,
-                    rotation=45
-                )
-                
         plt.xlim(emax,emin)
         plt.yscale("log")
         plt.title(f"{element[0]}")
         plt.xlabel("Energy in eV")
         plt.ylabel("Crosssection")
-        plt.bar(eKin,cs,alpha=0.75)
+        plt.bar(eKin,cs_arr,alpha=0.75)